@@ -79,12 +79,7 @@ class Amplitude:
         if extra_data := getattr(res, "amplitude_data", None):
             data["event_properties"].update(extra_data)
 
-        hit = {
-            "api_key": self._api_key,
-            "events": [data],
-        }
-        hit = json.dumps(hit, cls=DjangoJSONEncoder)
-        return self.forward_event(hit)
+        return self.enqueue_event(data)
 
     def _track_revenue_event(
         self,
@@ -136,10 +131,8 @@ class Amplitude:
             additional_properties = {}
         user_id, user_properties = self._build_user_properties(user)
 
-        valid_user_id = _ensure_valid_user_id(user_id)
-
         data = {
-            "user_id": valid_user_id,
+            "user_id": user_id,
             "event_type": "user_activity",
             "user_properties": user_properties,
             "event_properties": {
@@ -147,12 +140,34 @@ class Amplitude:
                 **additional_properties,
             },
         }
-        hit = {
-            "api_key": self._api_key,
-            "events": [data],
-        }
-        hit = json.dumps(hit, cls=DjangoJSONEncoder)
-        return self.forward_event(hit)
+        return self.enqueue_event(data)
+
+    def enqueue_event(self, event):
+        """
+        Queue an event for batched delivery by the event shipper, without
+        waiting on Amplitude. Returns False if the event was dropped.
+
+        User IDs are padded to Amplitude's minimum length. Events Amplitude
+        would reject, without an event type or without a user or device ID
+        (e.g. of anonymous users), are dropped here so they can't fail a batch.
+        """
+        if not self.enabled:
+            logger.debug("Amplitude tracking disabled, skipping event")
+            return False
+
+        if user_id := event.get("user_id"):
+            event["user_id"] = _ensure_valid_user_id(user_id)
+        else:
+            event.pop("user_id", None)
+        if not event.get("event_type") or not (
+            event.get("user_id") or event.get("device_id")
+        ):
+            logger.debug("Skipping invalid Amplitude event: %s", event)
+            return False
+
+        from analytics.services.amplitude_shipper import get_event_shipper
+
+        return get_event_shipper().enqueue(json.dumps(event, cls=DjangoJSONEncoder))
 
     def forward_event(self, hit):
         if not self.enabled:
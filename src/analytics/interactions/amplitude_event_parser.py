@@ -84,7 +84,9 @@ class AmplitudeEventParser:
     _content_type_cache = {}
 
     def __init__(self):
-        pass
+        # Whether a user exists, by ID: a batch of events usually comes from
+        # few users, so each is looked up once per parser.
+        self._user_exists = {}
 
     @classmethod
     def get_content_type(cls, model_name: str) -> ContentType:
@@ -107,10 +109,7 @@ class AmplitudeEventParser:
         if user_id_str:
             try:
                 user_id = int(user_id_str)
-                if (
-                    validate_user_exists
-                    and not User.objects.filter(id=user_id).exists()
-                ):
+                if validate_user_exists and not self._check_user_exists(user_id):
                     logger.warning(f"User {user_id} not found, using external_user_id")
                     user_id = None
             except ValueError:
@@ -118,6 +117,11 @@ class AmplitudeEventParser:
 
         return user_id, external_user_id
 
+    def _check_user_exists(self, user_id: int) -> bool:
+        if user_id not in self._user_exists:
+            self._user_exists[user_id] = User.objects.filter(id=user_id).exists()
+        return self._user_exists[user_id]
+
     def _extract_timestamp(
         self, event: dict[str, Any], time_field: str = "time"
     ) -> datetime:
@@ -0,0 +1,22 @@
+# Generated by Django 5.2
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("analytics", "0017_delete_websitevisits"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="userinteractions",
+            name="personalize_sync_attempts",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="userinteractions",
+            name="personalize_sync_error",
+            field=models.TextField(blank=True, default=""),
+        ),
+    ]
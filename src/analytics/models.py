@@ -46,6 +46,10 @@ class UserInteractions(DefaultModel):
     item = GenericForeignKey("content_type", "object_id")
     event_timestamp = models.DateTimeField()
     is_synced_with_personalize = models.BooleanField(default=False)
+    # Failed Personalize sync attempts, interactions are no longer sent once
+    # this reaches `SYNC_MAX_ATTEMPTS`.
+    personalize_sync_attempts = models.PositiveSmallIntegerField(default=0)
+    personalize_sync_error = models.TextField(blank=True, default="")
     personalize_rec_id = models.CharField(
         max_length=255,
         null=True,
@@ -0,0 +1,266 @@
+"""
+Buffered, batched delivery of Amplitude events.
+
+Events are put on a bounded in-process queue and shipped to Amplitude's batch
+endpoint by a daemon thread, so tracking never waits on Amplitude inside an API
+request:
+
+- a batch is sent once `batch_size` events are queued, or `flush_interval`
+  seconds after the first event of the batch was queued,
+- when the queue is full, new events are dropped instead of blocking the
+  caller, and counted in `stats()`,
+- rate limited (429) and server error responses are retried with exponential
+  backoff. While the worker backs off the queue keeps absorbing events, and
+  drops them once full,
+- a rejected batch (400, 413) only loses the events Amplitude reports as
+  invalid: those are dropped and the rest is sent again. Without such details
+  the batch is split in halves until the offending events are isolated,
+- the worker logs `stats()` every `STATS_LOG_INTERVAL` seconds.
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from dataclasses import asdict, dataclass
+
+import requests
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+AMPLITUDE_BATCH_URL = "https://api2.amplitude.com/batch"
+
+MAX_QUEUE_SIZE = 10000
+BATCH_SIZE = 500
+FLUSH_INTERVAL = 5.0
+MAX_RETRIES = 4
+RETRY_BACKOFF = 1.0
+REQUEST_TIMEOUT = 10
+STATS_LOG_INTERVAL = 300
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+REJECTED_STATUS_CODES = {400, 413}
+
+
+@dataclass
+class ShipperStats:
+    enqueued: int = 0
+    sent: int = 0
+    dropped_queue_full: int = 0
+    dropped_invalid: int = 0
+    dropped_failed: int = 0
+
+
+class AmplitudeEventShipper:
+    def __init__(
+        self,
+        api_key: str,
+        max_queue_size: int = MAX_QUEUE_SIZE,
+        batch_size: int = BATCH_SIZE,
+        flush_interval: float = FLUSH_INTERVAL,
+        max_retries: int = MAX_RETRIES,
+        retry_backoff: float = RETRY_BACKOFF,
+        autostart: bool = True,
+    ):
+        self._api_key = api_key
+        self._max_queue_size = max_queue_size
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._max_retries = max_retries
+        self._retry_backoff = retry_backoff
+        self._autostart = autostart
+
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._stats = ShipperStats()
+        self._lock = threading.Lock()
+        self._worker = None
+        self._worker_pid = None
+
+    def enqueue(self, event_json: str) -> bool:
+        """
+        Queue a JSON serialized event without blocking.
+        Returns False if the event was dropped because the queue is full.
+        """
+        if self._autostart:
+            self._ensure_worker()
+
+        try:
+            self._queue.put_nowait(event_json)
+        except queue.Full:
+            dropped = self._increment("dropped_queue_full")
+            # Log the first drop and then every 1000th, not every event.
+            if dropped % 1000 == 1:
+                logger.warning(
+                    "Amplitude event queue is full, dropped %d events so far",
+                    dropped,
+                )
+            return False
+
+        self._increment("enqueued")
+        return True
+
+    def flush(self):
+        """Ship all currently queued events in the calling thread."""
+        while batch := self._drain(self._batch_size):
+            self._send(batch)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {**asdict(self._stats), "queued": self._queue.qsize()}
+
+    def _ensure_worker(self):
+        pid = os.getpid()
+        if self._worker_pid == pid and self._worker.is_alive():
+            return
+
+        with self._lock:
+            if self._worker_pid == pid and self._worker.is_alive():
+                return
+            if self._worker_pid not in (None, pid):
+                # Forked (e.g. a gunicorn or celery worker): the parent's
+                # events and thread are not ours to ship.
+                self._queue = queue.Queue(maxsize=self._max_queue_size)
+            self._worker = threading.Thread(
+                target=self._run, name="amplitude-shipper", daemon=True
+            )
+            self._worker_pid = pid
+            self._worker.start()
+
+    def _run(self):
+        next_stats_log = time.monotonic() + STATS_LOG_INTERVAL
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self._flush_interval
+            while len(batch) < self._batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                self._send(batch)
+            except Exception:
+                logger.exception("Failed to ship Amplitude events")
+
+            if time.monotonic() >= next_stats_log:
+                logger.info("Amplitude event shipper stats: %s", self.stats())
+                next_stats_log = time.monotonic() + STATS_LOG_INTERVAL
+
+    def _drain(self, limit: int) -> list[str]:
+        batch = []
+        while len(batch) < limit:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _send(self, batch: list[str]) -> bool:
+        # Events are serialized when queued, so the payload is assembled from
+        # the JSON strings instead of encoding the whole batch again.
+        api_key = json.dumps(self._api_key)
+        payload = f'{{"api_key": {api_key}, "events": [{",".join(batch)}]}}'
+        headers = {"Content-Type": "application/json", "Accept": "*/*"}
+
+        for attempt in range(self._max_retries + 1):
+            if attempt:
+                time.sleep(self._retry_backoff * 2 ** (attempt - 1))
+            try:
+                response = requests.post(
+                    AMPLITUDE_BATCH_URL,
+                    data=payload,
+                    headers=headers,
+                    timeout=REQUEST_TIMEOUT,
+                )
+            except requests.RequestException:
+                logger.warning("Failed to reach Amplitude", exc_info=True)
+                continue
+
+            if response.status_code == 200:
+                self._increment("sent", len(batch))
+                return True
+            if response.status_code in REJECTED_STATUS_CODES:
+                return self._resend_rejected(batch, response)
+            if response.status_code not in RETRYABLE_STATUS_CODES:
+                logger.error(
+                    "Amplitude rejected event batch: %s %s",
+                    response.status_code,
+                    response.text,
+                )
+                break
+
+        self._increment("dropped_failed", len(batch))
+        logger.error("Dropped %d Amplitude events after failed delivery", len(batch))
+        return False
+
+    def _resend_rejected(self, batch: list[str], response) -> bool:
+        """
+        Drop the events of a rejected batch that Amplitude reported as invalid
+        and send the rest again, or split the batch if none were reported.
+        """
+        invalid = _invalid_event_indices(response)
+        if invalid:
+            valid = [event for i, event in enumerate(batch) if i not in invalid]
+        elif len(batch) > 1:
+            middle = len(batch) // 2
+            sent_first = self._send(batch[:middle])
+            sent_second = self._send(batch[middle:])
+            return sent_first and sent_second
+        else:
+            valid = []
+
+        dropped = len(batch) - len(valid)
+        self._increment("dropped_invalid", dropped)
+        logger.error(
+            "Amplitude rejected %d events: %s %s",
+            dropped,
+            response.status_code,
+            response.text,
+        )
+        return bool(valid) and self._send(valid)
+
+    def _increment(self, field: str, amount: int = 1) -> int:
+        with self._lock:
+            value = getattr(self._stats, field) + amount
+            setattr(self._stats, field, value)
+            return value
+
+
+def _invalid_event_indices(response) -> set[int]:
+    """Indices of the events a 400 response reports as invalid or incomplete."""
+    try:
+        body = response.json()
+    except ValueError:
+        return set()
+    if not isinstance(body, dict):
+        return set()
+
+    indices = set()
+    for key in ("events_with_invalid_fields", "events_with_missing_fields"):
+        fields = body.get(key)
+        if isinstance(fields, dict):
+            for field_indices in fields.values():
+                indices.update(i for i in field_indices if isinstance(i, int))
+    return indices
+
+
+_shipper = None
+_shipper_lock = threading.Lock()
+
+
+def get_event_shipper() -> AmplitudeEventShipper:
+    """Process wide shipper, events still queued are flushed on exit."""
+    global _shipper
+    if _shipper is None:
+        with _shipper_lock:
+            if _shipper is None:
+                _shipper = AmplitudeEventShipper(settings.AMPLITUDE_API_KEY)
+                atexit.register(_shipper.flush)
+    return _shipper
@@ -1,16 +1,39 @@
 import logging
 from typing import Any
 
-from django.db import transaction
-
-from analytics.constants.event_types import BULK_FEED_IMPRESSION
+from django.db.models import Q
+from django.db.models.functions import TruncDate
+
+from analytics.constants.event_types import (
+    BULK_FEED_IMPRESSION,
+    DOCUMENT_TAB_CLICKED,
+    FEED_ITEM_ABSTRACT_EXPANDED,
+    FEED_ITEM_CLICK,
+    FEED_ITEM_IMPRESSION,
+    PAGE_VIEW,
+)
 from analytics.exceptions import EventProcessingError
 from analytics.interactions.amplitude_event_parser import AmplitudeEventParser
 from analytics.interactions.interaction_mapper import map_from_amplitude_event
 from analytics.models import UserInteractions
+from researchhub_document.related_models.researchhub_unified_document_model import (
+    ResearchhubUnifiedDocument,
+)
+from user.models import User
 
 logger = logging.getLogger(__name__)
 
+BATCH_SIZE = 1000
+
+# Events deduplicated per day, see `unique_daily_repeatable_interactions`.
+DAILY_UNIQUE_EVENTS = {
+    FEED_ITEM_CLICK,
+    PAGE_VIEW,
+    DOCUMENT_TAB_CLICKED,
+    FEED_ITEM_ABSTRACT_EXPANDED,
+    FEED_ITEM_IMPRESSION,
+}
+
 
 class EventProcessor:
     """Processes events from Amplitude."""
@@ -98,75 +121,154 @@ class EventProcessor:
                 f"for user {user_identifier} - {e}"
             ) from e
 
+    def map_event(self, event: dict[str, Any]) -> list[UserInteractions]:
+        """Map an event to the (unsaved) interactions it records."""
+        event_type = event.get("event_type", "unknown").lower()
+
+        if event_type in self.BULK_EVENT_TYPES:
+            event_props = event.get("event_properties", {})
+            user_id = event_props.get("user_id") or event.get("user_id")
+            external_user_id = event.get("amplitude_id") or event_props.get(
+                "amplitude_id"
+            )
+            if not user_id and not external_user_id:
+                raise EventProcessingError(
+                    "No user_id or external_user_id for bulk event"
+                )
+            amplitude_events = self.amplitude_parser.parse_bulk_impression_event(event)
+        else:
+            amplitude_event = self.amplitude_parser.parse_amplitude_event(event)
+            if amplitude_event is None:
+                raise EventProcessingError(f"Could not parse event {event_type}")
+            amplitude_events = [amplitude_event]
+
+        return [map_from_amplitude_event(e) for e in amplitude_events]
+
     def _process_bulk_event(self, event: dict[str, Any]) -> None:
         """Process a bulk event that creates multiple interaction records."""
         event_props = event.get("event_properties", {})
         user_id = event_props.get("user_id") or event.get("user_id")
         external_user_id = event.get("amplitude_id") or event_props.get("amplitude_id")
-
-        if not user_id and not external_user_id:
-            raise EventProcessingError("No user_id or external_user_id for bulk event")
-
-        # Parse the bulk event into individual AmplitudeEvent objects
-        amplitude_events = self.amplitude_parser.parse_bulk_impression_event(event)
-
         user_identifier = self._get_user_identifier(user_id, external_user_id)
 
-        if not amplitude_events:
+        interactions = self.map_event(event)
+        if not interactions:
             return
 
-        created_count = 0
-        failed_count = 0
-
-        for amplitude_event in amplitude_events:
-            try:
-                interaction = map_from_amplitude_event(amplitude_event)
-
-                lookup_kwargs = {
-                    "event": interaction.event,
-                    "unified_document_id": interaction.unified_document_id,
-                    "content_type": interaction.content_type,
-                    "object_id": interaction.object_id,
-                    "event_timestamp__date": interaction.event_timestamp.date(),
-                }
-
-                if interaction.external_user_id:
-                    lookup_kwargs["external_user_id"] = interaction.external_user_id
-                else:
-                    lookup_kwargs["user_id"] = interaction.user_id
-                    lookup_kwargs["external_user_id__isnull"] = True
-
-                # Use savepoint so FK violations don't break the whole batch
-                with transaction.atomic():
-                    _, created = UserInteractions.objects.get_or_create(
-                        **lookup_kwargs,
-                        defaults={
-                            "user_id": interaction.user_id,
-                            "external_user_id": interaction.external_user_id,
-                            "event_timestamp": interaction.event_timestamp,
-                            "is_synced_with_personalize": False,
-                            "personalize_rec_id": interaction.personalize_rec_id,
-                            "impression": interaction.impression,
-                        },
-                    )
-
-                if created:
-                    created_count += 1
-
-            except Exception as e:
-                logger.error(
-                    f"Failed to save impression for user {user_identifier}: {e}"
-                )
-                failed_count += 1
-                continue
-
-        duplicate_count = len(amplitude_events) - created_count - failed_count
+        created_count, failed_count, duplicate_count = self.save_interactions(
+            interactions
+        )
         logger.debug(
             f"Processed bulk event for user {user_identifier}: "
             f"{created_count} created, {failed_count} failed, "
             f"{duplicate_count} duplicates"
         )
 
+    def save_interactions(
+        self, interactions: list[UserInteractions]
+    ) -> tuple[int, int, int]:
+        """
+        Insert interactions that aren't recorded yet, using the same
+        uniqueness rules as the single event lookups.
+
+        Interactions pointing at missing users or documents are dropped up front,
+        so one bad reference doesn't need a savepoint per row.
+
+        Returns (created, failed, duplicate) counts.
+        """
+        document_ids = {i.unified_document_id for i in interactions}
+        user_ids = {i.user_id for i in interactions if i.user_id}
+        existing_document_ids = set(
+            ResearchhubUnifiedDocument.objects.filter(id__in=document_ids).values_list(
+                "id", flat=True
+            )
+        )
+        existing_user_ids = set(
+            User.objects.filter(id__in=user_ids).values_list("id", flat=True)
+        )
+
+        valid = [
+            i
+            for i in interactions
+            if i.unified_document_id in existing_document_ids
+            and (not i.user_id or i.user_id in existing_user_ids)
+        ]
+        failed_count = len(interactions) - len(valid)
+        if failed_count:
+            logger.error(
+                f"Skipped {failed_count} interactions referencing missing "
+                "users or documents"
+            )
+
+        seen = self._get_existing_interaction_keys(valid)
+        new_interactions = []
+        for interaction in valid:
+            key = self._interaction_key(
+                interaction.event,
+                interaction.unified_document_id,
+                interaction.content_type_id,
+                interaction.object_id,
+                interaction.event_timestamp.date(),
+                interaction.user_id,
+                interaction.external_user_id,
+            )
+            if key not in seen:
+                seen.add(key)
+                new_interactions.append(interaction)
+
+        # Conflicts are ignored in case a concurrent task inserted the same row.
+        UserInteractions.objects.bulk_create(
+            new_interactions, batch_size=BATCH_SIZE, ignore_conflicts=True
+        )
+        duplicate_count = len(valid) - len(new_interactions)
+        return len(new_interactions), failed_count, duplicate_count
+
+    def _get_existing_interaction_keys(
+        self, interactions: list[UserInteractions]
+    ) -> set[tuple]:
+        if not interactions:
+            return set()
+
+        user_ids = {i.user_id for i in interactions if not i.external_user_id}
+        external_user_ids = {
+            i.external_user_id for i in interactions if i.external_user_id
+        }
+        rows = (
+            UserInteractions.objects.filter(
+                Q(user_id__in=user_ids, external_user_id__isnull=True)
+                | Q(external_user_id__in=external_user_ids),
+                event__in={i.event for i in interactions},
+                unified_document_id__in={i.unified_document_id for i in interactions},
+            )
+            .annotate(day=TruncDate("event_timestamp"))
+            .values_list(
+                "event",
+                "unified_document_id",
+                "content_type_id",
+                "object_id",
+                "day",
+                "user_id",
+                "external_user_id",
+            )
+        )
+        return {self._interaction_key(*row) for row in rows}
+
+    @staticmethod
+    def _interaction_key(
+        event,
+        unified_document_id,
+        content_type_id,
+        object_id,
+        day,
+        user_id,
+        external_user_id,
+    ) -> tuple:
+        """Key matching the lookup that deduplicates an interaction."""
+        if event not in DAILY_UNIQUE_EVENTS:
+            day = None
+        user_key = external_user_id or ("user", user_id)
+        return (event, unified_document_id, content_type_id, object_id, day, user_key)
+
     @staticmethod
     def _get_user_identifier(user_id: Any, external_user_id: Any) -> str:
         """Get a user identifier string for logging."""
@@ -21,6 +21,35 @@ def process_amplitude_event(event: dict[str, Any]) -> None:
         logger.exception("Failed to process Amplitude event", extra={"event": event})
 
 
+@app.task(queue=QUEUE_EXTERNAL_REPORTING)
+def process_amplitude_events(events: list[dict[str, Any]]) -> None:
+    """
+    Process a batch of Amplitude events, e.g. one webhook payload.
+
+    Events are mapped one by one and saved with one bulk insert per batch.
+    Events that fail to map are logged and skipped.
+    """
+    from analytics.services.event_processor import EventProcessor
+
+    processor = EventProcessor()
+    interactions = []
+    for event in events:
+        try:
+            interactions.extend(processor.map_event(event))
+        except Exception:
+            logger.exception(
+                "Failed to process Amplitude event", extra={"event": event}
+            )
+
+    created_count, failed_count, duplicate_count = processor.save_interactions(
+        interactions
+    )
+    logger.debug(
+        f"Processed {len(events)} events: {created_count} created, "
+        f"{failed_count} failed, {duplicate_count} duplicates"
+    )
+
+
 @app.task(queue=QUEUE_EXTERNAL_REPORTING)
 def track_revenue_event(
     user_id,
@@ -80,6 +80,71 @@ class AmplitudeTests(TestCase):
         self.assertEqual(result, {"code": 200})
         mock_post.assert_called_once()
 
+    @patch("analytics.services.amplitude_shipper.get_event_shipper")
+    @patch("analytics.amplitude.requests.post")
+    def test_build_hit_enqueues_event(self, mock_post, mock_get_shipper):
+        """Test that build_hit queues the event instead of posting it inline."""
+        # Arrange
+        mock_get_shipper.return_value.enqueue.return_value = True
+        amplitude = Amplitude(enabled=True)
+        view = MagicMock(basename="paper", action="upvote")
+        user = User.objects.create(username="hit1", email="hit1@researchhub.com")
+        request = MagicMock(user=user)
+        res = Response({"id": 1})
+
+        # Act
+        result = amplitude.build_hit(res, view, request)
+
+        # Assert
+        self.assertTrue(result)
+        mock_post.assert_not_called()
+        event_json = mock_get_shipper.return_value.enqueue.call_args[0][0]
+        self.assertIn('"event_type": "paper_upvote"', event_json)
+
+    @patch("analytics.services.amplitude_shipper.get_event_shipper")
+    def test_enqueue_event_skipped_when_disabled(self, mock_get_shipper):
+        """Test that disabled clients don't queue events."""
+        # Arrange
+        amplitude = Amplitude(enabled=False)
+
+        # Act
+        result = amplitude.enqueue_event({"event_type": "paper_upvote"})
+
+        # Assert
+        self.assertFalse(result)
+        mock_get_shipper.assert_not_called()
+
+    @patch("analytics.services.amplitude_shipper.get_event_shipper")
+    def test_enqueue_event_pads_user_id(self, mock_get_shipper):
+        """Test that user IDs are padded to Amplitude's minimum length."""
+        # Arrange
+        amplitude = Amplitude(enabled=True)
+
+        # Act
+        amplitude.enqueue_event({"event_type": "paper_upvote", "user_id": 42})
+
+        # Assert
+        event_json = mock_get_shipper.return_value.enqueue.call_args[0][0]
+        self.assertIn('"user_id": "000042"', event_json)
+
+    @patch("analytics.services.amplitude_shipper.get_event_shipper")
+    def test_enqueue_event_drops_events_amplitude_rejects(self, mock_get_shipper):
+        """Test that events without a user or event type are not queued."""
+        # Arrange
+        amplitude = Amplitude(enabled=True)
+        events = [
+            {"event_type": "paper_upvote", "user_id": ""},
+            {"event_type": "paper_upvote"},
+            {"user_id": "000042"},
+        ]
+
+        # Act
+        results = [amplitude.enqueue_event(event) for event in events]
+
+        # Assert
+        self.assertEqual(results, [False, False, False])
+        mock_get_shipper.return_value.enqueue.assert_not_called()
+
 
 class TrackEventDecoratorTests(TestCase):
     def setUp(self):
@@ -0,0 +1,133 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import requests
+from django.test import SimpleTestCase
+
+from analytics.services.amplitude_shipper import (
+    AMPLITUDE_BATCH_URL,
+    AmplitudeEventShipper,
+)
+
+
+def _response(status_code, body=None):
+    return MagicMock(
+        status_code=status_code, text="", json=MagicMock(return_value=body or {})
+    )
+
+
+class AmplitudeEventShipperTests(SimpleTestCase):
+    def _shipper(self, **kwargs):
+        return AmplitudeEventShipper("key1", retry_backoff=0, autostart=False, **kwargs)
+
+    @patch("analytics.services.amplitude_shipper.requests.post")
+    def test_flush_sends_batches(self, mock_post):
+        # Arrange
+        mock_post.return_value = _response(200)
+        shipper = self._shipper(batch_size=2)
+        for i in range(3):
+            shipper.enqueue(json.dumps({"event_type": "test", "insert_id": str(i)}))
+
+        # Act
+        shipper.flush()
+
+        # Assert
+        self.assertEqual(mock_post.call_count, 2)
+        self.assertEqual(mock_post.call_args[0][0], AMPLITUDE_BATCH_URL)
+        payloads = [json.loads(c.kwargs["data"]) for c in mock_post.call_args_list]
+        self.assertEqual(payloads[0]["api_key"], "key1")
+        self.assertEqual(
+            [[e["insert_id"] for e in p["events"]] for p in payloads],
+            [["0", "1"], ["2"]],
+        )
+        self.assertEqual(shipper.stats()["sent"], 3)
+        self.assertEqual(shipper.stats()["queued"], 0)
+
+    def test_enqueue_drops_when_queue_is_full(self):
+        # Arrange
+        shipper = self._shipper(max_queue_size=2)
+
+        # Act
+        results = [shipper.enqueue("{}") for _ in range(3)]
+
+        # Assert
+        self.assertEqual(results, [True, True, False])
+        stats = shipper.stats()
+        self.assertEqual(stats["enqueued"], 2)
+        self.assertEqual(stats["dropped_queue_full"], 1)
+        self.assertEqual(stats["queued"], 2)
+
+    @patch("analytics.services.amplitude_shipper.requests.post")
+    def test_retries_rate_limited_batches(self, mock_post):
+        # Arrange
+        mock_post.side_effect = [
+            _response(429),
+            requests.ConnectionError(),
+            _response(200),
+        ]
+        shipper = self._shipper()
+        shipper.enqueue("{}")
+
+        # Act
+        shipper.flush()
+
+        # Assert
+        self.assertEqual(mock_post.call_count, 3)
+        self.assertEqual(shipper.stats()["sent"], 1)
+
+    @patch("analytics.services.amplitude_shipper.requests.post")
+    def test_drops_only_invalid_events_of_rejected_batches(self, mock_post):
+        # Arrange
+        mock_post.side_effect = [
+            _response(400, {"events_with_invalid_fields": {"time": [1]}}),
+            _response(200),
+        ]
+        shipper = self._shipper()
+        for i in range(3):
+            shipper.enqueue(json.dumps({"insert_id": str(i)}))
+
+        # Act
+        shipper.flush()
+
+        # Assert
+        resent = json.loads(mock_post.call_args.kwargs["data"])["events"]
+        self.assertEqual([e["insert_id"] for e in resent], ["0", "2"])
+        stats = shipper.stats()
+        self.assertEqual(stats["sent"], 2)
+        self.assertEqual(stats["dropped_invalid"], 1)
+
+    @patch("analytics.services.amplitude_shipper.requests.post")
+    def test_splits_rejected_batches_without_details(self, mock_post):
+        # Arrange
+        def post(url, data, **kwargs):
+            events = json.loads(data)["events"]
+            rejected = any(e["insert_id"] == "bad" for e in events)
+            return _response(400 if rejected else 200)
+
+        mock_post.side_effect = post
+        shipper = self._shipper()
+        for insert_id in ["0", "1", "bad", "3"]:
+            shipper.enqueue(json.dumps({"insert_id": insert_id}))
+
+        # Act
+        shipper.flush()
+
+        # Assert
+        stats = shipper.stats()
+        self.assertEqual(stats["sent"], 3)
+        self.assertEqual(stats["dropped_invalid"], 1)
+        self.assertEqual(stats["dropped_failed"], 0)
+
+    @patch("analytics.services.amplitude_shipper.requests.post")
+    def test_drops_batches_after_max_retries(self, mock_post):
+        # Arrange
+        mock_post.return_value = _response(503)
+        shipper = self._shipper(max_retries=2)
+        shipper.enqueue("{}")
+
+        # Act
+        shipper.flush()
+
+        # Assert
+        self.assertEqual(mock_post.call_count, 3)
+        self.assertEqual(shipper.stats()["dropped_failed"], 1)
@@ -42,9 +42,9 @@ class AmplitudeWebhookTestCase(TestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn("Invalid JSON", response.data["message"])
 
-    @patch("analytics.views.amplitude_webhook_view.process_amplitude_event")
+    @patch("analytics.views.amplitude_webhook_view.process_amplitude_events")
     def test_webhook_queues_events(self, mock_task):
-        """Test that the webhook queues multiple events for async processing."""
+        """Test that the webhook queues the events as one task."""
         event1 = {
             "event_type": "feed_item_clicked",
             "event_properties": {
@@ -77,6 +77,4 @@ class AmplitudeWebhookTestCase(TestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["queued"], 2)
-        self.assertEqual(mock_task.delay.call_count, 2)
-        mock_task.delay.assert_any_call(event1)
-        mock_task.delay.assert_any_call(event2)
+        mock_task.delay.assert_called_once_with([event1, event2])
@@ -1,10 +1,13 @@
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
+from analytics.constants.event_types import FEED_ITEM_CLICK, FEED_ITEM_IMPRESSION
 from analytics.models import UserInteractions
-from analytics.tasks import process_amplitude_event
+from analytics.tasks import process_amplitude_event, process_amplitude_events
 from researchhub_document.helpers import create_post
 from user.tests.helpers import create_random_default_user
 
@@ -56,3 +59,104 @@ class ProcessAmplitudeEventTaskTestCase(TestCase):
         self.assertEqual(interaction.user, user)
         self.assertEqual(interaction.event, "FEED_ITEM_CLICK")
         self.assertEqual(interaction.unified_document, post.unified_document)
+
+
+class ProcessAmplitudeEventsTaskTestCase(TestCase):
+    """Test cases for the process_amplitude_events Celery task."""
+
+    def setUp(self):
+        self.user = create_random_default_user("test_user")
+        self.post = create_post(created_by=self.user)
+
+    def _click_event(self, post, **event_properties):
+        return {
+            "event_type": "feed_item_clicked",
+            "event_properties": {
+                "user_id": str(self.user.id),
+                "related_work": {
+                    "unified_document_id": str(post.unified_document.id),
+                    "content_type": "researchhubpost",
+                    "id": str(post.id),
+                },
+                **event_properties,
+            },
+            "time": int(datetime.now().timestamp() * 1000),
+        }
+
+    def test_task_saves_batch_and_deduplicates(self):
+        """Test a batch of events is saved once per unique interaction."""
+        post2 = create_post(created_by=self.user)
+        process_amplitude_events([self._click_event(self.post)])
+        events = [
+            self._click_event(self.post),  # already recorded
+            self._click_event(post2),
+            self._click_event(post2),  # duplicate within the batch
+            {
+                "user_id": str(self.user.id),
+                "time": int(datetime.now().timestamp() * 1000),
+                "event_type": "bulk_feed_impression",
+                "event_properties": {
+                    "impressions": [
+                        {"unifiedDocumentId": str(self.post.unified_document.id)},
+                        {"unifiedDocumentId": str(post2.unified_document.id)},
+                        {"unifiedDocumentId": str(post2.unified_document.id)},
+                    ],
+                },
+            },
+        ]
+
+        process_amplitude_events(events)
+
+        self.assertEqual(
+            UserInteractions.objects.filter(event=FEED_ITEM_CLICK).count(), 2
+        )
+        self.assertEqual(
+            UserInteractions.objects.filter(event=FEED_ITEM_IMPRESSION).count(), 2
+        )
+
+    def test_task_skips_invalid_events_and_missing_documents(self):
+        """Test bad events don't prevent the rest of the batch from saving."""
+        missing_document_event = {
+            "user_id": str(self.user.id),
+            "time": int(datetime.now().timestamp() * 1000),
+            "event_type": "bulk_feed_impression",
+            "event_properties": {
+                "impressions": [
+                    {"unifiedDocumentId": str(self.post.unified_document.id + 1000)},
+                ],
+            },
+        }
+        events = [
+            {"event_type": "unknown_event", "event_properties": {}},
+            missing_document_event,
+            self._click_event(self.post),
+        ]
+
+        process_amplitude_events(events)
+
+        self.assertEqual(UserInteractions.objects.count(), 1)
+        self.assertEqual(UserInteractions.objects.get().event, FEED_ITEM_CLICK)
+
+    def test_task_query_count_does_not_grow_with_batch(self):
+        """Test the batch is saved with a fixed number of queries."""
+        posts = [create_post(created_by=self.user) for _ in range(6)]
+        process_amplitude_events([self._click_event(posts[0])])
+
+        def count_queries(batch):
+            with CaptureQueriesContext(connection) as context:
+                process_amplitude_events([self._click_event(post) for post in batch])
+            return len(context.captured_queries)
+
+        self.assertEqual(count_queries(posts[1:2]), count_queries(posts[2:]))
+        self.assertEqual(UserInteractions.objects.count(), 6)
+
+    def test_task_logs_unexpected_errors_and_saves_the_rest(self):
+        """Test an unexpected error in one event doesn't drop the batch."""
+        malformed_event = {"event_type": "bulk_feed_impression", "event_properties": []}
+
+        with self.assertLogs("analytics.tasks", "ERROR") as logs:
+            process_amplitude_events([malformed_event, self._click_event(self.post)])
+
+        self.assertEqual(len(logs.records), 1)
+        self.assertEqual(logs.records[0].event, malformed_event)
+        self.assertEqual(UserInteractions.objects.get().event, FEED_ITEM_CLICK)
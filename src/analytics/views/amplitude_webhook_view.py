@@ -7,7 +7,7 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from analytics.tasks import process_amplitude_event
+from analytics.tasks import process_amplitude_events
 
 logger = logging.getLogger(__name__)
 
@@ -56,9 +56,8 @@ class AmplitudeWebhookView(APIView):
                     )
                 events = [payload]
 
-            # Queue all events for async processing
-            for event in events:
-                process_amplitude_event.delay(event)
+            # Queue the whole payload as one task, so it's saved in bulk
+            process_amplitude_events.delay(events)
 
             logger.info(f"Amplitude webhook queued {len(events)} events for processing")
 
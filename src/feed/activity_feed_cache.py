@@ -1,7 +1,8 @@
 """Activity-feed cache helpers.
 
 Warm/replace model: Celery refreshes pages 1-20 every 5 minutes via ``cache.set``.
-No delete-based invalidation.
+No delete-based invalidation. Pages are stored through ``feed.page_cache``, so a
+page whose warm run is late is served stale while one request rebuilds it.
 """
 
 from __future__ import annotations
@@ -0,0 +1,158 @@
+"""
+Materialized hot score (v2) rankings for the popular and following feeds.
+
+Serving the following feed from the database joins `unified_document__hubs` for
+every followed hub and sorts the result by `hot_score_v2`, which gets slower the
+more hubs a user follows. Instead, the hot score refresh tasks rebuild:
+
+- one ranked id list per hub, holding the hub's top `FEED_RANKING_SIZE` entries
+- one global ranked id list over all hubs
+
+Each list holds `(hot_score_v2, entry_id)` pairs in descending order and only
+contains entries that pass the global feed filters (papers from allowed preprint
+hubs whose PDF may be displayed) and have a positive hot score. Feed requests
+merge the lists of the requested hubs in memory and fetch the resulting entries
+by primary key.
+
+Lists are versioned: a rebuild writes all lists under a new version and then
+switches `FEED_RANKINGS_VERSION_CACHE_KEY` to it, so readers never see a mix of
+two rebuilds.
+
+Zero-score entries are not ranked, so a list can be shorter than the hub's feed.
+Requests are served from the database instead when the page reaches past the end
+of the merged lists, or when a requested hub has no list under the current
+version (no scored entries, or its key was evicted).
+"""
+
+import heapq
+import logging
+import time
+from collections import defaultdict
+from itertools import islice
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+
+from feed.models import FeedEntry
+from paper.related_models.paper_model import Paper
+from researchhub_document.related_models.researchhub_unified_document_model import (
+    ResearchhubUnifiedDocument,
+)
+
+logger = logging.getLogger(__name__)
+
+# Number of entries kept per ranked list. Requests paging past this depth are
+# served from the database.
+FEED_RANKING_SIZE = 1000
+# Lists outlive a few missed refreshes; a missing version disables rankings.
+FEED_RANKINGS_CACHE_TIMEOUT = 60 * 60 * 2
+FEED_RANKINGS_VERSION_CACHE_KEY = "feed:rankings:version"
+
+GLOBAL_RANKING = "all"
+
+
+def feed_ranking_cache_key(version: int, hub_id: int | str) -> str:
+    return f"feed:rankings:v{version}:hub-{hub_id}"
+
+
+def rebuild_feed_rankings(size=FEED_RANKING_SIZE) -> dict:
+    """
+    Recompute the global and per-hub ranked id lists from `hot_score_v2`.
+    """
+    from feed.filtering import _get_allowed_preprint_hub_ids
+
+    start_time = time.time()
+
+    # Entries without a score (never scored, or nothing to score them on) are
+    # left out, so the window function only partitions scored entries instead
+    # of the whole feed history.
+    queryset = FeedEntry.objects.filter(
+        content_type=ContentType.objects.get_for_model(Paper),
+        unified_document__in=ResearchhubUnifiedDocument.objects.filter(
+            hubs__id__in=_get_allowed_preprint_hub_ids()
+        ),
+        hot_score_v2__gt=0,
+    ).exclude(pdf_copyright_allows_display=False)
+
+    global_ranking = list(
+        queryset.order_by("-hot_score_v2", "-id").values_list("hot_score_v2", "id")[
+            :size
+        ]
+    )
+
+    # Top `size` entries of every hub in a single windowed query
+    hub_rows = (
+        queryset.annotate(
+            ranked_hub_id=F("unified_document__hubs__id"),
+            rank=Window(
+                expression=RowNumber(),
+                partition_by=F("unified_document__hubs__id"),
+                order_by=[F("hot_score_v2").desc(), F("id").desc()],
+            ),
+        )
+        .filter(rank__lte=size)
+        .order_by("ranked_hub_id", "rank")
+        .values_list("ranked_hub_id", "hot_score_v2", "id")
+    )
+
+    hub_rankings = defaultdict(list)
+    for hub_id, hot_score_v2, entry_id in hub_rows.iterator(chunk_size=5000):
+        hub_rankings[hub_id].append((hot_score_v2, entry_id))
+
+    version = time.time_ns()
+    rankings = {feed_ranking_cache_key(version, GLOBAL_RANKING): global_ranking}
+    for hub_id, ranking in hub_rankings.items():
+        rankings[feed_ranking_cache_key(version, hub_id)] = ranking
+
+    cache.set_many(rankings, timeout=FEED_RANKINGS_CACHE_TIMEOUT)
+    cache.set(
+        FEED_RANKINGS_VERSION_CACHE_KEY, version, timeout=FEED_RANKINGS_CACHE_TIMEOUT
+    )
+
+    duration = time.time() - start_time
+    logger.info(
+        f"Rebuilt feed rankings in {duration:.2f}s: "
+        f"hubs={len(hub_rankings)}, global={len(global_ranking)}"
+    )
+
+    return {
+        "hubs": len(hub_rankings),
+        "global": len(global_ranking),
+        "duration": duration,
+    }
+
+
+def get_ranked_entry_ids(hub_ids=None, limit=FEED_RANKING_SIZE) -> list[int] | None:
+    """
+    Return the ids of the top-ranked entries across `hub_ids`, best first.
+
+    Uses the global ranking when `hub_ids` is None. Returns None when no
+    rankings have been built or any requested hub has no list, so callers can
+    fall back to the database.
+    """
+    version = cache.get(FEED_RANKINGS_VERSION_CACHE_KEY)
+    if version is None:
+        return None
+
+    if hub_ids is None:
+        hub_ids = [GLOBAL_RANKING]
+
+    keys = [feed_ranking_cache_key(version, hub_id) for hub_id in set(hub_ids)]
+    rankings = cache.get_many(keys)
+    if len(rankings) < len(keys):
+        return None
+
+    # Entries in several hubs appear in each of their lists
+    merged = heapq.merge(*rankings.values(), reverse=True)
+    unique_ids = _unique(entry_id for _, entry_id in merged)
+    return list(islice(unique_ids, limit))
+
+
+def _unique(values):
+    seen = set()
+    for value in values:
+        if value not in seen:
+            seen.add(value)
+            yield value
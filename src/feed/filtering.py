@@ -4,7 +4,9 @@ from django.core.cache import cache
 from rest_framework.filters import BaseFilterBackend
 
 from feed.feed_config import FEED_CONFIG
+from feed.feed_rankings import FEED_RANKING_SIZE, get_ranked_entry_ids
 from feed.models import FeedEntry
+from feed.views.common import is_cursor_request
 from feed.views.feed_view_mixin import get_moderator_view_as_user_id
 from hub.models import Hub
 from personalize.config.settings import PERSONALIZE_CONFIG
@@ -41,12 +43,17 @@ class FeedFilteringBackend(BaseFilterBackend):
         # Exclude entries that don't allow PDF display
         queryset = queryset.exclude(pdf_copyright_allows_display=False)
 
+        feed_view = request.query_params.get("feed_view", "popular")
+
+        # Precomputed rankings already apply the global filters below
+        ranked_queryset = self._filter_by_rankings(request, queryset, view, feed_view)
+        if ranked_queryset is not None:
+            return ranked_queryset
+
         # Global filter: Only show papers from allowed preprint sources
         # This applies to all feed views (papers must be from biorxiv, arxiv, etc.)
         queryset = self._filter_by_allowed_preprint_hubs(queryset, view)
 
-        feed_view = request.query_params.get("feed_view", "popular")
-
         if feed_view == "following":
             return self._filter_following(request, queryset, view)
         elif feed_view == "personalized":
@@ -56,6 +63,62 @@ class FeedFilteringBackend(BaseFilterBackend):
         else:
             return self._filter_popular(request, queryset, view)
 
+    def _filter_by_rankings(self, request, queryset, view, feed_view):
+        """
+        Restrict the queryset to the precomputed hot_score_v2 rankings.
+
+        Returns None when the request must be served from the database: rankings
+        are not built yet or miss a requested hub, the ordering is not
+        hot_score_v2, or the requested page lies deeper than the rankings.
+        """
+        if feed_view not in ("following", "popular"):
+            return None
+
+        ordering = request.query_params.get("ordering")
+        allowed_sorts = FEED_CONFIG[feed_view]["allowed_sorts"]
+        effective_ordering = ordering if ordering in allowed_sorts else allowed_sorts[0]
+        if effective_ordering != "hot_score_v2":
+            return None
+
+        if is_cursor_request(request):
+            return None
+        try:
+            page = int(request.query_params.get("page", "1"))
+        except ValueError:
+            return None
+        page_end = page * view.paginator.get_page_size(request)
+        if page_end > FEED_RANKING_SIZE:
+            return None
+
+        if feed_view == "following":
+            if not request.user.is_authenticated:
+                return None
+            hub_ids = view.get_followed_hub_ids()
+            if not hub_ids:
+                return None
+        else:
+            hub_ids = None
+            hub_slug = request.query_params.get("hub_slug")
+            if hub_slug:
+                hub_id = (
+                    Hub.objects.filter(slug=hub_slug)
+                    .values_list("id", flat=True)
+                    .first()
+                )
+                if hub_id is None:
+                    return None
+                hub_ids = [hub_id]
+
+        ranked_ids = get_ranked_entry_ids(hub_ids)
+        # Zero-score entries are not ranked; a short list means the rest of the
+        # feed has to come from the database.
+        if ranked_ids is None or len(ranked_ids) < page_end:
+            return None
+
+        if feed_view == "popular":
+            view._feed_source = "rh-popular"
+        return queryset.filter(id__in=ranked_ids)
+
     def _filter_latest(self, request, queryset, view):
         hub_slug = request.query_params.get("hub_slug")
         if hub_slug:
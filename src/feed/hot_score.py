@@ -39,8 +39,11 @@ import logging
 import math
 
 from django.contrib.contenttypes.models import ContentType
+from django.db.models import Case, F, FloatField, IntegerField, Value, When
+from django.db.models.functions import Cast, Extract, Floor, Greatest, Ln, Power
 
 from feed.hot_score_utils import (
+    CommentTotals,
     get_age_hours_from_content,
     get_bounties_from_content,
     get_comment_count_from_metrics,
@@ -49,6 +52,7 @@ from feed.hot_score_utils import (
     get_social_media_engagement_from_metrics,
     get_tips_from_content,
     get_upvotes_rolled_up,
+    has_time_sensitive_signals,
 )
 from paper.related_models.paper_model import Paper
 from researchhub_document.related_models.researchhub_post_model import ResearchhubPost
@@ -150,30 +154,34 @@ def get_total_bounty_amount(feed_entry):
     return get_bounties_from_content(feed_entry.content, feed_entry, urgency_hours)
 
 
-def get_total_tip_amount(feed_entry):
+def get_total_tip_amount(feed_entry, comment_totals: CommentTotals | None = None):
     """
     Sum all tips/boosts from FeedEntry content JSON and optionally comments.
 
     Args:
         feed_entry: FeedEntry instance
+        comment_totals: Optional pre-aggregated comment sums for the document
 
     Returns:
         float: Total tip amount
     """
-    return get_tips_from_content(feed_entry.content, feed_entry)
+    comment_tip_sum = comment_totals.tips if comment_totals is not None else None
+    return get_tips_from_content(feed_entry.content, feed_entry, comment_tip_sum)
 
 
-def get_total_upvotes(feed_entry):
+def get_total_upvotes(feed_entry, comment_totals: CommentTotals | None = None):
     """
     Calculate total upvotes: document upvotes + rolled-up comment upvotes.
 
     Args:
         feed_entry: FeedEntry instance
+        comment_totals: Optional pre-aggregated comment sums for the document
 
     Returns:
         int: Total upvote count
     """
-    return get_upvotes_rolled_up(feed_entry.metrics, feed_entry)
+    comment_upvote_sum = comment_totals.upvotes if comment_totals is not None else None
+    return get_upvotes_rolled_up(feed_entry.metrics, feed_entry, comment_upvote_sum)
 
 
 def get_peer_review_count(feed_entry):
@@ -270,7 +278,12 @@ def calculate_hot_score_for_item(feed_entry):
         return 0
 
 
-def calculate_hot_score(feed_entry, content_type_name, return_components=False):
+def calculate_hot_score(
+    feed_entry,
+    content_type_name,
+    return_components=False,
+    comment_totals: CommentTotals | None = None,
+):
     """
     Calculate hot score using HN-style algorithm with prioritized signals.
 
@@ -302,6 +315,9 @@ def calculate_hot_score(feed_entry, content_type_name, return_components=False):
         feed_entry: The feed entry object
         content_type_name: ContentType instance
         return_components: If True, return dict with score and all components
+        comment_totals: Pre-aggregated comment upvote/tip sums for the entry's
+            unified document. Batch callers pass these to avoid per-entry
+            queries; when omitted they are queried lazily.
 
     Returns:
         int: Calculated hot score (if return_components=False)
@@ -316,13 +332,13 @@ def calculate_hot_score(feed_entry, content_type_name, return_components=False):
         bounty_amount, has_urgent_bounty = get_total_bounty_amount(feed_entry)
 
         # Tips/Boosts
-        tip_amount = get_total_tip_amount(feed_entry)
+        tip_amount = get_total_tip_amount(feed_entry, comment_totals)
 
         # Peer reviews
         peer_review_count = get_peer_review_count(feed_entry)
 
         # Upvotes (document + comments rolled up)
-        upvote_count = get_total_upvotes(feed_entry)
+        upvote_count = get_total_upvotes(feed_entry, comment_totals)
 
         # Comments (excluding peer reviews)
         comment_count = get_comment_count(feed_entry)
@@ -389,16 +405,18 @@ def calculate_hot_score(feed_entry, content_type_name, return_components=False):
             * social_cfg["weight"]
         )
 
-        # Sum all components
-        engagement_score = (
+        # Sum all components. The non-recency components only change when
+        # engagement signals change, so they are summed separately and can be
+        # persisted for the decay-only refresh (see hot_score_decay_expression).
+        time_invariant_engagement = (
             bounty_component
             + tip_component
             + peer_review_component
             + comment_component
-            + recency_component
             + upvote_component
             + social_media_engagement_component
         )
+        engagement_score = time_invariant_engagement + recency_component
 
         # ====================================================================
         # 3. Apply time decay
@@ -454,6 +472,7 @@ def calculate_hot_score(feed_entry, content_type_name, return_components=False):
                     "gravity": gravity,
                 },
                 "engagement_score": engagement_score,
+                "time_invariant_engagement": time_invariant_engagement,
                 "time_denominator": denominator,
                 "raw_score": hot_score,
             }
@@ -465,3 +484,84 @@ def calculate_hot_score(feed_entry, content_type_name, return_components=False):
         if return_components:
             return None
         return 0
+
+
+# ============================================================================
+# Decay-only Refresh
+# ============================================================================
+
+
+def get_time_invariant_engagement(feed_entry, calc_data):
+    """
+    Return the engagement sum that only changes when signals change.
+
+    Entries with time-sensitive signals (open bounties, upcoming grant or
+    fundraise deadlines) return None: their engagement or age can change with
+    the clock alone, so they always need a full recalculation.
+
+    Args:
+        feed_entry: FeedEntry instance
+        calc_data: Dict returned from calculate_hot_score(return_components=True)
+
+    Returns:
+        float | None: Engagement score without the recency component
+    """
+    if not calc_data or has_time_sensitive_signals(feed_entry.content):
+        return None
+    return calc_data["time_invariant_engagement"]
+
+
+def hot_score_age_hours_expression(now):
+    """
+    Build a database expression for a feed entry's age in hours at `now`, as
+    used by `hot_score_decay_expression`.
+    """
+    # Entries with a future action_date fall back to created_date
+    reference_date = Case(
+        When(action_date__gt=now, then=F("created_date")),
+        default=F("action_date"),
+    )
+    age = Extract(Value(now) - reference_date, "epoch")
+    return Greatest(
+        Cast(age, FloatField()) / Value(3600.0),
+        Value(0.0),
+        output_field=FloatField(),
+    )
+
+
+def hot_score_decay_expression(now):
+    """
+    Build a database expression that recomputes hot_score_v2 from the stored
+    `hot_score_v2_engagement` and the entry's age at `now`.
+
+    Mirrors the recency and time decay steps of `calculate_hot_score` so a
+    whole window can be re-ranked with a single UPDATE.
+
+    Args:
+        now: Reference datetime for the age calculation
+
+    Returns:
+        Expression evaluating to the integer hot score
+    """
+    recency_config = HOT_SCORE_CONFIG["signals"]["recency"]
+    decay_config = HOT_SCORE_CONFIG["time_decay"]
+
+    age_hours = hot_score_age_hours_expression(now)
+    recency_value = Value(24.0) / (age_hours + Value(24.0))
+    recency_component = (
+        Ln(recency_value + Value(1.0))
+        / Value(math.log(recency_config["log_base"]))
+        * Value(recency_config["weight"])
+    )
+    engagement_score = F("hot_score_v2_engagement") + recency_component
+
+    denominator = Power(
+        age_hours + Value(float(decay_config["base_hours"])),
+        Value(decay_config["gravity"]),
+    )
+    scaled_score = engagement_score / denominator * Value(100.0)
+
+    return Cast(
+        Greatest(Floor(scaled_score), Value(0.0), output_field=FloatField()),
+        output_field=IntegerField(),
+    )
@@ -0,0 +1,423 @@
+"""
+Batched hot score (v2) recomputation.
+
+The per-entry path (`FeedEntry.calculate_hot_score_v2`) resolves the
+GenericForeignKey, lazily queries comment upvote/tip sums through the unified
+document and upserts one `HotScoreV2Breakdown` row at a time. This module scores
+whole batches of feed entries instead:
+
+1. Entries are read with keyset pagination on `id`, loading only the columns
+   the hot score reads (`content`, `metrics`, `action_date`, ...).
+2. Item existence and comment upvote/tip sums are resolved with a constant
+   number of set-based queries per batch.
+3. Scores are computed with `calculate_hot_score`, so results stay identical
+   to the per-entry path.
+4. Scores and breakdowns are written back with bulk statements.
+
+`refresh_decayed_hot_scores` is the cheaper decay-only variant: it re-ranks
+entries from their stored time-invariant engagement with one UPDATE and only
+fully rescores entries that have time-sensitive signals. The recency and time
+decay fields of the decayed entries' breakdowns are updated to match.
+"""
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import DecimalField, F, IntegerField, Min, Sum
+from django.db.models.fields.json import KT
+from django.db.models.functions import Cast
+from django.utils import timezone
+
+from feed.hot_score import (
+    calculate_hot_score,
+    get_time_invariant_engagement,
+    hot_score_age_hours_expression,
+    hot_score_decay_expression,
+)
+from feed.hot_score_breakdown import (
+    apply_time_decay_to_breakdown,
+    format_breakdown_from_calc_data,
+)
+from feed.hot_score_utils import CommentTotals, has_comments
+from feed.models import FeedEntry, HotScoreV2Breakdown
+from paper.related_models.paper_model import Paper
+from purchase.related_models.purchase_model import Purchase
+from researchhub_comment.related_models.rh_comment_model import RhCommentModel
+from researchhub_comment.related_models.rh_comment_thread_model import (
+    RhCommentThreadModel,
+)
+from researchhub_document.related_models.constants.document_type import (
+    BOUNTY,
+    DISCUSSION,
+    GRANT,
+    PAPER,
+    PREREGISTRATION,
+    QUESTION,
+    REGISTERED_REPORT,
+)
+from researchhub_document.related_models.researchhub_post_model import ResearchhubPost
+from researchhub_document.related_models.researchhub_unified_document_model import (
+    ResearchhubUnifiedDocument,
+)
+
+logger = logging.getLogger(__name__)
+
+# Columns read by the hot score calculation
+HOT_SCORE_FIELDS = (
+    "id",
+    "content_type_id",
+    "object_id",
+    "content",
+    "metrics",
+    "action_date",
+    "created_date",
+    "unified_document_id",
+)
+
+# Document types whose `get_document()` resolves to the first post
+POST_DOCUMENT_TYPES = (
+    BOUNTY,
+    DISCUSSION,
+    GRANT,
+    QUESTION,
+    REGISTERED_REPORT,
+    PREREGISTRATION,
+)
+
+
+@dataclass
+class HotScoreBatchResult:
+    """Outcome of scoring one batch of feed entries."""
+
+    scored: list[FeedEntry] = field(default_factory=list)
+    breakdowns: list[HotScoreV2Breakdown] = field(default_factory=list)
+    stale_breakdown_entry_ids: list[int] = field(default_factory=list)
+    missing_item_count: int = 0
+    errors: int = 0
+
+
+def iter_feed_entry_batches(queryset, batch_size=1000):
+    """
+    Yield lists of feed entries using keyset pagination on `id`.
+
+    Unlike OFFSET slicing, every batch is an index range scan regardless of how
+    deep into the queryset it is, and rows inserted mid-run do not shift pages.
+    """
+    queryset = (
+        queryset.select_related(None)
+        .prefetch_related(None)
+        .only(*HOT_SCORE_FIELDS)
+        .order_by("id")
+    )
+
+    last_id = 0
+    while True:
+        batch = list(queryset.filter(id__gt=last_id)[:batch_size])
+        if not batch:
+            return
+        yield batch
+        last_id = batch[-1].id
+
+
+def get_existing_item_keys(entries) -> set[tuple[int, int]]:
+    """
+    Return `(content_type_id, object_id)` pairs whose item still exists.
+
+    Issues one query per content type instead of resolving each entry's
+    GenericForeignKey.
+    """
+    object_ids_by_ct = defaultdict(set)
+    for entry in entries:
+        object_ids_by_ct[entry.content_type_id].add(entry.object_id)
+
+    existing = set()
+    for content_type_id, object_ids in object_ids_by_ct.items():
+        model = ContentType.objects.get_for_id(content_type_id).model_class()
+        if model is None:
+            continue
+        found = model._base_manager.filter(pk__in=object_ids).values_list(
+            "pk", flat=True
+        )
+        existing.update((content_type_id, object_id) for object_id in found)
+
+    return existing
+
+
+def get_comment_totals(unified_document_ids) -> dict[int, CommentTotals]:
+    """
+    Aggregate comment upvotes and tips for many unified documents at once.
+
+    Mirrors `ResearchhubUnifiedDocument.get_comment_upvote_sum` and
+    `get_comment_tip_sum`: comments are resolved through the document returned
+    by `get_document()` (the paper, or the first post). Document types that are
+    not papers or posts fall back to the per-document methods.
+    """
+    unified_document_ids = set(unified_document_ids)
+    if not unified_document_ids:
+        return {}
+
+    document_types = dict(
+        ResearchhubUnifiedDocument.objects.filter(
+            id__in=unified_document_ids
+        ).values_list("id", "document_type")
+    )
+
+    paper_doc_ids = [
+        doc_id for doc_id, doc_type in document_types.items() if doc_type == PAPER
+    ]
+    post_doc_ids = [
+        doc_id
+        for doc_id, doc_type in document_types.items()
+        if doc_type in POST_DOCUMENT_TYPES
+    ]
+    other_doc_ids = set(document_types) - set(paper_doc_ids) - set(post_doc_ids)
+
+    # Map (content_type_id, object_id) of the underlying document to its doc id
+    doc_id_by_item = {}
+    paper_ct = ContentType.objects.get_for_model(Paper)
+    for paper_id, doc_id in Paper._base_manager.filter(
+        unified_document_id__in=paper_doc_ids
+    ).values_list("id", "unified_document_id"):
+        doc_id_by_item[(paper_ct.id, paper_id)] = doc_id
+
+    post_ct = ContentType.objects.get_for_model(ResearchhubPost)
+    first_posts = (
+        ResearchhubPost.objects.filter(unified_document_id__in=post_doc_ids)
+        .values("unified_document_id")
+        .annotate(first_id=Min("id"))
+        .values_list("first_id", "unified_document_id")
+    )
+    for post_id, doc_id in first_posts:
+        doc_id_by_item[(post_ct.id, post_id)] = doc_id
+
+    totals = {}
+    if doc_id_by_item:
+        totals = _aggregate_comment_totals(doc_id_by_item)
+
+    for unified_document in ResearchhubUnifiedDocument.objects.filter(
+        id__in=other_doc_ids
+    ):
+        totals[unified_document.id] = CommentTotals(
+            upvotes=unified_document.get_comment_upvote_sum(),
+            tips=unified_document.get_comment_tip_sum(),
+        )
+
+    return {doc_id: totals.get(doc_id, CommentTotals()) for doc_id in document_types}
+
+
+def _aggregate_comment_totals(doc_id_by_item):
+    object_ids_by_ct = defaultdict(list)
+    for content_type_id, object_id in doc_id_by_item:
+        object_ids_by_ct[content_type_id].append(object_id)
+
+    doc_id_by_thread = {}
+    for content_type_id, object_ids in object_ids_by_ct.items():
+        threads = RhCommentThreadModel.objects.filter(
+            content_type_id=content_type_id, object_id__in=object_ids
+        ).values_list("id", "object_id")
+        for thread_id, object_id in threads:
+            doc_id_by_thread[thread_id] = doc_id_by_item[(content_type_id, object_id)]
+
+    if not doc_id_by_thread:
+        return {}
+
+    upvotes = defaultdict(int)
+    for thread_id, score in (
+        RhCommentModel.objects.filter(thread_id__in=doc_id_by_thread)
+        .values("thread_id")
+        .annotate(total_score=Sum("score"))
+        .values_list("thread_id", "total_score")
+    ):
+        upvotes[doc_id_by_thread[thread_id]] += score or 0
+
+    # Summed as Decimal so the final float matches a single SQL SUM
+    tips = defaultdict(Decimal)
+    for thread_id, amount in (
+        RhCommentModel.objects.filter(
+            thread_id__in=doc_id_by_thread,
+            purchases__purchase_type=Purchase.BOOST,
+            purchases__paid_status=Purchase.PAID,
+        )
+        .values("thread_id")
+        .annotate(
+            total=Sum(
+                Cast(
+                    "purchases__amount",
+                    DecimalField(max_digits=19, decimal_places=10),
+                )
+            )
+        )
+        .values_list("thread_id", "total")
+    ):
+        tips[doc_id_by_thread[thread_id]] += amount or Decimal(0)
+
+    return {
+        doc_id: CommentTotals(
+            upvotes=upvotes.get(doc_id, 0),
+            tips=float(tips[doc_id]) if tips.get(doc_id) else 0,
+        )
+        for doc_id in set(upvotes) | set(tips)
+    }
+
+
+def score_feed_entries(entries) -> HotScoreBatchResult:
+    """
+    Compute hot_score_v2 and breakdowns for a batch of feed entries in memory.
+
+    Entries whose item no longer exists are skipped (their score is left
+    untouched), matching `refresh_feed_hot_scores_batch`'s per-entry behaviour.
+    """
+    result = HotScoreBatchResult()
+
+    existing_items = get_existing_item_keys(entries)
+    comment_totals = get_comment_totals(
+        entry.unified_document_id for entry in entries if has_comments(entry.metrics)
+    )
+
+    for entry in entries:
+        if (entry.content_type_id, entry.object_id) not in existing_items:
+            result.missing_item_count += 1
+            continue
+
+        try:
+            content_type = ContentType.objects.get_for_id(entry.content_type_id)
+            calc_data = calculate_hot_score(
+                entry,
+                content_type,
+                return_components=True,
+                comment_totals=comment_totals.get(entry.unified_document_id),
+            )
+
+            if not calc_data:
+                entry.hot_score_v2 = 0
+                entry.hot_score_v2_engagement = None
+                result.stale_breakdown_entry_ids.append(entry.id)
+            else:
+                entry.hot_score_v2 = calc_data["final_score"]
+                entry.hot_score_v2_engagement = get_time_invariant_engagement(
+                    entry, calc_data
+                )
+                result.breakdowns.append(
+                    HotScoreV2Breakdown(
+                        feed_entry_id=entry.id,
+                        breakdown_data=format_breakdown_from_calc_data(calc_data),
+                    )
+                )
+            result.scored.append(entry)
+        except Exception as e:
+            result.errors += 1
+            logger.error(f"Error calculating score for entry {entry.id}: {e}")
+
+    return result
+
+
+def save_hot_scores(result: HotScoreBatchResult, batch_size=1000) -> None:
+    """Persist scores and breakdowns for a scored batch with bulk statements."""
+    if result.scored:
+        FeedEntry.objects.bulk_update(
+            result.scored,
+            ["hot_score_v2", "hot_score_v2_engagement"],
+            batch_size=batch_size,
+        )
+
+    if result.breakdowns:
+        HotScoreV2Breakdown.objects.bulk_create(
+            result.breakdowns,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=["feed_entry"],
+            update_fields=["breakdown_data"],
+        )
+
+    if result.stale_breakdown_entry_ids:
+        HotScoreV2Breakdown.objects.filter(
+            feed_entry_id__in=result.stale_breakdown_entry_ids
+        ).delete()
+
+
+def refresh_decayed_hot_scores(queryset, now=None, batch_size=1000) -> dict:
+    """
+    Re-apply time decay to hot_score_v2 for the entries in `queryset`.
+
+    Entries with a stored `hot_score_v2_engagement` are updated in the database
+    with `hot_score_decay_expression`, skipping rows whose score is unchanged,
+    and their breakdowns are brought in line with the new score. Entries
+    without one (time-sensitive signals, or never scored) are rescored through
+    the batch engine.
+    """
+    now = now or timezone.now()
+
+    new_score = hot_score_decay_expression(now)
+    decayed = (
+        queryset.filter(hot_score_v2_engagement__isnull=False)
+        .annotate(decayed_hot_score=new_score)
+        .exclude(hot_score_v2=F("decayed_hot_score"))
+        .update(hot_score_v2=new_score)
+    )
+    _refresh_decayed_breakdowns(queryset, now, batch_size=batch_size)
+
+    rescored = 0
+    for batch in iter_feed_entry_batches(
+        queryset.filter(hot_score_v2_engagement__isnull=True), batch_size=batch_size
+    ):
+        result = score_feed_entries(batch)
+        save_hot_scores(result, batch_size=batch_size)
+        rescored += len(result.scored)
+
+    return {"decayed": decayed, "rescored": rescored}
+
+
+def _refresh_decayed_breakdowns(queryset, now, batch_size=1000) -> int:
+    """
+    Update the breakdowns whose final score no longer matches the decayed
+    hot_score_v2. Returns the number of breakdowns updated.
+    """
+    rows = (
+        queryset.filter(
+            hot_score_v2_engagement__isnull=False,
+            hot_score_breakdown_v2__breakdown_data__signals__has_key="recency",
+            hot_score_breakdown_v2__breakdown_data__calculation__has_key=(
+                "engagement_score"
+            ),
+        )
+        .annotate(
+            breakdown_score=Cast(
+                KT("hot_score_breakdown_v2__breakdown_data__calculation__final_score"),
+                IntegerField(),
+            ),
+            age_hours=hot_score_age_hours_expression(now),
+        )
+        .exclude(breakdown_score=F("hot_score_v2"))
+        .values_list(
+            "hot_score_breakdown_v2__id",
+            "hot_score_breakdown_v2__breakdown_data",
+            "age_hours",
+            "hot_score_v2",
+        )
+    )
+
+    updated = 0
+    breakdowns = []
+    for breakdown_id, breakdown_data, age_hours, hot_score_v2 in rows.iterator(
+        chunk_size=batch_size
+    ):
+        breakdowns.append(
+            HotScoreV2Breakdown(
+                id=breakdown_id,
+                breakdown_data=apply_time_decay_to_breakdown(
+                    breakdown_data, age_hours, hot_score_v2
+                ),
+            )
+        )
+        if len(breakdowns) == batch_size:
+            HotScoreV2Breakdown.objects.bulk_update(breakdowns, ["breakdown_data"])
+            updated += len(breakdowns)
+            breakdowns = []
+
+    if breakdowns:
+        HotScoreV2Breakdown.objects.bulk_update(breakdowns, ["breakdown_data"])
+        updated += len(breakdowns)
+    return updated
@@ -6,6 +6,8 @@ All values are dynamically read from HOT_SCORE_CONFIG to ensure breakdowns
 automatically update when configuration changes.
 """
 
+import math
+
 from feed.hot_score import HOT_SCORE_CONFIG
 
 
@@ -100,6 +102,67 @@ def format_breakdown_from_calc_data(calc_data):
     }
 
 
+def apply_time_decay_to_breakdown(breakdown_data, age_hours, final_score):
+    """
+    Recompute the recency signal and time decay of a stored breakdown for a new
+    age, as the decay-only refresh does for hot_score_v2.
+
+    Engagement signals are kept from the last full calculation.
+
+    Args:
+        breakdown_data: Stored breakdown in the current format (has recency)
+        age_hours: Age of the feed entry in hours
+        final_score: The entry's decayed hot_score_v2
+
+    Returns:
+        dict with the updated breakdown
+    """
+    config = HOT_SCORE_CONFIG
+    recency_config = config["signals"]["recency"]
+    decay_config = config["time_decay"]
+
+    signals = {name: dict(data) for name, data in breakdown_data["signals"].items()}
+    recency = signals["recency"]
+    previous_recency_component = recency["component"]
+    recency["raw"] = 24.0 / (age_hours + 24.0)
+    recency["component"] = (
+        math.log(recency["raw"] + 1, recency_config["log_base"])
+        * recency_config["weight"]
+    )
+
+    time_factors = {
+        "age_hours": age_hours,
+        "base_hours": decay_config["base_hours"],
+        "gravity": decay_config["gravity"],
+    }
+    engagement_score = (
+        breakdown_data["calculation"]["engagement_score"]
+        - previous_recency_component
+        + recency["component"]
+    )
+    denominator = math.pow(
+        age_hours + time_factors["base_hours"], time_factors["gravity"]
+    )
+    calculation = {
+        "engagement_score": engagement_score,
+        "adjusted_engagement": engagement_score,
+        "time_denominator": denominator,
+        "raw_score": engagement_score / denominator
+        if denominator > 0
+        else engagement_score,
+        "final_score": final_score,
+    }
+
+    return {
+        **breakdown_data,
+        "equation": _format_equation(signals, time_factors, calculation, config),
+        "steps": _format_steps(signals, time_factors, calculation, config),
+        "signals": signals,
+        "time_factors": time_factors,
+        "calculation": calculation,
+    }
+
+
 def _empty_breakdown():
     """Return empty breakdown structure for entries without items."""
     return {
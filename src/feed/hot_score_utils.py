@@ -9,11 +9,18 @@ All functions gracefully handle missing keys and malformed data.
 
 import logging
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from typing import Any, NamedTuple
 
 logger = logging.getLogger(__name__)
 
 
+class CommentTotals(NamedTuple):
+    """Comment upvote and tip sums for a unified document."""
+
+    upvotes: int = 0
+    tips: float = 0
+
+
 def safe_get_nested(data: dict, *keys, default=None) -> Any:
     result = data
     for key in keys:
@@ -353,7 +360,9 @@ def get_bounties_from_content(
     return total_amount, has_urgent_bounty
 
 
-def get_tips_from_content(content: dict, feed_entry) -> float:
+def get_tips_from_content(
+    content: dict, feed_entry, comment_tip_sum: float | None = None
+) -> float:
     """
     Extract total tip/boost amount from content JSON and optionally comments.
 
@@ -362,6 +371,8 @@ def get_tips_from_content(content: dict, feed_entry) -> float:
     Args:
         content: The FeedEntry.content JSON dict
         feed_entry: FeedEntry instance (for metrics check and lazy unified_document)
+        comment_tip_sum: Pre-aggregated comment tips for the entry's document.
+            When provided, the per-document query is skipped.
 
     Returns:
         Total tip amount as float
@@ -397,6 +408,9 @@ def get_tips_from_content(content: dict, feed_entry) -> float:
 
     # Add comment tips only if comments exist
     if has_comments(feed_entry.metrics):
+        if comment_tip_sum is not None:
+            return total + comment_tip_sum
+
         # Lazy-load unified_document only when needed
         try:
             unified_document = feed_entry.unified_document
@@ -409,7 +423,9 @@ def get_tips_from_content(content: dict, feed_entry) -> float:
     return total
 
 
-def get_upvotes_rolled_up(metrics: dict, feed_entry) -> int:
+def get_upvotes_rolled_up(
+    metrics: dict, feed_entry, comment_upvote_sum: int | None = None
+) -> int:
     """
     Extract total upvotes (document + comments) from metrics and optionally DB.
 
@@ -418,6 +434,8 @@ def get_upvotes_rolled_up(metrics: dict, feed_entry) -> int:
     Args:
         metrics: The FeedEntry.metrics JSON dict
         feed_entry: FeedEntry instance (for lazy unified_document access)
+        comment_upvote_sum: Pre-aggregated comment upvotes for the entry's
+            document. When provided, the per-document query is skipped.
 
     Returns:
         Total upvote count as int
@@ -432,6 +450,9 @@ def get_upvotes_rolled_up(metrics: dict, feed_entry) -> int:
 
     # Add comment upvotes only if comments exist
     if has_comments(metrics):
+        if comment_upvote_sum is not None:
+            return max(0, total_upvotes + comment_upvote_sum)
+
         # Lazy-load unified_document only when needed
         try:
             unified_document = feed_entry.unified_document
@@ -478,6 +499,36 @@ def get_fundraise_amount_from_content(content: dict) -> float:
     return 0.0
 
 
+def has_time_sensitive_signals(content: dict) -> bool:
+    """
+    Whether the hot score inputs can change with time alone.
+
+    True for content with open bounties (urgency depends on bounty age and
+    expiration) and for grants/preregistrations whose deadline has not passed
+    yet (their age switches to the deadline-based urgency window).
+    """
+    if not isinstance(content, dict):
+        return False
+
+    bounties = safe_get_nested(content, "bounties", default=[])
+    if isinstance(bounties, list) and any(
+        isinstance(bounty, dict) and bounty.get("status") == "OPEN"
+        for bounty in bounties
+    ):
+        return True
+
+    doc_type = safe_get_nested(content, "type", default="")
+    if doc_type == "GRANT":
+        end_date_str = safe_get_nested(content, "grant", "end_date")
+    elif doc_type == "PREREGISTRATION":
+        end_date_str = safe_get_nested(content, "fundraise", "end_date")
+    else:
+        return False
+
+    end_date = parse_iso_datetime(end_date_str)
+    return end_date is not None and end_date > datetime.now(UTC)
+
+
 def get_age_hours_from_content(
     content: dict,
     feed_entry,
@@ -6,9 +6,11 @@ from django.utils import timezone
 
 from feed.models import FeedEntry
 from feed.serializers import serialize_feed_metrics
-from feed.tasks import create_feed_entry, serialize_feed_item
+from feed.tasks import create_feed_entries, serialize_feed_item
 from researchhub_comment.related_models.rh_comment_model import RhCommentModel
 
+BATCH_SIZE = 500
+
 
 class Command(BaseCommand):
     help = "Backfill or refresh FeedEntry rows for existing comments"
@@ -97,11 +99,7 @@ class Command(BaseCommand):
 
     def _handle_backfill(self, **options):
         comment_ct = ContentType.objects.get_for_model(RhCommentModel)
-        queryset = (
-            RhCommentModel.objects.filter(is_removed=False)
-            .select_related("thread__content_type", "created_by")
-            .order_by("id")
-        )
+        queryset = RhCommentModel.objects.filter(is_removed=False).order_by("id")
 
         if options["since"]:
             since_dt = self._parse_since(options["since"])
@@ -115,43 +113,38 @@ class Command(BaseCommand):
         if total == 0 or options["dry_run"]:
             return
 
-        processed = skipped = errors = 0
+        processed = written = errors = 0
+        batch = []
 
-        for comment in queryset.iterator(chunk_size=500):
+        def flush():
+            nonlocal written, errors
             try:
-                unified_doc = getattr(comment, "unified_document", None)
-                if unified_doc is None:
-                    try:
-                        unified_doc = comment.thread.unified_document
-                    except Exception:
-                        skipped += 1
-                        continue
-
-                if not unified_doc:
-                    skipped += 1
-                    continue
-
-                hub_ids = list(unified_doc.hubs.values_list("id", flat=True))
-
-                create_feed_entry(
-                    item_id=comment.id,
-                    item_content_type_id=comment_ct.id,
-                    action=FeedEntry.PUBLISH,
-                    hub_ids=hub_ids,
-                    user_id=comment.created_by_id or None,
-                )
-                processed += 1
-
-                if processed % 100 == 0:
-                    self.stdout.write(f"Processed {processed}/{total}")
+                written += create_feed_entries(batch, batch_size=BATCH_SIZE)
             except Exception as e:
-                errors += 1
+                errors += len(batch)
                 self.stderr.write(
-                    self.style.ERROR(f"Error on comment {comment.id}: {e}")
+                    self.style.ERROR(
+                        f"Error on comments {batch[0][0]}-{batch[-1][0]}: {e}"
+                    )
                 )
-
+            batch.clear()
+
+        for comment_id, created_by_id in queryset.values_list(
+            "id", "created_by_id"
+        ).iterator(chunk_size=BATCH_SIZE):
+            batch.append((comment_id, comment_ct.id, FeedEntry.PUBLISH, created_by_id))
+            processed += 1
+            if len(batch) == BATCH_SIZE:
+                flush()
+                self.stdout.write(f"Processed {processed}/{total}")
+
+        if batch:
+            flush()
+
+        # Comments without a unified document or with unsupported content
+        skipped = processed - written - errors
         self.stdout.write(
             self.style.SUCCESS(
-                f"Done: processed={processed}, skipped={skipped}, errors={errors}"
+                f"Done: processed={written}, skipped={skipped}, errors={errors}"
             )
         )
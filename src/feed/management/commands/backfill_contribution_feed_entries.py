@@ -5,13 +5,14 @@ from django.core.management.base import BaseCommand
 from django.utils import timezone
 
 from feed.models import FeedEntry
-from feed.tasks import create_feed_entry
-from purchase.models import Fundraise
+from feed.tasks import create_feed_entries
 from purchase.related_models.purchase_model import Purchase
 from purchase.related_models.usd_fundraise_contribution_model import (
     UsdFundraiseContribution,
 )
 
+BATCH_SIZE = 500
+
 
 class Command(BaseCommand):
     help = "Backfill FeedEntry rows for existing fundraise contributions"
@@ -58,13 +59,9 @@ class Command(BaseCommand):
     def _backfill_rsc_contributions(self, since_dt, dry_run):
         purchase_ct = ContentType.objects.get_for_model(Purchase)
 
-        queryset = (
-            Purchase.objects.filter(
-                purchase_type=Purchase.FUNDRAISE_CONTRIBUTION,
-            )
-            .select_related("user")
-            .order_by("id")
-        )
+        queryset = Purchase.objects.filter(
+            purchase_type=Purchase.FUNDRAISE_CONTRIBUTION,
+        ).order_by("id")
 
         if since_dt:
             queryset = queryset.filter(created_date__gte=since_dt)
@@ -77,55 +74,15 @@ class Command(BaseCommand):
                 self.stdout.write(f"Dry run: would backfill {total} RSC contributions")
             return (0, 0, 0)
 
-        processed = 0
-        skipped = 0
-        errors = 0
-
-        for purchase in queryset.iterator(chunk_size=500):
-            try:
-                try:
-                    fundraise = Fundraise.objects.select_related(
-                        "unified_document"
-                    ).get(id=purchase.object_id)
-                except Fundraise.DoesNotExist:
-                    skipped += 1
-                    continue
-
-                unified_doc = fundraise.unified_document
-                if not unified_doc:
-                    skipped += 1
-                    continue
-
-                hub_ids = list(unified_doc.hubs.values_list("id", flat=True))
-
-                create_feed_entry(
-                    item_id=purchase.id,
-                    item_content_type_id=purchase_ct.id,
-                    action=FeedEntry.PUBLISH,
-                    hub_ids=hub_ids,
-                    user_id=purchase.user_id,
-                )
-                processed += 1
-
-                if processed % 100 == 0:
-                    self.stdout.write(f"RSC: Processed {processed}/{total}")
-
-            except Exception as e:
-                errors += 1
-                self.stderr.write(f"Error on purchase {purchase.id}: {e}")
-
-        return (processed, skipped, errors)
+        rows = queryset.values_list("id", "user_id").iterator(chunk_size=BATCH_SIZE)
+        return self._create_entries("RSC", purchase_ct, rows, total)
 
     def _backfill_usd_contributions(self, since_dt, dry_run):
         usd_ct = ContentType.objects.get_for_model(UsdFundraiseContribution)
 
-        queryset = (
-            UsdFundraiseContribution.objects.filter(
-                is_refunded=False,
-            )
-            .select_related("user", "fundraise__unified_document")
-            .order_by("id")
-        )
+        queryset = UsdFundraiseContribution.objects.filter(
+            is_refunded=False,
+        ).order_by("id")
 
         if since_dt:
             queryset = queryset.filter(created_date__gte=since_dt)
@@ -138,33 +95,36 @@ class Command(BaseCommand):
                 self.stdout.write(f"Dry run: would backfill {total} USD contributions")
             return (0, 0, 0)
 
-        processed = 0
-        skipped = 0
-        errors = 0
+        rows = queryset.values_list("id", "user_id").iterator(chunk_size=BATCH_SIZE)
+        return self._create_entries("USD", usd_ct, rows, total)
 
-        for contribution in queryset.iterator(chunk_size=500):
+    def _create_entries(self, label, content_type, rows, total):
+        """
+        Create feed entries in batches; contributions whose fundraise or document
+        is missing are skipped by `create_feed_entries`.
+        """
+        processed = written = errors = 0
+        batch = []
+
+        def flush():
+            nonlocal written, errors
             try:
-                unified_doc = contribution.fundraise.unified_document
-                if not unified_doc:
-                    skipped += 1
-                    continue
-
-                hub_ids = list(unified_doc.hubs.values_list("id", flat=True))
-
-                create_feed_entry(
-                    item_id=contribution.id,
-                    item_content_type_id=usd_ct.id,
-                    action=FeedEntry.PUBLISH,
-                    hub_ids=hub_ids,
-                    user_id=contribution.user_id,
+                written += create_feed_entries(batch, batch_size=BATCH_SIZE)
+            except Exception as e:
+                errors += len(batch)
+                self.stderr.write(
+                    f"Error on {label} contributions {batch[0][0]}-{batch[-1][0]}: {e}"
                 )
-                processed += 1
+            batch.clear()
 
-                if processed % 100 == 0:
-                    self.stdout.write(f"USD: Processed {processed}/{total}")
+        for item_id, user_id in rows:
+            batch.append((item_id, content_type.id, FeedEntry.PUBLISH, user_id))
+            processed += 1
+            if len(batch) == BATCH_SIZE:
+                flush()
+                self.stdout.write(f"{label}: Processed {processed}/{total}")
 
-            except Exception as e:
-                errors += 1
-                self.stderr.write(f"Error on USD contribution {contribution.id}: {e}")
+        if batch:
+            flush()
 
-        return (processed, skipped, errors)
+        return (written, processed - written - errors, errors)
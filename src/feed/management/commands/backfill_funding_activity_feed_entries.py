@@ -6,9 +6,11 @@ from django.utils import timezone
 
 from feed.models import FeedEntry
 from feed.signals.funding_activity_signals import FINANCIAL_FEED_SOURCE_TYPES
-from feed.tasks import create_feed_entry
+from feed.tasks import create_feed_entries
 from user.related_models.funding_activity_model import FundingActivity
 
+BATCH_SIZE = 500
+
 
 class Command(BaseCommand):
     help = (
@@ -42,13 +44,9 @@ class Command(BaseCommand):
                 return
 
         fa_ct = ContentType.objects.get_for_model(FundingActivity)
-        queryset = (
-            FundingActivity.objects.filter(
-                source_type__in=FINANCIAL_FEED_SOURCE_TYPES,
-            )
-            .select_related("funder", "unified_document")
-            .order_by("id")
-        )
+        queryset = FundingActivity.objects.filter(
+            source_type__in=FINANCIAL_FEED_SOURCE_TYPES,
+        ).order_by("id")
 
         if since_dt:
             queryset = queryset.filter(activity_date__gte=since_dt)
@@ -65,37 +63,35 @@ class Command(BaseCommand):
             self.stdout.write(f"Dry run: would backfill {total} activities")
             return
 
-        processed = 0
-        skipped = 0
-        errors = 0
+        processed = written = errors = 0
+        batch = []
 
-        for activity in queryset.iterator(chunk_size=500):
+        def flush():
+            nonlocal written, errors
             try:
-                if activity.unified_document_id:
-                    hub_ids = list(
-                        activity.unified_document.hubs.values_list("id", flat=True)
-                    )
-                else:
-                    hub_ids = []
-
-                create_feed_entry(
-                    item_id=activity.id,
-                    item_content_type_id=fa_ct.id,
-                    action=FeedEntry.PUBLISH,
-                    hub_ids=hub_ids,
-                    user_id=activity.funder_id,
+                written += create_feed_entries(batch, batch_size=BATCH_SIZE)
+            except Exception as e:
+                errors += len(batch)
+                self.stderr.write(
+                    f"Error on FundingActivities {batch[0][0]}-{batch[-1][0]}: {e}"
                 )
-                processed += 1
+            batch.clear()
 
-                if processed % 100 == 0:
-                    self.stdout.write(f"Processed {processed}/{total}")
+        for activity_id, funder_id in queryset.values_list("id", "funder_id").iterator(
+            chunk_size=BATCH_SIZE
+        ):
+            batch.append((activity_id, fa_ct.id, FeedEntry.PUBLISH, funder_id))
+            processed += 1
+            if len(batch) == BATCH_SIZE:
+                flush()
+                self.stdout.write(f"Processed {processed}/{total}")
 
-            except Exception as e:
-                errors += 1
-                self.stderr.write(f"Error on FundingActivity {activity.id}: {e}")
+        if batch:
+            flush()
 
+        skipped = processed - written - errors
         self.stdout.write(
             self.style.SUCCESS(
-                f"Done: processed={processed}, skipped={skipped}, errors={errors}"
+                f"Done: processed={written}, skipped={skipped}, errors={errors}"
             )
         )
@@ -121,7 +121,7 @@ class Command(BaseCommand):
 
                 if entry.unified_document:
                     entry.hot_score_v2 = entry.calculate_hot_score_v2()
-                    fields_to_update.append("hot_score_v2")
+                    fields_to_update.extend(["hot_score_v2", "hot_score_v2_engagement"])
 
                 entry.save(update_fields=fields_to_update)
                 processed += 1
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.17 on 2026-10-16 20:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("feed", "0038_add_ct_unidoc_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="feedentry",
+            name="hot_score_v2_stale",
+            field=models.BooleanField(
+                default=False,
+                help_text="Set when engagement signals changed after hot_score_v2 was last calculated. Cleared by the incremental hot score refresh.",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="feedentry",
+            index=models.Index(
+                condition=models.Q(("hot_score_v2_stale", True)),
+                fields=["id"],
+                name="feed_hot_score_stale_idx",
+            ),
+        ),
+    ]
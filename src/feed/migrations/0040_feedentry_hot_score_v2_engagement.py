@@ -0,0 +1,21 @@
+# Generated by Django 5.2.17 on 2026-10-16 20:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("feed", "0039_feedentry_hot_score_v2_stale"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="feedentry",
+            name="hot_score_v2_engagement",
+            field=models.FloatField(
+                blank=True,
+                help_text="Time-invariant part of the hot_score_v2 engagement score. Used to re-apply time decay without re-reading engagement signals. Null when the entry has time-sensitive signals and needs a full recalculation.",
+                null=True,
+            ),
+        ),
+    ]
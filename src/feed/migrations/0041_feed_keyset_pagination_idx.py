@@ -0,0 +1,26 @@
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # AddIndexConcurrently cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ("feed", "0040_feedentry_hot_score_v2_engagement"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="feedentry",
+            index=models.Index(
+                fields=["-hot_score_v2", "-id"], name="feed_hot_score_v2_id_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="feedentry",
+            index=models.Index(
+                fields=["-action_date", "-id"], name="feed_action_date_id_idx"
+            ),
+        ),
+    ]
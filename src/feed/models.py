@@ -81,6 +81,24 @@ class FeedEntry(DefaultModel):
         db_index=True,
     )
 
+    hot_score_v2_engagement = models.FloatField(
+        null=True,
+        blank=True,
+        help_text=(
+            "Time-invariant part of the hot_score_v2 engagement score. Used to "
+            "re-apply time decay without re-reading engagement signals. Null when "
+            "the entry has time-sensitive signals and needs a full recalculation."
+        ),
+    )
+
+    hot_score_v2_stale = models.BooleanField(
+        default=False,
+        help_text=(
+            "Set when engagement signals changed after hot_score_v2 was last "
+            "calculated. Cleared by the incremental hot score refresh."
+        ),
+    )
+
     metrics = models.JSONField(
         encoder=DjangoJSONEncoder,
         default=dict,
@@ -149,6 +167,20 @@ class FeedEntry(DefaultModel):
                 fields=["content_type", "unified_document"],
                 name="feed_ct_unidoc_idx",
             ),
+            # Keyset (cursor) pagination on `(sort_key, id)`
+            models.Index(
+                fields=["-hot_score_v2", "-id"],
+                name="feed_hot_score_v2_id_idx",
+            ),
+            models.Index(
+                fields=["-action_date", "-id"],
+                name="feed_action_date_id_idx",
+            ),
+            models.Index(
+                fields=["id"],
+                name="feed_hot_score_stale_idx",
+                condition=models.Q(hot_score_v2_stale=True),
+            ),
         ]
         constraints = [
             # Constraint for entries WITH a user
@@ -175,13 +207,20 @@ class FeedEntry(DefaultModel):
         ]
 
     def calculate_hot_score_v2(self):
-        """Calculate hot score using new v2 algorithm and store breakdown."""
+        """
+        Calculate hot score using new v2 algorithm and store breakdown.
+
+        Also sets `hot_score_v2_engagement`; callers saving `hot_score_v2` with
+        `update_fields` should include it.
+        """
         from django.contrib.contenttypes.models import ContentType
         from django.core.exceptions import ObjectDoesNotExist
 
-        from feed.hot_score import calculate_hot_score
+        from feed.hot_score import calculate_hot_score, get_time_invariant_engagement
         from feed.hot_score_breakdown import format_breakdown_from_calc_data
 
+        self.hot_score_v2_engagement = None
+
         try:
             # Get content type
             item = self.item
@@ -210,6 +249,9 @@ class FeedEntry(DefaultModel):
 
             # Format breakdown from calculation data
             breakdown_data = format_breakdown_from_calc_data(calc_data)
+            self.hot_score_v2_engagement = get_time_invariant_engagement(
+                self, calc_data
+            )
 
             _breakdown, _created = HotScoreV2Breakdown.objects.update_or_create(
                 feed_entry=self,
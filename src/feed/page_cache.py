@@ -0,0 +1,97 @@
+"""
+Stale-while-revalidate cache for feed list pages.
+
+Pages are stored together with a soft expiry (`fresh_until`). The cache entry
+itself lives longer (the hard expiry), so once a page goes stale:
+
+- one request takes a `utils.locking` lock and rebuilds the page,
+- concurrent requests keep being served the stale page meanwhile.
+
+When there is no cached page at all, requests that lose the lock race wait
+briefly for the winner's page instead of all rebuilding it at once.
+
+Deleting a key (feed cache invalidation) still forces a rebuild.
+"""
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+from django.core.cache import cache
+
+import utils.locking as lock
+
+CACHE_HIT = "hit"
+CACHE_STALE = "stale"
+CACHE_MISS = "miss"
+
+REFRESH_LOCK_TIMEOUT = 60
+COALESCE_WAIT_SECONDS = 2.0
+COALESCE_POLL_INTERVAL = 0.1
+
+
+def set_cached_page(
+    key: str, data: Any, timeout: int, stale_timeout: int | None = None
+) -> None:
+    """
+    Store a page that is fresh for `timeout` seconds and may be served stale
+    for `stale_timeout` seconds after that (defaults to `timeout`).
+    """
+    if stale_timeout is None:
+        stale_timeout = timeout
+    cache.set(
+        key,
+        {"data": data, "fresh_until": time.time() + timeout},
+        timeout=timeout + stale_timeout,
+    )
+
+
+def get_cached_page(
+    key: str,
+    build: Callable[[], Any],
+    timeout: int,
+    stale_timeout: int | None = None,
+) -> tuple[Any, str]:
+    """
+    Return `(data, status)` for a cached page, building it with `build` when
+    needed. `status` is one of `CACHE_HIT`, `CACHE_STALE` or `CACHE_MISS`.
+    """
+    entry = cache.get(key)
+    if entry is not None:
+        if not _is_page_entry(entry):
+            # Written before pages carried a soft expiry
+            return entry, CACHE_HIT
+        if entry["fresh_until"] > time.time():
+            return entry["data"], CACHE_HIT
+
+    lock_key = lock.name(f"page_cache:{key}")
+    if lock.acquire(lock_key, timeout=REFRESH_LOCK_TIMEOUT):
+        try:
+            data = build()
+            set_cached_page(key, data, timeout, stale_timeout)
+        finally:
+            lock.release(lock_key)
+        return data, CACHE_MISS
+
+    if entry is not None:
+        return entry["data"], CACHE_STALE
+
+    data = _wait_for_page(key)
+    if data is not None:
+        return data, CACHE_HIT
+
+    return build(), CACHE_MISS
+
+
+def _wait_for_page(key: str) -> Any:
+    deadline = time.monotonic() + COALESCE_WAIT_SECONDS
+    while time.monotonic() < deadline:
+        time.sleep(COALESCE_POLL_INTERVAL)
+        entry = cache.get(key)
+        if entry is not None:
+            return entry["data"] if _is_page_entry(entry) else entry
+    return None
+
+
+def _is_page_entry(entry: Any) -> bool:
+    return isinstance(entry, dict) and "fresh_until" in entry
@@ -2,6 +2,8 @@ import logging
 from typing import Any
 
 from django.contrib.contenttypes.models import ContentType
+from django.db.models import prefetch_related_objects
+from django.db.models.manager import BaseManager
 from rest_framework import serializers
 
 from hub.models import Hub
@@ -566,7 +568,10 @@ class FundraiseContributionContentSerializer(serializers.Serializer):
         from purchase.models import Fundraise
 
         if hasattr(obj, "purchase_type"):
-            # Purchase - object_id points to Fundraise
+            # Purchase - object_id points to Fundraise, preloaded by batch builds
+            if hasattr(obj, "_feed_fundraise"):
+                fundraise = obj._feed_fundraise
+                return fundraise.unified_document if fundraise else None
             try:
                 fundraise = Fundraise.objects.select_related("unified_document").get(
                     id=obj.object_id
@@ -818,6 +823,78 @@ class CommentSerializer(serializers.Serializer):
         ]
 
 
+APPROVED_PREREGISTRATION_POST_IDS = "approved_preregistration_post_ids"
+
+
+def _get_preregistration_post_ids(content):
+    """Preregistration post ids of the grant applications in cached post content."""
+    if not isinstance(content, dict):
+        return set()
+
+    grant = content.get("grant")
+    if not isinstance(grant, dict):
+        return set()
+
+    applications = grant.get("applications")
+    if not isinstance(applications, list):
+        return set()
+
+    return {
+        app.get("preregistration_post_id")
+        for app in applications
+        if isinstance(app, dict) and app.get("preregistration_post_id")
+    }
+
+
+def _get_approved_preregistration_post_ids(post_ids):
+    if not post_ids:
+        return set()
+
+    return set(
+        ResearchhubPost.objects.filter(
+            id__in=post_ids,
+            document_type=PREREGISTRATION,
+            unified_document__status=ResearchhubUnifiedDocument.APPROVED,
+            unified_document__is_removed=False,
+        ).values_list("id", flat=True)
+    )
+
+
+def hydrate_feed_entries(entries, context):
+    """
+    Bulk load everything `FeedEntrySerializer` reads per entry, so a page is
+    serialized with a fixed number of queries instead of a few per entry:
+
+    - feed items, one query per content type on the page,
+    - entry authors and their verification records,
+    - the hubs of paper documents, for the journal shim,
+    - the approved proposal ids of all grant applications on the page.
+    """
+    prefetch_related_objects(
+        entries, "item", "user__author_profile", "user__userverification"
+    )
+
+    paper_entries = [entry for entry in entries if entry.content_type.model == "paper"]
+    prefetch_related_objects(paper_entries, "unified_document__hubs")
+
+    post_ids = set()
+    for entry in entries:
+        if entry.content_type.model == "researchhubpost":
+            post_ids |= _get_preregistration_post_ids(entry.content)
+    context[APPROVED_PREREGISTRATION_POST_IDS] = _get_approved_preregistration_post_ids(
+        post_ids
+    )
+
+
+class FeedEntryListSerializer(serializers.ListSerializer):
+    """Hydrates the whole page once before serializing its entries."""
+
+    def to_representation(self, data):
+        entries = list(data.all() if isinstance(data, BaseManager) else data)
+        hydrate_feed_entries(entries, self.context)
+        return super().to_representation(entries)
+
+
 class FeedEntrySerializer(serializers.ModelSerializer):
     """Serializer for feed entries that can reference different content types"""
 
@@ -837,6 +914,7 @@ class FeedEntrySerializer(serializers.ModelSerializer):
 
     class Meta:
         model = FeedEntry
+        list_serializer_class = FeedEntryListSerializer
         fields = [
             "id",
             "content_type",
@@ -862,12 +940,18 @@ class FeedEntrySerializer(serializers.ModelSerializer):
 
     def get_metrics(self, obj):
         """Return metrics with adjusted_score included."""
+        # Cached per entry, `adjusted_score` reads the same metrics again.
+        cache = self.context.setdefault("feed_entry_metrics_cache", {})
+        if obj.id in cache:
+            return cache[obj.id]
+
         metrics = dict(obj.metrics or {})
         base_votes = metrics.get("votes", 0)
         external_metrics = metrics.get("external", {})
         metrics["adjusted_score"] = calculate_adjusted_score(
             base_votes, external_metrics
         )
+        cache[obj.id] = metrics
         return metrics
 
     def get_adjusted_score(self, obj):
@@ -895,8 +979,8 @@ class FeedEntrySerializer(serializers.ModelSerializer):
         Returns None for non-paper content.
         """
         if (
-            obj.item
-            and obj.content_type.model == "paper"
+            obj.content_type.model == "paper"
+            and obj.item
             and hasattr(obj.item, "external_metadata")
         ):
             return obj.item.external_metadata
@@ -913,7 +997,9 @@ class FeedEntrySerializer(serializers.ModelSerializer):
         content = obj.content
 
         if obj.content_type.model == "researchhubpost":
-            content = self._remove_unapproved_grant_applications(content)
+            content = self._remove_unapproved_grant_applications(
+                content, self.context.get(APPROVED_PREREGISTRATION_POST_IDS)
+            )
 
         # Shim #1: temporary shim to ensure we have a journal set for as many
         # papers as possible until we get to the bottom of why some papers
@@ -954,7 +1040,11 @@ class FeedEntrySerializer(serializers.ModelSerializer):
         return content
 
     @staticmethod
-    def _remove_unapproved_grant_applications(content):
+    def _remove_unapproved_grant_applications(content, approved_post_ids=None):
+        """
+        `approved_post_ids` is loaded for the whole page by
+        `hydrate_feed_entries`, and queried here for single entries.
+        """
         if not isinstance(content, dict):
             return content
 
@@ -966,23 +1056,10 @@ class FeedEntrySerializer(serializers.ModelSerializer):
         if not isinstance(applications, list) or not applications:
             return content
 
-        proposal_post_ids = {
-            app.get("preregistration_post_id")
-            for app in applications
-            if isinstance(app, dict) and app.get("preregistration_post_id")
-        }
-        approved_post_ids = (
-            set(
-                ResearchhubPost.objects.filter(
-                    id__in=proposal_post_ids,
-                    document_type=PREREGISTRATION,
-                    unified_document__status=ResearchhubUnifiedDocument.APPROVED,
-                    unified_document__is_removed=False,
-                ).values_list("id", flat=True)
+        if approved_post_ids is None:
+            approved_post_ids = _get_approved_preregistration_post_ids(
+                _get_preregistration_post_ids(content)
             )
-            if proposal_post_ids
-            else set()
-        )
         filtered_applications = [
             app
             for app in applications
@@ -1301,6 +1378,7 @@ class FundingFeedEntrySerializer(FeedEntrySerializer):
 
     class Meta:
         model = FeedEntry
+        list_serializer_class = FeedEntryListSerializer
         fields = FeedEntrySerializer.Meta.fields + [
             "is_nonprofit",
             "nonprofit",
@@ -1349,6 +1427,7 @@ class GrantFeedEntrySerializer(FeedEntrySerializer):
 
     class Meta:
         model = FeedEntry
+        list_serializer_class = FeedEntryListSerializer
         fields = FeedEntrySerializer.Meta.fields
 
 
@@ -1383,6 +1462,7 @@ class ModeratorFeedEntrySerializer(FeedEntrySerializer):
 
     class Meta:
         model = FeedEntry
+        list_serializer_class = FeedEntryListSerializer
         fields = FeedEntrySerializer.Meta.fields + ["risk_score"]
 
     def __init__(self, *args, **kwargs) -> None:
@@ -1,11 +1,13 @@
 import logging
+import threading
+from contextlib import contextmanager
 
 from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
 from django.db.models.signals import m2m_changed, post_save
 from django.dispatch import receiver
 
-from feed.tasks import create_feed_entry, delete_feed_entry
+from feed.tasks import create_feed_entries, create_feed_entry, delete_feed_entry
 from hub.models import Hub
 from researchhub_document.related_models.researchhub_unified_document_model import (
     ResearchhubUnifiedDocument,
@@ -20,6 +22,30 @@ when documents are added to or removed from hubs.
 
 logger = logging.getLogger(__name__)
 
+_feed_entry_batch = threading.local()
+
+
+@contextmanager
+def batch_document_feed_entries():
+    """
+    Collect the feed entries created by hub additions inside the block and queue
+    them as a single `create_feed_entries` task on commit, e.g. for one paper
+    ingestion response. Nested blocks join the outermost one.
+    """
+    if getattr(_feed_entry_batch, "entries", None) is not None:
+        yield
+        return
+
+    entries = _feed_entry_batch.entries = []
+    try:
+        yield
+    finally:
+        _feed_entry_batch.entries = None
+        if entries:
+            transaction.on_commit(
+                lambda: create_feed_entries.apply_async(args=(entries,), priority=1)
+            )
+
 
 @receiver(
     m2m_changed,
@@ -50,6 +76,19 @@ def _create_feed_entry_for_unified_document(unified_document, hub_ids):
 
     item = unified_document.get_document()
 
+    batch = getattr(_feed_entry_batch, "entries", None)
+    if batch is not None:
+        # Hubs are taken from the document when the batch is written
+        batch.append(
+            (
+                item.id,
+                ContentType.objects.get_for_model(item).id,
+                "PUBLISH",
+                _get_document_user_id(item),
+            )
+        )
+        return
+
     create_feed_entry.apply_async(
         args=(
             item.id,
@@ -1,11 +1,13 @@
 import logging
 
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from discussion.models import Vote
 from feed.serializers import serialize_feed_metrics
 from feed.tasks import update_feed_metrics
+from feed.user_votes import cache_user_vote, clear_user_vote
 
 logger = logging.getLogger(__name__)
 
@@ -33,3 +35,13 @@ def handle_feed_vote(instance, sender, **kwargs):
             ),
             priority=1,
         )
+
+
+@receiver(post_save, sender=Vote, dispatch_uid="feed_user_vote_index_save")
+def update_user_vote_index(instance, sender, **kwargs):
+    transaction.on_commit(lambda: cache_user_vote(instance))
+
+
+@receiver(post_delete, sender=Vote, dispatch_uid="feed_user_vote_index_delete")
+def clear_user_vote_index(instance, sender, **kwargs):
+    transaction.on_commit(lambda: clear_user_vote(instance))
@@ -8,6 +8,13 @@ from django.db import transaction
 from django.utils import timezone
 
 import utils.locking as lock
+from feed.feed_rankings import rebuild_feed_rankings
+from feed.hot_score_batch import (
+    iter_feed_entry_batches,
+    refresh_decayed_hot_scores,
+    save_hot_scores,
+    score_feed_entries,
+)
 from feed.models import FeedEntry
 from feed.serializers import serialize_feed_item, serialize_feed_metrics
 from paper.related_models.paper_model import Paper
@@ -24,6 +31,10 @@ from user.related_models.author_model import Author
 logger = logging.getLogger(__name__)
 
 
+# Models whose feed entries are ranked by hot_score_v2
+HOT_SCORE_CONTENT_TYPE_MODELS = ("paper", "researchhubpost")
+
+
 # Default content types for hot score refresh
 def _get_default_content_types():
     return [
@@ -49,6 +60,44 @@ def create_feed_entry(
 
     unified_document = _get_unified_document(item, item_content_type)
 
+    fields = _build_feed_entry_fields(item, item_content_type, action, unified_document)
+    if fields is None:
+        return None
+
+    # Get authors for the item
+    authors = _get_authors_for_item(item, item_content_type)
+
+    # Create and return the feed entry
+    try:
+        feed_entry, _ = FeedEntry.objects.update_or_create(
+            content_type=item_content_type,
+            object_id=item_id,
+            action=action,
+            defaults={**fields, "user": user},
+        )
+        if hub_ids:
+            feed_entry.hubs.add(*hub_ids)
+        if authors:
+            feed_entry.authors.set(authors)
+        return feed_entry
+    except Exception as e:
+        # Ignore error if feed entry already exists
+        logger.warning(
+            f"Failed to save feed entry for item_id={item_id} "
+            f"content_type={item_content_type.model}: {e}"
+        )
+
+
+def _build_feed_entry_fields(
+    item: Any,
+    item_content_type: ContentType,
+    action: str,
+    unified_document: ResearchhubUnifiedDocument | None,
+) -> dict | None:
+    """
+    Build the FeedEntry field values for an item, or None if the item must not
+    be published to the feed.
+    """
     # Suppress feed entries for items attached to a private unified document.
     # Covers posts, comments, bounties, and fundraise contributions in one place.
     if unified_document is not None and not unified_document.is_public:
@@ -68,7 +117,7 @@ def create_feed_entry(
     if content is None:
         logger.warning(
             f"Unsupported content type for feed entry: {item_content_type.model} "
-            f"(item_id={item_id}). Skipping."
+            f"(item_id={item.id}). Skipping."
         )
         return None
 
@@ -85,40 +134,238 @@ def create_feed_entry(
     ):
         action_date = item.paper_publish_date
 
-    # Get authors for the item
-    authors = _get_authors_for_item(item, item_content_type)
-
     if item_content_type.model == "paper":
         allows_display = pdf_copyright_allows_display(item)
     else:
         allows_display = True  # Non-papers default to True
 
-    # Create and return the feed entry
-    try:
-        feed_entry, _ = FeedEntry.objects.update_or_create(
-            content_type=item_content_type,
-            object_id=item_id,
-            action=action,
-            defaults={
-                "action_date": action_date,
-                "content": content,
-                "metrics": metrics,
-                "unified_document": unified_document,
-                "user": user,
-                "pdf_copyright_allows_display": allows_display,
-            },
+    return {
+        "action_date": action_date,
+        "content": content,
+        "metrics": metrics,
+        "unified_document": unified_document,
+        "pdf_copyright_allows_display": allows_display,
+    }
+
+
+# Relations read while building a feed entry, loaded in bulk per content type
+FEED_ITEM_SELECT_RELATED = {
+    "bounty": ("unified_document",),
+    "fundingactivity": ("unified_document", "funder__author_profile"),
+    "paper": ("unified_document",),
+    "purchase": ("user__author_profile",),
+    "researchhubpost": ("unified_document",),
+    "rhcommentmodel": ("thread__unified_document", "created_by__author_profile"),
+    "usdfundraisecontribution": (
+        "fundraise__unified_document",
+        "user__author_profile",
+    ),
+}
+FEED_ITEM_PREFETCH_RELATED = {
+    "paper": ("authors",),
+    "researchhubpost": ("authors",),
+}
+
+
+@app.task
+def create_feed_entries(entries, batch_size=500):
+    """
+    Batch variant of `create_feed_entry` for ingestion and backfills.
+
+    `entries` holds `(item_id, item_content_type_id, action)` tuples, optionally
+    followed by a `user_id`. Unlike `create_feed_entry`, hubs are always taken
+    from the item's unified document.
+
+    Per batch, items are loaded with one query per content type, existing entries
+    are matched with one query and written with `bulk_create`/`bulk_update`, and
+    hub and author links are inserted directly into the M2M through tables.
+    Returns the number of feed entries written.
+    """
+    entries = [tuple(entry) for entry in entries]
+    written = 0
+    for start in range(0, len(entries), batch_size):
+        written += _create_feed_entries_batch(entries[start : start + batch_size])
+    return written
+
+
+def _create_feed_entries_batch(entries) -> int:
+    items = _load_feed_items(entries)
+    users = User.objects.in_bulk(
+        {entry[3] for entry in entries if len(entry) > 3 and entry[3]}
+    )
+
+    rows = {}
+    for entry in entries:
+        item_id, item_content_type_id, action = entry[:3]
+        user_id = entry[3] if len(entry) > 3 else None
+        item_content_type = ContentType.objects.get_for_id(item_content_type_id)
+
+        item = items.get((item_content_type_id, item_id))
+        if item is None:
+            logger.warning(
+                f"Feed item not found: item_id={item_id} "
+                f"content_type={item_content_type.model}. Skipping."
+            )
+            continue
+
+        try:
+            unified_document = _get_unified_document(item, item_content_type)
+            fields = _build_feed_entry_fields(
+                item, item_content_type, action, unified_document
+            )
+            if fields is None:
+                continue
+            if unified_document is None:
+                raise ValueError("Feed item has no unified document")
+            fields["user"] = users.get(user_id) if user_id else None
+            authors = _get_authors_for_item(item, item_content_type)
+        except Exception as e:
+            logger.warning(
+                f"Failed to build feed entry for item_id={item_id} "
+                f"content_type={item_content_type.model}: {e}"
+            )
+            continue
+
+        rows[(item_content_type_id, item_id, action)] = (fields, authors)
+
+    if not rows:
+        return 0
+
+    existing = {}
+    duplicates = set()
+    for feed_entry in FeedEntry.objects.filter(
+        content_type_id__in={key[0] for key in rows},
+        object_id__in={key[1] for key in rows},
+        action__in={key[2] for key in rows},
+    ).only("id", "content_type_id", "object_id", "action"):
+        key = (feed_entry.content_type_id, feed_entry.object_id, feed_entry.action)
+        if key not in rows:
+            continue
+        if key in existing:
+            duplicates.add(key)
+        existing[key] = feed_entry
+
+    # `update_or_create` fails on these too; leave them untouched
+    for key in duplicates:
+        logger.warning(f"Multiple feed entries for {key}. Skipping.")
+        del rows[key]
+
+    now = timezone.now()
+    to_create = []
+    to_update = []
+    for key, (fields, _) in rows.items():
+        feed_entry = existing.get(key)
+        if feed_entry is None:
+            feed_entry = FeedEntry(
+                content_type_id=key[0], object_id=key[1], action=key[2]
+            )
+            to_create.append(feed_entry)
+        else:
+            feed_entry.updated_date = now
+            to_update.append(feed_entry)
+        for name, value in fields.items():
+            setattr(feed_entry, name, value)
+        existing[key] = feed_entry
+
+    hub_ids_by_document = _get_hub_ids_by_unified_document(
+        {fields["unified_document"].id for fields, _ in rows.values()}
+    )
+
+    with transaction.atomic():
+        FeedEntry.objects.bulk_create(to_create)
+        FeedEntry.objects.bulk_update(
+            to_update,
+            [
+                "action_date",
+                "content",
+                "metrics",
+                "unified_document",
+                "user",
+                "pdf_copyright_allows_display",
+                "updated_date",
+            ],
         )
-        if hub_ids:
-            feed_entry.hubs.add(*hub_ids)
-        if authors:
-            feed_entry.authors.set(authors)
-        return feed_entry
-    except Exception as e:
-        # Ignore error if feed entry already exists
-        logger.warning(
-            f"Failed to save feed entry for item_id={item_id} "
-            f"content_type={item_content_type.model}: {e}"
+
+        feed_entry_hubs = []
+        feed_entry_authors = []
+        entries_with_authors = []
+        for key, (fields, authors) in rows.items():
+            feed_entry_id = existing[key].id
+            feed_entry_hubs.extend(
+                FeedEntry.hubs.through(feedentry_id=feed_entry_id, hub_id=hub_id)
+                for hub_id in hub_ids_by_document.get(fields["unified_document"].id, [])
+            )
+            if authors:
+                entries_with_authors.append(feed_entry_id)
+                feed_entry_authors.extend(
+                    FeedEntry.authors.through(
+                        feedentry_id=feed_entry_id, author_id=author.id
+                    )
+                    for author in authors
+                )
+
+        FeedEntry.hubs.through.objects.bulk_create(
+            feed_entry_hubs, ignore_conflicts=True
         )
+        # Same semantics as `authors.set`: replace the links of entries with authors
+        FeedEntry.authors.through.objects.filter(
+            feedentry_id__in=entries_with_authors
+        ).delete()
+        FeedEntry.authors.through.objects.bulk_create(
+            feed_entry_authors, ignore_conflicts=True
+        )
+
+    return len(rows)
+
+
+def _load_feed_items(entries) -> dict[tuple[int, int], Any]:
+    """
+    Load feed items with their related objects, keyed by (content type id, id).
+    """
+    item_ids_by_content_type = {}
+    for entry in entries:
+        item_ids_by_content_type.setdefault(entry[1], set()).add(entry[0])
+
+    items = {}
+    for content_type_id, item_ids in item_ids_by_content_type.items():
+        item_content_type = ContentType.objects.get_for_id(content_type_id)
+        model = item_content_type.model_class()
+        queryset = (
+            model._base_manager.filter(id__in=item_ids)
+            .select_related(*FEED_ITEM_SELECT_RELATED.get(item_content_type.model, ()))
+            .prefetch_related(
+                *FEED_ITEM_PREFETCH_RELATED.get(item_content_type.model, ())
+            )
+        )
+        loaded = list(queryset)
+        if item_content_type.model == "purchase":
+            _prefetch_purchase_fundraises(loaded)
+        for item in loaded:
+            items[(content_type_id, item.id)] = item
+
+    return items
+
+
+def _prefetch_purchase_fundraises(purchases) -> None:
+    """
+    Attach each contribution's Fundraise as `_feed_fundraise`, in one query.
+    """
+    from purchase.models import Fundraise
+
+    fundraises = Fundraise.objects.select_related("unified_document").in_bulk(
+        {purchase.object_id for purchase in purchases}
+    )
+    for purchase in purchases:
+        purchase._feed_fundraise = fundraises.get(purchase.object_id)
+
+
+def _get_hub_ids_by_unified_document(unified_document_ids) -> dict[int, list[int]]:
+    hub_ids = {}
+    for document_id, hub_id in ResearchhubUnifiedDocument.hubs.through.objects.filter(
+        researchhubunifieddocument_id__in=unified_document_ids
+    ).values_list("researchhubunifieddocument_id", "hub_id"):
+        hub_ids.setdefault(document_id, []).append(hub_id)
+    return hub_ids
 
 
 def publish_to_feed(item: ResearchhubPost | Paper, user_id: int | None = None) -> None:
@@ -152,7 +399,16 @@ def refresh_feed_entry(feed_entry, skip_figure_extraction=False):
     feed_entry.content = content
     feed_entry.metrics = metrics
     feed_entry.hot_score_v2 = feed_entry.calculate_hot_score_v2()
-    feed_entry.save(update_fields=["content", "metrics", "hot_score_v2"])
+    feed_entry.hot_score_v2_stale = False
+    feed_entry.save(
+        update_fields=[
+            "content",
+            "metrics",
+            "hot_score_v2",
+            "hot_score_v2_engagement",
+            "hot_score_v2_stale",
+        ]
+    )
 
     if (
         not skip_figure_extraction
@@ -207,10 +463,23 @@ def refresh_feed_entries_for_objects(
 def update_feed_metrics(item_id, item_content_type_id, metrics):
     item_content_type = ContentType.objects.get(id=item_content_type_id)
 
-    FeedEntry.objects.filter(
+    feed_entries = FeedEntry.objects.filter(
         object_id=item_id,
         content_type=item_content_type,
-    ).update(metrics=metrics)
+    )
+
+    # Metrics feed the hot score, so flag the entries for the incremental refresh
+    if item_content_type.model in HOT_SCORE_CONTENT_TYPE_MODELS:
+        feed_entries.update(metrics=metrics, hot_score_v2_stale=True)
+    else:
+        feed_entries.update(metrics=metrics)
+
+    if item_content_type.model == "rhcommentmodel":
+        # Comment upvotes roll up into the hot score of the commented document
+        FeedEntry.objects.filter(
+            content_type__in=_get_default_content_types(),
+            unified_document_id__in=feed_entries.values("unified_document_id"),
+        ).update(hot_score_v2_stale=True)
 
 
 def _get_unified_document(
@@ -231,13 +500,17 @@ def _get_unified_document(
             # Fundraise contribution - object_id points to Fundraise
             from purchase.models import Fundraise
 
-            try:
-                fundraise = Fundraise.objects.select_related("unified_document").get(
-                    id=item.object_id
-                )
-                doc = fundraise.unified_document
-            except Fundraise.DoesNotExist:
-                doc = None
+            if hasattr(item, "_feed_fundraise"):
+                fundraise = item._feed_fundraise
+                doc = fundraise.unified_document if fundraise else None
+            else:
+                try:
+                    fundraise = Fundraise.objects.select_related(
+                        "unified_document"
+                    ).get(id=item.object_id)
+                    doc = fundraise.unified_document
+                except Fundraise.DoesNotExist:
+                    doc = None
         case "usdfundraisecontribution":
             doc = item.fundraise.unified_document
         case "fundingactivity":
@@ -329,12 +602,118 @@ def refresh_feed_hot_scores():
             content_types=None,
         )
         logger.info(f"Refreshed hot scores: {stats}")
+        stats["rankings"] = rebuild_feed_rankings()
         return stats
     finally:
         lock.release(key)
         logger.info(f"Released lock {key}")
 
 
+def _get_hot_score_refresh_queryset(days_back=30, content_types=None):
+    queryset = FeedEntry.objects.all()
+
+    # Apply date filter
+    if days_back is not None:
+        cutoff_date = timezone.now() - timedelta(days=days_back)
+        queryset = queryset.filter(created_date__gte=cutoff_date)
+
+    # Apply content type filter with defaults
+    if content_types is None:
+        content_types = _get_default_content_types()
+
+    if content_types:
+        queryset = queryset.filter(content_type__in=content_types)
+
+    return queryset
+
+
+@app.task
+def refresh_feed_hot_scores_decay(days_back=30):
+    """
+    Re-apply time decay to hot scores in the refresh window.
+
+    Uses the stored time-invariant engagement instead of re-reading engagement
+    signals, so it is cheap enough to run every few minutes. The full
+    `refresh_feed_hot_scores` sweep remains the source of truth.
+
+    Both tasks rebuild the materialized feed rankings once scores are written.
+    """
+    key = lock.name("refresh_feed_hot_scores")
+    if not lock.acquire(key):
+        logger.warning(f"Already locked {key}, skipping task")
+        return False
+
+    try:
+        start_time = time.time()
+        stats = refresh_decayed_hot_scores(
+            _get_hot_score_refresh_queryset(days_back=days_back)
+        )
+        stats["duration"] = time.time() - start_time
+        logger.info(f"Refreshed decayed hot scores: {stats}")
+        stats["rankings"] = rebuild_feed_rankings()
+        return stats
+    finally:
+        lock.release(key)
+
+
+@app.task
+def refresh_stale_feed_hot_scores(batch_size=1000, max_batches=20):
+    """
+    Recompute hot_score_v2 only for entries whose engagement signals changed.
+
+    Entries are flagged with `hot_score_v2_stale` when their metrics are updated.
+    The flag is cleared before the entry is read, so a signal arriving while a
+    batch is being scored flags the entry again for the next run. A batch that
+    fails to score or save is flagged again before the error is raised.
+    """
+    key = lock.name("refresh_stale_feed_hot_scores")
+    if not lock.acquire(key):
+        logger.warning(f"Already locked {key}, skipping task")
+        return False
+
+    try:
+        refreshed = 0
+        for _ in range(max_batches):
+            batch = _claim_stale_feed_entries(batch_size)
+            if not batch:
+                break
+
+            try:
+                result = score_feed_entries(batch)
+                save_hot_scores(result, batch_size=batch_size)
+            except Exception:
+                FeedEntry.objects.filter(id__in=[entry.id for entry in batch]).update(
+                    hot_score_v2_stale=True
+                )
+                raise
+            refreshed += len(result.scored)
+
+        if refreshed:
+            logger.info(f"Refreshed {refreshed} stale hot scores")
+        return refreshed
+    finally:
+        lock.release(key)
+
+
+def _claim_stale_feed_entries(batch_size):
+    with transaction.atomic():
+        entry_ids = list(
+            FeedEntry.objects.filter(hot_score_v2_stale=True)
+            .order_by("id")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not entry_ids:
+            return []
+        FeedEntry.objects.filter(id__in=entry_ids).update(hot_score_v2_stale=False)
+
+    return next(
+        iter_feed_entry_batches(
+            FeedEntry.objects.filter(id__in=entry_ids), batch_size=batch_size
+        ),
+        [],
+    )
+
+
 def refresh_feed_hot_scores_batch(
     queryset=None,
     batch_size=1000,
@@ -344,82 +723,46 @@ def refresh_feed_hot_scores_batch(
 ):
     """
     Refresh hot scores (v2) for feed entries with optional filtering.
+
+    Entries are scored in keyset-paginated batches by `feed.hot_score_batch`,
+    producing the same scores and breakdowns as `calculate_hot_score_v2`.
     """
     start_time = time.time()
 
     # Build default queryset if none provided
     if queryset is None:
-        queryset = FeedEntry.objects.all()
-
-        # Apply date filter
-        if days_back is not None:
-            cutoff_date = timezone.now() - timedelta(days=days_back)
-            queryset = queryset.filter(created_date__gte=cutoff_date)
-
-        # Apply content type filter with defaults
-        if content_types is None:
-            content_types = _get_default_content_types()
-
-        if content_types:
-            queryset = queryset.filter(content_type__in=content_types)
-
-    # Apply proper prefetching
-    queryset = queryset.select_related(
-        "content_type", "unified_document"
-    ).prefetch_related("item")
+        queryset = _get_hot_score_refresh_queryset(days_back, content_types)
 
     total_entries = queryset.count()
     processed = 0
     updated = 0
     errors = 0
 
-    update_fields = ["hot_score_v2"]
-
     processed_papers = set()
     paper_content_type = ContentType.objects.get_for_model(Paper)
 
-    # Process in batches
-    for offset in range(0, total_entries, batch_size):
-        entries_to_update = []
-
-        # Process a batch of entries
-        batch = list(queryset[offset : offset + batch_size])
+    # Keyset-paginated batches scored in memory and written back in bulk
+    for batch in iter_feed_entry_batches(queryset, batch_size=batch_size):
+        result = score_feed_entries(batch)
+        errors += result.errors
 
-        # Calculate hot scores for each entry in the batch
-        for feed_entry in batch:
+        if result.scored:
             try:
-                if not feed_entry.item:
-                    processed += 1
-                    continue
-
-                feed_entry.hot_score_v2 = feed_entry.calculate_hot_score_v2()
-                entries_to_update.append(feed_entry)
-
-            except Exception as e:
-                errors += 1
-                logger.error(f"Error calculating score for entry {feed_entry.id}: {e}")
-                continue
-
-        # Bulk update entries using Django ORM
-        if entries_to_update:
-            try:
-                FeedEntry.objects.bulk_update(
-                    entries_to_update, update_fields, batch_size=batch_size
-                )
-                updated += len(entries_to_update)
+                save_hot_scores(result, batch_size=batch_size)
+                updated += len(result.scored)
 
-                for feed_entry in entries_to_update:
+                for feed_entry in result.scored:
                     if (
-                        feed_entry.content_type == paper_content_type
-                        and feed_entry.item.id not in processed_papers
+                        feed_entry.content_type_id == paper_content_type.id
+                        and feed_entry.object_id not in processed_papers
                     ):
                         trigger_figure_extraction_for_paper(
-                            feed_entry.item.id, feed_entry.hot_score_v2
+                            feed_entry.object_id, feed_entry.hot_score_v2
                         )
-                        processed_papers.add(feed_entry.item.id)
+                        processed_papers.add(feed_entry.object_id)
 
             except Exception as e:
-                errors += len(entries_to_update)
+                errors += len(result.scored)
                 logger.error(f"Error bulk updating batch: {e}")
 
         processed += len(batch)
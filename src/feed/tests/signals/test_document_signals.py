@@ -1,8 +1,11 @@
+from unittest.mock import patch
+
 from django.contrib.contenttypes.models import ContentType
 from django.test import override_settings
 from django.utils import timezone
 
 from feed.models import FeedEntry
+from feed.signals.document_signals import batch_document_feed_entries
 from hub.tests.helpers import create_hub
 from paper.tests.helpers import create_paper
 from researchhub_document.helpers import create_post
@@ -184,6 +187,40 @@ class DocumentSignalsTests(AWSMockTestCase):
         self.assertEqual(feed_entries[0].hubs.count(), 1)
         self.assertEqual(feed_entries[0].hubs.first(), hub2)
 
+    @override_settings(CELERY_TASK_ALWAYS_EAGER=True, CELERY_TASK_EAGER_PROPAGATES=True)
+    def test_hub_additions_in_a_batch_create_feed_entries_with_one_task(self):
+        """
+        Test that hub additions inside `batch_document_feed_entries` are queued
+        as a single batch task on commit.
+        """
+        # Arrange
+        hub = create_hub(name="testHub1")
+        papers = [
+            create_paper(title=f"testPaper{i}", uploaded_by=self.user) for i in range(2)
+        ]
+
+        # Act
+        with (
+            patch(
+                "feed.signals.document_signals.create_feed_entry.apply_async"
+            ) as mock_create_feed_entry,
+            self.captureOnCommitCallbacks(execute=True),
+            batch_document_feed_entries(),
+        ):
+            for paper in papers:
+                paper.unified_document.hubs.add(hub)
+
+        # Assert
+        mock_create_feed_entry.assert_not_called()
+        feed_entries = FeedEntry.objects.filter(
+            content_type=ContentType.objects.get_for_model(papers[0]),
+            object_id__in=[paper.id for paper in papers],
+        )
+        self.assertEqual(feed_entries.count(), 2)
+        for feed_entry in feed_entries:
+            self.assertEqual(list(feed_entry.hubs.all()), [hub])
+            self.assertEqual(feed_entry.user, self.user)
+
 
 class DocumentRemovalSignalsTests(AWSMockTransactionTestCase):
     """
@@ -383,7 +383,7 @@ class FeedCachingTests(APITestCase):
         researchhub_keys = [key for key in cache_keys if "researchhub_" in str(key)]
         self.assertGreater(len(researchhub_keys), 0)
 
-    @patch("feed.views.feed_view.cache")
+    @patch("feed.page_cache.cache")
     def test_following_feed_respects_use_cache_config(self, mock_cache):
         url = reverse("feed-list")
         self.client.force_authenticate(user=self.user)
@@ -428,7 +428,7 @@ class FeedCachingTests(APITestCase):
         response2 = self.client.get(url, {"feed_view": "personalized"})
         self.assertEqual(response2["RH-Cache"], "partial-cache-hit (auth)")
 
-    @patch("feed.views.feed_view.cache")
+    @patch("feed.page_cache.cache")
     def test_popular_feed_respects_use_cache_config(self, mock_cache):
         url = reverse("feed-list")
 
@@ -0,0 +1,142 @@
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from feed.feed_rankings import get_ranked_entry_ids, rebuild_feed_rankings
+from feed.models import FeedEntry
+from hub.models import Hub
+from paper.models import Paper
+from researchhub_document.related_models.researchhub_unified_document_model import (
+    ResearchhubUnifiedDocument,
+)
+from user.tests.helpers import create_random_default_user
+from user.views.follow_view_mixins import create_follow
+
+
+class FeedRankingsTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = create_random_default_user("feed_rankings_user")
+        self.biorxiv, _ = Hub.objects.get_or_create(
+            slug="biorxiv", defaults={"name": "bioRxiv"}
+        )
+        self.topic_hub = Hub.objects.create(name="Genetics", slug="genetics")
+        self.other_hub = Hub.objects.create(name="Physics", slug="physics")
+        self.paper_content_type = ContentType.objects.get_for_model(Paper)
+
+    def _create_paper_entry(self, hubs, hot_score_v2, allows_display=True):
+        unified_document = ResearchhubUnifiedDocument.objects.create(
+            document_type="PAPER"
+        )
+        unified_document.hubs.add(*hubs)
+        paper = Paper.objects.create(
+            title="Ranked Paper",
+            paper_publish_date=timezone.now(),
+            unified_document=unified_document,
+        )
+        return FeedEntry.objects.create(
+            action="PUBLISH",
+            action_date=timezone.now(),
+            content_type=self.paper_content_type,
+            object_id=paper.id,
+            unified_document=unified_document,
+            hot_score_v2=hot_score_v2,
+            content={},
+            metrics={},
+            pdf_copyright_allows_display=allows_display,
+        )
+
+    def test_rankings_unavailable_before_rebuild(self):
+        self.assertIsNone(get_ranked_entry_ids())
+
+    def test_rebuild_ranks_eligible_entries_per_hub(self):
+        # Arrange
+        low = self._create_paper_entry([self.biorxiv, self.topic_hub], 10)
+        high = self._create_paper_entry([self.biorxiv, self.topic_hub], 30)
+        other = self._create_paper_entry([self.biorxiv, self.other_hub], 20)
+        # Not from an allowed preprint hub, PDF display not allowed, or no score
+        self._create_paper_entry([self.topic_hub], 50)
+        self._create_paper_entry([self.biorxiv, self.topic_hub], 40, False)
+        self._create_paper_entry([self.biorxiv, self.topic_hub], 0)
+
+        # Act
+        stats = rebuild_feed_rankings()
+
+        # Assert
+        self.assertEqual(stats["global"], 3)
+        self.assertEqual(get_ranked_entry_ids(), [high.id, other.id, low.id])
+        self.assertEqual(get_ranked_entry_ids([self.topic_hub.id]), [high.id, low.id])
+        self.assertEqual(get_ranked_entry_ids([self.other_hub.id]), [other.id])
+
+    def test_merged_hub_rankings_are_deduplicated_and_limited(self):
+        # Arrange
+        shared = self._create_paper_entry([self.biorxiv, self.topic_hub], 30)
+        other = self._create_paper_entry([self.biorxiv, self.other_hub], 20)
+        self._create_paper_entry([self.biorxiv, self.topic_hub], 10)
+        rebuild_feed_rankings()
+
+        # Act
+        ranked_ids = get_ranked_entry_ids(
+            [self.biorxiv.id, self.topic_hub.id, self.other_hub.id], limit=2
+        )
+
+        # Assert
+        self.assertEqual(ranked_ids, [shared.id, other.id])
+
+    def test_following_feed_served_from_rankings(self):
+        # Arrange
+        create_follow(self.user, self.topic_hub)
+        high = self._create_paper_entry([self.biorxiv, self.topic_hub], 30)
+        low = self._create_paper_entry([self.biorxiv, self.topic_hub], 10)
+        self._create_paper_entry([self.biorxiv, self.other_hub], 20)
+        rebuild_feed_rankings()
+        # Created after the rebuild, so not ranked yet
+        self._create_paper_entry([self.biorxiv, self.topic_hub], 50)
+        self.client.force_authenticate(self.user)
+
+        # Act
+        response = self.client.get(
+            reverse("feed-list"),
+            {"feed_view": "following", "ordering": "hot_score_v2", "page_size": 2},
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [item["id"] for item in response.data["results"]], [high.id, low.id]
+        )
+
+    def test_feed_past_the_end_of_the_rankings_served_from_database(self):
+        # Arrange
+        create_follow(self.user, self.topic_hub)
+        scored = self._create_paper_entry([self.biorxiv, self.topic_hub], 30)
+        unscored = self._create_paper_entry([self.biorxiv, self.topic_hub], 0)
+        rebuild_feed_rankings()
+        self.client.force_authenticate(self.user)
+
+        # Act
+        response = self.client.get(
+            reverse("feed-list"),
+            {"feed_view": "following", "ordering": "hot_score_v2", "page_size": 2},
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [item["id"] for item in response.data["results"]],
+            [scored.id, unscored.id],
+        )
+
+    def test_rankings_unavailable_for_hub_without_list(self):
+        # Arrange
+        self._create_paper_entry([self.biorxiv, self.topic_hub], 30)
+        rebuild_feed_rankings()
+
+        # Act
+        ranked_ids = get_ranked_entry_ids([self.topic_hub.id, self.other_hub.id])
+
+        # Assert
+        self.assertIsNone(ranked_ids)
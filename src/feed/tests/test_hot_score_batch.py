@@ -0,0 +1,267 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from feed.hot_score import calculate_hot_score
+from feed.hot_score_batch import (
+    get_comment_totals,
+    iter_feed_entry_batches,
+    refresh_decayed_hot_scores,
+    save_hot_scores,
+    score_feed_entries,
+)
+from feed.hot_score_breakdown import format_breakdown_from_calc_data
+from feed.models import FeedEntry, HotScoreV2Breakdown
+from paper.tests.helpers import create_paper
+from purchase.related_models.purchase_model import Purchase
+from researchhub_comment.models import RhCommentModel, RhCommentThreadModel
+from researchhub_document.helpers import create_post
+from user.tests.helpers import create_random_default_user
+from utils.test_helpers import AWSMockTestCase
+
+NOW = datetime(2025, 6, 1, 12, 0, tzinfo=UTC)
+
+
+class FrozenDatetime(datetime):
+    frozen_now = NOW
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.frozen_now
+
+
+@patch("feed.hot_score_utils.datetime", FrozenDatetime)
+class TestHotScoreBatch(AWSMockTestCase):
+    def setUp(self):
+        super().setUp()
+        FrozenDatetime.frozen_now = NOW
+        self.user = create_random_default_user("hot_score_batch_user")
+
+    def _create_entry(self, item, metrics, content=None, hours_ago=5):
+        return FeedEntry.objects.create(
+            item=item,
+            unified_document=item.unified_document,
+            content_type=ContentType.objects.get_for_model(item),
+            object_id=item.id,
+            action=FeedEntry.PUBLISH,
+            action_date=NOW - timedelta(hours=hours_ago),
+            content=content or {"bounties": [], "purchases": []},
+            metrics=metrics,
+        )
+
+    def _comment_on(self, item, score, tip_amount=None):
+        thread = RhCommentThreadModel.objects.create(
+            content_object=item,
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        comment = RhCommentModel.objects.create(
+            comment_content_json={"text": "comment"},
+            thread=thread,
+            created_by=self.user,
+            updated_by=self.user,
+            score=score,
+        )
+        if tip_amount is not None:
+            Purchase.objects.create(
+                user=self.user,
+                content_type=ContentType.objects.get_for_model(RhCommentModel),
+                object_id=comment.id,
+                purchase_method=Purchase.OFF_CHAIN,
+                purchase_type=Purchase.BOOST,
+                amount=tip_amount,
+                paid_status=Purchase.PAID,
+            )
+        return comment
+
+    def _create_entries(self):
+        paper = create_paper(uploaded_by=self.user)
+        self._comment_on(paper, score=4, tip_amount="12.5")
+        self._comment_on(paper, score=3, tip_amount="0.25")
+
+        post = create_post(created_by=self.user)
+        self._comment_on(post, score=7)
+
+        quiet_post = create_post(created_by=self.user)
+
+        return [
+            self._create_entry(
+                paper,
+                {"votes": 3, "replies": 2, "review_metrics": {"count": 1}},
+                content={
+                    "bounties": [
+                        {
+                            "amount": "100.0",
+                            "status": "OPEN",
+                            "expiration_date": (NOW + timedelta(hours=10)).isoformat(),
+                        }
+                    ],
+                    "purchases": [{"amount": "20"}],
+                },
+            ),
+            self._create_entry(post, {"votes": 1, "replies": 1}, hours_ago=30),
+            self._create_entry(quiet_post, {"votes": 0, "replies": 0}, hours_ago=80),
+        ]
+
+    def test_batch_scores_match_per_entry_scores(self):
+        # Arrange
+        entries = self._create_entries()
+        expected = {}
+        for entry in entries:
+            expected[entry.id] = (
+                entry.calculate_hot_score_v2(),
+                HotScoreV2Breakdown.objects.get(feed_entry=entry).breakdown_data,
+            )
+        HotScoreV2Breakdown.objects.all().delete()
+
+        # Act
+        batch = next(iter_feed_entry_batches(FeedEntry.objects.all()))
+        result = score_feed_entries(batch)
+        save_hot_scores(result)
+
+        # Assert
+        for entry in FeedEntry.objects.filter(id__in=expected):
+            score, breakdown = expected[entry.id]
+            self.assertEqual(entry.hot_score_v2, score)
+            self.assertEqual(entry.hot_score_breakdown_v2.breakdown_data, breakdown)
+
+    def test_get_comment_totals_matches_unified_document_methods(self):
+        # Arrange
+        entries = self._create_entries()
+        documents = [entry.unified_document for entry in entries]
+
+        # Act
+        totals = get_comment_totals(doc.id for doc in documents)
+
+        # Assert
+        for doc in documents:
+            self.assertEqual(totals[doc.id].upvotes, doc.get_comment_upvote_sum())
+            self.assertEqual(totals[doc.id].tips, doc.get_comment_tip_sum())
+
+    def test_query_count_does_not_grow_with_batch_size(self):
+        # Arrange
+        self._create_entries()
+        small_batch = next(iter_feed_entry_batches(FeedEntry.objects.all()))
+
+        with CaptureQueriesContext(connection) as small:
+            score_feed_entries(small_batch)
+
+        self._create_entries()
+        self._create_entries()
+        large_batch = next(iter_feed_entry_batches(FeedEntry.objects.all()))
+
+        # Act
+        with CaptureQueriesContext(connection) as large:
+            score_feed_entries(large_batch)
+
+        # Assert
+        self.assertEqual(len(large_batch), 3 * len(small_batch))
+        self.assertEqual(len(large.captured_queries), len(small.captured_queries))
+
+    def test_entries_with_missing_items_are_skipped(self):
+        # Arrange
+        post = create_post(created_by=self.user)
+        entry = self._create_entry(post, {"votes": 2})
+        FeedEntry.objects.filter(id=entry.id).update(hot_score_v2=42)
+        entry.refresh_from_db()
+        FeedEntry.objects.filter(id=entry.id).update(object_id=post.id + 100000)
+        entry.refresh_from_db()
+
+        # Act
+        result = score_feed_entries([entry])
+        save_hot_scores(result)
+
+        # Assert
+        self.assertEqual(result.missing_item_count, 1)
+        self.assertEqual(result.scored, [])
+        entry.refresh_from_db()
+        self.assertEqual(entry.hot_score_v2, 42)
+
+    def test_keyset_batches_cover_every_entry_once(self):
+        # Arrange
+        entries = self._create_entries() + self._create_entries()
+
+        # Act
+        batches = list(iter_feed_entry_batches(FeedEntry.objects.all(), batch_size=4))
+
+        # Assert
+        seen = [entry.id for batch in batches for entry in batch]
+        self.assertEqual(seen, sorted(entry.id for entry in entries))
+        self.assertEqual([len(batch) for batch in batches], [4, 2])
+
+    def test_decay_refresh_matches_full_recalculation(self):
+        # Arrange
+        entries = self._create_entries()
+        batch = next(iter_feed_entry_batches(FeedEntry.objects.all()))
+        save_hot_scores(score_feed_entries(batch))
+
+        later = NOW + timedelta(hours=37, minutes=13)
+        FrozenDatetime.frozen_now = later
+        expected = {}
+        for entry in FeedEntry.objects.filter(id__in=[e.id for e in entries]):
+            expected[entry.id] = entry.calculate_hot_score_v2()
+
+        # Act
+        stats = refresh_decayed_hot_scores(FeedEntry.objects.all(), now=later)
+
+        # Assert
+        self.assertEqual(stats["rescored"], 1)  # the paper has an open bounty
+        for entry in FeedEntry.objects.filter(id__in=expected):
+            self.assertEqual(entry.hot_score_v2, expected[entry.id])
+
+    def test_decay_refresh_updates_breakdowns(self):
+        # Arrange
+        _, post_entry, quiet_entry = self._create_entries()
+        save_hot_scores(score_feed_entries([post_entry, quiet_entry]))
+
+        later = NOW + timedelta(hours=37, minutes=13)
+        FrozenDatetime.frozen_now = later
+        expected = {}
+        for entry in FeedEntry.objects.filter(id__in=[post_entry.id, quiet_entry.id]):
+            expected[entry.id] = format_breakdown_from_calc_data(
+                calculate_hot_score(
+                    entry,
+                    ContentType.objects.get_for_id(entry.content_type_id),
+                    return_components=True,
+                )
+            )
+
+        # Act
+        refresh_decayed_hot_scores(FeedEntry.objects.all(), now=later)
+
+        # Assert
+        for entry in FeedEntry.objects.filter(id__in=expected).select_related(
+            "hot_score_breakdown_v2"
+        ):
+            breakdown = entry.hot_score_breakdown_v2.breakdown_data
+            self.assertEqual(
+                breakdown["calculation"]["final_score"], entry.hot_score_v2
+            )
+            for section, key in (
+                ("time_factors", "age_hours"),
+                ("calculation", "engagement_score"),
+                ("calculation", "time_denominator"),
+            ):
+                self.assertAlmostEqual(
+                    breakdown[section][key], expected[entry.id][section][key], places=3
+                )
+            self.assertAlmostEqual(
+                breakdown["signals"]["recency"]["component"],
+                expected[entry.id]["signals"]["recency"]["component"],
+                places=3,
+            )
+
+        # Arrange
+        paper_entry, post_entry, quiet_entry = self._create_entries()
+
+        # Act
+        save_hot_scores(score_feed_entries([paper_entry, post_entry, quiet_entry]))
+
+        # Assert
+        paper_entry.refresh_from_db()
+        post_entry.refresh_from_db()
+        self.assertIsNone(paper_entry.hot_score_v2_engagement)
+        self.assertIsNotNone(post_entry.hot_score_v2_engagement)
@@ -0,0 +1,77 @@
+from unittest.mock import Mock, patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+import utils.locking as lock
+from feed.page_cache import (
+    CACHE_HIT,
+    CACHE_MISS,
+    CACHE_STALE,
+    get_cached_page,
+    set_cached_page,
+)
+
+KEY = "feed:test-page"
+
+
+class PageCacheTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_miss_builds_and_stores_page(self):
+        # Arrange
+        build = Mock(return_value={"results": [1]})
+
+        # Act
+        first = get_cached_page(KEY, build, timeout=60)
+        second = get_cached_page(KEY, build, timeout=60)
+
+        # Assert
+        self.assertEqual(first, ({"results": [1]}, CACHE_MISS))
+        self.assertEqual(second, ({"results": [1]}, CACHE_HIT))
+        build.assert_called_once()
+
+    def test_stale_page_is_rebuilt_by_lock_holder(self):
+        # Arrange
+        with patch("feed.page_cache.time.time", return_value=1000):
+            set_cached_page(KEY, {"results": ["old"]}, timeout=60)
+        build = Mock(return_value={"results": ["new"]})
+
+        # Act
+        with patch("feed.page_cache.time.time", return_value=1100):
+            data, status = get_cached_page(KEY, build, timeout=60)
+
+        # Assert
+        self.assertEqual(data, {"results": ["new"]})
+        self.assertEqual(status, CACHE_MISS)
+        self.assertEqual(get_cached_page(KEY, build, timeout=60)[1], CACHE_HIT)
+
+    def test_stale_page_is_served_while_another_request_refreshes(self):
+        # Arrange
+        with patch("feed.page_cache.time.time", return_value=1000):
+            set_cached_page(KEY, {"results": ["old"]}, timeout=60)
+        lock.acquire(lock.name(f"page_cache:{KEY}"))
+        build = Mock()
+
+        # Act
+        with patch("feed.page_cache.time.time", return_value=1100):
+            data, status = get_cached_page(KEY, build, timeout=60)
+
+        # Assert
+        self.assertEqual(data, {"results": ["old"]})
+        self.assertEqual(status, CACHE_STALE)
+        build.assert_not_called()
+
+    def test_entries_without_soft_expiry_are_hits(self):
+        # Arrange
+        cache.set(KEY, {"results": ["legacy"]})
+        build = Mock()
+
+        # Act
+        data, status = get_cached_page(KEY, build, timeout=60)
+
+        # Assert
+        self.assertEqual(data, {"results": ["legacy"]})
+        self.assertEqual(status, CACHE_HIT)
+        build.assert_not_called()
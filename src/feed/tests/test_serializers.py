@@ -6,6 +6,8 @@ from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core.files.storage import FileSystemStorage, default_storage
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from ai_peer_review.models import (
     KeyInsightItemType,
@@ -2388,6 +2390,106 @@ class FeedEntrySerializerTests(AWSMockTestCase):
         self.assertEqual(content_object["journal"]["slug"], "ARXIV")
 
 
+class FeedEntryListSerializerTests(AWSMockTestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = create_random_default_user("feed_page_user")
+        self.journal = create_hub("Page Journal", namespace=Hub.Namespace.JOURNAL)
+        self.paper_content_type = ContentType.objects.get_for_model(Paper)
+        self.post_content_type = ContentType.objects.get_for_model(ResearchhubPost)
+
+    def _create_paper_entry(self):
+        paper = create_paper(uploaded_by=self.user)
+        paper.unified_document.hubs.add(self.journal)
+        return FeedEntry.objects.create(
+            content_type=self.paper_content_type,
+            object_id=paper.id,
+            content={"id": paper.id, "title": paper.title, "journal": None},
+            metrics={"votes": 3},
+            user=self.user,
+            action="PUBLISH",
+            action_date=paper.created_date,
+            unified_document=paper.unified_document,
+        )
+
+    def _create_grant_entry(self):
+        grant_doc = ResearchhubUnifiedDocument.objects.create(document_type=GRANT)
+        grant_post = ResearchhubPost.objects.create(
+            title="Grant",
+            created_by=self.user,
+            document_type=GRANT,
+            unified_document=grant_doc,
+        )
+        proposal_doc = ResearchhubUnifiedDocument.objects.create(
+            document_type=PREREGISTRATION
+        )
+        proposal = ResearchhubPost.objects.create(
+            title="Proposal",
+            created_by=self.user,
+            document_type=PREREGISTRATION,
+            unified_document=proposal_doc,
+        )
+        return FeedEntry.objects.create(
+            content_type=self.post_content_type,
+            object_id=grant_post.id,
+            content={
+                "id": grant_post.id,
+                "grant": {
+                    "application_count": 2,
+                    "applications": [
+                        {"preregistration_post_id": proposal.id},
+                        {"preregistration_post_id": proposal.id + 10000},
+                    ],
+                },
+            },
+            metrics={"votes": 1},
+            user=self.user,
+            action="PUBLISH",
+            action_date=grant_post.created_date,
+            unified_document=grant_doc,
+        )
+
+    def _serialize_page(self, entry_ids):
+        queryset = FeedEntry.objects.filter(id__in=entry_ids).order_by("id")
+        with CaptureQueriesContext(connection) as queries:
+            data = FeedEntrySerializer(queryset, many=True).data
+        return data, len(queries)
+
+    @patch.object(settings, "RESEARCHHUB_JOURNAL_ID", 999999)
+    def test_page_is_serialized_with_constant_number_of_queries(self):
+        # Arrange
+        entries = []
+        for _ in range(15):
+            entries.append(self._create_paper_entry())
+            entries.append(self._create_grant_entry())
+        entry_ids = [entry.id for entry in entries]
+
+        # Act
+        _, small_page_queries = self._serialize_page(entry_ids[:2])
+        data, full_page_queries = self._serialize_page(entry_ids)
+
+        # Assert
+        self.assertEqual(len(data), 30)
+        self.assertEqual(full_page_queries, small_page_queries)
+
+    @patch.object(settings, "RESEARCHHUB_JOURNAL_ID", 999999)
+    def test_hydrated_page_matches_single_entry_serialization(self):
+        # Arrange
+        entries = [self._create_paper_entry(), self._create_grant_entry()]
+
+        # Act
+        data, _ = self._serialize_page([entry.id for entry in entries])
+
+        # Assert
+        self.assertEqual(data, [FeedEntrySerializer(entry).data for entry in entries])
+        self.assertEqual(data[0]["content_object"]["journal"]["id"], self.journal.id)
+        grant = data[1]["content_object"]["grant"]
+        self.assertEqual(grant["application_count"], 1)
+        self.assertEqual(
+            data[1]["adjusted_score"], data[1]["metrics"]["adjusted_score"]
+        )
+
+
 class FundingFeedEntrySerializerTests(AWSMockTestCase):
     """Test cases for the FundingFeedEntrySerializer"""
 
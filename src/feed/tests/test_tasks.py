@@ -9,6 +9,8 @@ from feed.models import FeedEntry
 from feed.tasks import (
     _get_authors_for_item,
     _get_unified_document,
+    _load_feed_items,
+    create_feed_entries,
     create_feed_entry,
     delete_feed_entry,
     refresh_feed_entries_for_objects,
@@ -194,6 +196,72 @@ class FeedTasksTest(AWSMockTestCase):
         feed_entries = FeedEntry.objects.filter(id=feed_entry.id)
         self.assertEqual(feed_entries.count(), 1)
 
+    def test_create_feed_entries(self):
+        """Batch creation matches create_feed_entry, taking hubs from the document."""
+        # Arrange
+        author = Author.objects.create(first_name="John", last_name="Doe")
+        self.paper.authors.add(author)
+        self.unified_document.hubs.add(self.hub)
+        other_document = ResearchhubUnifiedDocument.objects.create()
+        other_paper = Paper.objects.create(
+            title="testPaper2",
+            paper_publish_date="2025-01-01",
+            unified_document=other_document,
+        )
+
+        # Act
+        written = create_feed_entries(
+            [
+                (self.paper.id, self.paper_content_type.id, FeedEntry.PUBLISH),
+                (
+                    other_paper.id,
+                    self.paper_content_type.id,
+                    FeedEntry.PUBLISH,
+                    self.user.id,
+                ),
+                (999999, self.paper_content_type.id, FeedEntry.PUBLISH),
+            ]
+        )
+
+        # Assert
+        self.assertEqual(written, 2)
+        feed_entry = FeedEntry.objects.get(
+            object_id=self.paper.id, content_type=self.paper_content_type
+        )
+        self.assertIsNone(feed_entry.user)
+        self.assertEqual(feed_entry.unified_document, self.unified_document)
+        self.assertEqual(list(feed_entry.hubs.all()), [self.hub])
+        self.assertEqual(list(feed_entry.authors.all()), [author])
+        self.assertEqual(feed_entry.content["id"], self.paper.id)
+        other_entry = FeedEntry.objects.get(
+            object_id=other_paper.id, content_type=self.paper_content_type
+        )
+        self.assertEqual(other_entry.user, self.user)
+        self.assertFalse(other_entry.hubs.exists())
+
+    def test_create_feed_entries_updates_existing_entries(self):
+        # Arrange
+        feed_entry = create_feed_entry(
+            item_id=self.paper.id,
+            item_content_type_id=self.paper_content_type.id,
+            action=FeedEntry.PUBLISH,
+        )
+        self.paper.title = "Updated title"
+        self.paper.save()
+
+        # Act
+        create_feed_entries(
+            [(self.paper.id, self.paper_content_type.id, FeedEntry.PUBLISH)]
+        )
+
+        # Assert
+        feed_entries = FeedEntry.objects.filter(
+            object_id=self.paper.id, content_type=self.paper_content_type
+        )
+        self.assertEqual(feed_entries.count(), 1)
+        self.assertEqual(feed_entries.get().id, feed_entry.id)
+        self.assertEqual(feed_entries.get().content["title"], "Updated title")
+
     def test_delete_feed_entry(self):
         """Test deleting a feed entry for a paper"""
         # Arrange
@@ -332,6 +400,128 @@ class FeedTasksTest(AWSMockTestCase):
             self.assertIn("review_metrics", feed_entry.metrics)
             self.assertEqual(feed_entry.metrics["review_metrics"], review_metrics)
 
+    def test_update_feed_metrics_marks_hot_score_stale(self):
+        # Arrange
+        feed_entry = create_feed_entry(
+            item_id=self.paper.id,
+            item_content_type_id=self.paper_content_type.id,
+            action=FeedEntry.PUBLISH,
+            hub_ids=[self.hub.id],
+            user_id=self.user.id,
+        )
+
+        # Act
+        update_feed_metrics(
+            item_id=self.paper.id,
+            item_content_type_id=self.paper_content_type.id,
+            metrics={"votes": 10},
+        )
+
+        # Assert
+        feed_entry.refresh_from_db()
+        self.assertTrue(feed_entry.hot_score_v2_stale)
+
+    def test_update_feed_metrics_for_comment_marks_document_stale(self):
+        # Arrange
+        paper_entry = create_feed_entry(
+            item_id=self.paper.id,
+            item_content_type_id=self.paper_content_type.id,
+            action=FeedEntry.PUBLISH,
+            hub_ids=[self.hub.id],
+            user_id=self.user.id,
+        )
+        thread = RhCommentThreadModel.objects.create(
+            content_object=self.paper,
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        comment = RhCommentModel.objects.create(
+            thread=thread,
+            created_by=self.user,
+            updated_by=self.user,
+            comment_content_json={"ops": [{"insert": "comment"}]},
+        )
+        comment_content_type = ContentType.objects.get_for_model(RhCommentModel)
+        comment_entry = create_feed_entry(
+            item_id=comment.id,
+            item_content_type_id=comment_content_type.id,
+            action=FeedEntry.PUBLISH,
+            hub_ids=[self.hub.id],
+            user_id=self.user.id,
+        )
+        FeedEntry.objects.update(hot_score_v2_stale=False)
+
+        # Act
+        update_feed_metrics(
+            item_id=comment.id,
+            item_content_type_id=comment_content_type.id,
+            metrics={"votes": 3},
+        )
+
+        # Assert
+        paper_entry.refresh_from_db()
+        comment_entry.refresh_from_db()
+        self.assertTrue(paper_entry.hot_score_v2_stale)
+        self.assertFalse(comment_entry.hot_score_v2_stale)
+
+    def test_refresh_stale_feed_hot_scores(self):
+        # Arrange
+        from feed.tasks import refresh_stale_feed_hot_scores
+
+        feed_entry = create_feed_entry(
+            item_id=self.paper.id,
+            item_content_type_id=self.paper_content_type.id,
+            action=FeedEntry.PUBLISH,
+            hub_ids=[self.hub.id],
+            user_id=self.user.id,
+        )
+        fresh_entry = create_feed_entry(
+            item_id=self.paper.id,
+            item_content_type_id=self.paper_content_type.id,
+            action=FeedEntry.OPEN,
+            hub_ids=[self.hub.id],
+        )
+        FeedEntry.objects.filter(id=feed_entry.id).update(
+            action_date=timezone.now(),
+            metrics={"votes": 50},
+            hot_score_v2=0,
+            hot_score_v2_stale=True,
+        )
+        FeedEntry.objects.filter(id=fresh_entry.id).update(hot_score_v2=0)
+
+        # Act
+        refreshed = refresh_stale_feed_hot_scores()
+
+        # Assert
+        self.assertEqual(refreshed, 1)
+        feed_entry.refresh_from_db()
+        fresh_entry.refresh_from_db()
+        self.assertFalse(feed_entry.hot_score_v2_stale)
+        self.assertGreater(feed_entry.hot_score_v2, 0)
+        self.assertEqual(fresh_entry.hot_score_v2, 0)
+
+    @patch("feed.tasks.save_hot_scores", side_effect=RuntimeError("db error"))
+    def test_refresh_stale_feed_hot_scores_keeps_failed_entries_stale(self, _):
+        # Arrange
+        from feed.tasks import refresh_stale_feed_hot_scores
+
+        feed_entry = create_feed_entry(
+            item_id=self.paper.id,
+            item_content_type_id=self.paper_content_type.id,
+            action=FeedEntry.PUBLISH,
+            hub_ids=[self.hub.id],
+            user_id=self.user.id,
+        )
+        FeedEntry.objects.filter(id=feed_entry.id).update(hot_score_v2_stale=True)
+
+        # Act
+        with self.assertRaises(RuntimeError):
+            refresh_stale_feed_hot_scores()
+
+        # Assert
+        feed_entry.refresh_from_db()
+        self.assertTrue(feed_entry.hot_score_v2_stale)
+
     def test_update_feed_metrics_feed_entry_does_not_exist(self):
         """Test updating feed metrics for a feed entry that doesn't exist."""
         # Act
@@ -812,6 +1002,49 @@ class FeedTasksTest(AWSMockTestCase):
         # Assert
         self.assertEqual(actual, unified_document)
 
+    def test_load_feed_items_preloads_purchase_fundraises(self):
+        # Arrange
+        fundraise_ct = ContentType.objects.get_for_model(Fundraise)
+        purchase_ct = ContentType.objects.get_for_model(Purchase)
+        purchases = []
+        for _ in range(2):
+            unified_document = ResearchhubUnifiedDocument.objects.create(
+                document_type=document_type.PREREGISTRATION,
+            )
+            fundraise = Fundraise.objects.create(
+                unified_document=unified_document,
+                created_by=self.user,
+                goal_amount=Decimal("1000.00"),
+                goal_currency=USD,
+                status=Fundraise.OPEN,
+            )
+            purchases.append(
+                Purchase.objects.create(
+                    user=self.user,
+                    content_type=fundraise_ct,
+                    object_id=fundraise.id,
+                    purchase_type=Purchase.FUNDRAISE_CONTRIBUTION,
+                    purchase_method=Purchase.OFF_CHAIN,
+                    amount="100",
+                )
+            )
+
+        # Act
+        items = _load_feed_items(
+            [(purchase.id, purchase_ct.id, FeedEntry.PUBLISH) for purchase in purchases]
+        )
+
+        # Assert
+        with self.assertNumQueries(0):
+            documents = [
+                _get_unified_document(items[(purchase_ct.id, purchase.id)], purchase_ct)
+                for purchase in purchases
+            ]
+        self.assertEqual(
+            [document.id for document in documents],
+            [purchase.item.unified_document_id for purchase in purchases],
+        )
+
     def test_get_unified_document_for_usd_contribution(self):
         """
         Test getting a unified document from a UsdFundraiseContribution.
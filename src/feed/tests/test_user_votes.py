@@ -0,0 +1,76 @@
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from discussion.models import Vote
+from discussion.serializers import VoteSerializer
+from feed.user_votes import get_user_votes
+from paper.related_models.paper_model import Paper
+from user.tests.helpers import create_random_default_user
+from utils.test_helpers import AWSMockTestCase
+
+
+class UserVotesTests(AWSMockTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.user = create_random_default_user("user_votes_user")
+        self.voted_paper = Paper.objects.create(title="Voted Paper")
+        self.other_paper = Paper.objects.create(title="Other Paper")
+        self.content_type = ContentType.objects.get_for_model(Paper)
+
+    def _vote(self, paper, vote_type=Vote.UPVOTE):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Vote.objects.create(
+                created_by=self.user, item=paper, vote_type=vote_type
+            )
+
+    def test_votes_match_vote_serializer(self):
+        # Arrange
+        vote = Vote.objects.create(
+            created_by=self.user, item=self.voted_paper, vote_type=Vote.UPVOTE
+        )
+
+        # Act
+        votes = get_user_votes(
+            self.user.id,
+            {self.content_type.id: [self.voted_paper.id, self.other_paper.id]},
+        )
+
+        # Assert
+        self.assertEqual(
+            votes,
+            {(self.content_type.id, self.voted_paper.id): VoteSerializer(vote).data},
+        )
+
+    def test_indexed_votes_are_read_without_queries(self):
+        # Arrange
+        object_ids = {self.content_type.id: [self.voted_paper.id, self.other_paper.id]}
+        self._vote(self.voted_paper)
+        get_user_votes(self.user.id, object_ids)
+
+        # Act
+        with CaptureQueriesContext(connection) as queries:
+            votes = get_user_votes(self.user.id, object_ids)
+
+        # Assert
+        self.assertEqual(len(queries), 0)
+        self.assertEqual(list(votes), [(self.content_type.id, self.voted_paper.id)])
+
+    def test_vote_signals_keep_index_current(self):
+        # Arrange
+        object_ids = {self.content_type.id: [self.voted_paper.id]}
+        self.assertEqual(get_user_votes(self.user.id, object_ids), {})
+
+        # Act
+        vote = self._vote(self.voted_paper, Vote.DOWNVOTE)
+        after_vote = get_user_votes(self.user.id, object_ids)
+        with self.captureOnCommitCallbacks(execute=True):
+            vote.delete()
+        after_delete = get_user_votes(self.user.id, object_ids)
+
+        # Assert
+        key = (self.content_type.id, self.voted_paper.id)
+        self.assertEqual(after_vote[key]["vote_type"], Vote.DOWNVOTE)
+        self.assertEqual(after_delete, {})
@@ -1825,7 +1825,7 @@ class ActivityFeedFunderFilterTests(APITestCase):
 class ActivityFeedCacheTests(ActivityFeedBaseTests):
     """Public warm-cache behavior for the unscoped activity feed."""
 
-    @patch("feed.views.activity_feed_view.cache")
+    @patch("feed.page_cache.cache")
     def test_authenticated_non_mod_uses_cache(self, mock_cache):
         # Arrange
         mock_cache.get.return_value = {
@@ -1842,7 +1842,7 @@ class ActivityFeedCacheTests(ActivityFeedBaseTests):
         self.assertTrue(mock_cache.get.called)
         self.assertFalse(mock_cache.set.called)
 
-    @patch("feed.views.activity_feed_view.cache")
+    @patch("feed.page_cache.cache")
     def test_moderator_bypasses_cache(self, mock_cache):
         # Arrange
         from user.tests.helpers import create_random_authenticated_user
@@ -1861,7 +1861,7 @@ class ActivityFeedCacheTests(ActivityFeedBaseTests):
         mock_cache.get.assert_not_called()
         mock_cache.set.assert_not_called()
 
-    @patch("feed.views.activity_feed_view.cache")
+    @patch("feed.page_cache.cache")
     def test_hub_editor_bypasses_cache(self, mock_cache):
         # Arrange
         from user.tests.helpers import create_hub_editor
@@ -1878,7 +1878,7 @@ class ActivityFeedCacheTests(ActivityFeedBaseTests):
         mock_cache.get.assert_not_called()
         mock_cache.set.assert_not_called()
 
-    @patch("feed.views.activity_feed_view.cache")
+    @patch("feed.page_cache.cache")
     def test_scoped_and_filtered_requests_skip_cache(self, mock_cache):
         # Arrange / Act
         cases = [
@@ -1897,7 +1897,7 @@ class ActivityFeedCacheTests(ActivityFeedBaseTests):
             mock_cache.get.assert_not_called()
             mock_cache.set.assert_not_called()
 
-    @patch("feed.views.activity_feed_view.cache")
+    @patch("feed.page_cache.cache")
     def test_warm_activity_feed_cache_replaces_pages(self, mock_cache):
         # Arrange / Act
         from feed.activity_feed_cache import (
@@ -1919,6 +1919,6 @@ class ActivityFeedCacheTests(ActivityFeedBaseTests):
             ],
         )
         for call in mock_cache.set.call_args_list:
-            payload = call.args[1]
+            payload = call.args[1]["data"]
             self.assertIn("results", payload)
             self.assertIn("next", payload)
@@ -0,0 +1,206 @@
+from datetime import timedelta
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from feed.models import FeedEntry
+from hub.models import Hub
+from paper.models import Paper
+from researchhub_document.related_models.constants.document_type import (
+    PREREGISTRATION,
+)
+from researchhub_document.related_models.researchhub_post_model import ResearchhubPost
+from researchhub_document.related_models.researchhub_unified_document_model import (
+    ResearchhubUnifiedDocument,
+)
+from user.tests.helpers import create_random_default_user
+
+FEED_URL = reverse("feed-list")
+ACTIVITY_FEED_URL = reverse("activity_feed-list")
+
+
+class FeedCursorPaginationTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = create_random_default_user("cursor_feed_user")
+        self.hub, _ = Hub.objects.get_or_create(
+            slug="biorxiv", defaults={"name": "bioRxiv"}
+        )
+        self.paper_content_type = ContentType.objects.get_for_model(Paper)
+        self.now = timezone.now()
+
+    def _create_paper_entry(self, action_date, hot_score_v2=0):
+        unified_document = ResearchhubUnifiedDocument.objects.create(
+            document_type="PAPER"
+        )
+        unified_document.hubs.add(self.hub)
+        paper = Paper.objects.create(
+            title="Cursor Paper",
+            paper_publish_date=action_date,
+            unified_document=unified_document,
+        )
+        return FeedEntry.objects.create(
+            action="PUBLISH",
+            action_date=action_date,
+            content_type=self.paper_content_type,
+            object_id=paper.id,
+            unified_document=unified_document,
+            hot_score_v2=hot_score_v2,
+            content={},
+            metrics={},
+            pdf_copyright_allows_display=True,
+        )
+
+    def _walk(self, url, params):
+        """Follow `next` links from the first cursor page, collecting ids."""
+        pages = []
+        response = self.client.get(url, params)
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            pages.append(response.data)
+            if not response.data["next"]:
+                return pages
+            response = self.client.get(response.data["next"])
+
+    def _result_ids(self, pages):
+        return [item["id"] for page in pages for item in page["results"]]
+
+    def test_latest_feed_cursor_pages_break_ties_by_id(self):
+        # Arrange
+        tied_date = self.now - timedelta(hours=1)
+        entries = [
+            self._create_paper_entry(self.now),
+            self._create_paper_entry(tied_date),
+            self._create_paper_entry(tied_date),
+            self._create_paper_entry(tied_date),
+            self._create_paper_entry(self.now - timedelta(days=1)),
+        ]
+        expected = [
+            e.id
+            for e in sorted(entries, key=lambda e: (-e.action_date.timestamp(), -e.id))
+        ]
+
+        # Act
+        pages = self._walk(
+            FEED_URL, {"feed_view": "latest", "cursor": "", "page_size": 2}
+        )
+
+        # Assert
+        self.assertEqual(self._result_ids(pages), expected)
+        self.assertEqual([len(page["results"]) for page in pages], [2, 2, 1])
+        self.assertIsNone(pages[0]["previous"])
+        self.assertIn("cursor=", pages[0]["next"])
+        self.assertNotIn("page=", pages[0]["next"])
+
+    def test_popular_feed_cursor_previous_link_returns_prior_page(self):
+        # Arrange
+        for score in [50, 40, 40, 30, 20]:
+            self._create_paper_entry(self.now, hot_score_v2=score)
+        first_page = self.client.get(
+            FEED_URL,
+            {
+                "feed_view": "popular",
+                "ordering": "hot_score_v2",
+                "cursor": "",
+                "page_size": 2,
+            },
+        ).data
+        second_page = self.client.get(first_page["next"]).data
+
+        # Act
+        response = self.client.get(second_page["previous"])
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [item["id"] for item in response.data["results"]],
+            [item["id"] for item in first_page["results"]],
+        )
+        self.assertIsNone(response.data["previous"])
+        self.assertEqual(
+            [item["hot_score_v2"] for item in second_page["results"]], [40, 30]
+        )
+
+    def test_invalid_cursor_returns_not_found(self):
+        # Arrange
+        self._create_paper_entry(self.now)
+
+        # Act
+        response = self.client.get(
+            FEED_URL, {"feed_view": "latest", "cursor": "not-a-cursor"}
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_cursor_from_other_ordering_is_rejected(self):
+        # Arrange
+        self._create_paper_entry(self.now, hot_score_v2=10)
+        self._create_paper_entry(self.now, hot_score_v2=5)
+        popular = self.client.get(
+            FEED_URL,
+            {
+                "feed_view": "popular",
+                "ordering": "hot_score_v2",
+                "cursor": "",
+                "page_size": 1,
+            },
+        ).data
+        cursor = popular["next"].split("cursor=")[1].split("&")[0]
+
+        # Act
+        response = self.client.get(FEED_URL, {"feed_view": "latest", "cursor": cursor})
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_page_number_mode_is_unchanged(self):
+        # Arrange
+        for hours in range(3):
+            self._create_paper_entry(self.now - timedelta(hours=hours))
+
+        # Act
+        response = self.client.get(FEED_URL, {"feed_view": "latest", "page_size": 2})
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("page=2", response.data["next"])
+        self.assertNotIn("cursor=", response.data["next"])
+
+    def test_activity_feed_cursor_pages(self):
+        # Arrange
+        post_content_type = ContentType.objects.get_for_model(ResearchhubPost)
+        entries = []
+        for hours in range(3):
+            unified_document = ResearchhubUnifiedDocument.objects.create(
+                document_type=PREREGISTRATION
+            )
+            post = ResearchhubPost.objects.create(
+                title="Cursor Post",
+                created_by=self.user,
+                document_type=PREREGISTRATION,
+                unified_document=unified_document,
+            )
+            entries.append(
+                FeedEntry.objects.create(
+                    content_type=post_content_type,
+                    object_id=post.id,
+                    unified_document=unified_document,
+                    user=self.user,
+                    action="PUBLISH",
+                    action_date=self.now - timedelta(hours=hours),
+                    content={},
+                    metrics={},
+                )
+            )
+
+        # Act
+        pages = self._walk(ACTIVITY_FEED_URL, {"cursor": "", "page_size": 2})
+
+        # Assert
+        self.assertEqual(self._result_ids(pages), [entry.id for entry in entries])
+        self.assertEqual(len(pages), 2)
@@ -223,7 +223,7 @@ class FundingFeedViewSetTests(AWSMockTestCase):
         self.assertNotIn(pending_post.id, post_ids)
         self.assertIn(self.post.id, post_ids)
 
-    @patch("feed.views.funding_feed_view.cache")
+    @patch("feed.page_cache.cache")
     def test_funding_feed_cache(self, mock_cache):
         """Test caching functionality for funding feed"""
         # No cache on first request
@@ -286,7 +286,7 @@ class FundingFeedViewSetTests(AWSMockTestCase):
         vote_type = post_data["user_vote"]["vote_type"]
         self.assertEqual(vote_type, 1)  # 1 corresponds to UPVOTE
 
-    @patch("feed.views.funding_feed_view.cache")
+    @patch("feed.page_cache.cache")
     def test_authenticated_request_uses_cache_with_votes_applied(self, mock_cache):
         """Authenticated viewers reuse the cached payload, then get votes layered on."""
         post_content_type = ContentType.objects.get_for_model(ResearchhubPost)
@@ -329,7 +329,7 @@ class FundingFeedViewSetTests(AWSMockTestCase):
         self.assertIn("user_vote", post_data)
         self.assertEqual(post_data["user_vote"]["id"], vote.id)
 
-    @patch("feed.views.funding_feed_view.cache")
+    @patch("feed.page_cache.cache")
     def test_cached_payload_is_user_agnostic(self, mock_cache):
         """The payload written to cache must not contain viewer-specific votes.
 
@@ -360,7 +360,7 @@ class FundingFeedViewSetTests(AWSMockTestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertTrue(mock_cache.set.called)
-        for item in captured["payload"]["results"]:
+        for item in captured["payload"]["data"]["results"]:
             self.assertNotIn("user_vote", item)
 
     def test_get_cache_key(self):
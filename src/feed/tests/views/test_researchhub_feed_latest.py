@@ -116,7 +116,7 @@ class LatestFeedTests(APITestCase):
             second_date = results[1].get("action_date")
             self.assertGreaterEqual(first_date, second_date)
 
-    @patch("feed.views.feed_view.cache")
+    @patch("feed.page_cache.cache")
     def test_latest_feed_uses_cache(self, mock_cache):
         """Test that latest feed respects use_cache config."""
         url = reverse("feed-list")
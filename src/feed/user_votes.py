@@ -0,0 +1,117 @@
+"""
+Per-user vote index for overlaying `user_vote` onto cached feed pages.
+
+Each `(user, content type, object)` vote is cached under its own key, holding
+the `VoteSerializer` representation of the vote, or `NO_VOTE` when the user has
+not voted on the object. A page of feed items is resolved with a single
+`cache.get_many` round trip; only objects missing from the index are read from
+the database, and those results are written back for the next request.
+
+The vote signals in `feed.signals.vote_signals` keep the index up to date when
+votes are cast, changed or removed.
+"""
+
+from django.core.cache import cache
+from django.db.models import Q
+from rest_framework.fields import DateTimeField
+
+from discussion.models import Vote
+
+NO_VOTE = 0
+USER_VOTE_CACHE_TIMEOUT = 60 * 60 * 24
+
+_VOTE_FIELDS = (
+    "id",
+    "content_type_id",
+    "object_id",
+    "created_by_id",
+    "created_date",
+    "vote_type",
+)
+
+
+def user_vote_cache_key(user_id: int, content_type_id: int, object_id: int) -> str:
+    return f"feed:user_vote:{user_id}:{content_type_id}:{object_id}"
+
+
+def serialize_vote(vote: dict) -> dict:
+    """
+    Build the `VoteSerializer` representation from a `Vote.values()` row.
+    """
+    return {
+        "id": vote["id"],
+        "content_type": vote["content_type_id"],
+        "created_by": vote["created_by_id"],
+        "created_date": DateTimeField().to_representation(vote["created_date"]),
+        "vote_type": vote["vote_type"],
+        "item": vote["object_id"],
+    }
+
+
+def cache_user_vote(vote: Vote) -> None:
+    cache.set(
+        user_vote_cache_key(vote.created_by_id, vote.content_type_id, vote.object_id),
+        serialize_vote({field: getattr(vote, field) for field in _VOTE_FIELDS}),
+        timeout=USER_VOTE_CACHE_TIMEOUT,
+    )
+
+
+def clear_user_vote(vote: Vote) -> None:
+    cache.set(
+        user_vote_cache_key(vote.created_by_id, vote.content_type_id, vote.object_id),
+        NO_VOTE,
+        timeout=USER_VOTE_CACHE_TIMEOUT,
+    )
+
+
+def get_user_votes(
+    user_id: int, object_ids_by_content_type: dict[int, list[int]]
+) -> dict[tuple[int, int], dict]:
+    """
+    Return serialized votes of `user_id`, keyed by `(content_type_id, object_id)`.
+
+    Objects the user has not voted on are left out of the result.
+    """
+    keys = {
+        user_vote_cache_key(user_id, content_type_id, object_id): (
+            content_type_id,
+            object_id,
+        )
+        for content_type_id, object_ids in object_ids_by_content_type.items()
+        for object_id in object_ids
+    }
+    if not keys:
+        return {}
+
+    cached = cache.get_many(keys)
+    votes = {keys[key]: value for key, value in cached.items() if value != NO_VOTE}
+
+    missing = [item for key, item in keys.items() if key not in cached]
+    if missing:
+        missing_ids_by_content_type = {}
+        for content_type_id, object_id in missing:
+            missing_ids_by_content_type.setdefault(content_type_id, []).append(
+                object_id
+            )
+
+        query = Q()
+        for content_type_id, object_ids in missing_ids_by_content_type.items():
+            query |= Q(content_type_id=content_type_id, object_id__in=object_ids)
+
+        fetched = {
+            (row["content_type_id"], row["object_id"]): serialize_vote(row)
+            for row in Vote.objects.filter(query, created_by_id=user_id).values(
+                *_VOTE_FIELDS
+            )
+        }
+        votes.update(fetched)
+
+        # `add` so a vote cast while this page was being read is not overwritten
+        for content_type_id, object_id in missing:
+            cache.add(
+                user_vote_cache_key(user_id, content_type_id, object_id),
+                fetched.get((content_type_id, object_id), NO_VOTE),
+                timeout=USER_VOTE_CACHE_TIMEOUT,
+            )
+
+    return votes
@@ -1,13 +1,11 @@
 from django.contrib.auth.models import AnonymousUser
 from django.contrib.contenttypes.models import ContentType
-from django.core.cache import cache
 from django.db.models import Count, Exists, OuterRef, Prefetch, Q
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.test import APIRequestFactory
 from rest_framework.viewsets import ModelViewSet
 
-from discussion.serializers import VoteSerializer
 from feed.activity_feed_cache import (
     ACTIVITY_FEED_CACHE_PAGE_SIZE,
     ACTIVITY_FEED_CACHE_TIMEOUT,
@@ -16,8 +14,10 @@ from feed.activity_feed_cache import (
     should_cache_activity_feed,
 )
 from feed.models import FeedEntry
+from feed.page_cache import CACHE_MISS, get_cached_page, set_cached_page
 from feed.serializers import ActivityFeedEntrySerializer
-from feed.views.common import FeedPagination
+from feed.user_votes import get_user_votes
+from feed.views.common import FeedPagination, is_cursor_request
 from feed.views.feed_view_mixin import FeedViewMixin
 from paper.related_models.paper_model import Paper
 from purchase.models import Fundraise
@@ -68,6 +68,8 @@ class ActivityFeedViewSet(FeedViewMixin, ModelViewSet):
     Filters can be combined: e.g. ?scope=grants&content_type=RHCOMMENTMODEL
     returns only comments across all grant-related documents.
 
+    Pass ``?cursor=`` to page with keyset cursors instead of page numbers.
+
     The unscoped public discovery feed (pages 1–20, page_size=20) may be served
     from a shared warm cache. Moderators and hub editors always get a live
     response. Votes are attached after the cache read for authenticated users.
@@ -99,15 +101,13 @@ class ActivityFeedViewSet(FeedViewMixin, ModelViewSet):
             else:
                 post_ids.append(work_id)
 
-        paper_votes_map = {}
-        if paper_ids:
-            for vote in self._get_user_votes(user, paper_ids, self._paper_content_type):
-                paper_votes_map[int(vote.object_id)] = VoteSerializer(vote).data
-
-        post_votes_map = {}
-        if post_ids:
-            for vote in self._get_user_votes(user, post_ids, self._post_content_type):
-                post_votes_map[int(vote.object_id)] = VoteSerializer(vote).data
+        votes = get_user_votes(
+            user.id,
+            {
+                self._paper_content_type.id: paper_ids,
+                self._post_content_type.id: post_ids,
+            },
+        )
 
         for item in results:
             related = item.get("related_work")
@@ -115,38 +115,38 @@ class ActivityFeedViewSet(FeedViewMixin, ModelViewSet):
                 continue
             work_id = int(related["id"])
             if (related.get("document_type") or "").upper() == PAPER:
-                vote_data = paper_votes_map.get(work_id)
+                vote_data = votes.get((self._paper_content_type.id, work_id))
             else:
-                vote_data = post_votes_map.get(work_id)
+                vote_data = votes.get((self._post_content_type.id, work_id))
             if not vote_data:
                 continue
             related["user_vote"] = vote_data
             item["user_vote"] = vote_data
 
     def list(self, request, *args, **kwargs):
-        cache_key = None
-        if should_cache_activity_feed(request):
+        # Cached payloads carry page-number links, so cursor requests skip them
+        if not is_cursor_request(request) and should_cache_activity_feed(request):
             page = int(request.query_params.get("page", "1"))
-            cache_key = activity_feed_cache_key(page)
+            response_data, cache_status = get_cached_page(
+                activity_feed_cache_key(page),
+                self._build_list_data,
+                timeout=ACTIVITY_FEED_CACHE_TIMEOUT,
+            )
+        else:
+            response_data, cache_status = self._build_list_data(), CACHE_MISS
+
+        if request.user.is_authenticated:
+            self.add_user_votes_to_response(request.user, response_data)
 
-            cached_response = cache.get(cache_key)
-            if cached_response is not None:
-                if request.user.is_authenticated:
-                    self.add_user_votes_to_response(request.user, cached_response)
-                return Response(cached_response)
+        response = Response(response_data)
+        response["RH-Cache"] = cache_status
+        return response
 
+    def _build_list_data(self):
         queryset = self.filter_queryset(self.get_queryset())
         page = self.paginate_queryset(queryset)
         serializer = self.get_serializer(page, many=True)
-        response_data = self.get_paginated_response(serializer.data).data
-
-        if cache_key:
-            cache.set(cache_key, response_data, timeout=ACTIVITY_FEED_CACHE_TIMEOUT)
-
-        if request.user.is_authenticated:
-            self.add_user_votes_to_response(request.user, response_data)
-
-        return Response(response_data)
+        return self.get_paginated_response(serializer.data).data
 
     def get_queryset(self):
         queryset = (
@@ -267,7 +267,7 @@ class ActivityFeedViewSet(FeedViewMixin, ModelViewSet):
         """Replace cached payloads for pages 1–MAX with fresh public data."""
         for page in range(1, ACTIVITY_FEED_MAX_CACHED_PAGE + 1):
             payload = cls.build_page_payload(page)
-            cache.set(
+            set_cached_page(
                 activity_feed_cache_key(page),
                 payload,
                 timeout=ACTIVITY_FEED_CACHE_TIMEOUT,
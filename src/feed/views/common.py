@@ -2,24 +2,72 @@
 Common functionality shared between feed ViewSets.
 """
 
+import base64
+import binascii
+import json
 from collections import OrderedDict
 
+from django.core.exceptions import ValidationError
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 from researchhub.pagination import NoCountPaginator
 
+# Query param that switches feed pagination to keyset (cursor) mode.
+# Clients opt in by sending it empty for the first page and then follow the
+# `next`/`previous` links, which carry an opaque cursor value.
+CURSOR_QUERY_PARAM = "cursor"
+
+# Orderings that can be paginated with a keyset, mapped to their sort column.
+# Ties on the sort column are broken by `id`, which keeps pages stable.
+KEYSET_ORDERINGS = {
+    "-hot_score_v2": "hot_score_v2",
+    "-hot_score": "hot_score",
+    "-action_date": "action_date",
+}
+
+
+def is_cursor_request(request) -> bool:
+    """Return whether the client asked for cursor pagination."""
+    return CURSOR_QUERY_PARAM in request.query_params
+
 
 class FeedPagination(PageNumberPagination):
     """
     Pagination class for feed endpoints.
     Optimized to skip expensive COUNT queries.
+
+    Supports two modes:
+      - page number (default): `?page=N`, kept for existing clients.
+      - keyset (cursor): `?cursor=` for the first page, then the `next` and
+        `previous` links. Pages are read with a `(sort_key, id)` range filter
+        instead of OFFSET, so deep pages cost the same as the first one.
+        Only querysets ordered by one of `KEYSET_ORDERINGS` are paginated this
+        way; everything else (e.g. in-memory ordered recommendation lists)
+        falls back to page numbers.
     """
 
     page_size = 20
     page_size_query_param = "page_size"
     max_page_size = 100
     django_paginator_class = NoCountPaginator
+    cursor_query_param = CURSOR_QUERY_PARAM
+    invalid_cursor_message = "Invalid cursor"
+
+    keyset_field = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset_field = None
+        if is_cursor_request(request):
+            self.keyset_field = self._get_keyset_field(queryset)
+
+        if self.keyset_field is None:
+            return super().paginate_queryset(queryset, request, view)
+
+        return self._paginate_keyset(queryset, request)
 
     def get_paginated_response(self, data):
         """
@@ -41,3 +89,97 @@ class FeedPagination(PageNumberPagination):
                 ]
             )
         )
+
+    def get_next_link(self):
+        if self.keyset_field is None:
+            return super().get_next_link()
+        if not self.has_next or not self.page:
+            return None
+        return self._build_cursor_link(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if self.keyset_field is None:
+            return super().get_previous_link()
+        if not self.has_previous or not self.page:
+            return None
+        return self._build_cursor_link(self.page[0], reverse=True)
+
+    def _get_keyset_field(self, queryset):
+        if not isinstance(queryset, QuerySet):
+            return None
+        ordering = tuple(queryset.query.order_by)
+        if len(ordering) != 1:
+            return None
+        return KEYSET_ORDERINGS.get(ordering[0])
+
+    def _paginate_keyset(self, queryset, request):
+        self.request = request
+        field = self.keyset_field
+        page_size = self.get_page_size(request)
+        cursor = self._decode_cursor(request, queryset.model)
+
+        reverse = cursor is not None and cursor["reverse"]
+        if reverse:
+            queryset = queryset.order_by(field, "id")
+        else:
+            queryset = queryset.order_by(f"-{field}", "-id")
+
+        if cursor is not None:
+            # `field <= value` bounds the index range scan; the OR only
+            # resolves ties on `value`.
+            value, last_id = cursor["value"], cursor["id"]
+            if reverse:
+                queryset = queryset.filter(
+                    Q(**{f"{field}__gte": value}),
+                    Q(**{f"{field}__gt": value}) | Q(id__gt=last_id),
+                )
+            else:
+                queryset = queryset.filter(
+                    Q(**{f"{field}__lte": value}),
+                    Q(**{f"{field}__lt": value}) | Q(id__lt=last_id),
+                )
+
+        results = list(queryset[: page_size + 1])
+        has_more = len(results) > page_size
+        results = results[:page_size]
+
+        if reverse:
+            results.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = cursor is not None
+
+        self.page = results
+        return results
+
+    def _build_cursor_link(self, entry, reverse):
+        field = entry._meta.get_field(self.keyset_field)
+        payload = [field.name, field.value_to_string(entry), entry.id, reverse]
+        token = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, token)
+
+    def _decode_cursor(self, request, model):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None
+
+        try:
+            field, raw_value, last_id, reverse = json.loads(
+                base64.urlsafe_b64decode(token.encode())
+            )
+            if field != self.keyset_field:
+                raise ValueError("Cursor was issued for a different ordering")
+            value = model._meta.get_field(self.keyset_field).to_python(raw_value)
+            last_id = int(last_id)
+        except (TypeError, ValueError, binascii.Error, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if value is None:
+            raise NotFound(self.invalid_cursor_message)
+
+        return {"value": value, "id": last_id, "reverse": bool(reverse)}
@@ -1,5 +1,4 @@
 from django.conf import settings
-from django.core.cache import cache
 from rest_framework.response import Response
 from rest_framework.viewsets import ReadOnlyModelViewSet
 
@@ -7,7 +6,9 @@ from feed.feed_config import FEED_CONFIG, FEED_DEFAULTS
 from feed.filtering import FeedFilteringBackend
 from feed.models import FeedEntry
 from feed.ordering import FeedOrderingBackend
+from feed.page_cache import CACHE_MISS, get_cached_page
 from feed.serializers import FeedEntrySerializer
+from feed.views.common import CURSOR_QUERY_PARAM
 from feed.views.common import FeedPagination as BaseFeedPagination
 from feed.views.feed_view_mixin import FeedViewMixin
 from utils.throttles import FeedRecommendationRefreshThrottle
@@ -72,27 +73,21 @@ class FeedViewSet(FeedViewMixin, ReadOnlyModelViewSet):
         use_cache = self._should_use_cache(request, feed_config)
         cache_key = self.get_cache_key(request, feed_type="researchhub")
 
-        # Try cache first
         if use_cache:
-            cached_response = cache.get(cache_key)
-            if cached_response:
-                if request.user.is_authenticated:
-                    self.add_user_votes_to_response(request.user, cached_response)
-                response = Response(cached_response)
-                response["RH-Cache"] = self._with_auth_suffix(request, "hit")
-                self._add_feed_source_header(response, feed_view)
-                return response
-
-        # Fetch fresh data
-        response = super().list(request)
-
-        if use_cache:
-            cache.set(cache_key, response.data, timeout=self.DEFAULT_CACHE_TIMEOUT)
+            list_page = super().list
+            response_data, cache_status = get_cached_page(
+                cache_key,
+                lambda: list_page(request).data,
+                timeout=self.DEFAULT_CACHE_TIMEOUT,
+            )
+        else:
+            response_data, cache_status = super().list(request).data, CACHE_MISS
 
         if request.user.is_authenticated:
-            self.add_user_votes_to_response(request.user, response.data)
+            self.add_user_votes_to_response(request.user, response_data)
 
-        response["RH-Cache"] = self._with_auth_suffix(request, "miss")
+        response = Response(response_data)
+        response["RH-Cache"] = self._with_auth_suffix(request, cache_status)
         self._add_feed_source_header(response, feed_view)
         return response
 
@@ -110,6 +105,10 @@ class FeedViewSet(FeedViewMixin, ReadOnlyModelViewSet):
         if disable_token == settings.HEALTH_CHECK_TOKEN:
             return False
 
+        # Only the first cursor page is cached; deeper keyset pages are cheap
+        if request.query_params.get(CURSOR_QUERY_PARAM):
+            return False
+
         # Page limit check
         page_num = int(request.query_params.get("page", "1"))
         return page_num <= FEED_DEFAULTS["cache"]["num_pages_to_cache"]
@@ -3,11 +3,10 @@ from django.core.cache import cache
 from django.db.models import Model
 from rest_framework.request import Request
 
-from discussion.models import Vote
-from discussion.serializers import VoteSerializer
 from feed.models import FeedEntry
 from feed.serializers import serialize_feed_metrics
-from feed.views.common import FeedPagination
+from feed.user_votes import get_user_votes
+from feed.views.common import FeedPagination, is_cursor_request
 from hub.models import Hub
 from paper.related_models.paper_model import Paper
 from researchhub_comment.related_models.rh_comment_model import RhCommentModel
@@ -90,98 +89,40 @@ class FeedViewMixin:
         """
         Add user votes to feed items in the response data.
 
+        Votes are read from the per-user vote index in a single cache round
+        trip; see `feed.user_votes`.
+
         Args:
             user: The authenticated user
             response_data: The response data containing feed items
         """
-        # Get uppercase model names from ContentType objects
-        paper_type_str = self._paper_content_type.model.upper()
-        post_type_str = self._post_content_type.model.upper()
-        comment_type_str = self._comment_content_type.model.upper()
-
-        paper_ids = []
-        post_ids = []
-        comment_ids = []
+        # Map uppercase model names to content type ids
+        content_type_ids = {
+            content_type.model.upper(): content_type.id
+            for content_type in (
+                self._paper_content_type,
+                self._post_content_type,
+                self._comment_content_type,
+            )
+        }
 
         # Collect IDs for each content type
+        item_keys = []
+        object_ids_by_content_type = {}
         for item in response_data["results"]:
             content_object = item.get("content_object")
-            if not content_object:
+            content_type_id = content_type_ids.get(item.get("content_type"))
+            if not content_object or content_type_id is None:
                 continue
 
-            content_type_str = item.get("content_type")
-            if content_type_str == paper_type_str:
-                paper_ids.append(int(content_object["id"]))
-            elif content_type_str == post_type_str:
-                post_ids.append(int(content_object["id"]))
-            elif content_type_str == comment_type_str:
-                comment_ids.append(int(content_object["id"]))
-
-        # Process paper votes
-        if paper_ids:
-            paper_votes = self._get_user_votes(
-                user,
-                paper_ids,
-                self._paper_content_type,
-            )
+            key = (content_type_id, int(content_object["id"]))
+            item_keys.append((item, key))
+            object_ids_by_content_type.setdefault(content_type_id, []).append(key[1])
 
-            paper_votes_map = {}
-            for vote in paper_votes:
-                paper_votes_map[int(vote.object_id)] = VoteSerializer(vote).data
-
-            for item in response_data["results"]:
-                if item.get("content_type") != paper_type_str:
-                    continue
-                content_object = item.get("content_object")
-                if not content_object:
-                    continue
-                paper_id = int(content_object["id"])
-                if paper_id in paper_votes_map:
-                    item["user_vote"] = paper_votes_map[paper_id]
-
-        # Process post votes
-        if post_ids:
-            post_votes = self._get_user_votes(
-                user,
-                post_ids,
-                self._post_content_type,
-            )
-
-            post_votes_map = {}
-            for vote in post_votes:
-                post_votes_map[int(vote.object_id)] = VoteSerializer(vote).data
-
-            for item in response_data["results"]:
-                if item.get("content_type") != post_type_str:
-                    continue
-                content_object = item.get("content_object")
-                if not content_object:
-                    continue
-                post_id = int(content_object["id"])
-                if post_id in post_votes_map:
-                    item["user_vote"] = post_votes_map[post_id]
-
-        # Process comment votes
-        if comment_ids:
-            comment_votes = self._get_user_votes(
-                user,
-                comment_ids,
-                self._comment_content_type,
-            )
-
-            comment_votes_map = {}
-            for vote in comment_votes:
-                comment_votes_map[int(vote.object_id)] = VoteSerializer(vote).data
-
-            for item in response_data["results"]:
-                if item.get("content_type") != comment_type_str:
-                    continue
-                content_object = item.get("content_object")
-                if not content_object:
-                    continue
-                comment_id = int(content_object["id"])
-                if comment_id in comment_votes_map:
-                    item["user_vote"] = comment_votes_map[comment_id]
+        votes = get_user_votes(user.id, object_ids_by_content_type)
+        for item, key in item_keys:
+            if key in votes:
+                item["user_vote"] = votes[key]
 
     def get_common_serializer_context(self):
         """
@@ -230,7 +171,12 @@ class FeedViewMixin:
         if view_as_user_id is not None:
             target_user_id = view_as_user_id
 
-        page = request.query_params.get("page", "1")
+        # Cursor-mode responses carry cursor links, so they never share a key
+        # with page-number responses
+        if is_cursor_request(request):
+            page = "cursor"
+        else:
+            page = request.query_params.get("page", "1")
         page_size = request.query_params.get(
             FeedPagination.page_size_query_param,
             str(FeedPagination.page_size),
@@ -273,13 +219,6 @@ class FeedViewMixin:
             ).values_list("object_id", flat=True)
         )
 
-    def _get_user_votes(self, created_by, doc_ids, reaction_content_type):
-        return Vote.objects.filter(
-            content_type=reaction_content_type,
-            object_id__in=doc_ids,
-            created_by=created_by,
-        )
-
     @staticmethod
     def invalidate_feed_cache_for_user(user_id):
         """
@@ -305,7 +244,7 @@ class FeedViewMixin:
         feed_views = ["following"]
         hub_parts = ["all"]
         source_parts = ["all", "researchhub"]
-        pages = ["1", "2", "3", "4"]
+        pages = ["1", "2", "3", "4", "cursor"]
         page_sizes = ["20"]
 
         for feed_view in feed_views:
@@ -8,7 +8,6 @@ This is done for three reasons:
 3. Older feed entries are not in the feed table.
 """
 
-from django.core.cache import cache
 from django.db.models import Count, Prefetch, Q
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.response import Response
@@ -20,6 +19,7 @@ from feed.feed_list_dto import (
     serialize_fund_feed_metrics,
 )
 from feed.filters import FundOrderingFilter
+from feed.page_cache import CACHE_MISS, get_cached_page
 from feed.views.feed_view_mixin import FeedViewMixin
 from feed.views.funding_cache_mixin import (
     FUNDING_FEED_MAX_CACHED_PAGE,
@@ -71,12 +71,20 @@ class FundingFeedViewSet(FundingCacheMixin, FeedViewMixin, ReadOnlyModelViewSet)
         )
 
         if cache_key:
-            cached_response = cache.get(cache_key)
-            if cached_response:
-                if request.user.is_authenticated:
-                    self.add_user_votes_to_response(request.user, cached_response)
-                return Response(cached_response)
+            response_data, cache_status = get_cached_page(
+                cache_key, self._build_list_data, timeout=self.DEFAULT_CACHE_TIMEOUT
+            )
+        else:
+            response_data, cache_status = self._build_list_data(), CACHE_MISS
+
+        if request.user.is_authenticated:
+            self.add_user_votes_to_response(request.user, response_data)
+
+        response = Response(response_data)
+        response["RH-Cache"] = cache_status
+        return response
 
+    def _build_list_data(self):
         queryset = self.filter_queryset(self.get_queryset())
         page = self.paginate_queryset(queryset)
 
@@ -93,15 +101,7 @@ class FundingFeedViewSet(FundingCacheMixin, FeedViewMixin, ReadOnlyModelViewSet)
         serializer = FundingFeedListEntrySerializer(
             feed_entries, many=True, context=self.get_serializer_context()
         )
-        response_data = self.get_paginated_response(serializer.data).data
-
-        if cache_key:
-            cache.set(cache_key, response_data, timeout=self.DEFAULT_CACHE_TIMEOUT)
-
-        if request.user.is_authenticated:
-            self.add_user_votes_to_response(request.user, response_data)
-
-        return Response(response_data)
+        return self.get_paginated_response(serializer.data).data
 
     def get_queryset(self):
         fundraise_status = self.request.query_params.get("fundraise_status")
@@ -4,7 +4,6 @@ This view displays grants in a feed format, showing funding opportunities
 and research grant postings.
 """
 
-from django.core.cache import cache
 from django.db.models import Prefetch, Q
 from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
@@ -15,6 +14,7 @@ from ai_peer_review.models import ProposalReview
 from feed.cache_segment import get_feed_cache_segment
 from feed.feed_list_dto import GrantFeedListEntrySerializer
 from feed.filters import FundOrderingFilter
+from feed.page_cache import CACHE_MISS, get_cached_page
 from feed.views.feed_view_mixin import FeedViewMixin
 from feed.views.grant_cache_mixin import GRANT_FEED_MAX_CACHED_PAGE, GrantCacheMixin
 from purchase.related_models.fundraise_model import Fundraise
@@ -61,10 +61,17 @@ class GrantFeedViewSet(GrantCacheMixin, FeedViewMixin, ReadOnlyModelViewSet):
         )
 
         if cache_key:
-            cached_response = cache.get(cache_key)
-            if cached_response:
-                return Response(cached_response)
+            response_data, cache_status = get_cached_page(
+                cache_key, self._build_list_data, timeout=self.DEFAULT_CACHE_TIMEOUT
+            )
+        else:
+            response_data, cache_status = self._build_list_data(), CACHE_MISS
+
+        response = Response(response_data)
+        response["RH-Cache"] = cache_status
+        return response
 
+    def _build_list_data(self):
         queryset = self.filter_queryset(self.get_queryset())
         page = self.paginate_queryset(queryset)
 
@@ -78,12 +85,7 @@ class GrantFeedViewSet(GrantCacheMixin, FeedViewMixin, ReadOnlyModelViewSet):
         serializer = GrantFeedListEntrySerializer(
             feed_entries, many=True, context=self.get_serializer_context()
         )
-        response_data = self.get_paginated_response(serializer.data).data
-
-        if cache_key:
-            cache.set(cache_key, response_data, timeout=self.DEFAULT_CACHE_TIMEOUT)
-
-        return Response(response_data)
+        return self.get_paginated_response(serializer.data).data
 
     def get_queryset(self):
         status = self.request.query_params.get("status")
@@ -0,0 +1,120 @@
+"""
+Incremental hub counts.
+
+`Hub.paper_count` and `Hub.discussion_count` are adjusted by deltas when
+documents are added to or removed from hubs, and when a document's discussion
+count is refreshed. `hub.tasks.calculate_and_set_hub_counts` reconciles them
+nightly for changes that don't send signals (bulk updates, cascading deletes).
+"""
+
+import logging
+from collections import Counter
+
+from django.db.models import Case, F, IntegerField, Sum, Value, When
+from django.db.models.signals import m2m_changed, post_save, pre_save
+from django.dispatch import receiver
+
+from hub.models import Hub
+from paper.related_models.paper_model import Paper
+from researchhub_document.related_models.researchhub_post_model import (
+    ResearchhubPost,
+)
+from researchhub_document.related_models.researchhub_unified_document_model import (
+    ResearchhubUnifiedDocument,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(
+    m2m_changed,
+    sender=ResearchhubUnifiedDocument.hubs.through,
+    dispatch_uid="hub_counts_on_document_hubs_changed",
+)
+def update_hub_counts_on_hubs_changed(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    # `post_add` only gets the newly linked IDs, but `pre_remove` gets all IDs
+    # passed to `remove()`, so removals are read from the links that exist.
+    if action == "post_add":
+        sign = 1
+    elif action in ("pre_remove", "pre_clear"):
+        sign = -1
+    else:
+        return
+
+    source_field = "hub_id" if reverse else "researchhubunifieddocument_id"
+    target_field = "researchhubunifieddocument_id" if reverse else "hub_id"
+    links = sender.objects.filter(**{source_field: instance.pk})
+    if action != "pre_clear":
+        links = links.filter(**{f"{target_field}__in": pk_set})
+    links = list(links.values_list("hub_id", "researchhubunifieddocument_id"))
+    if not links:
+        return
+
+    discussion_counts = _get_discussion_counts({doc_id for _, doc_id in links})
+    paper_deltas = Counter()
+    discussion_deltas = Counter()
+    for hub_id, doc_id in links:
+        paper_deltas[hub_id] += sign
+        discussion_deltas[hub_id] += sign * discussion_counts.get(doc_id, 0)
+
+    _apply_deltas(paper_deltas, discussion_deltas)
+
+
+@receiver(pre_save, sender=Paper, dispatch_uid="hub_counts_paper_pre_save")
+@receiver(pre_save, sender=ResearchhubPost, dispatch_uid="hub_counts_post_pre_save")
+def remember_discussion_count(sender, instance, update_fields, **kwargs):
+    # Only targeted saves of the discussion count are tracked, full saves are
+    # left to the nightly reconciliation to avoid a read on every save.
+    if not instance.pk or not update_fields or "discussion_count" not in update_fields:
+        return
+    instance._previous_discussion_count = (
+        sender.objects.filter(pk=instance.pk)
+        .values_list("discussion_count", flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=Paper, dispatch_uid="hub_counts_paper_post_save")
+@receiver(post_save, sender=ResearchhubPost, dispatch_uid="hub_counts_post_post_save")
+def update_hub_counts_on_discussion_count(sender, instance, **kwargs):
+    previous = instance.__dict__.pop("_previous_discussion_count", None)
+    if previous is None or not instance.unified_document_id:
+        return
+
+    delta = instance.discussion_count - previous
+    if delta:
+        Hub.objects.filter(related_documents=instance.unified_document_id).update(
+            discussion_count=F("discussion_count") + delta
+        )
+
+
+def _get_discussion_counts(unified_document_ids) -> dict[int, int]:
+    counts = Counter()
+    for model in (Paper, ResearchhubPost):
+        rows = (
+            model.objects.filter(unified_document_id__in=unified_document_ids)
+            .values("unified_document_id")
+            .annotate(total=Sum("discussion_count"))
+            .values_list("unified_document_id", "total")
+        )
+        for doc_id, total in rows:
+            counts[doc_id] += total or 0
+    return counts
+
+
+def _apply_deltas(paper_deltas: Counter, discussion_deltas: Counter):
+    """Apply per-hub deltas in a single UPDATE."""
+
+    def delta_case(deltas):
+        return Case(
+            *[When(id=hub_id, then=Value(delta)) for hub_id, delta in deltas.items()],
+            default=Value(0),
+            output_field=IntegerField(),
+        )
+
+    Hub.objects.filter(id__in=paper_deltas.keys()).update(
+        paper_count=F("paper_count") + delta_case(paper_deltas),
+        discussion_count=F("discussion_count") + delta_case(discussion_deltas),
+    )
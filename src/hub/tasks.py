@@ -1,23 +1,67 @@
-from django.db.models import Count, F, Sum
+import logging
+
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Sum
 from django.db.models.functions import Coalesce
 
 from hub.models import Hub
+from paper.related_models.paper_model import Paper
 from researchhub.celery import app
+from researchhub_document.related_models.researchhub_post_model import (
+    ResearchhubPost,
+)
+from researchhub_document.related_models.researchhub_unified_document_model import (
+    ResearchhubUnifiedDocument,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _hub_subquery(queryset, hub_field, aggregate):
+    """
+    Aggregate `queryset` per hub, as a subquery correlated with the outer hub.
+    Each aggregate is computed on its own, so joins don't multiply each other.
+    """
+    return Coalesce(
+        Subquery(
+            queryset.filter(**{hub_field: OuterRef("pk")})
+            .order_by()
+            .values(hub_field)
+            .annotate(total=aggregate)
+            .values("total"),
+            output_field=IntegerField(),
+        ),
+        0,
+    )
+
+
+def get_expected_hub_counts():
+    """Expressions for `Hub.paper_count` and `Hub.discussion_count`."""
+    paper_count = _hub_subquery(
+        ResearchhubUnifiedDocument.hubs.through.objects.all(), "hub", Count("*")
+    )
+    discussion_count = _hub_subquery(
+        ResearchhubPost.objects.all(),
+        "unified_document__hubs",
+        Sum("discussion_count"),
+    ) + _hub_subquery(
+        Paper.objects.all(), "unified_document__hubs", Sum("discussion_count")
+    )
+    return paper_count, discussion_count
 
 
 @app.task
 def calculate_and_set_hub_counts():
-    hubs = Hub.objects.annotate(
-        total_paper_count=Count("related_documents"),
-        posts_discussion_count=Sum("related_documents__posts__discussion_count"),
-        paper_discussion_count=Sum("related_documents__paper__discussion_count"),
-    ).annotate(
-        # Combine the summed counts from posts and paper for total discussion count
-        total_discussion_count=Coalesce(F("posts_discussion_count"), 0)
-        + Coalesce(F("paper_discussion_count"), 0)
-    )
+    """
+    Reconcile hub counts with the documents in each hub.
 
-    for hub in hubs.iterator():
-        hub.paper_count = hub.total_paper_count
-        hub.discussion_count = hub.total_discussion_count
-        hub.save(update_fields=["paper_count", "discussion_count"])
+    The counts are kept up to date incrementally by `hub.signals`, so this only
+    rewrites hubs that drifted (e.g. after bulk updates or deletes that don't
+    send signals), in a single UPDATE.
+    """
+    paper_count, discussion_count = get_expected_hub_counts()
+    updated = Hub.objects.exclude(
+        paper_count=paper_count, discussion_count=discussion_count
+    ).update(paper_count=paper_count, discussion_count=discussion_count)
+    if updated:
+        logger.warning(f"Reconciled counts of {updated} hubs")
+    return updated
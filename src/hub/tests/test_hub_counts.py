@@ -0,0 +1,85 @@
+from django.test import TestCase
+
+from hub.models import Hub
+from hub.tasks import calculate_and_set_hub_counts
+from hub.tests.helpers import create_hub
+from researchhub_document.helpers import create_post
+from researchhub_document.related_models.researchhub_post_model import (
+    ResearchhubPost,
+)
+from user.tests.helpers import create_random_default_user
+
+
+class HubCountsTests(TestCase):
+    def setUp(self):
+        self.user = create_random_default_user("hub_counts_user")
+        self.hub = create_hub(name="Hub Counts")
+        self.other_hub = create_hub(name="Other Hub Counts")
+
+    def _create_post(self, discussion_count=0):
+        post = create_post(created_by=self.user)
+        ResearchhubPost.objects.filter(id=post.id).update(
+            discussion_count=discussion_count
+        )
+        post.discussion_count = discussion_count
+        return post
+
+    def _counts(self, hub):
+        hub.refresh_from_db()
+        return hub.paper_count, hub.discussion_count
+
+    def test_adding_and_removing_documents_updates_counts(self):
+        # Arrange
+        post1 = self._create_post(discussion_count=3)
+        post2 = self._create_post(discussion_count=2)
+
+        # Act
+        post1.unified_document.hubs.add(self.hub, self.other_hub)
+        self.hub.related_documents.add(post2.unified_document)
+        added = (self._counts(self.hub), self._counts(self.other_hub))
+        post1.unified_document.hubs.remove(self.hub, self.hub)
+        post2.unified_document.hubs.remove(self.other_hub)  # not linked
+        removed = self._counts(self.hub)
+        self.other_hub.related_documents.clear()
+
+        # Assert
+        self.assertEqual(added, ((2, 5), (1, 3)))
+        self.assertEqual(removed, (1, 2))
+        self.assertEqual(self._counts(self.other_hub), (0, 0))
+
+    def test_discussion_count_refresh_updates_hub_counts(self):
+        # Arrange
+        post = self._create_post(discussion_count=1)
+        post.unified_document.hubs.add(self.hub, self.other_hub)
+
+        # Act
+        post.discussion_count = 4
+        post.save(update_fields=["discussion_count"])
+
+        # Assert
+        self.assertEqual(self._counts(self.hub), (1, 4))
+        self.assertEqual(self._counts(self.other_hub), (1, 4))
+
+    def test_reconciliation_fixes_drifted_hubs_only(self):
+        # Arrange
+        post = self._create_post(discussion_count=2)
+        # A second post on the same document shouldn't multiply the counts.
+        ResearchhubPost.objects.create(
+            title="Second post",
+            created_by=self.user,
+            document_type="DISCUSSION",
+            renderable_text="text",
+            unified_document=post.unified_document,
+            discussion_count=5,
+        )
+        post.unified_document.hubs.add(self.hub)
+        Hub.objects.filter(id=self.hub.id).update(paper_count=10, discussion_count=0)
+
+        # Act
+        updated = calculate_and_set_hub_counts()
+
+        # Assert
+        self.assertEqual(updated, 1)
+        self.assertEqual(self._counts(self.hub), (1, 7))
+        self.assertEqual(self._counts(self.other_hub), (0, 0))
+        self.assertEqual(calculate_and_set_hub_counts(), 0)
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+
+from note.models import Note
+from note.services.note_version_storage import compact_note_history
+
+
+class Command(BaseCommand):
+    help = (
+        "Delta-encode the stored version history of existing notes. New "
+        "versions are delta-encoded on save; this converts older full rows."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--note-id",
+            type=int,
+            action="append",
+            dest="note_ids",
+            help="Only compact this note. Can be passed more than once.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        notes = Note.objects.order_by("id")
+        if options["note_ids"]:
+            notes = notes.filter(id__in=options["note_ids"])
+
+        converted = 0
+        for note_id in notes.values_list("id", flat=True).iterator():
+            converted += compact_note_history(note_id)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Delta-encoded {converted} note versions.")
+        )
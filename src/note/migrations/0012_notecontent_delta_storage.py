@@ -0,0 +1,42 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+import note.related_models.note_model
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("note", "0011_note_selected_grant"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="notecontent",
+            name="delta",
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="notecontent",
+            name="keyframe",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.DO_NOTHING,
+                related_name="delta_versions",
+                to="note.notecontent",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="notecontent",
+            name="json",
+            field=note.related_models.note_model.VersionContentJSONField(
+                blank=True, null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="notecontent",
+            name="plain_text",
+            field=note.related_models.note_model.VersionContentTextField(null=True),
+        ),
+    ]
@@ -2,7 +2,7 @@ import json
 
 from asgiref.sync import async_to_sync
 from channels.layers import get_channel_layer
-from django.db import models
+from django.db import models, transaction
 
 from researchhub_document.models import ResearchhubUnifiedDocument
 from researchhub_document.related_models.constants.document_type import DOCUMENT_TYPES
@@ -137,6 +137,26 @@ def parse_note_json(value: object) -> dict[str, object] | None:
     return parsed
 
 
+class VersionContentFieldMixin:
+    """Stores NULL for delta-encoded versions (see ``note_version_storage``).
+
+    The instance keeps the full value; only the column stays empty.
+    """
+
+    def pre_save(self, model_instance, add):
+        if model_instance.delta is not None:
+            return None
+        return super().pre_save(model_instance, add)
+
+
+class VersionContentJSONField(VersionContentFieldMixin, models.JSONField):
+    pass
+
+
+class VersionContentTextField(VersionContentFieldMixin, models.TextField):
+    pass
+
+
 class NoteContent(models.Model):
     # created_via values; null means unknown (legacy rows).
     CREATED_VIA_EDITOR = "editor"
@@ -172,7 +192,7 @@ class NoteContent(models.Model):
         related_name="derived_versions",
         on_delete=models.SET_NULL,
     )
-    plain_text = models.TextField(null=True)
+    plain_text = VersionContentTextField(null=True)
     src = models.FileField(
         max_length=512,
         upload_to="note/uploads/%Y/%m/%d",
@@ -180,4 +200,45 @@ class NoteContent(models.Model):
         null=True,
         blank=True,
     )
-    json = models.JSONField(null=True, blank=True)
+    json = VersionContentJSONField(null=True, blank=True)
+    # Delta storage: versions after a keyframe hold the edits from it instead
+    # of a full copy of the document; see note.services.note_version_storage.
+    keyframe = models.ForeignKey(
+        "self",
+        null=True,
+        blank=True,
+        related_name="delta_versions",
+        # Dependents are materialized by a pre_delete receiver instead.
+        on_delete=models.DO_NOTHING,
+    )
+    delta = models.JSONField(null=True, blank=True)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        from note.services.note_version_storage import load_version_content
+
+        version = super().from_db(db, field_names, values)
+        load_version_content(version)
+        return version
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        # Content of a delta version can only be rebuilt with its storage
+        # fields, e.g. when a deferred ``json`` is loaded.
+        if fields is not None and {"json", "plain_text"} & set(fields):
+            fields = {*fields, "keyframe", "delta"}
+        super().refresh_from_db(using, fields, from_queryset)
+
+    def save(self, *args, **kwargs):
+        from note.services.note_version_storage import (
+            prepare_version_for_save,
+            remember_version_content,
+        )
+
+        # The keyframe locked while choosing the storage is held until the
+        # row is written.
+        with transaction.atomic(using=kwargs.get("using")):
+            kwargs["update_fields"] = prepare_version_for_save(
+                self, kwargs.get("update_fields")
+            )
+            super().save(*args, **kwargs)
+        remember_version_content(self)
@@ -44,7 +44,8 @@ class NoteContentSerializer(ModelSerializer):
 
     class Meta:
         model = NoteContent
-        fields = "__all__"
+        # Storage internals; json/plain_text always hold the full content.
+        exclude = ["keyframe", "delta"]
         # Server-owned lineage and attribution: set by the create paths,
         # never client-writable (PUT/PATCH must not forge them).
         read_only_fields = ["created_by", "created_via", "note", "parent_version"]
@@ -63,7 +64,7 @@ class NoteContentSerializer(ModelSerializer):
 class DynamicNoteContentSerializer(DynamicModelFieldSerializer):
     class Meta:
         model = NoteContent
-        fields = "__all__"
+        exclude = ["keyframe", "delta"]
 
 
 class NoteSerializer(ModelSerializer):
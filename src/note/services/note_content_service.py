@@ -3,7 +3,9 @@
 Mirrors the persistence model of ``NoteContentViewSet.create``: note content
 is append-only. Every edit creates a new ``NoteContent`` row and the
 ``update_latest_version`` post_save signal repoints ``note.latest_version``,
-so prior versions remain available as history.
+so prior versions remain available as history. Most rows are stored as
+block edits against a recent full version and rebuilt on load (see
+``note_version_storage``); callers always see complete content.
 """
 
 import json
@@ -0,0 +1,483 @@
+"""Delta storage for note content versions.
+
+Every editor autosave and agent edit appends a ``NoteContent`` row, and
+consecutive versions of a note are nearly identical. Instead of a full copy
+of the document per row, versions are stored as:
+
+- keyframes: full ``json``/``plain_text`` columns, as before;
+- deltas: ``keyframe`` plus a ``delta`` holding the block edits (in the
+  ``edit_note`` wire format of ``research_ai.services.note_block_edits``,
+  with blocks in the compact dialect of ``utils.prosemirror``) and line
+  edits of the plain text that turn the keyframe into the version. Their
+  ``json``/``plain_text`` columns are NULL.
+
+Deltas are relative to the keyframe, not to the previous version, so any
+version is rebuilt from two rows no matter how long the history is, and
+concurrent writers never depend on each other's rows. A new keyframe starts
+every ``KEYFRAME_INTERVAL`` versions, or sooner once the delta would be more
+than ``MAX_DELTA_RATIO`` of the full content. A version is only stored as a
+delta when decoding it gives back exactly what was written (same JSON
+string), otherwise it becomes a keyframe.
+
+Reads are transparent: ``NoteContent.from_db`` fills in ``json`` and
+``plain_text`` of delta rows, through an in-process LRU cache of recently
+read versions. Deltas carry a fingerprint of their keyframe, so a keyframe
+rewritten in another process is reloaded instead of served stale.
+
+Writers take a row lock on the keyframe (``select_for_update``): encoding a
+new delta and rewriting or deleting a keyframe are serialized, so a delta is
+never written against keyframe content that is being replaced.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from copy import deepcopy
+from difflib import SequenceMatcher
+
+from django.db import transaction
+
+from note.related_models.note_model import NoteContent, parse_note_json
+from research_ai.services.note_block_edits import (
+    DELETE,
+    INSERT,
+    REPLACE,
+    apply_block_edits,
+    parse_block_edits,
+)
+from utils.prosemirror import BLOCK_EDITOR, compact_blocks, parse_blocks
+
+KEYFRAME_INTERVAL = 50
+MAX_DELTA_RATIO = 0.5
+CACHE_SIZE = 512
+
+# How the JSON string of a version is re-encoded: the service path writes
+# ``json.dumps`` output, the editor ``JSON.stringify`` output.
+OBJECT_ENCODING = "object"
+JSON_ENCODINGS = {
+    "python": {},
+    "js": {"separators": (",", ":"), "ensure_ascii": False},
+}
+
+CONTENT_FIELDS = ("json", "plain_text")
+STORAGE_FIELDS = ("keyframe", "delta")
+
+logger = logging.getLogger(__name__)
+
+
+class VersionCache:
+    """Thread-safe LRU of ``version_id -> (json, plain_text, fingerprint)``."""
+
+    def __init__(self, maxsize: int = CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[int, tuple] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, version_id: int) -> tuple | None:
+        with self._lock:
+            entry = self._entries.get(version_id)
+            if entry is not None:
+                self._entries.move_to_end(version_id)
+            return entry
+
+    def set(self, version_id: int, json_value, plain_text) -> tuple:
+        entry = (json_value, plain_text, fingerprint(json_value, plain_text))
+        with self._lock:
+            self._entries[version_id] = entry
+            self._entries.move_to_end(version_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return entry
+
+    def discard(self, version_id: int) -> None:
+        with self._lock:
+            self._entries.pop(version_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+version_cache = VersionCache()
+
+
+def fingerprint(json_value, plain_text) -> str:
+    payload = json.dumps([json_value, plain_text], sort_keys=True)
+    return hashlib.sha1(payload.encode()).hexdigest()[:16]
+
+
+# -- encoding ---------------------------------------------------------------
+
+
+def encode_delta(
+    keyframe_json, keyframe_text, json_value, plain_text, n: int = 1
+) -> dict | None:
+    """The delta turning a keyframe's content into ``json_value``/``plain_text``.
+
+    Returns ``None`` when the version should be stored in full instead:
+    either document is not a block document, the JSON string is not one
+    this module re-encodes byte for byte, or the delta is not small enough.
+    """
+    keyframe_doc = parse_note_json(keyframe_json)
+    doc = parse_note_json(json_value)
+    if not _has_blocks(keyframe_doc) or not _has_blocks(doc):
+        return None
+    encoding = _detect_encoding(json_value, doc)
+    if encoding is None:
+        return None
+
+    delta = {
+        "n": n,
+        "base": fingerprint(keyframe_json, keyframe_text),
+        "encoding": encoding,
+        "text": _diff_text(keyframe_text, plain_text),
+    }
+    root = _root(doc)
+    if root != _root(keyframe_doc):
+        delta["root"] = root
+
+    full_size = len(json.dumps([json_value, plain_text]))
+    edits = _diff_blocks(keyframe_doc["content"], doc["content"])
+    # Compact blocks are smaller but only round-trip for documents the
+    # editor schema accepts; the decode check below catches the rest.
+    for compact in (True, False):
+        candidate = _with_edits(delta, edits, compact)
+        if candidate is None:
+            continue
+        if len(json.dumps(candidate)) > MAX_DELTA_RATIO * full_size:
+            return None
+        try:
+            decoded = decode_delta(keyframe_json, keyframe_text, candidate)
+        except ValueError:
+            continue
+        if decoded == (json_value, plain_text):
+            return candidate
+    return None
+
+
+def decode_delta(keyframe_json, keyframe_text, delta: dict) -> tuple:
+    """The ``(json, plain_text)`` of a version from its keyframe's content."""
+    keyframe_doc = parse_note_json(keyframe_json)
+    edits = parse_block_edits(delta["edits"]) if delta["edits"] else []
+    if delta.get("compact"):
+        for edit in edits:
+            if edit.blocks is not None:
+                edit.blocks = parse_blocks(BLOCK_EDITOR, edit.blocks)
+    blocks = apply_block_edits(keyframe_doc["content"], edits)
+
+    root = delta.get("root", _root(keyframe_doc))
+    doc = {key: blocks if key == "content" else value for key, value in root.items()}
+    if delta["encoding"] == OBJECT_ENCODING:
+        json_value = doc
+    else:
+        json_value = json.dumps(doc, **JSON_ENCODINGS[delta["encoding"]])
+    return json_value, _apply_text(keyframe_text, delta["text"])
+
+
+def _has_blocks(doc) -> bool:
+    return isinstance(doc, dict) and isinstance(doc.get("content"), list)
+
+
+def _detect_encoding(json_value, doc: dict) -> str | None:
+    if isinstance(json_value, dict):
+        return OBJECT_ENCODING
+    for name, options in JSON_ENCODINGS.items():
+        if json.dumps(doc, **options) == json_value:
+            return name
+    return None
+
+
+def _root(doc: dict) -> dict:
+    # "content" stays as a placeholder so decoding keeps the key order.
+    return {key: None if key == "content" else value for key, value in doc.items()}
+
+
+def _diff_blocks(old: list, new: list) -> list[dict]:
+    # Blocks compare by their exact JSON, so a reordered key is a change.
+    matcher = SequenceMatcher(
+        None,
+        [json.dumps(block) for block in old],
+        [json.dumps(block) for block in new],
+        autojunk=False,
+    )
+    edits = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "replace":
+            edits.append(
+                {"op": REPLACE, "from": i1, "to": i2 - 1, "blocks": new[j1:j2]}
+            )
+        elif tag == "delete":
+            edits.append({"op": DELETE, "from": i1, "to": i2 - 1})
+        elif tag == "insert":
+            edits.append({"op": INSERT, "at": i1, "blocks": new[j1:j2]})
+    return edits
+
+
+def _with_edits(delta: dict, edits: list[dict], compact: bool) -> dict | None:
+    if not compact:
+        return {**delta, "edits": edits}
+    compacted = []
+    for edit in edits:
+        if "blocks" in edit:
+            try:
+                blocks = compact_blocks(
+                    BLOCK_EDITOR, {"type": "doc", "content": edit["blocks"]}
+                )
+            except ValueError:
+                return None
+            edit = {**edit, "blocks": blocks}
+        compacted.append(edit)
+    return {**delta, "edits": compacted, "compact": True}
+
+
+def _diff_text(old, new) -> dict:
+    if not isinstance(old, str) or not isinstance(new, str):
+        return {"value": new}
+    old_lines = old.split("\n")
+    new_lines = new.split("\n")
+    matcher = SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    return {
+        "edits": [
+            [i1, i2, new_lines[j1:j2]]
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+            if tag != "equal"
+        ]
+    }
+
+
+def _apply_text(old, text_delta: dict):
+    if "value" in text_delta:
+        return text_delta["value"]
+    lines = old.split("\n")
+    # Back to front, so earlier line indices still point at the old text.
+    for i1, i2, new_lines in reversed(text_delta["edits"]):
+        lines[i1:i2] = new_lines
+    return "\n".join(lines)
+
+
+# -- model hooks --------------------------------------------------------------
+
+
+def prepare_version_for_save(version: NoteContent, update_fields=None):
+    """Choose how ``version`` is stored; returns the ``update_fields`` to use.
+
+    New versions are delta-encoded against the note's current keyframe when
+    possible. Rewriting the content of an existing version stores it in full
+    (its dependents are materialized first if it is a keyframe).
+
+    Must run in the transaction that saves ``version``, which holds the
+    keyframe lock until the row is written.
+    """
+    if version._state.adding:
+        _encode_new_version(version)
+        return update_fields
+
+    if update_fields is not None and not set(CONTENT_FIELDS) & set(update_fields):
+        return update_fields
+
+    if version.delta is None:
+        stored = (
+            NoteContent.objects.select_for_update()
+            .filter(id=version.id)
+            .values_list(*CONTENT_FIELDS)
+            .first()
+        )
+        if stored is not None and stored != (version.json, version.plain_text):
+            materialize_dependents(version.id, stored)
+    version.keyframe = None
+    version.delta = None
+    version_cache.discard(version.id)
+    if update_fields is not None:
+        update_fields = {*update_fields, *STORAGE_FIELDS}
+    return update_fields
+
+
+def _encode_new_version(version: NoteContent) -> None:
+    version.keyframe = None
+    version.delta = None
+    if version.json is None:
+        return
+
+    latest = (
+        NoteContent.objects.filter(note_id=version.note_id)
+        .order_by("-id")
+        .values("id", "keyframe_id", "delta__n")
+        .first()
+    )
+    if latest is None:
+        return
+    keyframe_id = latest["keyframe_id"] or latest["id"]
+    n = (latest["delta__n"] or 0) + 1
+    if n >= KEYFRAME_INTERVAL:
+        return
+
+    # Read from the database, not the cache, and lock the row until the delta
+    # is written: a delta must never be encoded against stale keyframe content.
+    keyframe = (
+        NoteContent.objects.select_for_update()
+        .filter(id=keyframe_id)
+        .values_list("delta", *CONTENT_FIELDS)
+        .first()
+    )
+    if keyframe is None or keyframe[0] is not None:
+        return
+    keyframe = keyframe[1:]
+    delta = encode_delta(*keyframe, version.json, version.plain_text, n)
+    if delta is not None:
+        version.keyframe_id = keyframe_id
+        version.delta = delta
+        version_cache.set(keyframe_id, *keyframe)
+
+
+def remember_version_content(version: NoteContent) -> None:
+    """Cache a just-saved delta version; it is usually read right back."""
+    if version.delta is not None:
+        version_cache.set(version.id, version.json, version.plain_text)
+
+
+def load_version_content(version: NoteContent) -> None:
+    """Fill in ``json``/``plain_text`` of a delta version loaded from the DB.
+
+    Runs inside ``from_db``, so it never raises: a version that can't be
+    decoded is logged and keeps its stored (empty) content.
+    """
+    fields = version.__dict__
+    if fields.get("delta") is None or "keyframe_id" not in fields:
+        return
+    if not set(CONTENT_FIELDS) & fields.keys():
+        return
+
+    entry = version_cache.get(version.id)
+    if entry is None:
+        try:
+            keyframe_json, keyframe_text = get_keyframe_content(
+                version.keyframe_id, version.delta["base"]
+            )
+            entry = version_cache.set(
+                version.id,
+                *decode_delta(keyframe_json, keyframe_text, version.delta),
+            )
+        except Exception:
+            logger.exception(
+                "Failed to decode note version %s from keyframe %s",
+                version.id,
+                version.keyframe_id,
+            )
+            return
+    json_value, plain_text, _ = entry
+    # Only fill in what was loaded; deferred fields stay deferred.
+    if "json" in fields:
+        # Object-encoded documents are mutable; callers get their own copy.
+        version.json = deepcopy(json_value)
+    if "plain_text" in fields:
+        version.plain_text = plain_text
+
+
+def get_keyframe_content(keyframe_id: int, expected_fingerprint: str) -> tuple:
+    entry = version_cache.get(keyframe_id)
+    if entry is None or entry[2] != expected_fingerprint:
+        stored = (
+            NoteContent.objects.filter(id=keyframe_id)
+            .values_list(*CONTENT_FIELDS)
+            .get()
+        )
+        entry = version_cache.set(keyframe_id, *stored)
+        if entry[2] != expected_fingerprint:
+            raise ValueError(
+                f"note version keyframe {keyframe_id} changed after its deltas "
+                "were written"
+            )
+    return entry[0], entry[1]
+
+
+def materialize_dependents(keyframe_id: int, keyframe_content=None) -> int:
+    """Store every delta version of ``keyframe_id`` in full.
+
+    Runs before a keyframe is deleted or its content rewritten, so its
+    dependents no longer need it. ``keyframe_content`` is the keyframe's
+    current ``(json, plain_text)``, read from the database when omitted.
+    The keyframe stays locked until the caller's transaction ends, so no new
+    delta can be encoded against it in the meantime.
+    Returns the number of versions rewritten.
+    """
+    with transaction.atomic():
+        # Lock before listing dependents: deltas being encoded against the
+        # keyframe are committed by then and included.
+        stored = (
+            NoteContent.objects.select_for_update()
+            .filter(id=keyframe_id)
+            .values_list(*CONTENT_FIELDS)
+            .first()
+        )
+        if keyframe_content is None:
+            keyframe_content = stored
+        dependents = list(
+            NoteContent.objects.filter(keyframe_id=keyframe_id).values_list(
+                "id", "delta"
+            )
+        )
+        if not dependents or keyframe_content is None:
+            return 0
+
+        for version_id, delta in dependents:
+            json_value, plain_text = decode_delta(*keyframe_content, delta)
+            # A queryset update, not bulk_update: that would write JSON null
+            # instead of SQL NULL into the JSON columns.
+            NoteContent.objects.filter(id=version_id).update(
+                json=json_value, plain_text=plain_text, keyframe=None, delta=None
+            )
+            version_cache.discard(version_id)
+    version_cache.discard(keyframe_id)
+    return len(dependents)
+
+
+def compact_note_history(note_id: int) -> int:
+    """Delta-encode the full versions of an existing note's history.
+
+    Walks the versions oldest first, the way new saves would have stored
+    them. Deltas, keyframes other versions depend on, and the latest version
+    (which concurrent saves may be encoding against) are kept as they are.
+    Returns the number of versions converted.
+    """
+    # Versions are locked as they are walked, so a keyframe can't be rewritten
+    # while deltas are encoded against it.
+    with transaction.atomic():
+        versions = (
+            NoteContent.objects.select_for_update()
+            .filter(note_id=note_id)
+            .order_by("id")
+            .values_list("id", "delta", *CONTENT_FIELDS)
+        )
+        kept = set(
+            NoteContent.objects.filter(note_id=note_id, keyframe__isnull=False)
+            .values_list("keyframe_id", flat=True)
+            .distinct()
+        )
+        latest = versions.last()
+        if latest is not None:
+            kept.add(latest[0])
+
+        keyframe = None
+        converted = 0
+        for version_id, delta, json_value, plain_text in versions.iterator():
+            if delta is not None:
+                keyframe = None
+                continue
+            if keyframe is not None and version_id not in kept:
+                keyframe_id, keyframe_content, n = keyframe
+                delta = encode_delta(*keyframe_content, json_value, plain_text, n)
+                if delta is not None:
+                    # bulk_update would write JSON null instead of SQL NULL.
+                    NoteContent.objects.filter(id=version_id).update(
+                        json=None, plain_text=None, keyframe_id=keyframe_id, delta=delta
+                    )
+                    version_cache.discard(version_id)
+                    converted += 1
+                    keyframe = (keyframe_id, keyframe_content, n + 1)
+                    if n + 1 >= KEYFRAME_INTERVAL:
+                        keyframe = None
+                    continue
+            keyframe = (version_id, (json_value, plain_text), 1)
+        return converted
@@ -1,6 +1,11 @@
-from note.signals.note_signal import emit_note_version_created, update_latest_version
+from note.signals.note_signal import (
+    emit_note_version_created,
+    materialize_note_deltas,
+    update_latest_version,
+)
 
 __all__ = [
     "emit_note_version_created",
+    "materialize_note_deltas",
     "update_latest_version",
 ]
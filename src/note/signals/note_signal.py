@@ -1,8 +1,10 @@
-from django.db.models.signals import post_save
+from django.db.models import QuerySet
+from django.db.models.signals import post_save, pre_delete
 from django.dispatch import receiver
 
 from note.models import Note, NoteContent
 from note.services.note_events import NoteVersionEventPublisher
+from note.services.note_version_storage import materialize_dependents
 
 
 @receiver(post_save, sender=NoteContent, dispatch_uid="update_latest_version")
@@ -22,3 +24,15 @@ _version_event_publisher = NoteVersionEventPublisher()
 def emit_note_version_created(sender, instance, created, **kwargs):
     if created:
         _version_event_publisher.publish_created(instance)
+
+
+@receiver(pre_delete, sender=NoteContent, dispatch_uid="materialize_note_deltas")
+def materialize_note_deltas(sender, instance, origin, **kwargs):
+    # Deleting a version on its own must not orphan the delta versions that
+    # are stored against it. A whole note's versions go together, so its
+    # cascade skips the rewrite.
+    deleting_versions = isinstance(origin, NoteContent) or (
+        isinstance(origin, QuerySet) and origin.model is NoteContent
+    )
+    if deleting_versions and instance.delta is None:
+        materialize_dependents(instance.id)
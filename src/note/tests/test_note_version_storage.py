@@ -0,0 +1,286 @@
+import json
+import threading
+import unittest
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.db import close_old_connections
+from django.test import TestCase, TransactionTestCase
+
+from note.related_models.note_model import NoteContent
+from note.services import note_version_storage
+from note.services.note_content_service import NoteContentService
+from note.services.note_version_storage import (
+    compact_note_history,
+    decode_delta,
+    encode_delta,
+    version_cache,
+)
+from note.tests.helpers import create_note
+
+
+def paragraph(text):
+    return {
+        "type": "paragraph",
+        "attrs": {"id": None, "class": None, "textAlign": None},
+        "content": [{"type": "text", "text": text}],
+    }
+
+
+def document(texts):
+    return {"type": "doc", "content": [paragraph(text) for text in texts]}
+
+
+TEXTS = [f"Paragraph {i} of a long grant proposal draft." for i in range(30)]
+
+
+class DeltaEncodingTests(unittest.TestCase):
+    def test_delta_round_trips_the_exact_json_string(self):
+        # Arrange
+        keyframe = json.dumps(document(TEXTS))
+        texts = TEXTS[:3] + ["Inserted paragraph."] + TEXTS[3:10] + TEXTS[12:]
+        texts[20] = "Rewritten paragraph."
+        encodings = [
+            json.dumps(document(texts)),
+            json.dumps(document(texts), separators=(",", ":"), ensure_ascii=False),
+        ]
+
+        for json_value in encodings:
+            # Act
+            delta = encode_delta(keyframe, "a\nb", json_value, "a\nc")
+
+            # Assert
+            self.assertLess(len(json.dumps(delta)), len(json_value) / 5)
+            self.assertEqual(
+                decode_delta(keyframe, "a\nb", delta), (json_value, "a\nc")
+            )
+
+    def test_keeps_document_root_and_key_order(self):
+        # Arrange
+        keyframe = json.dumps(document(TEXTS))
+        doc = {"attrs": {"registered_report_prefill": {"proposal_id": 42}}}
+        doc.update(document(TEXTS[1:]))
+
+        # Act
+        delta = encode_delta(keyframe, None, json.dumps(doc), None)
+
+        # Assert
+        self.assertEqual(decode_delta(keyframe, None, delta), (json.dumps(doc), None))
+
+    def test_unencodable_content_is_stored_in_full(self):
+        # Arrange
+        keyframe = json.dumps(document(TEXTS))
+
+        # Act & Assert
+        self.assertIsNone(
+            encode_delta(keyframe, "", json.dumps(document(["Unrelated."])), "")
+        )
+        self.assertIsNone(encode_delta(keyframe, "", "not json", ""))
+        self.assertIsNone(
+            encode_delta(keyframe, "", json.dumps(document(TEXTS), indent=2), "")
+        )
+
+
+class NoteVersionStorageTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="storage@researchhub_test.com",
+            password="password",
+            email="storage@researchhub_test.com",
+        )
+        self.note, _ = create_note(self.user, organization=None)
+        self.service = NoteContentService()
+        version_cache.clear()
+
+    def _create_versions(self, count):
+        versions = []
+        for i in range(count):
+            texts = list(TEXTS)
+            texts[i % len(texts)] = f"Edit number {i}."
+            versions.append(self.service.create_version(self.note, document(texts)))
+        return versions
+
+    def _stored(self, version):
+        return (
+            NoteContent.objects.filter(id=version.id)
+            .values("json", "plain_text", "keyframe_id")
+            .get()
+        )
+
+    def test_versions_after_a_keyframe_are_stored_as_deltas(self):
+        # Arrange
+        keyframe, *deltas = self._create_versions(3)
+
+        # Act
+        version_cache.clear()
+        reloaded = NoteContent.objects.get(id=deltas[-1].id)
+
+        # Assert
+        self.assertIsNotNone(self._stored(keyframe)["json"])
+        for delta in deltas:
+            stored = self._stored(delta)
+            self.assertIsNone(stored["json"])
+            self.assertIsNone(stored["plain_text"])
+            self.assertEqual(stored["keyframe_id"], keyframe.id)
+        self.assertEqual(reloaded.json, deltas[-1].json)
+        self.assertEqual(reloaded.plain_text, deltas[-1].plain_text)
+
+    def test_latest_version_reads_through_the_note(self):
+        # Arrange
+        latest = self._create_versions(2)[-1]
+        version_cache.clear()
+
+        # Act
+        self.note.refresh_from_db()
+
+        # Assert
+        self.assertEqual(self.note.latest_version.json, latest.json)
+        deferred = NoteContent.objects.defer("json").get(id=latest.id)
+        self.assertEqual(deferred.json, latest.json)
+
+    @patch("note.services.note_version_storage.KEYFRAME_INTERVAL", 3)
+    def test_starts_a_new_keyframe_every_interval(self):
+        # Act
+        versions = self._create_versions(5)
+
+        # Assert
+        self.assertEqual(
+            [self._stored(version)["keyframe_id"] for version in versions],
+            [None, versions[0].id, versions[0].id, None, versions[3].id],
+        )
+
+    def test_deleting_a_keyframe_materializes_its_deltas(self):
+        # Arrange
+        keyframe, *deltas = self._create_versions(3)
+
+        # Act
+        keyframe.delete()
+
+        # Assert
+        for delta in deltas:
+            stored = self._stored(delta)
+            self.assertEqual(stored["json"], delta.json)
+            self.assertIsNone(stored["keyframe_id"])
+
+    def test_rewriting_a_keyframe_materializes_its_deltas(self):
+        # Arrange
+        keyframe, delta = self._create_versions(2)
+
+        # Act
+        keyframe.json = json.dumps(document(["Replaced."]))
+        keyframe.save()
+
+        # Assert
+        version_cache.clear()
+        self.assertEqual(NoteContent.objects.get(id=delta.id).json, delta.json)
+        self.assertIsNone(self._stored(delta)["keyframe_id"])
+
+    def test_undecodable_version_is_loaded_without_content(self):
+        # Arrange
+        _, delta = self._create_versions(2)
+        stored_delta = NoteContent.objects.values_list("delta", flat=True).get(
+            id=delta.id
+        )
+        NoteContent.objects.filter(id=delta.id).update(
+            delta={**stored_delta, "base": "stale"}
+        )
+        version_cache.clear()
+
+        # Act
+        with self.assertLogs(note_version_storage.logger, "ERROR"):
+            reloaded = NoteContent.objects.get(id=delta.id)
+
+        # Assert
+        self.assertIsNone(reloaded.json)
+        self.assertIsNone(reloaded.plain_text)
+
+    def test_compacts_existing_history(self):
+        # Arrange
+        texts = list(TEXTS)
+        versions = []
+        for i in range(4):
+            texts[i] = f"Legacy edit {i}."
+            versions.append(
+                NoteContent.objects.bulk_create(
+                    [NoteContent(note=self.note, json=json.dumps(document(texts)))]
+                )[0]
+            )
+
+        # Act
+        converted = compact_note_history(self.note.id)
+
+        # Assert
+        self.assertEqual(converted, 2)
+        self.assertEqual(
+            [self._stored(version)["keyframe_id"] for version in versions],
+            [None, versions[0].id, versions[0].id, None],
+        )
+        version_cache.clear()
+        for version in versions:
+            self.assertEqual(NoteContent.objects.get(id=version.id).json, version.json)
+
+
+class NoteVersionLockingTests(TransactionTestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="locking@researchhub_test.com",
+            password="password",
+            email="locking@researchhub_test.com",
+        )
+        self.note, _ = create_note(self.user, organization=None)
+        self.service = NoteContentService()
+        version_cache.clear()
+
+    def test_rewriting_a_keyframe_waits_for_a_delta_being_encoded(self):
+        # Arrange
+        keyframe = self.service.create_version(self.note, document(TEXTS))
+        texts = list(TEXTS)
+        texts[5] = "Edited while the keyframe is rewritten."
+        encoding = threading.Event()
+        proceed = threading.Event()
+        errors = []
+        created = []
+
+        def slow_encode_delta(*args):
+            encoding.set()
+            proceed.wait(timeout=10)
+            return encode_delta(*args)
+
+        def run(target):
+            close_old_connections()
+            try:
+                target()
+            except Exception as exc:  # noqa: BLE001 - surfaced in main test thread
+                errors.append(exc)
+            finally:
+                close_old_connections()
+
+        def create_version():
+            created.append(self.service.create_version(self.note, document(texts)))
+
+        def rewrite_keyframe():
+            version = NoteContent.objects.get(id=keyframe.id)
+            version.json = json.dumps(document(["Replaced."]))
+            version.save()
+
+        # Act
+        with patch.object(note_version_storage, "encode_delta", slow_encode_delta):
+            encoder = threading.Thread(target=run, args=(create_version,))
+            encoder.start()
+            self.assertTrue(encoding.wait(timeout=10))
+            rewriter = threading.Thread(target=run, args=(rewrite_keyframe,))
+            rewriter.start()
+            rewriter.join(timeout=0.5)
+            rewriter_blocked = rewriter.is_alive()
+            proceed.set()
+            encoder.join(timeout=10)
+            rewriter.join(timeout=10)
+
+        # Assert
+        self.assertFalse(errors)
+        self.assertTrue(rewriter_blocked)
+        version_cache.clear()
+        (delta,) = created
+        stored = NoteContent.objects.get(id=delta.id)
+        self.assertIsNone(stored.keyframe_id)
+        self.assertEqual(stored.json, delta.json)
@@ -36,3 +36,7 @@ class NotificationConsumer(AsyncWebsocketConsumer):
         event_data = event["data"]
         data = {"notification_type": notification_type, "data": event_data}
         await self.send(text_data=json.dumps(data, cls=DjangoJSONEncoder))
+
+    async def send_unread_count(self, event):
+        data = {"unread_count": event["count"]}
+        await self.send(text_data=json.dumps(data))
@@ -3,7 +3,7 @@ from channels.layers import get_channel_layer
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.postgres.fields import ArrayField, HStoreField
-from django.db import models
+from django.db import models, transaction
 
 from researchhub_document.related_models.researchhub_unified_document_model import (
     ResearchhubUnifiedDocument,
@@ -127,12 +127,50 @@ class Notification(models.Model):
     created_date = models.DateTimeField(auto_now_add=True)
     updated_date = models.DateTimeField(auto_now=True)
 
+    # Fields pushed to the recipient's `notification_{user_id}` channel group.
+    WEBSOCKET_FIELDS = [
+        "action_user",
+        "body",
+        "created_date",
+        "extra",
+        "id",
+        "notification_type",
+        "read",
+        "read_date",
+        "recipient",
+    ]
+
     class Meta:
         indexes = (models.Index(fields=("content_type", "object_id")),)
 
     def save(self, *args, **kwargs):
+        from notification.services.unread_count_service import (
+            record_notification_saved,
+        )
+
         self.format_body()
-        super().save(*args, **kwargs)
+
+        # The recipient's unread count changes in the same transaction.
+        with transaction.atomic():
+            previous = None
+            update_fields = kwargs.get("update_fields")
+            if not self._state.adding and (
+                update_fields is None
+                or {"read", "notification_type"} & set(update_fields)
+            ):
+                previous = (
+                    Notification.objects.filter(pk=self.pk)
+                    .values("read", "notification_type")
+                    .first()
+                )
+            created = self._state.adding
+            super().save(*args, **kwargs)
+            record_notification_saved(self, created, previous)
+
+    @property
+    def is_unread(self) -> bool:
+        """Whether the notification counts towards the recipient's unread count."""
+        return not self.read and self.notification_type != self.DEPRECATED
 
     def send_notification(self):
         from notification.serializers import DynamicNotificationSerializer
@@ -142,17 +180,7 @@ class Notification(models.Model):
         notification = Notification.objects.get(id=self.id)
         serialized_data = DynamicNotificationSerializer(
             notification,
-            _include_fields=[
-                "action_user",
-                "body",
-                "created_date",
-                "extra",
-                "id",
-                "notification_type",
-                "read",
-                "read_date",
-                "recipient",
-            ],
+            _include_fields=self.WEBSOCKET_FIELDS,
             context=context,
         ).data
 
@@ -738,3 +766,19 @@ class Notification(models.Model):
             {"type": "link", "value": doc_title, "link": base_url, "extra": '["link"]'},
             {"type": "text", "value": f" {outcome}"},
         ], base_url
+
+
+class NotificationUnreadCount(models.Model):
+    """
+    Number of unread notifications of a user, kept in step with notification
+    writes so the unread count is read from a single row. Created on first
+    read, and reconciled with the notifications table periodically (deletes
+    are only picked up then).
+    """
+
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        related_name="unread_notification_count",
+    )
+    count = models.PositiveIntegerField(default=0)
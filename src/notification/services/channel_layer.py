@@ -0,0 +1,26 @@
+import asyncio
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+
+# Messages in flight on the channel layer at once.
+SEND_CONCURRENCY = 100
+
+
+def group_send_batch(messages: list[tuple[str, dict]]):
+    """Send `(group, message)` pairs to the channel layer from one event loop."""
+    if not messages:
+        return
+
+    channel_layer = get_channel_layer()
+
+    async def send_all():
+        for start in range(0, len(messages), SEND_CONCURRENCY):
+            await asyncio.gather(
+                *(
+                    channel_layer.group_send(group, message)
+                    for group, message in messages[start : start + SEND_CONCURRENCY]
+                )
+            )
+
+    async_to_sync(send_all)()
@@ -0,0 +1,103 @@
+"""
+Bulk notification fan-out.
+
+Creating and pushing notifications one recipient at a time costs an
+existence check, an insert, a re-fetch and a blocking channel layer call per
+recipient. `fan_out_notifications` does the same work for a whole batch:
+
+- recipients that were already notified about the same item are skipped
+  with one query,
+- bodies are formatted in memory and the rows are inserted with
+  `bulk_create`,
+- after commit, the new rows are read back in one query, serialized
+  together, and pushed to the recipients' channel groups from a single event
+  loop instead of one `async_to_sync` round trip per message.
+"""
+
+from django.db import transaction
+
+from notification.models import Notification
+from notification.services.channel_layer import group_send_batch
+from notification.services.unread_count_service import record_notifications_created
+
+BATCH_SIZE = 500
+
+
+def _dedupe_key(notification: Notification) -> tuple[int, int, int]:
+    return (
+        notification.content_type_id,
+        notification.object_id,
+        notification.recipient_id,
+    )
+
+
+def _get_notified_keys(notifications: list[Notification]) -> set:
+    keys = {_dedupe_key(notification) for notification in notifications}
+    existing = Notification.objects.filter(
+        content_type_id__in={content_type_id for content_type_id, _, _ in keys},
+        object_id__in={object_id for _, object_id, _ in keys},
+        recipient_id__in={recipient_id for _, _, recipient_id in keys},
+    ).values_list("content_type_id", "object_id", "recipient_id")
+    return set(existing) & keys
+
+
+def fan_out_notifications(
+    notifications: list[Notification], batch_size: int = BATCH_SIZE
+) -> list[Notification]:
+    """
+    Insert unsaved notifications in bulk and push them over websockets.
+
+    A notification is skipped when its recipient already has one for the same
+    item, or when it repeats an earlier notification of the batch.
+    Returns the notifications that were created.
+    """
+    if not notifications:
+        return []
+
+    seen = _get_notified_keys(notifications)
+    new_notifications = []
+    for notification in notifications:
+        key = _dedupe_key(notification)
+        if key in seen:
+            continue
+        seen.add(key)
+        notification.format_body()
+        new_notifications.append(notification)
+
+    created = Notification.objects.bulk_create(new_notifications, batch_size=batch_size)
+    record_notifications_created(created)
+    notification_ids = [notification.id for notification in created]
+    transaction.on_commit(lambda: send_notifications(notification_ids))
+    return created
+
+
+def send_notifications(notification_ids: list[int]):
+    """Serialize notifications together and push them to their recipients."""
+    from notification.serializers import DynamicNotificationSerializer
+    from notification.views import NotificationViewSet
+
+    notifications = list(
+        Notification.objects.filter(id__in=notification_ids).select_related(
+            "recipient__author_profile", "action_user__author_profile"
+        )
+    )
+    serialized = DynamicNotificationSerializer(
+        notifications,
+        _include_fields=Notification.WEBSOCKET_FIELDS,
+        context=NotificationViewSet()._get_context(),
+        many=True,
+    ).data
+
+    group_send_batch(
+        [
+            (
+                f"notification_{notification.recipient_id}",
+                {
+                    "type": "send_notification",
+                    "notification_type": notification.notification_type,
+                    "data": data,
+                },
+            )
+            for notification, data in zip(notifications, serialized, strict=True)
+        ]
+    )
@@ -0,0 +1,240 @@
+"""
+Counter-cached unread notification counts.
+
+`NotificationUnreadCount` holds the number of unread notifications of each
+user, so the frontend's unread count is a single row read:
+
+- creating an unread notification increments the recipient's count,
+- reading one (or marking all read) decrements or resets it.
+
+Every change is pushed to the recipient's `notification_{user_id}` channel
+group after commit, so clients don't need to poll. A user's counter is
+created from the notifications table on first read. Deletes are not tracked,
+a delete signal would keep cascades from deleting notifications in bulk;
+explicit bulk deletes go through `delete_notifications` instead.
+`reconcile_unread_counts` corrects the drift from cascades and other writes
+that bypass the model (e.g. queryset updates).
+"""
+
+import logging
+from collections import Counter, defaultdict
+
+from django.db import transaction
+from django.db.models import Count, F
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from notification.models import Notification, NotificationUnreadCount
+from notification.services.channel_layer import group_send_batch
+
+logger = logging.getLogger(__name__)
+
+
+def get_unread_notifications():
+    return Notification.objects.filter(read=False).exclude(
+        notification_type=Notification.DEPRECATED
+    )
+
+
+def _count_unread(user_ids) -> dict[int, int]:
+    return dict(
+        get_unread_notifications()
+        .filter(recipient_id__in=user_ids)
+        .values("recipient_id")
+        .annotate(count=Count("id"))
+        .order_by()
+        .values_list("recipient_id", "count")
+    )
+
+
+def _create_counters(deltas: dict[int, int]):
+    """
+    Create the missing counters of `{user_id: delta}` from the notifications
+    table, which already includes writes of the current transaction.
+
+    A counter created concurrently by another transaction was counted without
+    our uncommitted notifications, so the delta is applied to it instead.
+    This runs once per user, so it doesn't need to be a bulk write.
+    """
+    counts = _count_unread(deltas)
+    for user_id, delta in deltas.items():
+        _, created = NotificationUnreadCount.objects.get_or_create(
+            user_id=user_id, defaults={"count": counts.get(user_id, 0)}
+        )
+        if not created and delta:
+            NotificationUnreadCount.objects.filter(user_id=user_id).update(
+                count=Greatest(F("count") + delta, 0)
+            )
+
+
+def get_unread_count(user_id: int) -> int:
+    count = (
+        NotificationUnreadCount.objects.filter(user_id=user_id)
+        .values_list("count", flat=True)
+        .first()
+    )
+    if count is None:
+        _create_counters({user_id: 0})
+        count = NotificationUnreadCount.objects.get(user_id=user_id).count
+    return count
+
+
+def adjust_unread_counts(deltas: dict[int, int]):
+    """Add `{user_id: delta}` to the users' unread counts and push them."""
+    deltas = {user_id: delta for user_id, delta in deltas.items() if delta}
+    if not deltas:
+        return
+
+    existing = set(
+        NotificationUnreadCount.objects.filter(user_id__in=deltas).values_list(
+            "user_id", flat=True
+        )
+    )
+    # One UPDATE per distinct delta, which is +1 for almost every recipient.
+    user_ids_by_delta = defaultdict(list)
+    for user_id, delta in deltas.items():
+        if user_id in existing:
+            user_ids_by_delta[delta].append(user_id)
+    for delta, user_ids in user_ids_by_delta.items():
+        NotificationUnreadCount.objects.filter(user_id__in=user_ids).update(
+            count=Greatest(F("count") + delta, 0)
+        )
+
+    _create_counters(
+        {user_id: delta for user_id, delta in deltas.items() if user_id not in existing}
+    )
+    push_unread_counts(deltas.keys())
+
+
+def mark_all_read(user_id: int):
+    """Mark all notifications of a user as read and reset the counter."""
+    with transaction.atomic():
+        # Lock the counter before marking: a notification created meanwhile
+        # either is marked read here, or waits for the lock and is counted
+        # on top of the reset.
+        counter, _ = NotificationUnreadCount.objects.select_for_update().get_or_create(
+            user_id=user_id
+        )
+        Notification.objects.filter(recipient_id=user_id).update(
+            read=True, read_date=timezone.now()
+        )
+        counter.count = 0
+        counter.save(update_fields=["count"])
+    push_unread_counts([user_id])
+
+
+def delete_notifications(notifications) -> int:
+    """
+    Delete a notification queryset and decrement the unread counts of the
+    recipients of its unread notifications. Returns the number deleted.
+    """
+    with transaction.atomic():
+        unread_by_recipient = _count_unread_in(notifications)
+        deleted, _ = notifications.delete()
+        adjust_unread_counts(
+            {user_id: -count for user_id, count in unread_by_recipient.items()}
+        )
+    return deleted
+
+
+def _count_unread_in(notifications) -> dict[int, int]:
+    return dict(
+        get_unread_notifications()
+        .filter(id__in=notifications.values("id"))
+        .values("recipient_id")
+        .annotate(count=Count("id"))
+        .order_by()
+        .values_list("recipient_id", "count")
+    )
+
+
+def record_notification_saved(
+    notification: Notification, created: bool, previous: dict | None = None
+):
+    if created:
+        was_unread = False
+    elif previous is None:
+        return
+    else:
+        was_unread = (
+            not previous["read"]
+            and previous["notification_type"] != Notification.DEPRECATED
+        )
+
+    if notification.is_unread != was_unread:
+        delta = 1 if notification.is_unread else -1
+        adjust_unread_counts({notification.recipient_id: delta})
+
+
+def record_notifications_created(notifications: list[Notification]):
+    """Count notifications inserted with `bulk_create`."""
+    adjust_unread_counts(
+        Counter(
+            notification.recipient_id
+            for notification in notifications
+            if notification.is_unread
+        )
+    )
+
+
+def push_unread_counts(user_ids):
+    user_ids = list(user_ids)
+    transaction.on_commit(lambda: _send_unread_counts(user_ids))
+
+
+def _send_unread_counts(user_ids):
+    counts = NotificationUnreadCount.objects.filter(user_id__in=user_ids).values_list(
+        "user_id", "count"
+    )
+    try:
+        group_send_batch(
+            [
+                (
+                    f"notification_{user_id}",
+                    {"type": "send_unread_count", "count": count},
+                )
+                for user_id, count in counts
+            ]
+        )
+    except Exception:
+        # Clients still get the count from the API, don't fail the write.
+        logger.exception("Failed to push unread notification counts")
+
+
+def reconcile_unread_counts() -> int:
+    """
+    Correct counters that drifted from the notifications table.
+    Returns the number of corrected counters.
+    """
+    actual_counts = {}
+    for row in (
+        get_unread_notifications()
+        .values("recipient_id")
+        .annotate(count=Count("id"))
+        .order_by()
+        .iterator()
+    ):
+        actual_counts[row["recipient_id"]] = row["count"]
+
+    drifted_user_ids = [
+        user_id
+        for user_id, count in NotificationUnreadCount.objects.values_list(
+            "user_id", "count"
+        ).iterator()
+        if count != actual_counts.get(user_id, 0)
+    ]
+
+    for user_id in drifted_user_ids:
+        with transaction.atomic():
+            # Lock the counter first: concurrent changes wait for the recount
+            # and are applied on top of it.
+            counter = NotificationUnreadCount.objects.select_for_update().get(
+                user_id=user_id
+            )
+            counter.count = _count_unread([user_id]).get(user_id, 0)
+            counter.save(update_fields=["count"])
+
+    if drifted_user_ids:
+        logger.info("Reconciled %d unread notification counts", len(drifted_user_ids))
+        push_unread_counts(drifted_user_ids)
+    return len(drifted_user_ids)
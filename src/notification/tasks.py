@@ -0,0 +1,7 @@
+from notification.services.unread_count_service import reconcile_unread_counts
+from researchhub.celery import QUEUE_NOTIFICATION, app
+
+
+@app.task(queue=QUEUE_NOTIFICATION)
+def reconcile_unread_notification_counts():
+    return reconcile_unread_counts()
@@ -1,8 +1,20 @@
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient, APITestCase
 
-from notification.models import Notification
+from notification.models import Notification, NotificationUnreadCount
+from notification.services.fan_out_service import fan_out_notifications
+from notification.services.unread_count_service import (
+    _create_counters,
+    delete_notifications,
+    get_unread_count,
+    reconcile_unread_counts,
+)
 from paper.tests.helpers import create_paper
 from user.tests.helpers import create_random_default_user
 
@@ -52,3 +64,194 @@ class NotificationViewSetTests(APITestCase):
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class NotificationFanOutTests(TestCase):
+    def setUp(self):
+        self.action_user = create_random_default_user("fan_out_action_user")
+        self.paper = create_paper(uploaded_by=self.action_user)
+
+    def _notification(self, recipient):
+        return Notification(
+            item=self.paper,
+            recipient=recipient,
+            action_user=self.action_user,
+            notification_type=Notification.PUBLICATIONS_ADDED,
+        )
+
+    @patch("notification.services.unread_count_service.group_send_batch")
+    @patch("notification.services.fan_out_service.group_send_batch")
+    def test_fan_out_skips_notified_recipients(self, mock_group_send_batch, _):
+        # Arrange
+        notified = create_random_default_user("fan_out_notified")
+        Notification.objects.create(
+            item=self.paper,
+            recipient=notified,
+            action_user=self.action_user,
+            notification_type=Notification.PUBLICATIONS_ADDED,
+        )
+        recipients = [
+            create_random_default_user(f"fan_out_recipient_{i}") for i in range(3)
+        ]
+
+        # Act
+        with self.captureOnCommitCallbacks(execute=True):
+            created = fan_out_notifications(
+                [self._notification(notified)]
+                + [self._notification(recipient) for recipient in recipients]
+                + [self._notification(recipients[0])]
+            )
+
+        # Assert
+        self.assertEqual(
+            [notification.recipient_id for notification in created],
+            [recipient.id for recipient in recipients],
+        )
+        self.assertEqual(Notification.objects.filter(recipient=notified).count(), 1)
+        messages = mock_group_send_batch.call_args.args[0]
+        self.assertEqual(
+            [group for group, _ in messages],
+            [f"notification_{recipient.id}" for recipient in recipients],
+        )
+        self.assertEqual(
+            messages[0][1]["notification_type"], Notification.PUBLICATIONS_ADDED
+        )
+
+    @patch("notification.services.fan_out_service.group_send_batch")
+    def test_fan_out_query_count_does_not_grow_with_recipients(self, _):
+        # Arrange
+        few = [create_random_default_user(f"fan_out_few_{i}") for i in range(2)]
+        many = [create_random_default_user(f"fan_out_many_{i}") for i in range(20)]
+
+        # Act
+        with CaptureQueriesContext(connection) as few_queries:
+            fan_out_notifications([self._notification(user) for user in few])
+        with CaptureQueriesContext(connection) as many_queries:
+            fan_out_notifications([self._notification(user) for user in many])
+
+        # Assert
+        self.assertEqual(len(many_queries), len(few_queries))
+        self.assertEqual(
+            Notification.objects.filter(object_id=self.paper.id).count(), 22
+        )
+
+
+@patch("notification.services.unread_count_service.group_send_batch")
+class NotificationUnreadCountTests(APITestCase):
+    def setUp(self):
+        self.user = create_random_default_user("unread_count_user")
+        self.paper = create_paper(uploaded_by=self.user)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def _create_notification(self, **kwargs):
+        return Notification.objects.create(
+            item=self.paper,
+            recipient=self.user,
+            action_user=kwargs.pop("action_user", self.user),
+            notification_type=kwargs.pop(
+                "notification_type", Notification.PUBLICATIONS_ADDED
+            ),
+            **kwargs,
+        )
+
+    def test_counter_follows_notification_writes(self, _):
+        # Arrange
+        first = self._create_notification()
+        self._create_notification()
+        self._create_notification(read=True)
+        self._create_notification(notification_type=Notification.DEPRECATED)
+
+        # Act
+        self.assertEqual(get_unread_count(self.user.id), 2)
+        self._create_notification()
+        self.client.patch(
+            reverse("notification-detail", args=[first.id]),
+            {"read": True},
+            format="json",
+        )
+
+        # Assert
+        self.assertEqual(get_unread_count(self.user.id), 2)
+
+    def test_increment_applies_to_counter_created_concurrently(self, _):
+        # Arrange
+        self._create_notification()
+        NotificationUnreadCount.objects.filter(user=self.user).update(count=3)
+
+        # Act
+        # As if the counter was missing when checked, and another transaction
+        # created it before this one did.
+        _create_counters({self.user.id: 1})
+
+        # Assert
+        self.assertEqual(get_unread_count(self.user.id), 4)
+
+    def test_delete_notifications_decrements_recipients(self, _):
+        # Arrange
+        spammer = create_random_default_user("unread_count_spammer")
+        other = create_random_default_user("unread_count_other")
+        self._create_notification(action_user=spammer)
+        self._create_notification(action_user=spammer, read=True)
+        self._create_notification()
+        Notification.objects.create(
+            item=self.paper,
+            recipient=other,
+            action_user=spammer,
+            notification_type=Notification.PUBLICATIONS_ADDED,
+        )
+
+        # Act
+        deleted = delete_notifications(Notification.objects.filter(action_user=spammer))
+
+        # Assert
+        self.assertEqual(deleted, 3)
+        self.assertEqual(NotificationUnreadCount.objects.get(user=self.user).count, 1)
+        self.assertEqual(NotificationUnreadCount.objects.get(user=other).count, 0)
+
+    def test_unread_count_endpoint_reads_counter(self, _):
+        # Arrange
+        self._create_notification()
+        self._create_notification()
+        NotificationUnreadCount.objects.filter(user=self.user).update(count=5)
+
+        # Act
+        response = self.client.get(reverse("notification-unread-count"))
+
+        # Assert
+        self.assertEqual(response.data["count"], 5)
+
+    def test_mark_read_resets_and_pushes_counter(self, mock_group_send_batch):
+        # Arrange
+        self._create_notification()
+        self._create_notification()
+
+        # Act
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(reverse("notification-mark-read"))
+
+        # Assert
+        self.assertEqual(get_unread_count(self.user.id), 0)
+        mock_group_send_batch.assert_called_with(
+            [
+                (
+                    f"notification_{self.user.id}",
+                    {"type": "send_unread_count", "count": 0},
+                )
+            ]
+        )
+
+    def test_reconcile_fixes_writes_that_bypass_save(self, _):
+        # Arrange
+        self._create_notification()
+        self._create_notification()
+        Notification.objects.filter(recipient=self.user).update(read=True)
+        self._create_notification().delete()
+
+        # Act
+        reconciled = reconcile_unread_counts()
+
+        # Assert
+        self.assertEqual(reconciled, 1)
+        self.assertEqual(get_unread_count(self.user.id), 0)
+        self.assertEqual(reconcile_unread_counts(), 0)
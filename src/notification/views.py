@@ -9,6 +9,10 @@ from notification.serializers import (
     DynamicNotificationSerializer,
     NotificationSerializer,
 )
+from notification.services.unread_count_service import (
+    get_unread_count,
+    mark_all_read,
+)
 
 
 class NotificationViewSet(viewsets.ModelViewSet):
@@ -70,10 +74,7 @@ class NotificationViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=["PATCH"], permission_classes=[IsAuthenticated])
     def mark_read(self, request, pk=None):
-        user = request.user
-        Notification.objects.filter(recipient=user).update(
-            read=True, read_date=timezone.now()
-        )
+        mark_all_read(request.user.id)
         return Response("Success", status=status.HTTP_200_OK)
 
     @action(
@@ -81,10 +82,9 @@ class NotificationViewSet(viewsets.ModelViewSet):
         methods=["GET"],
     )
     def unread_count(self, request):
-        unread_count = (
-            self.get_queryset().filter(read=False, recipient_id=request.user.id).count()
+        return Response(
+            {"count": get_unread_count(request.user.id)}, status=status.HTTP_200_OK
         )
-        return Response({"count": unread_count}, status=status.HTTP_200_OK)
 
     def _get_context(self):
         context = {
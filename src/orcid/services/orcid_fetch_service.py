@@ -14,7 +14,7 @@ from paper.models import Paper
 from paper.openalex_util import process_openalex_works
 from paper.related_models.authorship_model import Authorship
 from user.related_models.author_model import Author
-from utils.openalex import OpenAlex
+from utils.openalex import OpenAlex, normalize_doi
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
@@ -135,7 +135,8 @@ class OrcidFetchService:
 
     def _fetch_works_from_openalex(self, dois: list[str]) -> list[dict]:
         """Fetch works from OpenAlex and process them into ResearchHub."""
-        works = [w for doi in dois if (w := self.openalex.get_work_by_doi(doi))]
+        works_by_doi = self.openalex.get_works_by_dois(dois)
+        works = [w for doi in dois if (w := works_by_doi.get(normalize_doi(doi)))]
         if works:
             sanitized_works = self._sanitize_works(works)
             self.process_works_fn(sanitized_works)
@@ -10,6 +10,7 @@ from paper.models import Paper
 from paper.related_models.authorship_model import Authorship
 from user.related_models.author_model import Author
 from user.tests.helpers import create_random_default_user
+from utils.openalex import normalize_doi
 
 
 class NormalizeOrcidTests(TestCase):
@@ -43,6 +44,12 @@ class OrcidFetchServiceTests(TestCase):
     def setUp(self):
         self.mock_client = Mock()
         self.mock_openalex = Mock()
+        # Batch lookups resolve through the per-DOI mock each test configures
+        self.mock_openalex.get_works_by_dois.side_effect = lambda dois: {
+            normalize_doi(doi): work
+            for doi in dois
+            if (work := self.mock_openalex.get_work_by_doi(doi))
+        }
         self.mock_email_service = Mock()
         self.mock_process = Mock()
         self.service = OrcidFetchService(
@@ -12,6 +12,7 @@ import requests
 
 from paper.ingestion.clients.base import BaseClient, ClientConfig
 from paper.ingestion.exceptions import FetchError, TimeoutError
+from utils.openalex import OPENALEX_MAX_FILTER_IDS, normalize_doi
 
 logger = logging.getLogger(__name__)
 
@@ -284,3 +285,33 @@ class OpenAlexClient(BaseClient):
         except Exception as e:
             logger.error(f"Failed to fetch papers by IDs: {e}")
             return []
+
+    def fetch_by_dois(self, dois: list[str]) -> dict[str, dict[str, Any]]:
+        """
+        Fetch papers for many DOIs, combining up to `OPENALEX_MAX_FILTER_IDS`
+        DOIs into each `filter=doi:a|b|c` request.
+
+        Args:
+            dois: DOIs to fetch, with or without a doi.org prefix
+
+        Returns:
+            Raw paper records keyed by normalized DOI. DOIs OpenAlex has no
+            work for are left out.
+
+        Raises:
+            RetryExhaustedError: If a request keeps failing
+        """
+        unique_dois = list(dict.fromkeys(filter(None, map(normalize_doi, dois))))
+        papers = {}
+        for start in range(0, len(unique_dois), OPENALEX_MAX_FILTER_IDS):
+            chunk = unique_dois[start : start + OPENALEX_MAX_FILTER_IDS]
+            params = {
+                "filter": f"doi:{'|'.join(chunk)}",
+                "per-page": len(chunk),
+            }
+            response = self.fetch_with_retry("/works", params)
+            for paper in self.process_page(response):
+                doi = normalize_doi(paper["raw_data"].get("doi"))
+                if doi:
+                    papers[doi] = paper
+        return papers
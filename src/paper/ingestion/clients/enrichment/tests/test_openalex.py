@@ -465,6 +465,31 @@ class TestOpenAlexClient(TestCase):
         # Assert
         self.assertEqual(papers, [])
 
+    @patch.object(OpenAlexClient, "fetch_with_retry")
+    def test_fetch_by_dois_combines_dois_into_batched_requests(self, mock_fetch):
+        """
+        Test fetch_by_dois requests up to 50 DOIs at a time, keyed by DOI.
+        """
+        # Arrange
+        dois = [f"https://doi.org/10.1234/Test{i}" for i in range(60)]
+        mock_fetch.side_effect = lambda endpoint, params: {
+            "results": [
+                {"id": doi, "doi": f"https://doi.org/{doi}"}
+                for doi in params["filter"].removeprefix("doi:").split("|")
+            ]
+        }
+
+        # Act
+        papers = self.client.fetch_by_dois(dois + ["10.1234/test0"])
+
+        # Assert
+        self.assertEqual(mock_fetch.call_count, 2)
+        first_params = mock_fetch.call_args_list[0][0][1]
+        self.assertEqual(first_params["per-page"], 50)
+        self.assertTrue(first_params["filter"].startswith("doi:10.1234/test0|"))
+        self.assertEqual(len(papers), 60)
+        self.assertEqual(papers["10.1234/test59"]["raw_data"]["id"], "10.1234/test59")
+
     @patch.object(OpenAlexClient, "fetch_with_retry")
     def test_fetch_recent_with_additional_filters(self, mock_fetch):
         """
@@ -10,11 +10,13 @@ from typing import Any
 
 from django.db import transaction
 
+from feed.signals.document_signals import batch_document_feed_entries
 from institution.models import Institution
 from paper.ingestion.constants import IngestionSource
 from paper.ingestion.mappers import BaseMapper
 from paper.models import Paper
 from paper.related_models.authorship_model import Authorship
+from search.tasks import update_institution_documents
 from user.related_models.author_model import Author
 
 logger = logging.getLogger(__name__)
@@ -67,109 +69,245 @@ class PaperIngestionService:
         Returns:
             Tuple of (created authors, created institutions, created authorships)
         """
-        created_authors = []
-        created_institutions = []
-        created_authorships = []
+        return self._create_authors_and_institutions_batch([(paper, record)], mapper)
 
-        # Get model instances from mapper
-        author_models = mapper.map_to_authors(record)
-        institution_models = mapper.map_to_institutions(record)
+    def _create_authors_and_institutions_batch(
+        self,
+        items: list[tuple[Paper, dict[str, Any]]],
+        mapper: BaseMapper,
+    ) -> tuple[list[Author], list[Institution], list[Authorship]]:
+        """
+        Create authors, institutions, and their relationships for a batch of papers.
 
-        # Save or find existing institutions
-        saved_institutions = {}  # Map ror_id to saved Institution
-        for inst_model in institution_models:
-            if not inst_model.ror_id:
-                continue
+        Existing rows are resolved with one query per entity type (institutions by
+        ROR ID, authors by ORCID ID, authorships by paper and author), and new rows
+        are written with bulk inserts, so the number of queries does not depend on
+        the number of papers or authors in the batch.
 
+        Args:
+            items: Pairs of saved Paper instance and original source record
+            mapper: Mapper instance for the source
+
+        Returns:
+            Tuple of (created authors, created institutions, created authorships)
+        """
+        mapped = []
+        for paper, record in items:
             try:
-                # Try to find existing institution by ROR ID
-                existing_inst = Institution.objects.filter(
-                    ror_id=inst_model.ror_id
-                ).first()
-
-                if existing_inst:
-                    saved_institutions[inst_model.ror_id] = existing_inst
-                else:
-                    # Save new institution
-                    inst_model.save()
-                    created_institutions.append(inst_model)
-                    saved_institutions[inst_model.ror_id] = inst_model
-                    logger.info(
-                        f"Created institution: {inst_model.display_name} "
-                        f"with ROR ID: {inst_model.ror_id}"
+                mapped.append(
+                    (
+                        paper,
+                        mapper.map_to_authors(record),
+                        mapper.map_to_institutions(record),
+                        mapper.map_to_authorships(paper, record),
                     )
-
+                )
             except Exception as e:
-                logger.error(f"Failed to save institution: {e}")
+                logger.warning(
+                    "Failed to map authors/institutions for paper %s: %s",
+                    paper.id,
+                    e,
+                )
 
-        # Save or find existing authors
-        saved_authors = {}  # Map orcid_id to saved Author
-        for author_model in author_models:
-            if not author_model.orcid_id:
-                continue
+        institution_models = {}  # Map ror_id to mapped Institution
+        author_models = {}  # Map orcid_id to mapped Author
+        for _, authors, institutions, _ in mapped:
+            for inst_model in institutions:
+                if inst_model.ror_id:
+                    institution_models.setdefault(inst_model.ror_id, inst_model)
+            for author_model in authors:
+                if author_model.orcid_id:
+                    author_models.setdefault(author_model.orcid_id, author_model)
+
+        saved_institutions, created_institutions = self._save_institutions(
+            institution_models
+        )
+        saved_authors, created_authors = self._save_authors(author_models)
+        created_authorships = self._save_authorships(
+            [(paper, authorships) for paper, _, _, authorships in mapped],
+            saved_authors,
+            saved_institutions,
+        )
 
-            try:
-                # Try to find existing author by ORCID ID
-                existing_author = Author.objects.filter(
-                    orcid_id=author_model.orcid_id
-                ).first()
-
-                if existing_author:
-                    saved_authors[author_model.orcid_id] = existing_author
-                else:
-                    # Save new author
-                    author_model.save()
-                    created_authors.append(author_model)
-                    saved_authors[author_model.orcid_id] = author_model
-                    logger.info(
-                        "Created author: %s %s with ORCID: %s",
-                        author_model.first_name,
-                        author_model.last_name,
-                        author_model.orcid_id,
-                    )
+        return created_authors, created_institutions, created_authorships
 
-            except Exception as e:
-                logger.error(f"Failed to save author: {e}")
-
-        # Get authorship models from mapper and save them
-        authorship_models = mapper.map_to_authorships(paper, record)
-        for authorship_model in authorship_models:
-            # Update authorship with saved author instance
-            if authorship_model.author and authorship_model.author.orcid_id:
-                saved_author = saved_authors.get(authorship_model.author.orcid_id)
-                if not saved_author:
-                    continue  # Skip if author wasn't saved
-                authorship_model.author = saved_author
+    def _save_institutions(
+        self, institution_models: dict[str, Institution]
+    ) -> tuple[dict[str, Institution], list[Institution]]:
+        """
+        Find or create institutions by ROR ID.
 
-            try:
-                # Check if authorship already exists
-                existing_authorship = Authorship.objects.filter(
-                    paper=paper, author=authorship_model.author
-                ).first()
-
-                if not existing_authorship:
-                    # Save new authorship
-                    authorship_model.save()
-                    created_authorships.append(authorship_model)
-
-                    # Add institutions (many-to-many relationship)
-                    if hasattr(authorship_model, "_institutions_to_add"):
-                        for inst in authorship_model._institutions_to_add:
-                            if inst.ror_id in saved_institutions:
-                                authorship_model.institutions.add(
-                                    saved_institutions[inst.ror_id]
-                                )
-
-                    logger.info(
-                        "Created authorship: %s -> %s",
-                        authorship_model.author.last_name,
-                        paper.title[:50],
-                    )
+        Returns:
+            Tuple of (saved institutions by ROR ID, created institutions)
+        """
+        if not institution_models:
+            return {}, []
 
-            except Exception as e:
-                logger.error(f"Failed to create authorship: {e}")
+        saved_institutions = Institution.objects.in_bulk(
+            list(institution_models), field_name="ror_id"
+        )
+        new_institutions = [
+            inst_model
+            for ror_id, inst_model in institution_models.items()
+            if ror_id not in saved_institutions
+        ]
+        if not new_institutions:
+            return saved_institutions, []
 
-        return created_authors, created_institutions, created_authorships
+        try:
+            Institution.objects.bulk_create(new_institutions, ignore_conflicts=True)
+        except Exception as e:
+            logger.error(f"Failed to save institutions: {e}")
+            return saved_institutions, []
+
+        # Conflicting rows are skipped, so read back what was actually written
+        inserted = Institution.objects.in_bulk(
+            [inst_model.ror_id for inst_model in new_institutions],
+            field_name="ror_id",
+        )
+        saved_institutions.update(inserted)
+        created_institutions = [
+            inserted[inst_model.ror_id]
+            for inst_model in new_institutions
+            if inst_model.ror_id in inserted
+        ]
+        logger.info(f"Created {len(created_institutions)} institutions")
+
+        # Bulk inserts skip post_save, so index the new institutions explicitly
+        institution_ids = [institution.id for institution in created_institutions]
+        if institution_ids:
+            transaction.on_commit(
+                lambda: update_institution_documents.delay(institution_ids)
+            )
+
+        return saved_institutions, created_institutions
+
+    def _save_authors(
+        self, author_models: dict[str, Author]
+    ) -> tuple[dict[str, Author], list[Author]]:
+        """
+        Find or create authors by ORCID ID.
+
+        Returns:
+            Tuple of (saved authors by ORCID ID, created authors)
+        """
+        if not author_models:
+            return {}, []
+
+        saved_authors = {}
+        existing_authors = Author.objects.filter(orcid_id__in=list(author_models))
+        for author in existing_authors.order_by("id"):
+            saved_authors.setdefault(author.orcid_id, author)
+
+        new_authors = [
+            author_model
+            for orcid_id, author_model in author_models.items()
+            if orcid_id not in saved_authors
+        ]
+        if not new_authors:
+            return saved_authors, []
+
+        try:
+            Author.objects.bulk_create(new_authors, ignore_conflicts=True)
+        except Exception as e:
+            logger.error(f"Failed to save authors: {e}")
+            return saved_authors, []
+
+        inserted = {}
+        inserted_authors = Author.objects.filter(
+            orcid_id__in=[author_model.orcid_id for author_model in new_authors]
+        )
+        for author in inserted_authors.order_by("id"):
+            inserted.setdefault(author.orcid_id, author)
+        saved_authors.update(inserted)
+        created_authors = [
+            inserted[author_model.orcid_id]
+            for author_model in new_authors
+            if author_model.orcid_id in inserted
+        ]
+        logger.info(f"Created {len(created_authors)} authors")
+
+        return saved_authors, created_authors
+
+    def _save_authorships(
+        self,
+        authorships_by_paper: list[tuple[Paper, list[Authorship]]],
+        saved_authors: dict[str, Author],
+        saved_institutions: dict[str, Institution],
+    ) -> list[Authorship]:
+        """
+        Create authorships that don't exist yet, and link them to their
+        institutions.
+
+        Returns:
+            Created authorships
+        """
+        new_authorships = {}  # Map (paper_id, author_id) to Authorship
+        for paper, authorships in authorships_by_paper:
+            for authorship_model in authorships:
+                # Update authorship with saved author instance
+                author = authorship_model.author
+                if author and author.orcid_id:
+                    author = saved_authors.get(author.orcid_id)
+                    if not author:
+                        continue  # Skip if author wasn't saved
+                    authorship_model.author = author
+                if not author or not author.pk:
+                    continue
+                new_authorships.setdefault((paper.id, author.pk), authorship_model)
+
+        if not new_authorships:
+            return []
+
+        paper_ids = {paper_id for paper_id, _ in new_authorships}
+        author_ids = {author_id for _, author_id in new_authorships}
+        pairs = Authorship.objects.filter(
+            paper_id__in=paper_ids, author_id__in=author_ids
+        ).values_list("paper_id", "author_id")
+        for pair in pairs:
+            new_authorships.pop(pair, None)
+
+        if not new_authorships:
+            return []
+
+        try:
+            Authorship.objects.bulk_create(
+                list(new_authorships.values()), ignore_conflicts=True
+            )
+        except Exception as e:
+            logger.error(f"Failed to create authorships: {e}")
+            return []
+
+        # bulk_create doesn't set primary keys when conflicts are ignored
+        authorship_ids = {
+            (paper_id, author_id): authorship_id
+            for authorship_id, paper_id, author_id in Authorship.objects.filter(
+                paper_id__in=paper_ids, author_id__in=author_ids
+            ).values_list("id", "paper_id", "author_id")
+        }
+        created_authorships = []
+        for pair, authorship_model in new_authorships.items():
+            if pair in authorship_ids:
+                authorship_model.pk = authorship_ids[pair]
+                created_authorships.append(authorship_model)
+
+        # Add institutions (many-to-many relationship)
+        through_model = Authorship.institutions.through
+        through_rows = [
+            through_model(
+                authorship_id=authorship_model.pk,
+                institution_id=saved_institutions[inst.ror_id].pk,
+            )
+            for authorship_model in created_authorships
+            for inst in getattr(authorship_model, "_institutions_to_add", [])
+            if inst.ror_id in saved_institutions
+        ]
+        if through_rows:
+            through_model.objects.bulk_create(through_rows, ignore_conflicts=True)
+
+        logger.info(f"Created {len(created_authorships)} authorships")
+
+        return created_authorships
 
     def ingest_papers(
         self,
@@ -206,71 +344,75 @@ class PaperIngestionService:
         # Process papers
         successful_papers = []
         failed_records = []
+        saved_records = []
+
+        # Feed entries for the papers' hubs are queued as one batch task
+        with batch_document_feed_entries():
+            for record in raw_response:
+                try:
+                    # Validate record if requested
+                    if validate and not mapper.validate(record):
+                        failed_records.append(
+                            {
+                                "record": record,
+                                "error": "Validation failed",
+                                "id": record.get("id", "unknown"),
+                            }
+                        )
+                        continue
+
+                    # Map to Paper model
+                    paper = mapper.map_to_paper(record)
+
+                    if not paper:
+                        failed_records.append(
+                            {
+                                "record": record,
+                                "error": "Mapper returned None",
+                                "id": record.get("id", "unknown"),
+                            }
+                        )
+                        continue
 
-        for record in raw_response:
-            try:
-                # Validate record if requested
-                if validate and not mapper.validate(record):
-                    failed_records.append(
-                        {
-                            "record": record,
-                            "error": "Validation failed",
-                            "id": record.get("id", "unknown"),
-                        }
-                    )
-                    continue
+                    paper = self._save_paper(paper)
+
+                    # Create hubs
+                    hubs = mapper.map_to_hubs(record)
+                    if hubs:
+                        paper.unified_document.hubs.add(*hubs)
+
+                    # Authors and institutions are created for the whole batch below
+                    if paper and paper.id:
+                        saved_records.append((paper, record))
 
-                # Map to Paper model
-                paper = mapper.map_to_paper(record)
+                    successful_papers.append(paper)
 
-                if not paper:
+                except Exception as e:
+                    logger.exception(
+                        "Failed to process paper %s", record.get("id", "unknown")
+                    )
                     failed_records.append(
                         {
                             "record": record,
-                            "error": "Mapper returned None",
+                            "error": str(e),
                             "id": record.get("id", "unknown"),
                         }
                     )
-                    continue
 
-                paper = self._save_paper(paper)
-
-                # Create hubs
-                hubs = mapper.map_to_hubs(record)
-                if hubs:
-                    paper.unified_document.hubs.add(*hubs)
-
-                # Create authors and institutions after paper is saved
-                if paper and paper.id:
-                    try:
-                        authors, institutions, authorships = (
-                            self._create_authors_and_institutions(paper, record, mapper)
-                        )
-                        logger.debug(
-                            f"Created {len(authors)} authors, "
-                            f"{len(institutions)} institutions, and "
-                            f"{len(authorships)} authorships for paper {paper.id}"
-                        )
-                    except Exception as e:
-                        logger.warning(
-                            "Failed to create authors/institutions for paper %s: %s",
-                            paper.id,
-                            e,
-                        )
-
-                successful_papers.append(paper)
-
-            except Exception as e:
-                logger.exception(
-                    "Failed to process paper %s", record.get("id", "unknown")
+        # Create authors and institutions after papers are saved
+        if saved_records:
+            try:
+                authors, institutions, authorships = (
+                    self._create_authors_and_institutions_batch(saved_records, mapper)
                 )
-                failed_records.append(
-                    {
-                        "record": record,
-                        "error": str(e),
-                        "id": record.get("id", "unknown"),
-                    }
+                logger.debug(
+                    f"Created {len(authors)} authors, "
+                    f"{len(institutions)} institutions, and "
+                    f"{len(authorships)} authorships for "
+                    f"{len(saved_records)} papers"
                 )
+            except Exception as e:
+                logger.warning("Failed to create authors/institutions: %s", e)
 
         # Log results
         logger.info(
@@ -1,5 +1,5 @@
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import timedelta
 
 from django.db import transaction
@@ -11,10 +11,21 @@ from paper.ingestion.clients.enrichment.openalex import OpenAlexClient
 from paper.ingestion.mappers import OpenAlexMapper
 from paper.models import Paper
 from paper.related_models.authorship_model import Authorship
+from search.tasks import update_author_related_documents, update_institution_documents
 from user.related_models.author_model import Author
+from utils.openalex import OPENALEX_MAX_FILTER_IDS, normalize_doi
 
 logger = logging.getLogger(__name__)
 
+AUTHOR_UPDATE_FIELDS = ["first_name", "last_name", "orcid_id", "created_source"]
+INSTITUTION_UPDATE_FIELDS = [
+    "display_name",
+    "country_code",
+    "ror_id",
+    "type",
+    "associated_institutions",
+]
+
 
 @dataclass
 class EnrichmentResult:
@@ -48,6 +59,20 @@ class BatchEnrichmentResult:
     total_hubs_created: int = 0
 
 
+@dataclass
+class _MappedWork:
+    """Model instances mapped from a paper's OpenAlex work record."""
+
+    paper: Paper
+    authors: list[Author] = field(default_factory=list)
+    institutions: list[Institution] = field(default_factory=list)
+    authorships: list[Authorship] = field(default_factory=list)
+    hubs: list[Hub] = field(default_factory=list)
+    license_updated: bool = False
+    citations_updated: bool = False
+    index: int = 0
+
+
 class PaperOpenAlexEnrichmentService:
     """
     Service for enriching papers with OpenAlex data.
@@ -103,86 +128,106 @@ class PaperOpenAlexEnrichmentService:
             return EnrichmentResult(status="skipped", reason="no_doi")
 
         try:
-            # Fetch OpenAlex data
             openalex_data = self.openalex_client.fetch_by_doi(paper.doi)
+        except Exception as e:
+            logger.exception("Error enriching paper %s (DOI: %s)", paper.id, paper.doi)
+            return EnrichmentResult(status="error", reason=str(e))
 
-            if not openalex_data:
-                logger.info(
-                    f"No OpenAlex data found for paper {paper.id} (DOI: {paper.doi})"
-                )
-                return EnrichmentResult(status="not_found", reason="no_openalex_data")
+        return self.apply_openalex_data(paper, openalex_data)
 
-            # Map the OpenAlex data to a Paper instance to extract all fields
-            raw_data = openalex_data.get("raw_data", {})
-            mapped_paper = self.openalex_mapper.map_to_paper(raw_data)
+    def apply_openalex_data(
+        self, paper: Paper, openalex_data: dict | None
+    ) -> EnrichmentResult:
+        """
+        Update the paper's license fields, authors, institutions, and
+        authorships from an already fetched OpenAlex record.
 
-            # Track statistics
-            authors_created = 0
-            authors_updated = 0
-            institutions_created = 0
-            institutions_updated = 0
-            authorships_created = 0
-            hubs_created = 0
+        Args:
+            paper: Paper instance to enrich
+            openalex_data: OpenAlex work record, or None if OpenAlex has none
 
-            # Process in a transaction
-            with transaction.atomic():
-                # Process license data if available and not already present
-                license_updated = False
-                citations_updated = False
-                update_fields = []
-
-                if mapped_paper.pdf_url and mapped_paper.pdf_license:
-                    # Only update if both required fields are missing (all-or-nothing)
-                    if not (paper.pdf_url and paper.pdf_license):
-                        update_fields = ["pdf_url", "pdf_license"]
-
-                        paper.pdf_license = mapped_paper.pdf_license
-                        paper.pdf_url = mapped_paper.pdf_url
-
-                        # pdf_license_url is optional
-                        if mapped_paper.pdf_license_url:
-                            paper.pdf_license_url = mapped_paper.pdf_license_url
-                            update_fields.append("pdf_license_url")
-
-                        license_updated = True
-                    else:
-                        logger.debug(
-                            f"Paper {paper.id} already has license data, "
-                            f"skipping license update"
-                        )
-                else:
-                    logger.debug(
-                        f"Missing license data in OpenAlex for paper {paper.id} "
-                        f"(has_pdf_url={bool(mapped_paper.pdf_url)}, "
-                        f"has_license={bool(mapped_paper.pdf_license)})"
-                    )
+        Returns:
+            EnrichmentResult with status and details
+        """
+        return self.apply_openalex_data_batch([(paper, openalex_data)])[0]
 
-                # Update citations if available
-                if mapped_paper.citations is not None:
-                    paper.citations = mapped_paper.citations
-                    update_fields = update_fields + ["citations"]
-                    citations_updated = True
+    def apply_openalex_data_batch(
+        self, items: list[tuple[Paper, dict | None]]
+    ) -> list[EnrichmentResult]:
+        """
+        Update license fields, authors, institutions, and authorships of
+        several papers from already fetched OpenAlex records.
+
+        License and citation updates are saved per paper. Authors, institutions,
+        authorships, and hubs of all papers are then written together, with one
+        query per entity type to find existing rows and bulk inserts for new ones.
 
-                if update_fields:
-                    paper.save(update_fields=update_fields)
+        Args:
+            items: Pairs of Paper instance and OpenAlex work record (or None)
 
-                # Always process authors, institutions, and authorships
-                authors_created, authors_updated = self.process_authors(
-                    paper, openalex_data
+        Returns:
+            EnrichmentResult for each item, in the same order
+        """
+        results = [None] * len(items)
+        works = []
+        for index, (paper, openalex_data) in enumerate(items):
+            if not openalex_data:
+                logger.info(
+                    f"No OpenAlex data found for paper {paper.id} (DOI: {paper.doi})"
+                )
+                results[index] = EnrichmentResult(
+                    status="not_found", reason="no_openalex_data"
                 )
+                continue
+
+            try:
+                # Map the OpenAlex data to a Paper instance to extract all fields
+                raw_data = openalex_data.get("raw_data", {})
+                mapped_paper = self.openalex_mapper.map_to_paper(raw_data)
+                work = self._map_work(paper, raw_data)
 
-                institutions_created, institutions_updated = self.process_institutions(
-                    paper, openalex_data
+                work.license_updated, work.citations_updated = (
+                    self._update_paper_fields(paper, mapped_paper)
                 )
+            except Exception as e:
+                logger.exception(
+                    "Error enriching paper %s (DOI: %s)", paper.id, paper.doi
+                )
+                results[index] = EnrichmentResult(status="error", reason=str(e))
+                continue
 
-                authorships_created = self.process_authorships(paper, openalex_data)
+            work.index = index
+            works.append(work)
 
-                hubs_created = self.process_hubs(paper, openalex_data)
+        if not works:
+            return results
 
+        try:
+            # Always process authors, institutions, and authorships
+            with transaction.atomic():
+                author_counts = self._upsert_authors(works)
+                institution_counts = self._upsert_institutions(works)
+                authorship_counts = self._create_authorships(works)
+                hub_counts = self._add_hubs(works)
+        except Exception as e:
+            logger.exception(
+                "Error saving OpenAlex authors for papers %s",
+                [work.paper.id for work in works],
+            )
+            for work in works:
+                results[work.index] = EnrichmentResult(status="error", reason=str(e))
+            return results
+
+        for position, work in enumerate(works):
+            paper = work.paper
+            authors_created, authors_updated = author_counts[position]
+            institutions_created, institutions_updated = institution_counts[position]
+            authorships_created = authorship_counts[position]
+            hubs_created = hub_counts[position]
             logger.info(
                 f"Successfully enriched paper {paper.id}: "
-                f"license_updated={license_updated}, "
-                f"citations_updated={citations_updated}, "
+                f"license_updated={work.license_updated}, "
+                f"citations_updated={work.citations_updated}, "
                 f"{authors_created} authors created, "
                 f"{authors_updated} authors updated, "
                 f"{institutions_created} institutions created, "
@@ -190,8 +235,7 @@ class PaperOpenAlexEnrichmentService:
                 f"{authorships_created} authorships created, "
                 f"{hubs_created} hubs created"
             )
-
-            return EnrichmentResult(
+            results[work.index] = EnrichmentResult(
                 status="success",
                 license=paper.pdf_license,
                 license_url=paper.pdf_license_url,
@@ -203,9 +247,66 @@ class PaperOpenAlexEnrichmentService:
                 hubs_created=hubs_created,
             )
 
-        except Exception as e:
-            logger.exception("Error enriching paper %s (DOI: %s)", paper.id, paper.doi)
-            return EnrichmentResult(status="error", reason=str(e))
+        return results
+
+    def _map_work(self, paper: Paper, raw_data: dict) -> _MappedWork:
+        return _MappedWork(
+            paper=paper,
+            authors=self.openalex_mapper.map_to_authors(raw_data),
+            institutions=self.openalex_mapper.map_to_institutions(raw_data),
+            authorships=self.openalex_mapper.map_to_authorships(paper, raw_data),
+            hubs=self.openalex_mapper.map_to_hubs(raw_data),
+        )
+
+    def _update_paper_fields(
+        self, paper: Paper, mapped_paper: Paper
+    ) -> tuple[bool, bool]:
+        """
+        Copy license and citation data from the mapped paper.
+
+        Returns:
+            Tuple of (license_updated, citations_updated)
+        """
+        license_updated = False
+        citations_updated = False
+        update_fields = []
+
+        if mapped_paper.pdf_url and mapped_paper.pdf_license:
+            # Only update if both required fields are missing (all-or-nothing)
+            if not (paper.pdf_url and paper.pdf_license):
+                update_fields = ["pdf_url", "pdf_license"]
+
+                paper.pdf_license = mapped_paper.pdf_license
+                paper.pdf_url = mapped_paper.pdf_url
+
+                # pdf_license_url is optional
+                if mapped_paper.pdf_license_url:
+                    paper.pdf_license_url = mapped_paper.pdf_license_url
+                    update_fields.append("pdf_license_url")
+
+                license_updated = True
+            else:
+                logger.debug(
+                    f"Paper {paper.id} already has license data, "
+                    f"skipping license update"
+                )
+        else:
+            logger.debug(
+                f"Missing license data in OpenAlex for paper {paper.id} "
+                f"(has_pdf_url={bool(mapped_paper.pdf_url)}, "
+                f"has_license={bool(mapped_paper.pdf_license)})"
+            )
+
+        # Update citations if available
+        if mapped_paper.citations is not None:
+            paper.citations = mapped_paper.citations
+            update_fields = update_fields + ["citations"]
+            citations_updated = True
+
+        if update_fields:
+            paper.save(update_fields=update_fields)
+
+        return license_updated, citations_updated
 
     def process_authors(self, paper: Paper, openalex_data: dict) -> tuple[int, int]:
         """
@@ -218,16 +319,101 @@ class PaperOpenAlexEnrichmentService:
         Returns:
             Tuple of (authors_created, authors_updated)
         """
-        authors_created = 0
-        authors_updated = 0
+        raw_data = openalex_data.get("raw_data", {})
+        work = _MappedWork(
+            paper=paper, authors=self.openalex_mapper.map_to_authors(raw_data)
+        )
+        return self._upsert_authors([work])[0]
+
+    def process_institutions(
+        self, paper: Paper, openalex_data: dict
+    ) -> tuple[int, int]:
+        """
+        Process institutions from OpenAlex data and create/update Institution records.
+
+        Args:
+            paper: Paper instance
+            openalex_data: OpenAlex work record
 
+        Returns:
+            Tuple of (institutions_created, institutions_updated)
+        """
         raw_data = openalex_data.get("raw_data", {})
-        author_instances = self.openalex_mapper.map_to_authors(raw_data)
+        work = _MappedWork(
+            paper=paper,
+            institutions=self.openalex_mapper.map_to_institutions(raw_data),
+        )
+        return self._upsert_institutions([work])[0]
 
-        for author_instance in author_instances:
-            try:
-                # Prepare defaults for creation
-                defaults = {
+    def process_authorships(self, paper: Paper, openalex_data: dict) -> int:
+        """
+        Process authorships from OpenAlex data and create Authorship records.
+
+        Args:
+            paper: Paper instance
+            openalex_data: OpenAlex work record
+
+        Returns:
+            Number of authorships created
+        """
+        raw_data = openalex_data.get("raw_data", {})
+        work = _MappedWork(
+            paper=paper,
+            authorships=self.openalex_mapper.map_to_authorships(paper, raw_data),
+        )
+        return self._create_authorships([work])[0]
+
+    def process_hubs(self, paper: Paper, openalex_data: dict) -> int:
+        """
+        Process hubs from OpenAlex data, create Hub instances, and assign it to the
+        given paper.
+
+        Args:
+            paper: Paper instance
+            openalex_data: OpenAlex work record
+
+        Returns:
+            Number of hubs created
+        """
+        raw_data = openalex_data.get("raw_data", {})
+        work = _MappedWork(paper=paper, hubs=self.openalex_mapper.map_to_hubs(raw_data))
+        return self._add_hubs([work])[0]
+
+    def _upsert_authors(self, works: list[_MappedWork]) -> list[tuple[int, int]]:
+        """
+        Create or update the authors of all works, matched by OpenAlex ID.
+
+        Returns:
+            (authors_created, authors_updated) for each work
+        """
+        counts = [[0, 0] for _ in works]
+        openalex_ids = {
+            openalex_id
+            for work in works
+            for author_instance in work.authors
+            for openalex_id in author_instance.openalex_ids or []
+        }
+        if not openalex_ids:
+            return [tuple(count) for count in counts]
+
+        # Map every OpenAlex ID to its author, existing or about to be created
+        resolved = {}
+        existing_authors = Author.objects.filter(
+            openalex_ids__overlap=list(openalex_ids)
+        )
+        for author in existing_authors.order_by("id"):
+            for openalex_id in author.openalex_ids:
+                resolved.setdefault(openalex_id, author)
+
+        changed_authors = {}
+        new_authors = []
+        for count, work in zip(counts, works):
+            for author_instance in work.authors:
+                author_openalex_ids = author_instance.openalex_ids or []
+                if not author_openalex_ids:
+                    continue
+
+                fields = {
                     "first_name": author_instance.first_name,
                     "last_name": author_instance.last_name,
                     "orcid_id": author_instance.orcid_id,
@@ -235,50 +421,76 @@ class PaperOpenAlexEnrichmentService:
                         author_instance, "created_source", Author.SOURCE_OPENALEX
                     ),
                 }
-
-                _, created = Author.objects.update_or_create(
-                    openalex_ids=author_instance.openalex_ids, defaults=defaults
+                author = next(
+                    (
+                        resolved[openalex_id]
+                        for openalex_id in author_openalex_ids
+                        if openalex_id in resolved
+                    ),
+                    None,
                 )
-
-                if created:
-                    authors_created += 1
+                if author is None:
+                    author = Author(openalex_ids=list(author_openalex_ids), **fields)
+                    new_authors.append(author)
+                    count[0] += 1
                 else:
-                    authors_updated += 1
-
-            except Exception:
-                logger.exception("Error processing author for paper %s", paper.id)
+                    for name, value in fields.items():
+                        setattr(author, name, value)
+                    if author.pk:
+                        changed_authors[author.pk] = author
+                    count[1] += 1
+
+                for openalex_id in author_openalex_ids:
+                    resolved.setdefault(openalex_id, author)
+
+        if changed_authors:
+            Author.objects.bulk_update(
+                list(changed_authors.values()), AUTHOR_UPDATE_FIELDS
+            )
+            # Bulk updates skip post_save, so reindex the users of changed authors.
+            # New authors can't be claimed by a user yet and have nothing to index.
+            author_ids = list(changed_authors)
+            transaction.on_commit(
+                lambda: update_author_related_documents.delay(author_ids)
+            )
+        if new_authors:
+            Author.objects.bulk_create(new_authors, ignore_conflicts=True)
 
-        return authors_created, authors_updated
+        return [tuple(count) for count in counts]
 
-    def process_institutions(
-        self, paper: Paper, openalex_data: dict
-    ) -> tuple[int, int]:
+    def _upsert_institutions(self, works: list[_MappedWork]) -> list[tuple[int, int]]:
         """
-        Process institutions from OpenAlex data and create/update Institution records.
-
-        Args:
-            paper: Paper instance
-            openalex_data: OpenAlex work record
+        Create or update the institutions of all works, matched by OpenAlex ID.
+        Institutions without a ROR ID are skipped.
 
         Returns:
-            Tuple of (institutions_created, institutions_updated)
+            (institutions_created, institutions_updated) for each work
         """
-        institutions_created = 0
-        institutions_updated = 0
-
-        raw_data = openalex_data.get("raw_data", {})
-        institution_instances = self.openalex_mapper.map_to_institutions(raw_data)
+        counts = [[0, 0] for _ in works]
+        openalex_ids = {
+            institution_instance.openalex_id
+            for work in works
+            for institution_instance in work.institutions
+            if institution_instance.ror_id and institution_instance.openalex_id
+        }
+        if not openalex_ids:
+            return [tuple(count) for count in counts]
+
+        resolved = Institution.objects.in_bulk(
+            list(openalex_ids), field_name="openalex_id"
+        )
 
-        for institution_instance in institution_instances:
-            if not institution_instance.ror_id:
-                continue
+        changed_institutions = {}
+        new_institutions = []
+        for count, work in zip(counts, works):
+            for institution_instance in work.institutions:
+                openalex_id = institution_instance.openalex_id
+                if not (institution_instance.ror_id and openalex_id):
+                    continue
 
-            try:
-                # Prepare fields to update/create
-                defaults = {
+                fields = {
                     "display_name": institution_instance.display_name,
                     "country_code": institution_instance.country_code,
-                    "openalex_id": institution_instance.openalex_id,
                     "ror_id": institution_instance.ror_id,
                     "type": institution_instance.type,
                     "associated_institutions": getattr(
@@ -286,127 +498,198 @@ class PaperOpenAlexEnrichmentService:
                     )
                     or [],
                 }
-
-                _, created = Institution.objects.update_or_create(
-                    openalex_id=institution_instance.openalex_id, defaults=defaults
-                )
-
-                if created:
-                    institutions_created += 1
+                institution = resolved.get(openalex_id)
+                if institution is None:
+                    institution = Institution(openalex_id=openalex_id, **fields)
+                    new_institutions.append(institution)
+                    count[0] += 1
                 else:
-                    institutions_updated += 1
+                    for name, value in fields.items():
+                        setattr(institution, name, value)
+                    if institution.pk:
+                        changed_institutions[institution.pk] = institution
+                    count[1] += 1
+
+                resolved[openalex_id] = institution
+
+        institution_ids = list(changed_institutions)
+        if changed_institutions:
+            Institution.objects.bulk_update(
+                list(changed_institutions.values()), INSTITUTION_UPDATE_FIELDS
+            )
+        if new_institutions:
+            Institution.objects.bulk_create(new_institutions, ignore_conflicts=True)
+            # bulk_create doesn't set primary keys when conflicts are ignored
+            institution_ids.extend(
+                Institution.objects.filter(
+                    openalex_id__in=[
+                        institution.openalex_id for institution in new_institutions
+                    ]
+                ).values_list("id", flat=True)
+            )
 
-            except Exception:
-                logger.exception("Error processing institution for paper %s", paper.id)
+        # Bulk writes skip post_save, so index the institutions explicitly
+        if institution_ids:
+            transaction.on_commit(
+                lambda: update_institution_documents.delay(institution_ids)
+            )
 
-        return institutions_created, institutions_updated
+        return [tuple(count) for count in counts]
 
-    def process_authorships(self, paper: Paper, openalex_data: dict) -> int:
+    def _create_authorships(self, works: list[_MappedWork]) -> list[int]:
         """
-        Process authorships from OpenAlex data and create Authorship records.
-
-        Args:
-            paper: Paper instance
-            openalex_data: OpenAlex work record
+        Create the authorships of all works that don't exist yet, and link them
+        to their institutions.
 
         Returns:
-            Number of authorships created
+            Number of authorships created for each work
         """
-        authorships_created = 0
-
-        raw_data = openalex_data.get("raw_data", {})
-        authorship_instances = self.openalex_mapper.map_to_authorships(paper, raw_data)
+        counts = [0] * len(works)
+        author_openalex_ids = {
+            getattr(authorship_instance, "_author_openalex_id", None)
+            for work in works
+            for authorship_instance in work.authorships
+        }
+        author_openalex_ids.discard(None)
+        if not author_openalex_ids:
+            return counts
+
+        authors = {}
+        existing_authors = Author.objects.filter(
+            openalex_ids__overlap=list(author_openalex_ids)
+        )
+        for author in existing_authors.order_by("id"):
+            for openalex_id in author.openalex_ids:
+                authors.setdefault(openalex_id, author)
 
-        for authorship_instance in authorship_instances:
-            try:
-                # Get the author by OpenAlex ID
+        new_authorships = {}  # Map (paper_id, author_id) to (work index, Authorship)
+        for index, work in enumerate(works):
+            for authorship_instance in work.authorships:
                 author_openalex_id = getattr(
                     authorship_instance, "_author_openalex_id", None
                 )
                 if not author_openalex_id:
                     continue
 
-                author = Author.objects.filter(
-                    openalex_ids__contains=[author_openalex_id]
-                ).first()
+                author = authors.get(author_openalex_id)
                 if not author:
                     logger.warning(
                         "Author with OpenAlex ID %s not found for paper %s",
                         author_openalex_id,
-                        paper.id,
+                        work.paper.id,
                     )
                     continue
 
                 # Set the author on the authorship
                 authorship_instance.author = author
+                new_authorships.setdefault(
+                    (work.paper.id, author.id), (index, authorship_instance)
+                )
 
-                # Check if authorship already exists
-                existing_authorship = Authorship.objects.filter(
-                    paper=paper, author=author
-                ).first()
+        if not new_authorships:
+            return counts
 
-                if existing_authorship:
-                    logger.debug(
-                        f"Authorship already exists for paper {paper.id} "
-                        f"and author {author.id}"
-                    )
-                    continue
+        # Skip authorships that already exist
+        paper_ids = {paper_id for paper_id, _ in new_authorships}
+        author_ids = {author_id for _, author_id in new_authorships}
+        pairs = Authorship.objects.filter(
+            paper_id__in=paper_ids, author_id__in=author_ids
+        ).values_list("paper_id", "author_id")
+        for pair in pairs:
+            new_authorships.pop(pair, None)
 
-                # Save the authorship
-                authorship_instance.save()
+        if not new_authorships:
+            return counts
 
-                # Link institutions if available
-                institution_openalex_ids = getattr(
-                    authorship_instance, "_institution_openalex_ids", []
-                )
-                if institution_openalex_ids:
-                    institutions = Institution.objects.filter(
-                        openalex_id__in=institution_openalex_ids
-                    )
-                    authorship_instance.institutions.set(institutions)
+        Authorship.objects.bulk_create(
+            [authorship for _, authorship in new_authorships.values()],
+            ignore_conflicts=True,
+        )
 
-                authorships_created += 1
+        # bulk_create doesn't set primary keys when conflicts are ignored
+        authorship_ids = {
+            (paper_id, author_id): authorship_id
+            for authorship_id, paper_id, author_id in Authorship.objects.filter(
+                paper_id__in=paper_ids, author_id__in=author_ids
+            ).values_list("id", "paper_id", "author_id")
+        }
+
+        institution_openalex_ids = {
+            openalex_id
+            for _, authorship in new_authorships.values()
+            for openalex_id in getattr(authorship, "_institution_openalex_ids", [])
+        }
+        institution_ids = dict(
+            Institution.objects.filter(
+                openalex_id__in=institution_openalex_ids
+            ).values_list("openalex_id", "id")
+        )
 
-            except Exception:
-                logger.exception("Error processing authorship for paper %s", paper.id)
+        # Link institutions if available
+        through_model = Authorship.institutions.through
+        through_rows = []
+        for pair, (index, authorship) in new_authorships.items():
+            authorship_id = authorship_ids.get(pair)
+            if authorship_id is None:
+                continue
+
+            authorship.pk = authorship_id
+            counts[index] += 1
+            through_rows.extend(
+                through_model(
+                    authorship_id=authorship_id,
+                    institution_id=institution_ids[openalex_id],
+                )
+                for openalex_id in getattr(authorship, "_institution_openalex_ids", [])
+                if openalex_id in institution_ids
+            )
 
-        return authorships_created
+        if through_rows:
+            through_model.objects.bulk_create(through_rows, ignore_conflicts=True)
 
-    def process_hubs(self, paper: Paper, openalex_data: dict) -> int:
+        return counts
+
+    def _add_hubs(self, works: list[_MappedWork]) -> list[int]:
         """
-        Process hubs from OpenAlex data, create Hub instances, and assign it to the
-        given paper.
+        Get or create the hubs of all works and assign them to their papers.
 
-        Args:
-            paper: Paper instance
-            openalex_data: OpenAlex work record
+        Hubs are added per paper so that the unified document `hubs` signals
+        still fire.
 
         Returns:
-            Number of hubs created
+            Number of hubs created for each work
         """
-        hubs_created = 0
+        counts = [0] * len(works)
+        names = {hub.name for work in works for hub in work.hubs}
+        if not names:
+            return counts
 
-        raw_data = openalex_data.get("raw_data", {})
-        hubs = self.openalex_mapper.map_to_hubs(raw_data)
-
-        for hub in hubs:
-            try:
-                hub, created = Hub.objects.get_or_create(name=hub.name)
-                if created:
-                    hubs_created += 1
+        hubs = {}
+        for hub in Hub.objects.filter(name__in=names).order_by("id"):
+            hubs.setdefault(hub.name, hub)
 
-                paper.unified_document.hubs.add(hub)
+        for index, work in enumerate(works):
+            paper_hubs = []
+            for hub in work.hubs:
+                if hub.name not in hubs:
+                    hubs[hub.name], created = Hub.objects.get_or_create(name=hub.name)
+                    if created:
+                        counts[index] += 1
+                paper_hubs.append(hubs[hub.name])
 
-            except Exception:
-                logger.exception("Error processing hub for paper %s", paper.id)
+            if paper_hubs:
+                work.paper.unified_document.hubs.add(*paper_hubs)
 
-        return hubs_created
+        return counts
 
     def enrich_papers_batch(self, paper_ids: list[int]) -> BatchEnrichmentResult:
         """
         Enrich multiple papers with OpenAlex data, including license info,
         authors, institutions, and authorships.
 
+        Papers are fetched from OpenAlex `OPENALEX_MAX_FILTER_IDS` DOIs per
+        request, and each batch is written with `apply_openalex_data_batch`.
+
         Args:
             paper_ids: List of paper IDs to enrich
 
@@ -424,11 +707,52 @@ class PaperOpenAlexEnrichmentService:
         total_authorships_created = 0
         total_hubs_created = 0
 
-        for paper_id in paper_ids:
+        for start in range(0, total, OPENALEX_MAX_FILTER_IDS):
+            batch_ids = paper_ids[start : start + OPENALEX_MAX_FILTER_IDS]
+            papers = Paper.objects.in_bulk(batch_ids)
+            dois = [
+                papers[paper_id].doi
+                for paper_id in batch_ids
+                if paper_id in papers and papers[paper_id].doi
+            ]
             try:
-                paper = Paper.objects.get(id=paper_id)
-                result = self.enrich_paper_with_openalex(paper)
+                # One request for the whole batch instead of one per DOI
+                openalex_records = (
+                    self.openalex_client.fetch_by_dois(dois) if dois else {}
+                )
+            except Exception:
+                error_count += len(batch_ids)
+                logger.exception(
+                    "Error fetching OpenAlex data for papers %s", batch_ids
+                )
+                continue
+
+            items = []
+            for paper_id in batch_ids:
+                paper = papers.get(paper_id)
+                if paper is None:
+                    error_count += 1
+                    logger.error(f"Paper {paper_id} not found during enrichment")
+                    continue
 
+                if not paper.doi:
+                    logger.warning(f"Paper {paper.id} has no DOI, skipping enrichment")
+                    not_found_count += 1
+                    continue
+
+                items.append((paper, openalex_records.get(normalize_doi(paper.doi))))
+
+            try:
+                results = self.apply_openalex_data_batch(items)
+            except Exception:
+                error_count += len(items)
+                logger.exception(
+                    "Unexpected error processing papers %s",
+                    [paper.id for paper, _ in items],
+                )
+                continue
+
+            for result in results:
                 if result.status == "success":
                     success_count += 1
                     total_authors_created += result.authors_created
@@ -442,13 +766,6 @@ class PaperOpenAlexEnrichmentService:
                 else:
                     error_count += 1
 
-            except Paper.DoesNotExist:
-                error_count += 1
-                logger.error(f"Paper {paper_id} not found during enrichment")
-            except Exception:
-                error_count += 1
-                logger.exception("Unexpected error processing paper %s", paper_id)
-
         return BatchEnrichmentResult(
             total=total,
             success_count=success_count,
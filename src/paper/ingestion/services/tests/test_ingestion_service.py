@@ -655,6 +655,94 @@ class TestPaperIngestionService(TestCase):
         self.assertIsNotNone(authorship)
         self.assertEqual(authorship.institutions.count(), 0)
 
+    def test_create_authors_and_institutions_batch_shares_rows(self):
+        """Test that authors and institutions shared by papers are saved once."""
+        papers = [
+            Paper.objects.create(
+                title=f"Batch Paper {i}",
+                doi=f"10.1234/chemrxiv.batch{i}",
+                external_source="chemrxiv",
+            )
+            for i in range(2)
+        ]
+
+        def map_to_authors(record):
+            return [
+                Author(
+                    first_name="Shared",
+                    last_name="Author",
+                    orcid_id="0000-0005-6789-0123",
+                    created_source=Author.SOURCE_RESEARCHHUB,
+                )
+            ]
+
+        def map_to_institutions(record):
+            return [
+                Institution(
+                    openalex_id="chemrxiv_shared",
+                    ror_id="https://ror.org/shared",
+                    display_name="Shared University",
+                )
+            ]
+
+        def map_to_authorships(paper, record):
+            authorship = Authorship(
+                paper=paper,
+                author=map_to_authors(record)[0],
+                author_position="first",
+                raw_author_name="Shared Author",
+            )
+            authorship._institutions_to_add = map_to_institutions(record)
+            return [authorship]
+
+        mock_mapper = Mock()
+        mock_mapper.map_to_authors.side_effect = map_to_authors
+        mock_mapper.map_to_institutions.side_effect = map_to_institutions
+        mock_mapper.map_to_authorships.side_effect = map_to_authorships
+
+        authors, institutions, authorships = (
+            self.service._create_authors_and_institutions_batch(
+                [(paper, {"id": paper.doi}) for paper in papers], mock_mapper
+            )
+        )
+
+        self.assertEqual(len(authors), 1)
+        self.assertEqual(len(institutions), 1)
+        self.assertEqual(len(authorships), 2)
+        self.assertEqual(
+            Author.objects.filter(orcid_id="0000-0005-6789-0123").count(), 1
+        )
+        for paper in papers:
+            authorship = Authorship.objects.get(paper=paper)
+            self.assertEqual(authorship.author, authors[0])
+            self.assertEqual(list(authorship.institutions.all()), institutions)
+
+    @patch("paper.ingestion.services.ingestion_service.update_institution_documents")
+    def test_created_institutions_are_indexed(self, mock_update_institutions):
+        """Test that bulk created institutions are queued for search indexing."""
+        paper = Paper.objects.create(
+            title="Indexed Paper",
+            doi="10.1234/chemrxiv.indexed",
+            external_source="chemrxiv",
+        )
+        mock_mapper = Mock()
+        mock_mapper.map_to_authors.return_value = []
+        mock_mapper.map_to_institutions.return_value = [
+            Institution(
+                openalex_id="chemrxiv_indexed",
+                ror_id="https://ror.org/indexed",
+                display_name="Indexed University",
+            )
+        ]
+        mock_mapper.map_to_authorships.return_value = []
+
+        with self.captureOnCommitCallbacks(execute=True):
+            _, institutions, _ = self.service._create_authors_and_institutions(
+                paper, {"id": paper.doi}, mock_mapper
+            )
+
+        mock_update_institutions.delay.assert_called_once_with([institutions[0].id])
+
     @patch("paper.tasks.download_pdf")
     def test_pdf_download_triggered_for_arxiv_papers(self, mock_download_pdf):
         """Test that PDF download task is triggered for arXiv papers with pdf_url."""
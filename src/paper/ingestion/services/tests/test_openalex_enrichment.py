@@ -2,13 +2,18 @@
 Tests for the OpenAlex enrichment service.
 """
 
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from hub.models import Hub
+from institution.models import Institution
 from paper.ingestion.services.openalex_enrichment import PaperOpenAlexEnrichmentService
+from paper.related_models.authorship_model import Authorship
 from paper.tests.helpers import create_paper
+from user.related_models.author_model import Author
 
 
 class TestPaperOpenAlexEnrichmentService(TestCase):
@@ -211,7 +216,10 @@ class TestPaperOpenAlexEnrichmentService(TestCase):
                 "authorships": [],
             }
         }
-        self.mock_openalex_client.fetch_by_doi.return_value = openalex_data
+        self.mock_openalex_client.fetch_by_dois.return_value = {
+            "10.1234/test1": openalex_data,
+            "10.1234/test2": openalex_data,
+        }
 
         # Mock the mapped paper with complete license data
         mock_mapped_paper = Mock()
@@ -235,6 +243,10 @@ class TestPaperOpenAlexEnrichmentService(TestCase):
         self.assertEqual(result.success_count, 2)
         self.assertEqual(result.not_found_count, 0)
         self.assertEqual(result.error_count, 0)
+        self.mock_openalex_client.fetch_by_dois.assert_called_once_with(
+            ["10.1234/test1", "10.1234/test2"]
+        )
+        self.mock_openalex_client.fetch_by_doi.assert_not_called()
 
     def test_enrich_papers_batch_mixed_results(self):
         """Test batch enrichment with mixed results."""
@@ -248,21 +260,18 @@ class TestPaperOpenAlexEnrichmentService(TestCase):
         paper3.doi = "10.1234/test3"
         paper3.save()
 
-        def mock_fetch(doi):
-            if doi == "10.1234/test1":
-                return {
-                    "raw_data": {
-                        "primary_location": {
-                            "license": "cc-by",
-                            "pdf_url": "https://arxiv.org/pdf/2301.00001.pdf",
-                        },
-                        "authorships": [],
-                    }
+        # paper3's DOI is not found
+        self.mock_openalex_client.fetch_by_dois.return_value = {
+            "10.1234/test1": {
+                "raw_data": {
+                    "primary_location": {
+                        "license": "cc-by",
+                        "pdf_url": "https://arxiv.org/pdf/2301.00001.pdf",
+                    },
+                    "authorships": [],
                 }
-            else:
-                return None  # Not found
-
-        self.mock_openalex_client.fetch_by_doi.side_effect = mock_fetch
+            }
+        }
 
         # Mock the mapped paper with complete license data
         mock_mapped_paper = Mock()
@@ -301,7 +310,7 @@ class TestPaperOpenAlexEnrichmentService(TestCase):
         paper.doi = "10.1234/test"
         paper.save()
 
-        self.mock_openalex_client.fetch_by_doi.side_effect = Exception(
+        self.mock_openalex_client.fetch_by_dois.side_effect = Exception(
             "Unexpected error"
         )
 
@@ -417,20 +426,20 @@ class TestPaperOpenAlexEnrichmentService(TestCase):
         mock_institution.ror_id = "abc123"
         mock_institution.display_name = "Test University"
         mock_institution.country_code = "US"
+        mock_institution.openalex_id = ""
 
-        mock_authorship = Mock(spec=Authorship)
-        mock_authorship.paper = self.paper
-        mock_authorship.author_position = "first"
-        mock_authorship.raw_author_name = "John Doe"
-        mock_authorship.is_corresponding = True
-        mock_authorship._author_openalex_id = "A123456"
-        mock_authorship._institution_openalex_ids = ["I123456"]
-        mock_authorship.save = Mock()
-        mock_authorship.institutions = Mock()
+        authorship = Authorship(
+            paper=self.paper,
+            author_position="first",
+            raw_author_name="John Doe",
+            is_corresponding=True,
+        )
+        authorship._author_openalex_id = "A123456"
+        authorship._institution_openalex_ids = ["I123456"]
 
         self.mock_openalex_mapper.map_to_authors.return_value = [mock_author]
         self.mock_openalex_mapper.map_to_institutions.return_value = [mock_institution]
-        self.mock_openalex_mapper.map_to_authorships.return_value = [mock_authorship]
+        self.mock_openalex_mapper.map_to_authorships.return_value = [authorship]
         self.mock_openalex_mapper.map_to_hubs.return_value = []
 
         result = self.service.enrich_paper_with_openalex(self.paper)
@@ -440,6 +449,10 @@ class TestPaperOpenAlexEnrichmentService(TestCase):
         self.assertEqual(result.authors_updated, 0)
         # Institutions created will be 0 since we skip creation without full data
         self.assertEqual(result.institutions_created, 0)
+        self.assertEqual(result.authorships_created, 1)
+        authorship = Authorship.objects.get(paper=self.paper)
+        self.assertEqual(authorship.author.openalex_ids, ["A123456"])
+        self.assertEqual(authorship.institutions.count(), 0)
 
     def test_process_authors_creates_new_author(self):
         """Test that process_authors creates new authors."""
@@ -494,7 +507,9 @@ class TestPaperOpenAlexEnrichmentService(TestCase):
                 "primary_location": {},
             }
         }
-        self.mock_openalex_client.fetch_by_doi.return_value = openalex_data
+        self.mock_openalex_client.fetch_by_dois.return_value = {
+            "10.1234/test": openalex_data
+        }
 
         # Mock the mapped paper
         mock_mapped_paper = Mock()
@@ -582,3 +597,150 @@ class TestPaperOpenAlexEnrichmentService(TestCase):
         hub = Hub.objects.get(name="Machine Learning")
         self.assertIn(hub, paper1.unified_document.hubs.all())
         self.assertIn(hub, paper2.unified_document.hubs.all())
+
+    def _mock_openalex_works(self, works):
+        """
+        Mock OpenAlex records for `works`, a dict of DOI to
+        (author OpenAlex IDs, institution OpenAlex ID), and make the mapper
+        return real model instances for them.
+        """
+        self.mock_openalex_client.fetch_by_dois.return_value = {
+            doi: {"raw_data": {"authors": author_ids, "institution": institution_id}}
+            for doi, (author_ids, institution_id) in works.items()
+        }
+        self.mock_openalex_mapper.map_to_paper.return_value = Mock(
+            pdf_license=None, pdf_url=None, pdf_license_url=None, citations=None
+        )
+        self.mock_openalex_mapper.map_to_authors.side_effect = lambda record: [
+            Author(
+                first_name="Author",
+                last_name=author_id,
+                openalex_ids=[author_id],
+                created_source=Author.SOURCE_OPENALEX,
+            )
+            for author_id in record["authors"]
+        ]
+        self.mock_openalex_mapper.map_to_institutions.side_effect = lambda record: [
+            Institution(
+                openalex_id=record["institution"],
+                ror_id=f"ror-{record['institution']}",
+                display_name="Test University",
+            )
+        ]
+
+        def map_to_authorships(paper, record):
+            authorships = []
+            for author_id in record["authors"]:
+                authorship = Authorship(paper=paper, author_position="middle")
+                authorship._author_openalex_id = author_id
+                authorship._institution_openalex_ids = [record["institution"]]
+                authorships.append(authorship)
+            return authorships
+
+        self.mock_openalex_mapper.map_to_authorships.side_effect = map_to_authorships
+        self.mock_openalex_mapper.map_to_hubs.return_value = []
+
+    def _create_papers_with_dois(self, *dois):
+        papers = []
+        for doi in dois:
+            paper = create_paper(title=doi)
+            paper.doi = doi
+            paper.save()
+            papers.append(paper)
+        return papers
+
+    def test_enrich_papers_batch_shares_authors_and_institutions(self):
+        """Test that authors and institutions shared by papers are saved once."""
+        paper1, paper2 = self._create_papers_with_dois("10.1234/a", "10.1234/b")
+        self._mock_openalex_works(
+            {
+                "10.1234/a": (["A1", "A2"], "I1"),
+                "10.1234/b": (["A2"], "I1"),
+            }
+        )
+
+        result = self.service.enrich_papers_batch([paper1.id, paper2.id])
+
+        self.assertEqual(result.success_count, 2)
+        self.assertEqual(result.total_authors_created, 2)
+        self.assertEqual(result.total_authors_updated, 1)
+        self.assertEqual(result.total_institutions_created, 1)
+        self.assertEqual(result.total_institutions_updated, 1)
+        self.assertEqual(result.total_authorships_created, 3)
+        self.assertEqual(Author.objects.filter(last_name="A2").count(), 1)
+        institution = Institution.objects.get(openalex_id="I1")
+        authorships = Authorship.objects.filter(paper__in=[paper1, paper2])
+        self.assertEqual(
+            sorted(
+                (authorship.paper_id, authorship.author.last_name)
+                for authorship in authorships
+            ),
+            [(paper1.id, "A1"), (paper1.id, "A2"), (paper2.id, "A2")],
+        )
+        for authorship in authorships:
+            self.assertEqual(list(authorship.institutions.all()), [institution])
+
+    def test_enrich_papers_batch_skips_existing_authorships(self):
+        """Test that enriching a paper again doesn't duplicate authorships."""
+        (paper,) = self._create_papers_with_dois("10.1234/a")
+        self._mock_openalex_works({"10.1234/a": (["A1"], "I1")})
+        self.service.enrich_papers_batch([paper.id])
+
+        result = self.service.enrich_papers_batch([paper.id])
+
+        self.assertEqual(result.total_authors_created, 0)
+        self.assertEqual(result.total_authors_updated, 1)
+        self.assertEqual(result.total_institutions_updated, 1)
+        self.assertEqual(result.total_authorships_created, 0)
+        self.assertEqual(Authorship.objects.filter(paper=paper).count(), 1)
+
+    def test_enrich_papers_batch_queries_do_not_grow_with_batch_size(self):
+        """Test that a batch is written with a fixed number of queries."""
+        (small_paper,) = self._create_papers_with_dois("10.1234/small")
+        large_papers = self._create_papers_with_dois(
+            "10.1234/large1", "10.1234/large2", "10.1234/large3"
+        )
+
+        self._mock_openalex_works({"10.1234/small": (["S1"], "I1")})
+        with CaptureQueriesContext(connection) as small_queries:
+            self.service.enrich_papers_batch([small_paper.id])
+
+        self._mock_openalex_works(
+            {
+                "10.1234/large1": (["L1", "L2", "L3"], "I2"),
+                "10.1234/large2": (["L4", "L5"], "I3"),
+                "10.1234/large3": (["L6", "L1"], "I2"),
+            }
+        )
+        with CaptureQueriesContext(connection) as large_queries:
+            result = self.service.enrich_papers_batch(
+                [paper.id for paper in large_papers]
+            )
+
+        self.assertEqual(result.total_authorships_created, 7)
+        self.assertEqual(len(large_queries), len(small_queries))
+
+    @patch("paper.ingestion.services.openalex_enrichment.update_institution_documents")
+    @patch(
+        "paper.ingestion.services.openalex_enrichment.update_author_related_documents"
+    )
+    def test_enrich_papers_batch_indexes_authors_and_institutions(
+        self, mock_update_authors, mock_update_institutions
+    ):
+        """Test that bulk written authors and institutions are queued for indexing."""
+        (paper,) = self._create_papers_with_dois("10.1234/a")
+        self._mock_openalex_works({"10.1234/a": (["A1"], "I1")})
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.enrich_papers_batch([paper.id])
+
+        institution = Institution.objects.get(openalex_id="I1")
+        mock_update_institutions.delay.assert_called_once_with([institution.id])
+        mock_update_authors.delay.assert_not_called()
+        mock_update_institutions.reset_mock()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.enrich_papers_batch([paper.id])
+
+        author = Author.objects.get(last_name="A1")
+        mock_update_authors.delay.assert_called_once_with([author.id])
+        mock_update_institutions.delay.assert_called_once_with([institution.id])
@@ -7,3 +7,16 @@ PERSONALIZE_CONFIG = {
 
 # Only sync papers published within this many days
 PAPER_RECENCY_DAYS = 60
+
+# Pending interactions and documents are sent to Personalize in batches by a
+# drain task, queued at most once per this many seconds.
+SYNC_DRAIN_DELAY_SECONDS = 10
+SYNC_DRAIN_BATCH_SIZE = 1000
+
+# Older unsynced interactions (e.g. backfills) aren't sent as real-time events.
+SYNC_EVENT_LOOKBACK_HOURS = 24
+
+# Pending work that failed this many drains is dead-lettered: it is logged and
+# left out of later drains (documents until they are queued again).
+SYNC_MAX_ATTEMPTS = 10
+SYNC_MAX_ERROR_LENGTH = 2000
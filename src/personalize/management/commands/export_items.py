@@ -9,7 +9,7 @@ from django.db.models import Q, QuerySet
 from analytics.models import UserInteractions
 from paper.related_models.paper_model import Paper
 from personalize.config.constants import SUPPORTED_DOCUMENT_TYPES
-from personalize.services.export_service import ExportService
+from personalize.services.export_service import ITEM_PREFETCH_RELATED, ExportService
 from researchhub_document.models import ResearchhubUnifiedDocument
 
 
@@ -58,6 +58,21 @@ class Command(BaseCommand):
                 "Choices: DISCUSSION, QUESTION, GRANT, PREREGISTRATION"
             ),
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help=(
+                "Number of worker processes mapping chunks in parallel "
+                "(default: 1, single process)"
+            ),
+        )
+        parser.add_argument(
+            "--gzip",
+            action="store_true",
+            default=False,
+            help="Write a gzip-compressed CSV (.csv.gz)",
+        )
         parser.add_argument(
             "--debug",
             action="store_true",
@@ -77,6 +92,8 @@ class Command(BaseCommand):
         with_interactions = options.get("with_interactions", True)
         with_posts = options.get("with_posts", False)
         post_types = options.get("post_types")
+        workers = options.get("workers") or 1
+        compress = options.get("gzip", False)
         log_queries = options.get("log_queries", False)
         # log-queries implies debug mode
         self.debug_mode = options.get("debug", False) or log_queries
@@ -89,8 +106,17 @@ class Command(BaseCommand):
             mode_msg += " ===\n"
             self.stdout.write(self.style.WARNING(mode_msg))
 
+        if workers > 1 and self.debug_mode:
+            raise CommandError("--workers cannot be combined with --debug")
+
         self.export_items(
-            since_publish_date, ids, with_interactions, with_posts, post_types
+            since_publish_date,
+            ids,
+            with_interactions,
+            with_posts,
+            post_types,
+            workers=workers,
+            compress=compress,
         )
 
     def export_items(
@@ -100,17 +126,20 @@ class Command(BaseCommand):
         with_interactions: bool = True,
         with_posts: bool = False,
         post_types: list | None = None,
+        workers: int = 1,
+        compress: bool = False,
     ):
         """Export items from ResearchhubUnifiedDocument to CSV."""
-        # Force enable query tracking for debugging
-        from django.conf import settings
-
-        settings.DEBUG = True
+        if self.debug_mode:
+            # Record queries for the debug summary without enabling DEBUG
+            connection.force_debug_cursor = True
 
         self.stdout.write("Exporting items...")
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"personalize_items_{timestamp}.csv"
+        if compress:
+            filename += ".gz"
 
         # Track performance metrics
         perf_metrics = {
@@ -200,9 +229,21 @@ class Command(BaseCommand):
             reset_queries()
             start = time.time()
 
-        result = service.export_to_csv(
-            queryset, filename, progress_callback=progress_callback, total_items=total
-        )
+        if workers > 1:
+            result = service.export_to_csv_parallel(
+                queryset,
+                filename,
+                workers,
+                progress_callback=progress_callback,
+                total_items=total,
+            )
+        else:
+            result = service.export_to_csv(
+                queryset,
+                filename,
+                progress_callback=progress_callback,
+                total_items=total,
+            )
 
         if self.debug_mode:
             perf_metrics["export_time"] = time.time() - start
@@ -253,10 +294,7 @@ class Command(BaseCommand):
     def _build_base_queryset(self) -> QuerySet[ResearchhubUnifiedDocument]:
         """Build base queryset with all necessary relations and filters."""
         return ResearchhubUnifiedDocument.objects.prefetch_related(
-            "hubs",
-            "related_bounties",
-            "fundraises",
-            "grants",
+            *ITEM_PREFETCH_RELATED
         ).filter(
             is_removed=False,
             document_type__in=SUPPORTED_DOCUMENT_TYPES,
@@ -0,0 +1,42 @@
+# Generated by Django 5.2
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        ("researchhub_document", "0082_researchhubpostauthor_ordering"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PendingItemSync",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "queued_date",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                (
+                    "unified_document",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="researchhub_document.researchhubunifieddocument",
+                    ),
+                ),
+            ],
+        ),
+    ]
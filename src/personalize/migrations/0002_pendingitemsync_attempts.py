@@ -0,0 +1,23 @@
+# Generated by Django 5.2
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("personalize", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="pendingitemsync",
+            name="attempts",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="pendingitemsync",
+            name="last_error",
+            field=models.TextField(blank=True, default=""),
+        ),
+    ]
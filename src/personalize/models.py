@@ -0,0 +1,23 @@
+from django.db import models
+from django.utils import timezone
+
+from researchhub_document.related_models.researchhub_unified_document_model import (
+    ResearchhubUnifiedDocument,
+)
+
+
+class PendingItemSync(models.Model):
+    """
+    A unified document waiting to be synced to Personalize.
+    Drained in batches by `drain_personalize_sync_queue_task`, which skips
+    documents that failed `SYNC_MAX_ATTEMPTS` times until they are queued again.
+    """
+
+    unified_document = models.OneToOneField(
+        ResearchhubUnifiedDocument,
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    queued_date = models.DateTimeField(default=timezone.now)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True, default="")
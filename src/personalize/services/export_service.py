@@ -1,8 +1,12 @@
 import csv
+import gzip
+import io
+import multiprocessing
 import time
+from collections import deque
 from collections.abc import Callable, Iterator
 
-from django.db import connection, reset_queries
+from django.db import connection, connections, reset_queries
 from django.db.models import QuerySet
 
 from personalize.config.constants import CSV_HEADERS
@@ -10,6 +14,12 @@ from personalize.services.item_mapper import ItemMapper
 from personalize.utils.related_data_fetcher import RelatedDataFetcher
 from researchhub_document.models import ResearchhubUnifiedDocument
 
+# Relations used by `ItemMapper`, prefetched for every exported chunk
+ITEM_PREFETCH_RELATED = ("hubs", "related_bounties", "fundraises", "grants")
+
+# Service of the current export worker process, see `export_to_csv_parallel`
+_worker_service = None
+
 
 class ExportService:
     """Service for exporting ResearchHub documents to Personalize format."""
@@ -45,6 +55,8 @@ class ExportService:
         total_chunks = (total + self.chunk_size - 1) // self.chunk_size
         items_processed = 0
 
+        self.fetcher.load_invariants()
+
         # Use ID-based pagination for better performance
         last_id = 0
         chunk_num = 0
@@ -67,18 +79,7 @@ class ExportService:
             if not chunk:
                 break
 
-            # Batch load papers for this chunk
-            paper_doc_ids = [doc.id for doc in chunk if doc.document_type == "PAPER"]
-            if paper_doc_ids:
-                from paper.models import Paper
-
-                papers = Paper.objects.filter(
-                    unified_document_id__in=paper_doc_ids
-                ).in_bulk(field_name="unified_document_id")
-                # Attach papers to their unified documents
-                for doc in chunk:
-                    if doc.document_type == "PAPER" and doc.id in papers:
-                        doc.paper = papers[doc.id]
+            self._attach_papers(chunk)
 
             if self.debug:
                 chunk_timing["eval_time"] = time.time() - start
@@ -121,7 +122,7 @@ class ExportService:
 
         Args:
             queryset: The queryset to export
-            filename: Output CSV filename
+            filename: Output CSV filename, gzip-compressed if it ends in ".gz"
             progress_callback: Optional callback(chunk_num, total_chunks,
                 items_processed) called after each chunk is processed
             total_items: Pre-calculated total count (avoids redundant query)
@@ -137,7 +138,7 @@ class ExportService:
         csv_errors = 0
 
         try:
-            with open(filename, "w", newline="", encoding="utf-8") as f:
+            with _open_csv(filename) as f:
                 writer = csv.DictWriter(f, fieldnames=CSV_HEADERS)
                 writer.writeheader()
 
@@ -161,6 +162,121 @@ class ExportService:
             "filtered_by_date_ids": self.filtered_by_date_ids,
         }
 
+    def export_to_csv_parallel(
+        self,
+        queryset: QuerySet[ResearchhubUnifiedDocument],
+        filename: str,
+        workers: int,
+        progress_callback: Callable[[int, int, int], None] | None = None,
+        total_items: int | None = None,
+    ) -> dict:
+        """Export items to CSV, mapping chunks in a pool of worker processes.
+
+        The parent walks the queryset ids in keyset chunks and hands each chunk
+        to a worker, which loads and maps the documents and returns the encoded
+        CSV rows. Rows are appended to the file in chunk order as they come
+        back, with at most two chunks per worker in flight, so memory stays
+        flat regardless of the export size. For ".gz" filenames every chunk is
+        written as its own gzip member.
+
+        Takes the same arguments and returns the same dict as `export_to_csv`.
+        """
+        total = total_items if total_items is not None else queryset.count()
+        total_chunks = (total + self.chunk_size - 1) // self.chunk_size
+        compress = filename.endswith(".gz")
+        exported = 0
+        csv_errors = 0
+        chunk_num = 0
+
+        self.fetcher.load_invariants()
+
+        # Forked workers must open their own database connections
+        connections.close_all()
+        context = multiprocessing.get_context("fork")
+
+        try:
+            with (
+                open(filename, "wb") as f,
+                context.Pool(
+                    processes=workers,
+                    initializer=_init_export_worker,
+                    initargs=(
+                        self.chunk_size,
+                        self.since_publish_date,
+                        self.fetcher.docs_with_funders,
+                    ),
+                ) as pool,
+            ):
+                f.write(_encode_csv_rows([], compress, header=True)[0])
+
+                pending = deque()
+
+                def write_next_result():
+                    nonlocal exported, csv_errors, chunk_num
+                    data, written, errors, failed_ids, filtered_ids = (
+                        pending.popleft().get()
+                    )
+                    f.write(data)
+                    exported += written
+                    csv_errors += errors
+                    self.failed_ids.extend(failed_ids)
+                    self.filtered_by_date_ids.extend(filtered_ids)
+                    chunk_num += 1
+                    if progress_callback:
+                        progress_callback(chunk_num, total_chunks, exported)
+
+                for chunk_ids in self._iter_id_chunks(queryset):
+                    pending.append(
+                        pool.apply_async(_export_chunk, (chunk_ids, compress))
+                    )
+                    if len(pending) >= workers * 2:
+                        write_next_result()
+
+                while pending:
+                    write_next_result()
+        except PermissionError as e:
+            raise PermissionError(f"Permission denied writing to {filename}: {e}")
+        except OSError as e:
+            raise OSError(f"Error writing to {filename}: {e}")
+
+        return {
+            "exported": exported,
+            "csv_errors": csv_errors,
+            "failed_ids": self.failed_ids,
+            "filtered_by_date_ids": self.filtered_by_date_ids,
+        }
+
+    def _iter_id_chunks(
+        self, queryset: QuerySet[ResearchhubUnifiedDocument]
+    ) -> Iterator[list[int]]:
+        """Yield the queryset ids in ascending keyset chunks."""
+        last_id = 0
+        while True:
+            chunk_ids = list(
+                queryset.filter(id__gt=last_id)
+                .order_by("id")
+                .values_list("id", flat=True)[: self.chunk_size]
+            )
+            if not chunk_ids:
+                return
+            yield chunk_ids
+            last_id = chunk_ids[-1]
+
+    def _attach_papers(self, chunk: list[ResearchhubUnifiedDocument]) -> None:
+        """Batch load papers for a chunk and attach them to their documents."""
+        paper_doc_ids = [doc.id for doc in chunk if doc.document_type == "PAPER"]
+        if not paper_doc_ids:
+            return
+
+        from paper.models import Paper
+
+        papers = Paper.objects.filter(unified_document_id__in=paper_doc_ids).in_bulk(
+            field_name="unified_document_id"
+        )
+        for doc in chunk:
+            if doc.document_type == "PAPER" and doc.id in papers:
+                doc.paper = papers[doc.id]
+
     def _process_chunk(
         self,
         chunk: list[ResearchhubUnifiedDocument],
@@ -232,3 +348,64 @@ class ExportService:
             timing["items_mapped"] = len(items)
 
         return items
+
+
+def _open_csv(filename: str):
+    if filename.endswith(".gz"):
+        return gzip.open(filename, "wt", newline="", encoding="utf-8")
+    return open(filename, "w", newline="", encoding="utf-8")
+
+
+def _encode_csv_rows(
+    rows: list[dict], compress: bool, header: bool = False
+) -> tuple[bytes, int, int]:
+    """Encode rows as CSV bytes, returning `(data, written, csv_errors)`."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=CSV_HEADERS)
+    if header:
+        writer.writeheader()
+
+    written = 0
+    csv_errors = 0
+    for row in rows:
+        try:
+            writer.writerow(row)
+            written += 1
+        except Exception:
+            csv_errors += 1
+
+    data = buffer.getvalue().encode("utf-8")
+    if compress:
+        data = gzip.compress(data)
+    return data, written, csv_errors
+
+
+def _init_export_worker(chunk_size, since_publish_date, docs_with_funders):
+    global _worker_service
+    _worker_service = ExportService(
+        chunk_size=chunk_size, since_publish_date=since_publish_date
+    )
+    _worker_service.fetcher.docs_with_funders = docs_with_funders
+
+
+def _export_chunk(
+    chunk_ids: list[int], compress: bool
+) -> tuple[bytes, int, int, list[int], list[int]]:
+    """
+    Map one chunk of documents in an export worker. Returns the encoded rows,
+    the written and CSV error counts, and the failed and date-filtered IDs.
+    """
+    service = _worker_service
+    chunk = list(
+        ResearchhubUnifiedDocument.objects.prefetch_related(*ITEM_PREFETCH_RELATED)
+        .filter(id__in=chunk_ids)
+        .order_by("id")
+    )
+    service._attach_papers(chunk)
+
+    rows = service._process_chunk(chunk)
+    data, written, csv_errors = _encode_csv_rows(rows, compress)
+
+    failed_ids, service.failed_ids = service.failed_ids, []
+    filtered_ids, service.filtered_by_date_ids = service.filtered_by_date_ids, []
+    return data, written, csv_errors, failed_ids, filtered_ids
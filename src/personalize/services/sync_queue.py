@@ -0,0 +1,163 @@
+"""
+Micro-batched Personalize sync.
+
+Pending work lives in the database: interactions with
+`is_synced_with_personalize=False`, and `PendingItemSync` rows for documents.
+Signals only mark work as pending, and a drain task sends everything pending
+in maximum-size batches, marking each drained batch as synced in bulk.
+Batches that fail stay pending and are retried by the next drain, with their
+attempt count and last error recorded. After `SYNC_MAX_ATTEMPTS` failures
+work is dead-lettered: logged and left out of later drains. Documents get
+another try when they are queued again.
+"""
+
+import logging
+from datetime import timedelta
+
+from django.db.models import F, Q
+from django.utils import timezone
+
+from analytics.models import UserInteractions
+from personalize.config.settings import (
+    SYNC_DRAIN_BATCH_SIZE,
+    SYNC_EVENT_LOOKBACK_HOURS,
+    SYNC_MAX_ATTEMPTS,
+    SYNC_MAX_ERROR_LENGTH,
+)
+from personalize.models import PendingItemSync
+from personalize.services.sync_service import SyncService
+from personalize.types import SyncResult, SyncResultWithSkipped
+
+logger = logging.getLogger(__name__)
+
+
+def queue_items_for_sync(unified_document_ids: list[int]) -> None:
+    """
+    Mark documents as pending, re-queueing ones that already are.
+    Re-queued documents start over with no failed attempts.
+    """
+    now = timezone.now()
+    PendingItemSync.objects.bulk_create(
+        [
+            PendingItemSync(unified_document_id=doc_id, queued_date=now)
+            for doc_id in unified_document_ids
+        ],
+        update_conflicts=True,
+        unique_fields=["unified_document"],
+        update_fields=["queued_date", "attempts", "last_error"],
+    )
+
+
+def drain_pending_interactions(
+    batch_size: int = SYNC_DRAIN_BATCH_SIZE,
+    sync_service: SyncService | None = None,
+) -> SyncResult:
+    sync_service = sync_service or SyncService()
+    since = timezone.now() - timedelta(hours=SYNC_EVENT_LOOKBACK_HOURS)
+    pending = (
+        UserInteractions.objects.filter(
+            is_synced_with_personalize=False,
+            event_timestamp__gte=since,
+            unified_document_id__isnull=False,
+            personalize_sync_attempts__lt=SYNC_MAX_ATTEMPTS,
+        )
+        .filter(Q(user_id__isnull=False) | Q(external_user_id__gt=""))
+        .order_by("id")
+    )
+
+    total = {"success": True, "synced": 0, "failed": 0, "errors": []}
+    last_id = 0
+    while batch := list(pending.filter(id__gt=last_id)[:batch_size]):
+        last_id = batch[-1].id
+        result, synced_ids = sync_service.sync_events(batch)
+        UserInteractions.objects.filter(id__in=synced_ids).update(
+            is_synced_with_personalize=True
+        )
+        failed_ids = {interaction.id for interaction in batch} - set(synced_ids)
+        if failed_ids:
+            failed = UserInteractions.objects.filter(id__in=failed_ids)
+            failed.update(
+                personalize_sync_attempts=F("personalize_sync_attempts") + 1,
+                personalize_sync_error=_format_errors(result),
+            )
+            _log_dead_letters(
+                "interactions",
+                list(
+                    failed.filter(
+                        personalize_sync_attempts__gte=SYNC_MAX_ATTEMPTS
+                    ).values_list("id", flat=True)
+                ),
+                result,
+            )
+        _add_result(total, result)
+
+    return total
+
+
+def drain_pending_items(
+    batch_size: int = SYNC_DRAIN_BATCH_SIZE,
+    sync_service: SyncService | None = None,
+) -> SyncResultWithSkipped:
+    sync_service = sync_service or SyncService()
+
+    total = {"success": True, "synced": 0, "failed": 0, "skipped": 0, "errors": []}
+    last_id = 0
+    while True:
+        started = timezone.now()
+        doc_ids = list(
+            PendingItemSync.objects.filter(
+                unified_document_id__gt=last_id, attempts__lt=SYNC_MAX_ATTEMPTS
+            )
+            .order_by("unified_document_id")
+            .values_list("unified_document_id", flat=True)[:batch_size]
+        )
+        if not doc_ids:
+            break
+        last_id = doc_ids[-1]
+
+        result, done_ids = sync_service.sync_items_by_ids(doc_ids)
+        # Documents queued again while this batch was syncing stay pending.
+        PendingItemSync.objects.filter(
+            unified_document_id__in=done_ids, queued_date__lte=started
+        ).delete()
+        failed_ids = set(doc_ids) - set(done_ids)
+        if failed_ids:
+            failed = PendingItemSync.objects.filter(unified_document_id__in=failed_ids)
+            failed.update(attempts=F("attempts") + 1, last_error=_format_errors(result))
+            _log_dead_letters(
+                "documents",
+                list(
+                    failed.filter(attempts__gte=SYNC_MAX_ATTEMPTS).values_list(
+                        "unified_document_id", flat=True
+                    )
+                ),
+                result,
+            )
+        _add_result(total, result)
+
+    return total
+
+
+def _format_errors(result: dict) -> str:
+    return "\n".join(str(error) for error in result["errors"])[:SYNC_MAX_ERROR_LENGTH]
+
+
+def _log_dead_letters(kind: str, ids: list[int], result: dict) -> None:
+    """Log work that failed its last attempt and won't be drained again."""
+    if ids:
+        logger.error(
+            "Dead-lettered %d Personalize %s after %d failed syncs: %s, errors: %s",
+            len(ids),
+            kind,
+            SYNC_MAX_ATTEMPTS,
+            ids,
+            _format_errors(result),
+        )
+
+
+def _add_result(total: dict, result: dict) -> None:
+    for key in ("synced", "failed", "skipped"):
+        if key in total:
+            total[key] += result[key]
+    total["errors"].extend(result["errors"])
+    total["success"] = total["success"] and result["success"]
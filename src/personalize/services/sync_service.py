@@ -1,4 +1,5 @@
 import logging
+from collections import defaultdict
 from datetime import timedelta
 
 from django.core.exceptions import ObjectDoesNotExist
@@ -39,6 +40,29 @@ class SyncService:
                 "errors": [],
             }
 
+        items, skipped = self._map_items(unified_docs)
+
+        if not items:
+            return {
+                "success": True,
+                "synced": 0,
+                "failed": 0,
+                "skipped": skipped,
+                "errors": [],
+            }
+
+        result = self.sync_client.put_items(list(items.values()))
+        result["skipped"] = skipped
+
+        return result
+
+    def _map_items(
+        self, unified_docs: list[ResearchhubUnifiedDocument]
+    ) -> tuple[dict[int, dict], int]:
+        """
+        Map documents to Personalize items, keyed by document ID.
+        Returns the items and the number of documents that failed to map.
+        """
         doc_ids = [doc.id for doc in unified_docs]
         batch_data = self.fetcher.fetch_all(doc_ids)
 
@@ -47,38 +71,25 @@ class SyncService:
         rfp_data = batch_data["rfp"]
         review_count_data = batch_data["review_count"]
 
-        items = []
+        items = {}
         skipped = 0
 
         for unified_doc in unified_docs:
             try:
-                item = self.mapper.map_to_api_item(
+                items[unified_doc.id] = self.mapper.map_to_api_item(
                     unified_doc,
                     bounty_data=bounty_data.get(unified_doc.id, {}),
                     proposal_data=proposal_data.get(unified_doc.id, {}),
                     rfp_data=rfp_data.get(unified_doc.id, {}),
                     review_count_data=review_count_data,
                 )
-                items.append(item)
             except Exception as e:
                 skipped += 1
                 logger.warning(
                     f"Failed to map document {unified_doc.id} for sync: {e!s}"
                 )
 
-        if not items:
-            return {
-                "success": True,
-                "synced": 0,
-                "failed": 0,
-                "skipped": skipped,
-                "errors": [],
-            }
-
-        result = self.sync_client.put_items(items)
-        result["skipped"] = skipped
-
-        return result
+        return items, skipped
 
     def sync_item_by_id(self, unified_document_id: int) -> SyncResultWithSkipped:
         """
@@ -109,6 +120,49 @@ class SyncService:
 
         return self.sync_items([unified_doc])
 
+    def sync_items_by_ids(
+        self, unified_document_ids: list[int]
+    ) -> tuple[SyncResultWithSkipped, set[int]]:
+        """
+        Sync documents by ID in `SyncClient.BATCH_SIZE` batches.
+
+        Returns the combined result and the IDs that no longer need syncing:
+        synced, ineligible, unmappable or deleted documents. Documents in
+        failed batches are left out, so they can be retried.
+        """
+        unified_docs = (
+            ResearchhubUnifiedDocument.objects.select_related("paper")
+            .prefetch_related("hubs", "posts")
+            .filter(id__in=unified_document_ids)
+        )
+        eligible_docs = [doc for doc in unified_docs if self._is_eligible_for_sync(doc)]
+        items = self._map_items(eligible_docs)[0] if eligible_docs else {}
+
+        done_ids = set(unified_document_ids) - items.keys()
+        synced = 0
+        failed = 0
+        errors = []
+
+        item_ids = list(items)
+        batch_size = SyncClient.BATCH_SIZE
+        for i in range(0, len(item_ids), batch_size):
+            batch_ids = item_ids[i : i + batch_size]
+            result = self.sync_client.put_items([items[doc_id] for doc_id in batch_ids])
+            if result["success"]:
+                synced += len(batch_ids)
+                done_ids.update(batch_ids)
+            else:
+                failed += len(batch_ids)
+                errors.extend(result["errors"])
+
+        return {
+            "success": failed == 0,
+            "synced": synced,
+            "failed": failed,
+            "skipped": len(unified_document_ids) - len(items),
+            "errors": errors,
+        }, done_ids
+
     def _is_eligible_for_sync(self, unified_doc: ResearchhubUnifiedDocument) -> bool:
         """
         Check if a unified document is eligible for Personalize sync.
@@ -166,6 +220,50 @@ class SyncService:
                 "errors": ["Missing both user_id and external_user_id"],
             }
 
+        user_id, session_id = self._get_user_session(interaction)
+        event = self._build_interaction_event(interaction)
+        result = self.sync_client.put_events(user_id, session_id, [event])
+
+        return result
+
+    def sync_events(
+        self, interactions: list[UserInteractions]
+    ) -> tuple[SyncResult, list[int]]:
+        """
+        Sync interactions in batches. Each PutEvents call takes up to
+        `SyncClient.BATCH_SIZE` events of a single user session.
+
+        Returns the combined result and the IDs of the synced interactions.
+        Interactions in failed batches are left out, so they can be retried.
+        """
+        sessions = defaultdict(list)
+        for interaction in interactions:
+            sessions[self._get_user_session(interaction)].append(interaction)
+
+        synced_ids = []
+        failed = 0
+        errors = []
+
+        batch_size = SyncClient.BATCH_SIZE
+        for (user_id, session_id), session_interactions in sessions.items():
+            for i in range(0, len(session_interactions), batch_size):
+                batch = session_interactions[i : i + batch_size]
+                events = [self._build_interaction_event(x) for x in batch]
+                result = self.sync_client.put_events(user_id, session_id, events)
+                if result["success"]:
+                    synced_ids.extend(x.id for x in batch)
+                else:
+                    failed += len(batch)
+                    errors.extend(result["errors"])
+
+        return {
+            "success": failed == 0,
+            "synced": len(synced_ids),
+            "failed": failed,
+            "errors": errors,
+        }, synced_ids
+
+    def _get_user_session(self, interaction: UserInteractions) -> tuple[str, str]:
         if interaction.user_id:
             user_id = str(interaction.user_id)
             session_id = build_session_id_for_user(
@@ -174,8 +272,4 @@ class SyncService:
         else:
             user_id = interaction.external_user_id
             session_id = build_session_id_for_anonymous(interaction.external_user_id)
-
-        event = self._build_interaction_event(interaction)
-        result = self.sync_client.put_events(user_id, session_id, [event])
-
-        return result
+        return user_id, session_id
@@ -5,7 +5,7 @@ from django.db.models.signals import post_save
 from django.dispatch import receiver
 
 from analytics.models import UserInteractions
-from personalize.tasks import sync_interaction_event_to_personalize_task
+from personalize.tasks import schedule_personalize_sync_drain
 
 logger = logging.getLogger(__name__)
 
@@ -36,20 +36,18 @@ def sync_interaction_to_personalize(sender, instance, created, **kwargs):
         return
 
     try:
-        # Use transaction.on_commit to ensure the task is only
-        # queued after the transaction commits, preventing race conditions
-        # where the Celery worker can't find the UserInteraction record
-        transaction.on_commit(
-            lambda: sync_interaction_event_to_personalize_task.delay(instance.id)
-        )
+        # The interaction is already pending (`is_synced_with_personalize` is
+        # False), so only a drain needs to be scheduled. Use on_commit so the
+        # drain can't run before the interaction is visible to it.
+        transaction.on_commit(schedule_personalize_sync_drain)
         logger.debug(
-            f"Scheduled Personalize sync task for UserInteraction {instance.id} "
+            f"Scheduled Personalize sync drain for UserInteraction {instance.id} "
             f"(event={instance.event}, user_id={instance.user_id}, "
             f"external_user_id={instance.external_user_id})"
         )
     except Exception:
         logger.exception(
-            "Failed to schedule Personalize sync task for UserInteraction %s",
+            "Failed to schedule Personalize sync drain for UserInteraction %s",
             instance.id,
         )
         # Don't re-raise - we don't want to break the UserInteraction creation process
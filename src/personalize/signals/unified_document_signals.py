@@ -1,9 +1,11 @@
 import logging
 
+from django.db import transaction
 from django.db.models.signals import m2m_changed
 from django.dispatch import receiver
 
-from personalize.tasks import sync_unified_document_to_personalize_task
+from personalize.services.sync_queue import queue_items_for_sync
+from personalize.tasks import schedule_personalize_sync_drain
 from researchhub_document.models import ResearchhubUnifiedDocument
 
 logger = logging.getLogger(__name__)
@@ -21,7 +23,8 @@ def sync_unified_document_to_personalize(sender, instance, action, pk_set, **kwa
     Triggers on post_add, post_remove, and post_clear to keep Personalize
     in sync with the current hub state.
 
-    The task handles additional filtering (e.g., paper recency check).
+    The document is queued and synced in a batch by the drain task, which
+    handles additional filtering (e.g., paper recency check).
     """
     # Only trigger after changes are committed (skip pre_* actions)
     if not action.startswith("post"):
@@ -32,7 +35,10 @@ def sync_unified_document_to_personalize(sender, instance, action, pk_set, **kwa
         return
 
     try:
-        sync_unified_document_to_personalize_task.delay(instance.id)
+        # Savepoint, so a failure here doesn't break the caller's transaction.
+        with transaction.atomic():
+            queue_items_for_sync([instance.id])
+        transaction.on_commit(schedule_personalize_sync_drain)
     except Exception as e:
         logger.error(
             f"Failed to queue personalize sync for unified_document {instance.id}: {e}"
@@ -1,4 +1,5 @@
 from celery.utils.log import get_task_logger
+from django.core.cache import cache
 
 from analytics.interactions.interaction_mapper import (
     map_from_comment,
@@ -7,6 +8,11 @@ from analytics.interactions.interaction_mapper import (
 )
 from analytics.models import UserInteractions
 from discussion.models import Vote
+from personalize.config.settings import SYNC_DRAIN_DELAY_SECONDS
+from personalize.services.sync_queue import (
+    drain_pending_interactions,
+    drain_pending_items,
+)
 from personalize.services.sync_service import SyncService
 from researchhub.celery import QUEUE_PAPER_MISC, app
 from researchhub_comment.models import RhCommentModel
@@ -14,6 +20,10 @@ from user_lists.models import ListItem
 
 logger = get_task_logger(__name__)
 
+SYNC_DRAIN_SCHEDULED_CACHE_KEY = "personalize:sync_drain_scheduled"
+SYNC_DRAIN_LOCK_CACHE_KEY = "personalize:sync_drain_lock"
+SYNC_DRAIN_LOCK_TIMEOUT = 60 * 10
+
 
 @app.task(queue=QUEUE_PAPER_MISC, max_retries=3, retry_backoff=True)
 def create_upvote_interaction_task(vote_id):
@@ -171,3 +181,36 @@ def sync_unified_document_to_personalize_task(unified_document_id):
         )
     else:
         raise Exception(f"Sync failed: {result}")
+
+
+@app.task(queue=QUEUE_PAPER_MISC)
+def drain_personalize_sync_queue_task():
+    """
+    Sync pending interactions and documents to Personalize in batches.
+    Runs shortly after new work is queued, and periodically to pick up
+    interactions created without signals and retry failed batches.
+    """
+    if not cache.add(SYNC_DRAIN_LOCK_CACHE_KEY, True, SYNC_DRAIN_LOCK_TIMEOUT):
+        logger.info("Personalize sync drain already running, skipping")
+        return
+
+    try:
+        events_result = drain_pending_interactions()
+        items_result = drain_pending_items()
+    finally:
+        cache.delete(SYNC_DRAIN_LOCK_CACHE_KEY)
+
+    logger.info(
+        f"Drained Personalize sync queue: events={events_result}, items={items_result}"
+    )
+
+
+def schedule_personalize_sync_drain():
+    """
+    Queue a sync drain, unless one is already queued: work queued within
+    `SYNC_DRAIN_DELAY_SECONDS` is sent in the same batches.
+    """
+    if cache.add(SYNC_DRAIN_SCHEDULED_CACHE_KEY, True, SYNC_DRAIN_DELAY_SECONDS):
+        drain_personalize_sync_queue_task.apply_async(
+            countdown=SYNC_DRAIN_DELAY_SECONDS
+        )
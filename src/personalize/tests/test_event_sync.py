@@ -1,4 +1,4 @@
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from unittest.mock import Mock, PropertyMock, patch
 
 from django.contrib.contenttypes.models import ContentType
@@ -16,6 +16,8 @@ from analytics.models import UserInteractions
 from analytics.services.event_processor import EventProcessor
 from discussion.models import Vote
 from personalize.clients.sync_client import SyncClient
+from personalize.services.sync_queue import drain_pending_interactions
+from personalize.services.sync_service import SyncService
 from personalize.tasks import (
     create_comment_interaction_task,
     create_upvote_interaction_task,
@@ -68,28 +70,40 @@ class EventSyncTests(TestCase):
             "_time": int((datetime.now(UTC).timestamp() + timestamp_offset) * 1000),
         }
 
-    @override_settings(CELERY_TASK_ALWAYS_EAGER=True)
-    @patch("personalize.signals.interaction_signals.transaction")
-    @patch("personalize.tasks.SyncService")
-    def test_only_specific_events_synced_from_amplitude(
-        self, sync_service_mock, transaction_mock
-    ):
-        # Arrange
-        transaction_mock.on_commit = lambda func: func()
-        mock_service = Mock()
-        mock_service.sync_event.return_value = self.mock_sync_result_success
-        sync_service_mock.return_value = mock_service
+    def _drain(self, put_events_result):
+        sync_client = Mock()
+        sync_client.put_events.return_value = put_events_result
+        drain_pending_interactions(sync_service=SyncService(sync_client=sync_client))
+        return sync_client
 
+    def _create_interaction(self, event=FEED_ITEM_CLICK, event_timestamp=None):
+        return UserInteractions.objects.create(
+            user=self.user,
+            event=event,
+            unified_document=self.paper,
+            content_type=self.content_type,
+            object_id=self.paper.paper.id,
+            event_timestamp=event_timestamp or datetime.now(UTC),
+            is_synced_with_personalize=False,
+        )
+
+    def test_only_specific_events_synced_from_amplitude(self):
+        # Arrange
         processor = EventProcessor()
         feed_click_event = self._create_amplitude_event("feed_item_clicked")
         page_view_event = self._create_amplitude_event("work_document_viewed", 1)
-
-        # Act
         processor.process_event(feed_click_event)
         processor.process_event(page_view_event)
 
+        # Act
+        sync_client = self._drain(self.mock_sync_result_success)
+
         # Assert
-        self.assertEqual(mock_service.sync_event.call_count, 2)
+        sync_client.put_events.assert_called_once()
+        event_list = sync_client.put_events.call_args[0][2]
+        self.assertEqual(
+            {event["eventType"] for event in event_list}, {FEED_ITEM_CLICK, PAGE_VIEW}
+        )
         synced_interactions = UserInteractions.objects.filter(
             user=self.user, unified_document=self.paper
         )
@@ -161,89 +175,113 @@ class EventSyncTests(TestCase):
         self.assertEqual(session_id, f"sess_anon_{external_user_id}")
         self.assertRegex(session_id, r"^sess_anon_.+$")
 
-    @override_settings(CELERY_TASK_ALWAYS_EAGER=True)
-    @patch("personalize.signals.interaction_signals.transaction")
-    @patch("personalize.tasks.SyncService")
-    def test_sync_only_triggered_when_interaction_created(
-        self, sync_service_mock, transaction_mock
-    ):
+    def test_synced_interactions_not_drained_again(self):
         # Arrange
-        transaction_mock.on_commit = lambda func: func()
-        mock_service = Mock()
-        mock_service.sync_event.return_value = self.mock_sync_result_success
-        sync_service_mock.return_value = mock_service
-
         processor = EventProcessor()
         event_payload = self._create_amplitude_event("feed_item_clicked")
-
-        # Act
         processor.process_event(event_payload)
-        first_call_count = mock_service.sync_event.call_count
+        self._drain(self.mock_sync_result_success)
 
+        # Act
         processor.process_event(event_payload)
-        second_call_count = mock_service.sync_event.call_count
+        sync_client = self._drain(self.mock_sync_result_success)
 
         # Assert
-        self.assertEqual(first_call_count, 1)
-        self.assertEqual(second_call_count, 1)
+        sync_client.put_events.assert_not_called()
         interactions = UserInteractions.objects.filter(
             user=self.user, unified_document=self.paper, event=FEED_ITEM_CLICK
         )
         self.assertEqual(interactions.count(), 1)
 
-    @override_settings(CELERY_TASK_ALWAYS_EAGER=True)
-    @patch("personalize.signals.interaction_signals.transaction")
-    @patch("personalize.tasks.SyncService")
-    def test_interaction_marked_as_synced_on_success(
-        self, sync_service_mock, transaction_mock
-    ):
+    def test_interaction_marked_as_synced_on_success(self):
         # Arrange
-        transaction_mock.on_commit = lambda func: func()
-        mock_service = Mock()
-        mock_service.sync_event.return_value = self.mock_sync_result_success
-        sync_service_mock.return_value = mock_service
+        interaction = self._create_interaction()
 
-        # Act - Creating UserInteraction should trigger signal which calls sync task
-        interaction = UserInteractions.objects.create(
-            user=self.user,
-            event=FEED_ITEM_CLICK,
-            unified_document=self.paper,
-            content_type=self.content_type,
-            object_id=self.paper.paper.id,
-            event_timestamp=datetime.now(UTC),
-            is_synced_with_personalize=False,
-        )
+        # Act
+        sync_client = self._drain(self.mock_sync_result_success)
 
         # Assert
-        mock_service.sync_event.assert_called_once()
+        sync_client.put_events.assert_called_once()
         interaction.refresh_from_db()
         self.assertTrue(interaction.is_synced_with_personalize)
 
-    @override_settings(CELERY_TASK_ALWAYS_EAGER=True)
-    @patch("personalize.signals.interaction_signals.transaction")
-    @patch("personalize.tasks.SyncService")
-    def test_interaction_not_marked_synced_on_failure(
-        self, sync_service_mock, transaction_mock
-    ):
+    def test_interaction_not_marked_synced_on_failure(self):
         # Arrange
-        transaction_mock.on_commit = lambda func: func()
-        mock_service = Mock()
-        mock_service.sync_event.return_value = self.mock_sync_result_failure
-        sync_service_mock.return_value = mock_service
+        interaction = self._create_interaction(event=PAGE_VIEW)
 
-        # Act - Creating UserInteraction should trigger signal which calls sync task
-        interaction = UserInteractions.objects.create(
-            user=self.user,
-            event=PAGE_VIEW,
-            unified_document=self.paper,
-            content_type=self.content_type,
-            object_id=self.paper.paper.id,
-            event_timestamp=datetime.now(UTC),
-            is_synced_with_personalize=False,
+        # Act
+        sync_client = self._drain(self.mock_sync_result_failure)
+
+        # Assert
+        sync_client.put_events.assert_called_once()
+        interaction.refresh_from_db()
+        self.assertFalse(interaction.is_synced_with_personalize)
+
+    @patch("personalize.services.sync_queue.SYNC_MAX_ATTEMPTS", 2)
+    def test_failing_interaction_is_dead_lettered(self):
+        # Arrange
+        interaction = self._create_interaction(event=PAGE_VIEW)
+        self._drain(self.mock_sync_result_failure)
+
+        # Act
+        with self.assertLogs("personalize.services.sync_queue", "ERROR"):
+            self._drain(self.mock_sync_result_failure)
+        sync_client = self._drain(self.mock_sync_result_failure)
+
+        # Assert
+        sync_client.put_events.assert_not_called()
+        interaction.refresh_from_db()
+        self.assertFalse(interaction.is_synced_with_personalize)
+        self.assertEqual(interaction.personalize_sync_attempts, 2)
+        self.assertEqual(interaction.personalize_sync_error, "AWS API error")
+
+    def test_drain_sends_full_batches_per_user_session(self):
+        # Arrange
+        other_user = create_random_default_user("other_test_user")
+        papers = [create_prefetched_paper(title=f"Paper {i}") for i in range(12)]
+        for paper in papers:
+            for user in (self.user, other_user):
+                UserInteractions.objects.create(
+                    user=user,
+                    event=FEED_ITEM_CLICK,
+                    unified_document=paper,
+                    event_timestamp=datetime.now(UTC),
+                )
+
+        # Act
+        sync_client = self._drain(self.mock_sync_result_success)
+
+        # Assert
+        batches = [
+            (call[0][0], len(call[0][2]))
+            for call in sync_client.put_events.call_args_list
+        ]
+        self.assertEqual(
+            sorted(batches),
+            sorted(
+                [
+                    (str(self.user.id), 10),
+                    (str(self.user.id), 2),
+                    (str(other_user.id), 10),
+                    (str(other_user.id), 2),
+                ]
+            ),
+        )
+        self.assertFalse(
+            UserInteractions.objects.filter(is_synced_with_personalize=False).exists()
+        )
+
+    def test_drain_skips_interactions_outside_lookback(self):
+        # Arrange
+        interaction = self._create_interaction(
+            event_timestamp=datetime.now(UTC) - timedelta(days=30)
         )
 
+        # Act
+        sync_client = self._drain(self.mock_sync_result_success)
+
         # Assert
-        mock_service.sync_event.assert_called_once()
+        sync_client.put_events.assert_not_called()
         interaction.refresh_from_db()
         self.assertFalse(interaction.is_synced_with_personalize)
 
@@ -3,6 +3,7 @@ Tests for ExportService.
 """
 
 import csv
+import gzip
 import tempfile
 from datetime import datetime
 from unittest.mock import patch
@@ -12,7 +13,11 @@ from django.test import TestCase
 from analytics.constants.event_types import FEED_ITEM_IMPRESSION
 from analytics.models import UserInteractions
 from personalize.config.constants import CSV_HEADERS
-from personalize.services.export_service import ExportService
+from personalize.services.export_service import (
+    ExportService,
+    _export_chunk,
+    _init_export_worker,
+)
 from personalize.tests.helpers import (
     create_prefetched_grant,
     create_prefetched_paper,
@@ -252,6 +257,57 @@ class ExportToCSVTests(TestCase):
         self.assertEqual(result["failed_ids"], [])
         self.assertEqual(result["filtered_by_date_ids"], [])
 
+    def test_export_to_csv_writes_gzip_for_gz_filename(self):
+        """Filenames ending in .gz should produce a gzip-compressed CSV."""
+        # Arrange
+        docs = [create_prefetched_paper(title=f"Paper {i}") for i in range(3)]
+        queryset = ResearchhubUnifiedDocument.objects.filter(
+            id__in=[doc.id for doc in docs]
+        )
+        service = ExportService(chunk_size=2)
+
+        # Act
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".csv.gz") as f:
+            filename = f.name
+        result = service.export_to_csv(queryset, filename)
+
+        # Assert
+        with gzip.open(filename, "rt", encoding="utf-8") as csvfile:
+            rows = list(csv.DictReader(csvfile))
+        self.assertEqual(result["exported"], 3)
+        self.assertEqual(
+            [row["ITEM_ID"] for row in rows], [str(doc.id) for doc in docs]
+        )
+
+
+class ExportWorkerTests(TestCase):
+    """Tests for the chunk mapping done by parallel export workers."""
+
+    def test_export_chunk_returns_encoded_rows(self):
+        """A worker chunk should be encoded as header-less CSV rows."""
+        # Arrange
+        docs = [create_prefetched_paper(title=f"Paper {i}") for i in range(2)]
+        doc_ids = [doc.id for doc in docs]
+        _init_export_worker(1000, None, set())
+
+        # Act
+        data, written, csv_errors, failed_ids, filtered_ids = _export_chunk(
+            doc_ids, compress=True
+        )
+
+        # Assert
+        rows = list(
+            csv.DictReader(
+                gzip.decompress(data).decode("utf-8").splitlines(),
+                fieldnames=CSV_HEADERS,
+            )
+        )
+        self.assertEqual([row["ITEM_ID"] for row in rows], [str(i) for i in doc_ids])
+        self.assertEqual(written, 2)
+        self.assertEqual(csv_errors, 0)
+        self.assertEqual(failed_ids, [])
+        self.assertEqual(filtered_ids, [])
+
 
 class IntegrationTests(TestCase):
     """Integration tests for export service."""
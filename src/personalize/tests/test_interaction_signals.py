@@ -21,14 +21,12 @@ class InteractionSignalsTests(TransactionTestCase):
         self.user = create_random_default_user("signal_test_user")
         self.doc = create_prefetched_paper(title="Test Paper")
 
-    @patch(
-        "personalize.signals.interaction_signals.sync_interaction_event_to_personalize_task.delay"
-    )
+    @patch("personalize.signals.interaction_signals.schedule_personalize_sync_drain")
     def test_impression_signal_triggers_personalize_sync(self, mock_task):
-        """Test that creating FEED_ITEM_IMPRESSION triggers sync task."""
+        """Test that creating FEED_ITEM_IMPRESSION schedules a sync drain."""
         # Create a FEED_ITEM_IMPRESSION interaction
         with transaction.atomic():
-            interaction = UserInteractions.objects.create(
+            UserInteractions.objects.create(
                 user=self.user,
                 event=FEED_ITEM_IMPRESSION,
                 unified_document=self.doc,
@@ -39,17 +37,15 @@ class InteractionSignalsTests(TransactionTestCase):
                 personalize_rec_id="test-rec-id",
             )
 
-        # Verify the sync task was queued after transaction commits
-        mock_task.assert_called_once_with(interaction.id)
+        # Verify the drain was scheduled after transaction commits
+        mock_task.assert_called_once_with()
 
-    @patch(
-        "personalize.signals.interaction_signals.sync_interaction_event_to_personalize_task.delay"
-    )
+    @patch("personalize.signals.interaction_signals.schedule_personalize_sync_drain")
     def test_impression_signal_with_external_user_id(self, mock_task):
         """Test impression signal works with external_user_id."""
         # Create a FEED_ITEM_IMPRESSION with external_user_id
         with transaction.atomic():
-            interaction = UserInteractions.objects.create(
+            UserInteractions.objects.create(
                 user=None,
                 external_user_id="external-user-123",
                 event=FEED_ITEM_IMPRESSION,
@@ -61,12 +57,10 @@ class InteractionSignalsTests(TransactionTestCase):
                 personalize_rec_id="test-rec-id",
             )
 
-        # Verify the sync task was queued after transaction commits
-        mock_task.assert_called_once_with(interaction.id)
+        # Verify the drain was scheduled after transaction commits
+        mock_task.assert_called_once_with()
 
-    @patch(
-        "personalize.signals.interaction_signals.sync_interaction_event_to_personalize_task.delay"
-    )
+    @patch("personalize.signals.interaction_signals.schedule_personalize_sync_drain")
     def test_signal_not_triggered_on_update(self, mock_task):
         """Test that signal is not triggered when updating existing interaction."""
         # Create interaction
@@ -89,5 +83,5 @@ class InteractionSignalsTests(TransactionTestCase):
             interaction.is_synced_with_personalize = True
             interaction.save()
 
-        # Verify the sync task was NOT queued again
+        # Verify the drain was NOT scheduled again
         mock_task.assert_not_called()
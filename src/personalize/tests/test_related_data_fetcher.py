@@ -285,3 +285,20 @@ class BatchFetchingTests(TestCase):
         self.assertIsInstance(result["proposal"], dict)
         self.assertIsInstance(result["rfp"], dict)
         self.assertIsInstance(result["review_count"], dict)
+
+    def test_fetcher_with_loaded_invariants_skips_funders_query(self):
+        """Funded proposals are looked up once, not for every batch."""
+        # Arrange
+        funded_doc = create_prefetched_proposal(status=Fundraise.OPEN)
+        create_fundraise_contribution(funded_doc.fundraises.first())
+        unfunded_doc = create_prefetched_proposal(status=Fundraise.OPEN)
+        fetcher = RelatedDataFetcher()
+        fetcher.load_invariants()
+
+        # Act
+        with self.assertNumQueries(6):
+            result = fetcher.fetch_all([funded_doc.id, unfunded_doc.id])
+
+        # Assert
+        self.assertTrue(result["proposal"][funded_doc.id]["has_funders"])
+        self.assertFalse(result["proposal"][unfunded_doc.id]["has_funders"])
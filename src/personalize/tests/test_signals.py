@@ -6,6 +6,7 @@ from django.test import TestCase
 from analytics.models import UserInteractions
 from discussion.models import Vote
 from hub.tests.helpers import create_hub
+from personalize.models import PendingItemSync
 from personalize.tasks import create_list_item_interaction_task
 from researchhub_document.helpers import create_post
 from researchhub_document.models import ResearchhubUnifiedDocument
@@ -14,93 +15,97 @@ from user_lists.models import List, ListItem
 
 
 class UnifiedDocumentSignalTests(TestCase):
-    """Tests for unified document hub changes triggering personalize sync."""
+    """Tests for unified document hub changes queueing personalize sync."""
+
+    def _assert_queued(self, unified_doc, mock_schedule_drain):
+        self.assertTrue(
+            PendingItemSync.objects.filter(unified_document=unified_doc).exists()
+        )
+        mock_schedule_drain.assert_called()
 
     @patch(
-        "personalize.signals.unified_document_signals"
-        ".sync_unified_document_to_personalize_task"
+        "personalize.signals.unified_document_signals.schedule_personalize_sync_drain"
     )
-    def test_signal_queues_task_when_hubs_added(self, mock_sync_task):
-        """Adding hubs to a unified document should queue the sync task."""
+    def test_signal_queues_document_when_hubs_added(self, mock_schedule_drain):
+        """Adding hubs to a unified document should queue it for sync."""
         unified_doc = ResearchhubUnifiedDocument.objects.create(
             document_type="DISCUSSION", is_removed=False
         )
         hub = create_hub(name="Test Hub")
 
-        mock_sync_task.reset_mock()
-
         # Adding hub should trigger the signal
-        unified_doc.hubs.add(hub)
+        with self.captureOnCommitCallbacks(execute=True):
+            unified_doc.hubs.add(hub)
 
-        mock_sync_task.delay.assert_called_once_with(unified_doc.id)
+        self._assert_queued(unified_doc, mock_schedule_drain)
 
     @patch(
-        "personalize.signals.unified_document_signals"
-        ".sync_unified_document_to_personalize_task"
+        "personalize.signals.unified_document_signals.schedule_personalize_sync_drain"
     )
-    def test_signal_does_not_queue_on_creation_without_hubs(self, mock_sync_task):
+    def test_signal_does_not_queue_on_creation_without_hubs(self, mock_schedule_drain):
         """Creating a unified document without hubs should not trigger sync."""
-        ResearchhubUnifiedDocument.objects.create(
-            document_type="DISCUSSION", is_removed=False
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            unified_doc = ResearchhubUnifiedDocument.objects.create(
+                document_type="DISCUSSION", is_removed=False
+            )
 
-        mock_sync_task.delay.assert_not_called()
+        self.assertFalse(
+            PendingItemSync.objects.filter(unified_document=unified_doc).exists()
+        )
+        mock_schedule_drain.assert_not_called()
 
     @patch(
-        "personalize.signals.unified_document_signals"
-        ".sync_unified_document_to_personalize_task"
+        "personalize.signals.unified_document_signals.schedule_personalize_sync_drain"
     )
-    def test_signal_queues_task_when_hubs_removed(self, mock_sync_task):
-        """Removing hubs should trigger sync to update Personalize."""
+    def test_signal_queues_document_when_hubs_removed(self, mock_schedule_drain):
+        """Removing hubs should queue a sync to update Personalize."""
         unified_doc = ResearchhubUnifiedDocument.objects.create(
             document_type="DISCUSSION", is_removed=False
         )
         hub = create_hub(name="Test Hub Remove")
         unified_doc.hubs.add(hub)
-
-        mock_sync_task.reset_mock()
+        PendingItemSync.objects.all().delete()
 
         # Removing hub should trigger the signal
-        unified_doc.hubs.remove(hub)
+        with self.captureOnCommitCallbacks(execute=True):
+            unified_doc.hubs.remove(hub)
 
-        mock_sync_task.delay.assert_called_once_with(unified_doc.id)
+        self._assert_queued(unified_doc, mock_schedule_drain)
 
     @patch(
-        "personalize.signals.unified_document_signals"
-        ".sync_unified_document_to_personalize_task"
+        "personalize.signals.unified_document_signals.schedule_personalize_sync_drain"
     )
-    def test_signal_queues_task_when_hubs_cleared(self, mock_sync_task):
-        """Clearing all hubs should trigger sync to update Personalize."""
+    def test_signal_queues_document_when_hubs_cleared(self, mock_schedule_drain):
+        """Clearing all hubs should queue a sync to update Personalize."""
         unified_doc = ResearchhubUnifiedDocument.objects.create(
             document_type="DISCUSSION", is_removed=False
         )
         hub1 = create_hub(name="Test Hub Clear 1")
         hub2 = create_hub(name="Test Hub Clear 2")
         unified_doc.hubs.add(hub1, hub2)
-
-        mock_sync_task.reset_mock()
+        PendingItemSync.objects.all().delete()
 
         # Clearing hubs should trigger the signal
-        unified_doc.hubs.clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            unified_doc.hubs.clear()
 
-        mock_sync_task.delay.assert_called_once_with(unified_doc.id)
+        self._assert_queued(unified_doc, mock_schedule_drain)
 
     @patch(
-        "personalize.signals.unified_document_signals"
-        ".sync_unified_document_to_personalize_task"
+        "personalize.signals.unified_document_signals.schedule_personalize_sync_drain"
     )
-    def test_signal_triggers_when_hubs_added_to_post(self, mock_sync_task):
-        """Adding hubs to a post's unified document queues the sync task."""
+    def test_signal_queues_document_when_hubs_added_to_post(self, mock_schedule_drain):
+        """Adding hubs to a post's unified document queues it for sync."""
         user = create_random_default_user("post_signal_user")
         post = create_post(created_by=user)
         hub = create_hub(name="Post Hub")
-
-        mock_sync_task.reset_mock()
+        PendingItemSync.objects.all().delete()
 
         # Adding hub should trigger the signal
-        post.unified_document.hubs.add(hub)
+        with self.captureOnCommitCallbacks(execute=True):
+            post.unified_document.hubs.add(hub)
 
-        mock_sync_task.delay.assert_called_with(post.unified_document.id)
+        self._assert_queued(post.unified_document, mock_schedule_drain)
 
 
 class VoteSignalTests(TestCase):
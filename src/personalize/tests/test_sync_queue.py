@@ -0,0 +1,122 @@
+from datetime import timedelta
+from unittest.mock import Mock, patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from personalize.models import PendingItemSync
+from personalize.services.sync_queue import drain_pending_items, queue_items_for_sync
+from personalize.services.sync_service import SyncService
+from personalize.tests.helpers import create_prefetched_paper
+from researchhub_document.helpers import create_post
+
+User = get_user_model()
+
+
+class DrainPendingItemsTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="sync_queue_user", email="sync_queue@researchhub.com"
+        )
+        self.sync_client = Mock()
+        self.sync_client.put_items.return_value = {
+            "success": True,
+            "synced": 1,
+            "failed": 0,
+            "errors": [],
+        }
+        self.service = SyncService(sync_client=self.sync_client)
+
+    def test_drain_syncs_documents_in_batches(self):
+        # Arrange
+        posts = [create_post(created_by=self.user) for _ in range(12)]
+        queue_items_for_sync([post.unified_document.id for post in posts])
+
+        # Act
+        result = drain_pending_items(sync_service=self.service)
+
+        # Assert
+        batch_sizes = [
+            len(call[0][0]) for call in self.sync_client.put_items.call_args_list
+        ]
+        self.assertEqual(batch_sizes, [10, 2])
+        self.assertEqual(result["synced"], 12)
+        self.assertFalse(PendingItemSync.objects.exists())
+
+    def test_drain_drops_ineligible_and_keeps_failed_documents(self):
+        # Arrange
+        self.sync_client.put_items.return_value = {
+            "success": False,
+            "synced": 0,
+            "failed": 1,
+            "errors": ["AWS API error"],
+        }
+        post = create_post(created_by=self.user)
+        old_paper = create_prefetched_paper(
+            title="Old Paper", paper_publish_date=timezone.now() - timedelta(days=90)
+        )
+        queue_items_for_sync([post.unified_document.id, old_paper.id])
+
+        # Act
+        result = drain_pending_items(sync_service=self.service)
+
+        # Assert
+        self.assertFalse(result["success"])
+        self.assertEqual(result["failed"], 1)
+        self.assertEqual(result["skipped"], 1)
+        self.assertEqual(
+            list(PendingItemSync.objects.values_list("unified_document_id", flat=True)),
+            [post.unified_document.id],
+        )
+
+    @patch("personalize.services.sync_queue.SYNC_MAX_ATTEMPTS", 2)
+    def test_drain_dead_letters_documents_after_max_attempts(self):
+        # Arrange
+        self.sync_client.put_items.return_value = {
+            "success": False,
+            "synced": 0,
+            "failed": 1,
+            "errors": ["AWS API error"],
+        }
+        post = create_post(created_by=self.user)
+        queue_items_for_sync([post.unified_document.id])
+        drain_pending_items(sync_service=self.service)
+
+        # Act
+        with self.assertLogs("personalize.services.sync_queue", "ERROR"):
+            drain_pending_items(sync_service=self.service)
+        drain_pending_items(sync_service=self.service)
+
+        # Assert
+        self.assertEqual(self.sync_client.put_items.call_count, 2)
+        pending = PendingItemSync.objects.get()
+        self.assertEqual(pending.attempts, 2)
+        self.assertEqual(pending.last_error, "AWS API error")
+
+    def test_queue_items_resets_failed_attempts(self):
+        # Arrange
+        post = create_post(created_by=self.user)
+        queue_items_for_sync([post.unified_document.id])
+        PendingItemSync.objects.update(attempts=10, last_error="AWS API error")
+
+        # Act
+        queue_items_for_sync([post.unified_document.id])
+
+        # Assert
+        pending = PendingItemSync.objects.get()
+        self.assertEqual(pending.attempts, 0)
+        self.assertEqual(pending.last_error, "")
+
+    def test_queue_items_requeues_pending_documents(self):
+        # Arrange
+        post = create_post(created_by=self.user)
+        queue_items_for_sync([post.unified_document.id])
+        PendingItemSync.objects.update(queued_date=timezone.now() - timedelta(days=1))
+
+        # Act
+        queue_items_for_sync([post.unified_document.id])
+
+        # Assert
+        pending = PendingItemSync.objects.get()
+        self.assertGreater(pending.queued_date, timezone.now() - timedelta(hours=1))
@@ -12,6 +12,15 @@ from researchhub_document.models import ResearchhubUnifiedDocument
 class RelatedDataFetcher:
     """Fetches related data for Personalize item auxiliary data."""
 
+    def __init__(self, docs_with_funders: set[int] | None = None):
+        # Chunk-invariant lookups, loaded once per export by `load_invariants`
+        self.docs_with_funders = docs_with_funders
+
+    def load_invariants(self) -> None:
+        """Load lookups that don't depend on the chunk being fetched."""
+        if self.docs_with_funders is None:
+            self.docs_with_funders = self.fetch_docs_with_funders()
+
     def fetch_all(self, doc_ids: list[int]) -> dict:
         """Fetch all auxiliary data for a batch of document IDs."""
         return {
@@ -52,8 +61,6 @@ class RelatedDataFetcher:
 
     def fetch_proposal_data(self, doc_ids: list[int]) -> dict[int, dict]:
         """Fetch proposal/fundraise flags for document IDs."""
-        from purchase.models import Fundraise
-
         proposal_map = defaultdict(lambda: {"is_open": False, "has_funders": False})
 
         open_fundraises = (
@@ -74,6 +81,23 @@ class RelatedDataFetcher:
         for doc_id in open_fundraises:
             proposal_map[doc_id]["is_open"] = True
 
+        if self.docs_with_funders is not None:
+            docs_with_funders = self.docs_with_funders.intersection(doc_ids)
+        else:
+            docs_with_funders = self.fetch_docs_with_funders(doc_ids)
+
+        for doc_id in docs_with_funders:
+            proposal_map[doc_id]["has_funders"] = True
+
+        return dict(proposal_map)
+
+    def fetch_docs_with_funders(self, doc_ids: list[int] | None = None) -> set[int]:
+        """
+        Fetch IDs of public proposals whose fundraise has at least one
+        contribution, optionally limited to `doc_ids`.
+        """
+        from purchase.models import Fundraise
+
         fundraise_content_type = ContentType.objects.get_for_model(Fundraise)
         fundraise_ids_with_funders = (
             Purchase.objects.filter(
@@ -84,21 +108,15 @@ class RelatedDataFetcher:
             .distinct()
         )
 
-        docs_with_funders = (
-            ResearchhubUnifiedDocument.objects.filter(
-                id__in=doc_ids,
-                document_type="PREREGISTRATION",
-                fundraises__id__in=fundraise_ids_with_funders,
-                is_public=True,
-            )
-            .values_list("id", flat=True)
-            .distinct()
+        docs_with_funders = ResearchhubUnifiedDocument.objects.filter(
+            document_type="PREREGISTRATION",
+            fundraises__id__in=fundraise_ids_with_funders,
+            is_public=True,
         )
+        if doc_ids is not None:
+            docs_with_funders = docs_with_funders.filter(id__in=doc_ids)
 
-        for doc_id in docs_with_funders:
-            proposal_map[doc_id]["has_funders"] = True
-
-        return dict(proposal_map)
+        return set(docs_with_funders.values_list("id", flat=True).distinct())
 
     def fetch_rfp_data(self, doc_ids: list[int]) -> dict[int, dict]:
         """Fetch RFP/grant flags for document IDs."""
@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand
+
+from purchase.services.balance_summary_service import reconcile_balance_summaries
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare UserBalanceSummary totals with the Balance ledger and report "
+        "differences. Run with --fix after writes that bypass Balance.save()."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--user-id",
+            type=int,
+            action="append",
+            dest="user_ids",
+            help="Only reconcile this user. Can be passed more than once.",
+        )
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Rebuild the summaries of users that differ from the ledger.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        drifts = reconcile_balance_summaries(
+            user_ids=options["user_ids"], fix=options["fix"]
+        )
+
+        for drift in drifts:
+            self.stdout.write(
+                f"user={drift.user_id} type={drift.balance_type} "
+                f"ledger={drift.ledger_total} summary={drift.summary_total}"
+            )
+
+        if not drifts:
+            self.stdout.write(self.style.SUCCESS("Summaries match the ledger."))
+        elif options["fix"]:
+            users = len({drift.user_id for drift in drifts})
+            self.stdout.write(
+                self.style.SUCCESS(f"Rebuilt summaries of {users} users.")
+            )
+        else:
+            self.stdout.write(
+                self.style.WARNING(f"{len(drifts)} summaries differ from the ledger.")
+            )
@@ -0,0 +1,114 @@
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import DecimalField, Exists, OuterRef, Q, Sum
+from django.db.models.functions import Cast
+
+BATCH_SIZE = 1000
+# `LEDGER_ONLY_BALANCE_EMAILS` at the time of this migration: the fee accounts
+# never get a summary.
+LEDGER_ONLY_BALANCE_EMAILS = (
+    "revenue@researchhub.com",
+    "revenue1@researchhub.foundation",
+)
+
+
+def backfill_balance_summaries(apps, schema_editor):
+    Balance = apps.get_model("purchase", "Balance")
+    UserBalanceSummary = apps.get_model("purchase", "UserBalanceSummary")
+    Withdrawal = apps.get_model("reputation", "Withdrawal")
+    ContentType = apps.get_model("contenttypes", "ContentType")
+
+    failed_withdrawals = Withdrawal.objects.filter(
+        id=OuterRef("object_id"),
+        user_id=OuterRef("user_id"),
+        paid_status="FAILED",
+        is_removed=False,
+    )
+    withdrawal_content_types = ContentType.objects.filter(
+        app_label="reputation", model="withdrawal"
+    )
+    rows = (
+        Balance.objects.exclude(
+            Q(content_type__in=withdrawal_content_types) & Q(Exists(failed_withdrawals))
+        )
+        .exclude(user__email__in=LEDGER_ONLY_BALANCE_EMAILS)
+        .values("user_id", "is_locked", "lock_type")
+        .annotate(
+            total=Sum(Cast("amount", DecimalField(max_digits=255, decimal_places=128)))
+        )
+        .order_by()
+    )
+    UserBalanceSummary.objects.bulk_create(
+        (
+            UserBalanceSummary(
+                user_id=row["user_id"],
+                balance_type=row["lock_type"] if row["is_locked"] else "UNLOCKED",
+                total=row["total"],
+            )
+            for row in rows.iterator()
+        ),
+        batch_size=BATCH_SIZE,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("purchase", "0060_alter_rscexchangerate_price_source"),
+        ("reputation", "0120_alter_distribution_distribution_type"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserBalanceSummary",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "balance_type",
+                    models.CharField(
+                        choices=[
+                            ("UNLOCKED", "Unlocked"),
+                            ("FUNDING_CREDIT", "Funding Credit"),
+                            ("PROMOTIONAL", "Promotional"),
+                        ],
+                        max_length=32,
+                    ),
+                ),
+                (
+                    "total",
+                    models.DecimalField(
+                        decimal_places=128, default=0, max_digits=255
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="balance_summaries",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "balance_type"),
+                        name="unique_user_balance_type",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(
+            backfill_balance_summaries, migrations.RunPython.noop
+        ),
+    ]
@@ -1,5 +1,5 @@
 from .related_models.aggregate_purchase_model import AggregatePurchase
-from .related_models.balance_model import Balance
+from .related_models.balance_model import Balance, UserBalanceSummary
 from .related_models.endaoment_account_model import EndaomentAccount
 from .related_models.fundraise_model import Fundraise
 from .related_models.grant_application_model import GrantApplication
@@ -25,5 +25,6 @@ migratables = (
     RscPurchaseFee,
     Support,
     UsdFundraiseContribution,
+    UserBalanceSummary,
     Wallet,
 )
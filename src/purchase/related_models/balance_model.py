@@ -1,6 +1,16 @@
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
-from django.db import models
+from django.db import models, transaction
+
+# Fields of a `Balance` row that decide its share of the user's summary.
+BALANCE_SUMMARY_FIELDS = (
+    "user_id",
+    "content_type_id",
+    "object_id",
+    "amount",
+    "is_locked",
+    "lock_type",
+)
 
 
 class Balance(models.Model):
@@ -93,7 +103,20 @@ class Balance(models.Model):
         if update_fields is not None and self.lock_type != original_lock_type:
             kwargs["update_fields"] = {*update_fields, "lock_type"}
 
-        return super().save(*args, **kwargs)
+        from purchase.services.balance_summary_service import record_balance_saved
+
+        # The user's `UserBalanceSummary` changes in the same transaction.
+        with transaction.atomic():
+            previous = None
+            if not self._state.adding:
+                previous = (
+                    Balance.objects.filter(pk=self.pk)
+                    .values(*BALANCE_SUMMARY_FIELDS)
+                    .first()
+                )
+            result = super().save(*args, **kwargs)
+            record_balance_saved(self, previous)
+        return result
 
     @staticmethod
     def locked_by_referral_bonus(queryset=None):
@@ -108,3 +131,35 @@ class Balance(models.Model):
                 distribution_type="REFERRAL_BONUS"
             ).values_list("id", flat=True),
         )
+
+
+class UserBalanceSummary(models.Model):
+    """
+    Running total of a user's `Balance` rows per balance type: unlocked funds,
+    or one of the locked `Balance.LockType` categories.
+
+    Updated in the same transaction as each balance row is written, so
+    balance reads are a single lookup. The `Balance` ledger stays the source
+    of truth, writes that bypass `Balance.save()` are corrected by the
+    `reconcile_balance_summaries` command.
+    """
+
+    UNLOCKED = "UNLOCKED"
+    BALANCE_TYPE_CHOICES = [
+        (UNLOCKED, "Unlocked"),
+        *Balance.LockType.choices,
+    ]
+
+    user = models.ForeignKey(
+        "user.User", on_delete=models.CASCADE, related_name="balance_summaries"
+    )
+    balance_type = models.CharField(max_length=32, choices=BALANCE_TYPE_CHOICES)
+    total = models.DecimalField(max_digits=255, decimal_places=128, default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "balance_type"],
+                name="unique_user_balance_type",
+            ),
+        ]
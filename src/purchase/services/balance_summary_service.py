@@ -0,0 +1,249 @@
+"""
+Materialized balance totals.
+
+`UserBalanceSummary` holds one row per `(user, balance type)` with the sum of
+the user's `Balance` amounts, so balance reads don't aggregate the ledger:
+
+- `Balance.save()` applies the row's amount, or the change of an existing
+  row, in the same transaction as the write,
+- deleting a balance row subtracts its amount,
+- balance rows of a failed withdrawal don't count towards the totals, same as
+  in `User.get_balance_qs`, so they are subtracted when a withdrawal fails
+  and added back if it is retried.
+
+Writes that bypass `Balance.save()` (bulk creates, queryset updates, or
+workers still running older code) are corrected by
+`reconcile_balance_summaries`, which compares the summaries with the ledger
+and runs as a periodic task. Balance reads only use the summaries when
+`BALANCE_SUMMARY_READS_ENABLED` is set.
+
+The fee accounts (`LEDGER_ONLY_BALANCE_EMAILS`) get no summaries: every
+purchase and bounty credits them, and a single running row would serialize
+those transactions.
+"""
+
+from dataclasses import dataclass
+from decimal import Decimal
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import DecimalField, Exists, F, OuterRef, Q, Sum
+from django.db.models.functions import Cast
+
+from purchase.related_models.balance_model import (
+    BALANCE_SUMMARY_FIELDS,
+    Balance,
+    UserBalanceSummary,
+)
+from reputation.models import PaidStatusModelMixin, Withdrawal
+from user.related_models.user_model import LEDGER_ONLY_BALANCE_EMAILS, User
+
+LEDGER_AMOUNT = Cast("amount", DecimalField(max_digits=255, decimal_places=128))
+
+
+@dataclass
+class BalanceSummaryDrift:
+    user_id: int
+    balance_type: str
+    ledger_total: Decimal
+    summary_total: Decimal
+
+
+def get_balance_type(is_locked: bool, lock_type: str | None) -> str:
+    return lock_type if is_locked else UserBalanceSummary.UNLOCKED
+
+
+def get_ledger_only_user_ids(user_ids=None) -> set[int]:
+    users = User.objects.filter(email__in=LEDGER_ONLY_BALANCE_EMAILS)
+    if user_ids is not None:
+        users = users.filter(id__in=user_ids)
+    return set(users.values_list("id", flat=True))
+
+
+def apply_balance_deltas(deltas):
+    """
+    Add `(user_id, balance_type, amount)` deltas to the summaries.
+
+    Amounts are added in the database: ledger amounts carry more digits than
+    Python's default decimal precision.
+    """
+    deltas = list(deltas)
+    if not deltas:
+        return
+    ledger_only = get_ledger_only_user_ids({user_id for user_id, _, _ in deltas})
+
+    with transaction.atomic():
+        for user_id, balance_type, amount in deltas:
+            if user_id in ledger_only:
+                continue
+            summaries = UserBalanceSummary.objects.filter(
+                user_id=user_id, balance_type=balance_type
+            )
+            if summaries.update(total=F("total") + amount):
+                continue
+            UserBalanceSummary.objects.get_or_create(
+                user_id=user_id, balance_type=balance_type
+            )
+            summaries.update(total=F("total") + amount)
+
+
+def _is_failed_withdrawal(user_id, content_type_id, object_id) -> bool:
+    if content_type_id != ContentType.objects.get_for_model(Withdrawal).id:
+        return False
+    return Withdrawal.objects.filter(
+        id=object_id, user_id=user_id, paid_status=PaidStatusModelMixin.FAILED
+    ).exists()
+
+
+def _summary_delta(row: dict, negate: bool = False):
+    if _is_failed_withdrawal(row["user_id"], row["content_type_id"], row["object_id"]):
+        return None
+
+    amount = Decimal(str(row["amount"]))
+    return (
+        row["user_id"],
+        get_balance_type(row["is_locked"], row["lock_type"]),
+        amount.copy_negate() if negate else amount,
+    )
+
+
+def _balance_row(balance: Balance) -> dict:
+    return {field: getattr(balance, field) for field in BALANCE_SUMMARY_FIELDS}
+
+
+def record_balance_saved(balance: Balance, previous: dict | None = None):
+    """Apply a created balance row, or the change of an updated one."""
+    current = _balance_row(balance)
+    if previous is not None:
+        previous = {**previous, "amount": Decimal(str(previous["amount"]))}
+        if previous == {**current, "amount": Decimal(str(current["amount"]))}:
+            return
+
+    deltas = [_summary_delta(current)]
+    if previous is not None:
+        deltas.append(_summary_delta(previous, negate=True))
+    apply_balance_deltas([delta for delta in deltas if delta is not None])
+
+
+def record_balance_deleted(balance: Balance):
+    delta = _summary_delta(_balance_row(balance), negate=True)
+    if delta is not None:
+        apply_balance_deltas([delta])
+
+
+def record_withdrawal_failure_changed(withdrawal: Withdrawal, failed: bool):
+    """Take a withdrawal's balance rows out of the totals, or put them back."""
+    rows = (
+        Balance.objects.filter(
+            content_type=ContentType.objects.get_for_model(Withdrawal),
+            object_id=withdrawal.id,
+            user_id=withdrawal.user_id,
+        )
+        .values("is_locked", "lock_type")
+        .annotate(total=Sum(LEDGER_AMOUNT))
+        .order_by()
+    )
+    apply_balance_deltas(
+        (
+            withdrawal.user_id,
+            get_balance_type(row["is_locked"], row["lock_type"]),
+            row["total"].copy_negate() if failed else row["total"],
+        )
+        for row in rows
+    )
+
+
+def get_ledger_totals(user_ids=None) -> dict[tuple[int, str], Decimal]:
+    """Balance totals by `(user_id, balance_type)`, aggregated from the ledger."""
+    failed_withdrawals = Withdrawal.objects.filter(
+        id=OuterRef("object_id"),
+        user_id=OuterRef("user_id"),
+        paid_status=PaidStatusModelMixin.FAILED,
+    )
+    balances = Balance.objects.exclude(
+        Q(content_type=ContentType.objects.get_for_model(Withdrawal))
+        & Q(Exists(failed_withdrawals))
+    ).exclude(user__email__in=LEDGER_ONLY_BALANCE_EMAILS)
+    if user_ids is not None:
+        balances = balances.filter(user_id__in=user_ids)
+
+    rows = (
+        balances.values("user_id", "is_locked", "lock_type")
+        .annotate(total=Sum(LEDGER_AMOUNT))
+        .order_by()
+    )
+    return {
+        (row["user_id"], get_balance_type(row["is_locked"], row["lock_type"])): row[
+            "total"
+        ]
+        for row in rows.iterator()
+    }
+
+
+def rebuild_user_balance_summary(user_id: int):
+    """Overwrite a user's summaries with the totals of the ledger."""
+    with transaction.atomic():
+        # Lock the summaries first: balance writes for this user wait until
+        # the rebuild commits, and then apply their deltas on top of it.
+        summaries = {
+            summary.balance_type: summary
+            for summary in UserBalanceSummary.objects.select_for_update().filter(
+                user_id=user_id
+            )
+        }
+        ledger_totals = {
+            balance_type: total
+            for (_, balance_type), total in get_ledger_totals([user_id]).items()
+        }
+
+        for balance_type in summaries.keys() | ledger_totals.keys():
+            total = ledger_totals.get(balance_type, Decimal(0))
+            summary = summaries.get(balance_type)
+            if summary is None:
+                UserBalanceSummary.objects.create(
+                    user_id=user_id, balance_type=balance_type, total=total
+                )
+            elif summary.total != total:
+                summary.total = total
+                summary.save(update_fields=["total"])
+
+
+def reconcile_balance_summaries(
+    user_ids=None, fix: bool = False
+) -> list[BalanceSummaryDrift]:
+    """
+    Compare the summaries with the ledger and return where they differ.
+    With `fix`, the summaries of the affected users are rebuilt.
+    """
+    ledger_totals = get_ledger_totals(user_ids)
+    summaries = UserBalanceSummary.objects.exclude(
+        user__email__in=LEDGER_ONLY_BALANCE_EMAILS
+    )
+    if user_ids is not None:
+        summaries = summaries.filter(user_id__in=user_ids)
+    summary_totals = {
+        (user_id, balance_type): total
+        for user_id, balance_type, total in summaries.values_list(
+            "user_id", "balance_type", "total"
+        ).iterator()
+    }
+
+    drifts = []
+    for user_id, balance_type in sorted(ledger_totals.keys() | summary_totals.keys()):
+        ledger_total = ledger_totals.get((user_id, balance_type), Decimal(0))
+        summary_total = summary_totals.get((user_id, balance_type), Decimal(0))
+        if ledger_total != summary_total:
+            drifts.append(
+                BalanceSummaryDrift(
+                    user_id=user_id,
+                    balance_type=balance_type,
+                    ledger_total=ledger_total,
+                    summary_total=summary_total,
+                )
+            )
+
+    if fix:
+        for user_id in sorted({drift.user_id for drift in drifts}):
+            rebuild_user_balance_summary(user_id)
+
+    return drifts
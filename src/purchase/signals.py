@@ -2,11 +2,17 @@ import logging
 
 from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
 from notification.models import Notification
+from purchase.related_models.balance_model import Balance
 from purchase.related_models.grant_application_model import GrantApplication
+from purchase.services.balance_summary_service import (
+    record_balance_deleted,
+    record_withdrawal_failure_changed,
+)
+from reputation.models import PaidStatusModelMixin, Withdrawal
 
 logger = logging.getLogger(__name__)
 
@@ -48,3 +54,34 @@ def notify_grant_owner_on_application(sender, instance, created, **kwargs):
             "GrantApplication %s",
             instance.id,
         )
+
+
+@receiver(post_delete, sender=Balance, dispatch_uid="balance_summary_on_delete")
+def update_balance_summary_on_delete(sender, instance, **kwargs):
+    record_balance_deleted(instance)
+
+
+def _is_failed_withdrawal(paid_status, is_removed):
+    # Soft deleted withdrawals are not excluded by `User.get_balance_qs`.
+    return paid_status == PaidStatusModelMixin.FAILED and not is_removed
+
+
+@receiver(pre_save, sender=Withdrawal, dispatch_uid="balance_summary_withdrawal_pre")
+def remember_withdrawal_failed(sender, instance, **kwargs):
+    previous = None
+    if instance.pk:
+        previous = (
+            Withdrawal.all_objects.filter(pk=instance.pk)
+            .values("paid_status", "is_removed")
+            .first()
+        )
+    instance._was_failed = previous is not None and _is_failed_withdrawal(
+        previous["paid_status"], previous["is_removed"]
+    )
+
+
+@receiver(post_save, sender=Withdrawal, dispatch_uid="balance_summary_withdrawal")
+def update_balance_summary_on_withdrawal(sender, instance, **kwargs):
+    failed = _is_failed_withdrawal(instance.paid_status, instance.is_removed)
+    if failed != getattr(instance, "_was_failed", False):
+        record_withdrawal_failure_changed(instance, failed)
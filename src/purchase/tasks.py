@@ -10,6 +10,7 @@ from paper.models import Paper
 from purchase.circle.service import CircleWalletService
 from purchase.models import Balance, Fundraise, Purchase
 from purchase.related_models.constants.currency import USD
+from purchase.services.balance_summary_service import reconcile_balance_summaries
 from purchase.services.fundraise_service import FundraiseService
 from reputation.models import Deposit
 from researchhub.celery import QUEUE_NOTIFICATION, QUEUE_PURCHASES, app
@@ -304,3 +305,18 @@ def sweep_deposit_to_multisig(self, circle_wallet_id, amount, network, sweep_ref
             deposit.sweep_status = Deposit.SWEEP_FAILED
             deposit.save(update_fields=["sweep_status"])
         raise self.retry(exc=exc)
+
+
+@app.task(queue=QUEUE_PURCHASES)
+def reconcile_balance_summaries_task():
+    """Rebuild the balance summaries of users that drifted from the ledger."""
+    drifts = reconcile_balance_summaries(fix=True)
+    for drift in drifts:
+        logger.warning(
+            "Rebuilt balance summary: user=%s type=%s ledger=%s summary=%s",
+            drift.user_id,
+            drift.balance_type,
+            drift.ledger_total,
+            drift.summary_total,
+        )
+    return len(drifts)
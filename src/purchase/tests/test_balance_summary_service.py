@@ -0,0 +1,175 @@
+from decimal import Decimal
+
+from django.contrib.contenttypes.models import ContentType
+from django.test import TestCase, override_settings
+
+from paper.related_models.paper_model import Paper
+from purchase.related_models.balance_model import Balance, UserBalanceSummary
+from purchase.services.balance_summary_service import (
+    get_ledger_totals,
+    reconcile_balance_summaries,
+)
+from purchase.tasks import reconcile_balance_summaries_task
+from reputation.models import Withdrawal
+from user.related_models.user_model import REVENUE_EMAIL
+from user.tests.helpers import create_user
+
+
+@override_settings(BALANCE_SUMMARY_READS_ENABLED=True)
+class BalanceSummaryServiceTest(TestCase):
+    def setUp(self):
+        self.user = create_user(email="summary@test.com")
+        self.content_type = ContentType.objects.get_for_model(Paper)
+
+    def _create_balance(self, amount, is_locked=False, lock_type=None, **kwargs):
+        return Balance.objects.create(
+            user=self.user,
+            amount=str(amount),
+            content_type=kwargs.pop("content_type", self.content_type),
+            is_locked=is_locked,
+            lock_type=lock_type,
+            **kwargs,
+        )
+
+    def _summaries(self):
+        return dict(
+            UserBalanceSummary.objects.filter(user=self.user).values_list(
+                "balance_type", "total"
+            )
+        )
+
+    def _create_withdrawal_balance(self, amount, paid_status=None):
+        withdrawal = Withdrawal.objects.create(
+            amount=str(amount).lstrip("-"), paid_status=paid_status, user=self.user
+        )
+        self._create_balance(
+            amount,
+            content_type=ContentType.objects.get_for_model(Withdrawal),
+            object_id=withdrawal.id,
+        )
+        return withdrawal
+
+    def test_balance_writes_keep_summaries_current(self):
+        # Arrange
+        self._create_balance("100")
+        self._create_balance("-0.000000000000000000000000000001")
+        self._create_balance("50", is_locked=True)
+        promotional = self._create_balance(
+            "30", is_locked=True, lock_type=Balance.LockType.PROMOTIONAL
+        )
+        changed = self._create_balance("10")
+
+        # Act
+        promotional.delete()
+        changed.amount = "12"
+        changed.save()
+
+        # Assert
+        self.assertEqual(
+            self._summaries(),
+            {
+                UserBalanceSummary.UNLOCKED: Decimal(
+                    "111.999999999999999999999999999999"
+                ),
+                Balance.LockType.FUNDING_CREDIT: Decimal(50),
+                Balance.LockType.PROMOTIONAL: Decimal(0),
+            },
+        )
+        self.assertEqual(
+            self.user.get_balance(), Decimal("111.999999999999999999999999999999")
+        )
+        self.assertEqual(self.user.get_locked_balance(), Decimal(50))
+
+    def test_failed_withdrawals_are_excluded_from_summaries(self):
+        # Arrange
+        self._create_balance("100")
+        self._create_withdrawal_balance("-20", paid_status=Withdrawal.FAILED)
+        withdrawal = self._create_withdrawal_balance(
+            "-30", paid_status=Withdrawal.PENDING
+        )
+
+        # Act
+        withdrawal.set_paid_failed()
+
+        # Assert
+        self.assertEqual(self.user.get_balance(), Decimal(100))
+
+        # Act
+        withdrawal.set_paid_pending()
+
+        # Assert
+        self.assertEqual(self.user.get_balance(), Decimal(70))
+
+    def test_reconcile_fixes_writes_that_bypass_save(self):
+        # Arrange
+        self._create_balance("100")
+        self._create_withdrawal_balance("-20", paid_status=Withdrawal.FAILED)
+        Balance.objects.bulk_create(
+            [
+                Balance(
+                    user=self.user,
+                    amount="5",
+                    content_type=self.content_type,
+                    is_locked=True,
+                    lock_type=Balance.LockType.PROMOTIONAL,
+                )
+            ]
+        )
+
+        # Act
+        drifts = reconcile_balance_summaries(user_ids=[self.user.id], fix=True)
+
+        # Assert
+        self.assertEqual(
+            [(drift.balance_type, drift.ledger_total) for drift in drifts],
+            [(Balance.LockType.PROMOTIONAL, Decimal(5))],
+        )
+        self.assertEqual(
+            {
+                balance_type: total
+                for (_, balance_type), total in get_ledger_totals(
+                    [self.user.id]
+                ).items()
+            },
+            self._summaries(),
+        )
+        self.assertEqual(reconcile_balance_summaries(user_ids=[self.user.id]), [])
+
+    def test_reconcile_task_rebuilds_drifted_summaries(self):
+        # Arrange
+        self._create_balance("100")
+        UserBalanceSummary.objects.filter(user=self.user).update(total=Decimal(1))
+
+        # Act
+        rebuilt = reconcile_balance_summaries_task()
+
+        # Assert
+        self.assertEqual(rebuilt, 1)
+        self.assertEqual(self.user.get_balance(), Decimal(100))
+
+    def test_fee_accounts_are_read_from_the_ledger(self):
+        # Arrange
+        revenue_account = create_user(email=REVENUE_EMAIL)
+
+        # Act
+        Balance.objects.create(
+            user=revenue_account,
+            amount="7",
+            content_type=self.content_type,
+        )
+
+        # Assert
+        self.assertFalse(
+            UserBalanceSummary.objects.filter(user=revenue_account).exists()
+        )
+        self.assertEqual(revenue_account.get_balance(), Decimal(7))
+        self.assertEqual(reconcile_balance_summaries(), [])
+
+    @override_settings(BALANCE_SUMMARY_READS_ENABLED=False)
+    def test_reads_use_the_ledger_until_enabled(self):
+        # Arrange
+        self._create_balance("100")
+        UserBalanceSummary.objects.filter(user=self.user).update(total=Decimal(1))
+
+        # Act & Assert
+        self.assertEqual(self.user.get_balance(), Decimal(100))
@@ -0,0 +1,75 @@
+import time
+from datetime import date, datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from reputation.services.staking_yield_service import StakingYieldService
+from user.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare per-user and bulk staking position calculation for an accrual "
+        "date. Read-only: no snapshots are written."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--date",
+            help="Accrual date (YYYY-MM-DD), defaults to today",
+        )
+
+    def handle(self, *args, **options):
+        accrual_date = self._parse_date(options.get("date"))
+
+        start = time.perf_counter()
+        per_user_positions = {}
+        eligible_users = User.objects.filter(
+            is_staking_opted_in=True,
+            is_active=True,
+            is_suspended=False,
+            probable_spammer=False,
+        ).iterator()
+        for user in eligible_users:
+            position = StakingYieldService.calculate_user_staking_position(
+                user, accrual_date
+            )
+            if position.stake_amount > 0:
+                per_user_positions[user.id] = position
+        per_user_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        bulk_positions = {
+            user_id: position
+            for user_id, position in StakingYieldService.iter_staking_positions(
+                accrual_date
+            )
+            if position.stake_amount > 0
+        }
+        bulk_time = time.perf_counter() - start
+
+        self.stdout.write(
+            f"Per-user: {len(per_user_positions)} positions in {per_user_time:.2f}s"
+        )
+        self.stdout.write(f"Bulk: {len(bulk_positions)} positions in {bulk_time:.2f}s")
+        if bulk_time > 0:
+            self.stdout.write(f"Speedup: {per_user_time / bulk_time:.1f}x")
+
+        mismatched_ids = sorted(
+            user_id
+            for user_id in per_user_positions.keys() | bulk_positions.keys()
+            if per_user_positions.get(user_id) != bulk_positions.get(user_id)
+        )
+        if mismatched_ids:
+            raise CommandError(
+                f"{len(mismatched_ids)} positions differ, user IDs: {mismatched_ids}"
+            )
+        self.stdout.write(self.style.SUCCESS("Positions match"))
+
+    def _parse_date(self, date_str: str | None) -> date:
+        if not date_str:
+            return date.today()
+        try:
+            return datetime.strptime(date_str, "%Y-%m-%d").date()
+        except ValueError:
+            raise CommandError(f"Invalid date: {date_str}. Use YYYY-MM-DD")
@@ -1,19 +1,26 @@
 import logging
 import math
 import time
+from collections import defaultdict
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import date, timedelta
 from decimal import ROUND_DOWN, Decimal
+from itertools import groupby
+from operator import itemgetter
 
 from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
-from django.db.models import Count, Q
+from django.db.models import Count, DecimalField, Exists, OuterRef, Q, Sum
+from django.db.models.functions import Cast
 
 from purchase.related_models.balance_model import Balance
 from purchase.related_models.constants.rsc_exchange_currency import COIN_GECKO, USD
 from purchase.related_models.rsc_exchange_rate_model import RscExchangeRate
 from reputation.distributions import create_staking_yield_distribution
 from reputation.distributor import Distributor
+from reputation.models import PaidStatusModelMixin, Withdrawal
 from reputation.related_models.staking_global_snapshot import StakingGlobalSnapshot
 from reputation.related_models.staking_user_snapshot import StakingUserSnapshot
 from reputation.related_models.staking_yield_record import StakingYieldRecord
@@ -32,6 +39,8 @@ STAKING_MULTIPLIER_30_DAY = Decimal("1.05")
 STAKING_MULTIPLIER_180_DAY = Decimal("1.1")
 STAKING_MULTIPLIER_365_DAY = Decimal("1.25")
 
+STAKING_SNAPSHOT_BATCH_SIZE = 1000
+
 STAKING_MULTIPLIER_TIERS = (
     (30, STAKING_MULTIPLIER_30_DAY),
     (180, STAKING_MULTIPLIER_180_DAY),
@@ -205,6 +214,103 @@ class StakingYieldService:
             weighted_stake=weighted_stake,
         )
 
+    @staticmethod
+    def calculate_user_staking_position(user, accrual_date):
+        """Calculate a single user's staking position from their balance lots."""
+        lots = user.get_yield_eligible_balance_lots_lifo()
+        opt_in_date = (
+            user.staking_opted_in_date.date() if user.staking_opted_in_date else None
+        )
+        return StakingYieldService.calculate_staking_position(
+            lots, opt_in_date, accrual_date
+        )
+
+    @staticmethod
+    def iter_staking_positions(accrual_date) -> Iterator[tuple[int, StakingPosition]]:
+        """Yield `(user_id, position)` for every staking-eligible user with balances.
+
+        Bulk equivalent of `calculate_user_staking_position`: instead of
+        several balance queries per user, the yield-eligible balances of all
+        eligible users are read in one stream ordered by user and LIFO order,
+        and each user's lots are rebuilt with the same `User` helpers as soon
+        as their rows have been read. Locked totals, which cap promotional
+        lots, are aggregated per user and lock type in one extra query.
+        """
+        User = get_user_model()  # noqa: N806
+
+        failed_withdrawals = Withdrawal.objects.filter(
+            id=OuterRef("object_id"),
+            user_id=OuterRef("user_id"),
+            paid_status=PaidStatusModelMixin.FAILED,
+        )
+        balances = Balance.objects.filter(
+            user__is_staking_opted_in=True,
+            user__is_active=True,
+            user__is_suspended=False,
+            user__probable_spammer=False,
+        ).exclude(
+            Q(content_type=ContentType.objects.get_for_model(Withdrawal))
+            & Q(Exists(failed_withdrawals))
+        )
+
+        locked_totals = defaultdict(dict)
+        locked_rows = (
+            balances.filter(is_locked=True)
+            .values("user_id", "lock_type")
+            .annotate(
+                total=Sum(
+                    Cast("amount", DecimalField(max_digits=255, decimal_places=128))
+                )
+            )
+            .order_by()
+        )
+        for row in locked_rows:
+            total = row["total"] or Decimal(0)
+            locked_totals[row["user_id"]][row["lock_type"]] = total
+
+        balance_rows = (
+            balances.filter(
+                Q(is_locked=False)
+                | Q(is_locked=True, lock_type=Balance.LockType.PROMOTIONAL)
+            )
+            .order_by("user_id", "-created_date", "-id")
+            .values_list(
+                "user_id",
+                "user__staking_opted_in_date",
+                "is_locked",
+                "amount",
+                "created_date",
+            )
+        )
+
+        for user_id, user_rows in groupby(
+            balance_rows.iterator(chunk_size=STAKING_SNAPSHOT_BATCH_SIZE),
+            key=itemgetter(0),
+        ):
+            opt_in_date = None
+            unlocked_rows = []
+            promotional_rows = []
+            for _, staking_opted_in_date, is_locked, amount, created_date in user_rows:
+                opt_in_date = staking_opted_in_date
+                if is_locked:
+                    promotional_rows.append((amount, created_date))
+                else:
+                    unlocked_rows.append((amount, created_date))
+
+            promotional_balance = User.effective_locked_balances(
+                locked_totals.pop(user_id, {})
+            ).get(Balance.LockType.PROMOTIONAL, Decimal(0))
+            lots = User.balance_lots_lifo(unlocked_rows) + User.cap_balance_lots_lifo(
+                User.balance_lots_lifo(promotional_rows), promotional_balance
+            )
+
+            yield (
+                user_id,
+                StakingYieldService.calculate_staking_position(
+                    lots, opt_in_date.date() if opt_in_date else None, accrual_date
+                ),
+            )
+
     @staticmethod
     def compute_global_staking_multiplier(total_staked, total_weighted_stake):
         if total_staked <= 0 or total_weighted_stake <= 0:
@@ -378,8 +484,6 @@ class StakingYieldService:
         Raises on any failure (supply fetch, DB errors, etc.) so callers
         can retry.
         """
-        User = get_user_model()  # noqa: N806
-
         if accrual_date < STAKING_RELEASE_DATE:
             logger.info(
                 "Skipping staking snapshot creation for pre-release accrual_date=%s",
@@ -397,59 +501,49 @@ class StakingYieldService:
 
         supply = RscSupplyService.fetch_circulating_supply()
 
-        eligible_users = User.objects.filter(
-            is_staking_opted_in=True,
-            is_active=True,
-            is_suspended=False,
-            probable_spammer=False,
-        ).iterator()
-
         total_staked = Decimal(0)
         total_weighted_stake = Decimal(0)
-        position_rows = []
 
-        for user in eligible_users:
-            user_lots = user.get_yield_eligible_balance_lots_lifo()
-            user_opt_in_date = (
-                user.staking_opted_in_date.date()
-                if user.staking_opted_in_date
-                else None
-            )
-            staking_position = StakingYieldService.calculate_staking_position(
-                user_lots, user_opt_in_date, accrual_date
+        with transaction.atomic():
+            global_snapshot = StakingGlobalSnapshot.objects.create(
+                accrual_date=accrual_date,
+                circulating_supply=supply,
             )
-            if (
-                staking_position.stake_amount <= 0
-                or staking_position.weighted_stake <= 0
+
+            position_rows = []
+            for user_id, staking_position in StakingYieldService.iter_staking_positions(
+                accrual_date
             ):
-                continue
+                if (
+                    staking_position.stake_amount <= 0
+                    or staking_position.weighted_stake <= 0
+                ):
+                    continue
 
-            total_staked += staking_position.stake_amount
-            total_weighted_stake += staking_position.weighted_stake
-            position_rows.append(
-                StakingUserSnapshot(
-                    user=user,
-                    stake_amount=staking_position.stake_amount,
-                    multiplier=staking_position.multiplier,
-                    weighted_stake=staking_position.weighted_stake,
+                total_staked += staking_position.stake_amount
+                total_weighted_stake += staking_position.weighted_stake
+                position_rows.append(
+                    StakingUserSnapshot(
+                        global_snapshot=global_snapshot,
+                        user_id=user_id,
+                        stake_amount=staking_position.stake_amount,
+                        multiplier=staking_position.multiplier,
+                        weighted_stake=staking_position.weighted_stake,
+                    )
                 )
-            )
+                if len(position_rows) >= STAKING_SNAPSHOT_BATCH_SIZE:
+                    StakingUserSnapshot.objects.bulk_create(position_rows)
+                    position_rows = []
+            StakingUserSnapshot.objects.bulk_create(position_rows)
+
+            global_snapshot.total_staked = total_staked
+            global_snapshot.total_weighted_stake = total_weighted_stake
+            global_snapshot.save(update_fields=["total_staked", "total_weighted_stake"])
 
         global_multiplier = StakingYieldService.compute_global_staking_multiplier(
             total_staked, total_weighted_stake
         )
 
-        with transaction.atomic():
-            global_snapshot = StakingGlobalSnapshot.objects.create(
-                accrual_date=accrual_date,
-                circulating_supply=supply,
-                total_staked=total_staked,
-                total_weighted_stake=total_weighted_stake,
-            )
-            for position_row in position_rows:
-                position_row.global_snapshot = global_snapshot
-            StakingUserSnapshot.objects.bulk_create(position_rows)
-
         logger.info(
             "Created daily StakingGlobalSnapshot pk=%d accrual_date=%s supply=%s "
             "total_staked=%s total_weighted_stake=%s global_multiplier=%s",
@@ -12,6 +12,7 @@ import utils.locking as lock
 from hub.models import Hub
 from mailing_list.services import EmailService
 from notification.models import Notification
+from notification.services.fan_out_service import fan_out_notifications
 from reputation.constants.bounty import ASSESSMENT_PERIOD_DAYS
 from reputation.lib import (
     broadcast_withdrawal_transfer,
@@ -427,36 +428,20 @@ def find_qualified_users_and_notify(
         .order_by("-max_hub_score")
     )
 
-    notifications_sent = []
-    for author in qualified_authors:
-        notification = Notification.objects.filter(
-            object_id=bounty.id,
-            content_type=ContentType.objects.get_for_model(Bounty),
-            recipient=author.user,
-        )
+    qualified_authors = list(qualified_authors.select_related("user"))
+    hubs = Hub.objects.in_bulk({author.matching_hub_id for author in qualified_authors})
 
-        if not notification.exists():
-            hub = Hub.objects.get(id=author.matching_hub_id)
-
-            notification = Notification.objects.create(
-                item=bounty,
-                recipient=author.user,
-                action_user=author.user,
-                unified_document=bounty.unified_document,
-                notification_type=Notification.BOUNTY_FOR_YOU,
-                extra={
-                    "bounty_id": bounty.id,
-                    "amount": bounty.amount,
-                    "bounty_type": bounty.bounty_type,
-                    "bounty_expiration_date": bounty.expiration_date,
-                    "user_hub_score": author.max_hub_score,
-                    "hub_details": json.dumps({"name": hub.name, "slug": hub.slug}),
-                },
+    return fan_out_notifications(
+        [
+            _build_bounty_for_you_notification(
+                bounty,
+                author.user,
+                hubs[author.matching_hub_id],
+                author.max_hub_score,
             )
-            notification.send_notification()
-            notifications_sent.append(notification)
-
-    return notifications_sent
+            for author in qualified_authors
+        ]
+    )
 
 
 @app.task
@@ -464,33 +449,45 @@ def find_bounties_for_user_and_notify(user_id) -> Notification | None:
     user = User.objects.get(id=user_id)
     bounties: list[AnnotatedBounty] = Bounty.find_bounties_for_user(user)
 
-    for bounty in bounties:
-        notification = Notification.objects.filter(
-            object_id=bounty.id,
+    notified_bounty_ids = set(
+        Notification.objects.filter(
             content_type=ContentType.objects.get_for_model(Bounty),
+            object_id__in=[bounty.id for bounty in bounties],
             recipient=user,
-        )
+        ).values_list("object_id", flat=True)
+    )
 
-        if not notification.exists():
-            hub = Hub.objects.get(id=bounty.matching_hub_id)
+    for bounty in bounties:
+        if bounty.id in notified_bounty_ids:
+            continue
 
-            notification = Notification.objects.create(
-                item=bounty,
-                recipient=user,
-                action_user=user,
-                unified_document=bounty.unified_document,
-                notification_type=Notification.BOUNTY_FOR_YOU,
-                extra={
-                    "bounty_id": bounty.id,
-                    "amount": bounty.amount,
-                    "bounty_type": bounty.bounty_type,
-                    "bounty_expiration_date": bounty.expiration_date,
-                    "user_hub_score": bounty.user_hub_score,
-                    "hub_details": json.dumps({"name": hub.name, "slug": hub.slug}),
-                },
-            )
-            notification.send_notification()
-            return notification
+        hub = Hub.objects.get(id=bounty.matching_hub_id)
+        notifications = fan_out_notifications(
+            [
+                _build_bounty_for_you_notification(
+                    bounty, user, hub, bounty.user_hub_score
+                )
+            ]
+        )
+        return notifications[0] if notifications else None
+
+
+def _build_bounty_for_you_notification(bounty, user, hub, user_hub_score):
+    return Notification(
+        item=bounty,
+        recipient=user,
+        action_user=user,
+        unified_document=bounty.unified_document,
+        notification_type=Notification.BOUNTY_FOR_YOU,
+        extra={
+            "bounty_id": bounty.id,
+            "amount": bounty.amount,
+            "bounty_type": bounty.bounty_type,
+            "bounty_expiration_date": bounty.expiration_date,
+            "user_hub_score": user_hub_score,
+            "hub_details": json.dumps({"name": hub.name, "slug": hub.slug}),
+        },
+    )
 
 
 @app.task(queue=QUEUE_PURCHASES)
@@ -6,7 +6,7 @@ from django.contrib.contenttypes.models import ContentType
 from django.test import TestCase
 
 from purchase.models import Balance
-from reputation.models import StakingGlobalSnapshot
+from reputation.models import StakingGlobalSnapshot, Withdrawal
 from reputation.services.staking_yield_service import (
     QUANTIZE_8,
     STAKING_RELEASE_DATE,
@@ -418,3 +418,66 @@ class StakingMultiplierCalculationTest(TestCase):
             user2_snapshot.weighted_stake / snapshot.total_weighted_stake,
             user2_snapshot.stake_amount / snapshot.total_staked,
         )
+
+    def test_iter_staking_positions_matches_per_user_positions(self):
+        # Arrange
+        self.user.is_staking_opted_in = True
+        self.user.staking_opted_in_date = self._timestamp(days_before_accrual=100)
+        self.user.save(update_fields=["is_staking_opted_in", "staking_opted_in_date"])
+        self._create_balance("100", days_before_accrual=400)
+        self._create_balance("25.5", days_before_accrual=60)
+        self._create_balance("-40", days_before_accrual=10)
+        failed_withdrawal = Withdrawal.objects.create(
+            amount="-80", paid_status="FAILED", user=self.user
+        )
+        Balance.objects.create(
+            user=self.user,
+            amount="-80",
+            content_type=ContentType.objects.get_for_model(Withdrawal),
+            object_id=failed_withdrawal.id,
+        )
+
+        user2 = create_random_default_user("staking-bulk-2")
+        user2.is_staking_opted_in = True
+        user2.staking_opted_in_date = self._timestamp(days_before_accrual=400)
+        user2.save(update_fields=["is_staking_opted_in", "staking_opted_in_date"])
+        self._create_balance(
+            "100",
+            days_before_accrual=200,
+            is_locked=True,
+            lock_type=Balance.LockType.PROMOTIONAL,
+            user=user2,
+        )
+        self._create_balance(
+            "30",
+            days_before_accrual=20,
+            is_locked=True,
+            lock_type=Balance.LockType.PROMOTIONAL,
+            user=user2,
+        )
+        self._create_balance(
+            "-60",
+            days_before_accrual=5,
+            is_locked=True,
+            lock_type=Balance.LockType.FUNDING_CREDIT,
+            user=user2,
+        )
+
+        not_opted_in = create_random_default_user("staking-bulk-3")
+        self._create_balance("500", days_before_accrual=30, user=not_opted_in)
+
+        # Act
+        positions = dict(StakingYieldService.iter_staking_positions(self.accrual_date))
+
+        # Assert
+        self.assertEqual(
+            positions,
+            {
+                user.id: StakingYieldService.calculate_user_staking_position(
+                    user, self.accrual_date
+                )
+                for user in (self.user, user2)
+            },
+        )
+        self.assertEqual(positions[self.user.id].stake_amount, Decimal("85.50000000"))
+        self.assertEqual(positions[user2.id].stake_amount, Decimal("70.00000000"))
@@ -318,16 +318,23 @@ class Agent:
     def _dispatch_tool_calls(
         self, tool_calls, iteration: int
     ) -> tuple[list[ToolResultBlock], bool]:
-        result_blocks: list[ToolResultBlock] = []
-        stop = False
-        for call in tool_calls:
+        def before_call(index: int) -> None:
             # Per call, not once per turn: a turn can ask for several tools, and
             # a cancellation landing partway through must not let the rest run.
+            # Pooled calls are checked as each one starts, not when queued.
             self._ensure_active()
+            call = tool_calls[index]
             logger.info(
                 "iter %d -> %s(%s)", iteration, call.name, _compact_args(call.input)
             )
-            result, tool_stop = self.toolset.dispatch(call.name, call.input)
+
+        outcomes = self.toolset.dispatch_many(
+            [(call.name, call.input) for call in tool_calls],
+            before_call=before_call,
+        )
+        result_blocks: list[ToolResultBlock] = []
+        stop = False
+        for call, (result, tool_stop) in zip(tool_calls, outcomes):
             logger.info(
                 "iter %d <- %s: %s%s",
                 iteration,
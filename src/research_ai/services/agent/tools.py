@@ -8,6 +8,12 @@ reusable pair of types:
 - ``Toolset`` -- a registry that dispatches a tool call and renders its specs to
   a provider's wire format.
 
+A turn that asks for several tools is dispatched with ``dispatch_many``. Calls
+to tools marked ``parallel_safe`` run concurrently on a bounded thread pool --
+they are almost always I/O-bound lookups (OpenAlex, web search, PDF fetches)
+that otherwise wait on each other -- while every other call, and every terminal
+call, runs on its own in turn order. Results come back in call order either way.
+
 Best-effort contract (carried over from the prior art): handlers **never raise**.
 A handler returns a plain dict; failures are reported as ``{"error": ...}`` so a
 transient miss is handed back to the model rather than aborting the run. The
@@ -17,7 +23,9 @@ same ``{"error": ...}`` shape.
 
 import json
 import logging
-from collections.abc import Callable
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
@@ -33,6 +41,10 @@ logger = logging.getLogger(__name__)
 # budget, and outgrows the row it has to be stored in to resume the run.
 MAX_TOOL_RESULT_BYTES = 128 * 1024
 
+# Default bound on parallel-safe calls in flight for one turn. Enough to overlap
+# a turn's handful of lookups without stampeding the upstream APIs.
+DEFAULT_MAX_PARALLEL_TOOLS = 4
+
 # Handler signature: receives the model's parsed tool input, returns a dict.
 ToolHandler = Callable[[dict], dict]
 
@@ -49,6 +61,10 @@ class Tool:
             ``{"error": ...}``.
         is_terminal: When True, a successful call ends the loop (a "submit"
             tool that hands back a final answer).
+        parallel_safe: When True, the handler may run on a worker thread
+            alongside other parallel-safe calls from the same turn. Only set it
+            for handlers that touch no database connection and guard any state
+            they share with other calls. Terminal tools always run on their own.
     """
 
     name: str
@@ -56,12 +72,25 @@ class Tool:
     input_schema: dict
     handler: ToolHandler
     is_terminal: bool = False
+    parallel_safe: bool = False
 
 
 class Toolset:
-    """A registry of ``Tool``s that dispatches calls and renders specs."""
+    """A registry of ``Tool``s that dispatches calls and renders specs.
+
+    Args:
+        tools: Tools to register, in order.
+        max_parallel: Most parallel-safe calls ``dispatch_many`` runs at once;
+            1 dispatches every call sequentially.
+    """
 
-    def __init__(self, tools: list[Tool] | None = None):
+    def __init__(
+        self,
+        tools: list[Tool] | None = None,
+        *,
+        max_parallel: int = DEFAULT_MAX_PARALLEL_TOOLS,
+    ):
+        self.max_parallel = max(1, max_parallel)
         self._tools: dict[str, Tool] = {}
         for tool in tools or []:
             self.add(tool)
@@ -141,6 +170,77 @@ class Toolset:
         is_error = isinstance(result, dict) and "error" in result
         return result, tool.is_terminal and not is_error
 
+    def dispatch_many(
+        self,
+        calls: Sequence[tuple[str, dict]],
+        *,
+        before_call: Callable[[int], None] | None = None,
+    ) -> list[tuple[dict, bool]]:
+        """Run a turn's ``(name, input)`` calls; one ``dispatch`` result per call.
+
+        Consecutive calls to parallel-safe, non-terminal tools run together on a
+        pool of at most ``max_parallel`` threads; any other call waits for the
+        calls before it and runs alone. Results are returned in call order.
+
+        ``before_call(index)`` runs on the calling thread right before call
+        ``index`` starts -- for a pooled call, once a worker is free for it -- so
+        a cancellation check there still gates every call. If it raises, no
+        further call starts; calls already running are waited for and their
+        results dropped. An ``InterruptedError`` from a handler is raised the
+        same way, in call order.
+        """
+        results: list[tuple[dict, bool]] = []
+        start = 0
+        while start < len(calls):
+            end = start
+            while end < len(calls) and self._runs_in_pool(calls[end][0]):
+                end += 1
+            if end - start > 1 and self.max_parallel > 1:
+                results.extend(self._dispatch_pooled(calls, start, end, before_call))
+                start = end
+                continue
+            if before_call is not None:
+                before_call(start)
+            results.append(self.dispatch(*calls[start]))
+            start += 1
+        return results
+
+    def _runs_in_pool(self, name: str) -> bool:
+        tool = self._tools.get(name)
+        return tool is not None and tool.parallel_safe and not tool.is_terminal
+
+    def _dispatch_pooled(
+        self,
+        calls: Sequence[tuple[str, dict]],
+        start: int,
+        end: int,
+        before_call: Callable[[int], None] | None,
+    ) -> list[tuple[dict, bool]]:
+        workers = min(self.max_parallel, end - start)
+        # One slot per worker: a call is only checked and submitted once it can
+        # start, rather than the whole batch being queued (and checked) up front.
+        slots = threading.BoundedSemaphore(workers)
+        futures: list[Future] = []
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="agent-tool"
+        ) as executor:
+            for index in range(start, end):
+                slots.acquire()
+                try:
+                    for running in futures:
+                        # A handler reported the run interrupted: stop here.
+                        if running.done() and running.exception() is not None:
+                            running.result()
+                    if before_call is not None:
+                        before_call(index)
+                    future = executor.submit(self.dispatch, *calls[index])
+                except BaseException:
+                    slots.release()
+                    raise
+                future.add_done_callback(lambda _: slots.release())
+                futures.append(future)
+        return [future.result() for future in futures]
+
     def render_specs(self, provider: "LLMProvider") -> Any:
         """Render this toolset to ``provider``'s wire format."""
         return provider.render_tools(self.tools)
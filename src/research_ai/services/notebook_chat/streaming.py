@@ -2,8 +2,14 @@
 
 Completed provider turns still land in the agent context and trace as one
 authoritative message. This module holds only a bounded user-visible preview:
-small coalesced WebSocket deltas for the fast path and one cache snapshot for
-reconnect and polling recovery.
+small coalesced WebSocket deltas for the fast path and a cache-backed delta log
+for reconnect and polling recovery.
+
+The log is a base snapshot plus an append-only tail: every flush writes only
+its own deltas under a per-sequence key and advances a small head pointer, so
+its cost does not grow with the answer. Every ``STREAM_COMPACT_DELTAS``
+flushes the writer folds the tail into a fresh base snapshot. Readers rebuild
+the preview from the base and the tail between it and the head.
 
 The preview is deliberately best-effort. Execution status is durable and
 authoritative, so clients must discard preview events after an execution has
@@ -31,35 +37,108 @@ STREAM_ACTIVE_CHECK_INTERVAL_SECONDS = 1.0
 STREAM_PUBLISH_TIMEOUT_SECONDS = 5.0
 MAX_STREAM_TEXT_CHARS = 100_000
 MAX_STREAM_THINKING_CHARS = 4_000
+STREAM_COMPACT_DELTAS = 64
 
 
 def _cache_key(execution_id: int) -> str:
     return f"research_ai:notebook_chat:stream:{execution_id}"
 
 
+def _head_key(execution_id: int) -> str:
+    return f"{_cache_key(execution_id)}:head"
+
+
+def _delta_key(execution_id: int, stream_id: str, sequence: int) -> str:
+    return f"{_cache_key(execution_id)}:delta:{stream_id}:{sequence}"
+
+
 class ExecutionStreamStore:
-    """Cache-backed preview shared by workers and REST processes."""
+    """Cache-backed preview shared by workers and REST processes.
+
+    ``set`` writes a base snapshot, ``append`` adds one flush's deltas after
+    it, and ``get`` returns the base with the tail applied. Delta entries are
+    never rewritten; they expire with the TTL, so a reader holding an older
+    base can still replay the tail it needs while the writer compacts.
+    """
 
     def __init__(self, cache_backend=None):
         self._cache = cache if cache_backend is None else cache_backend
 
     def get(self, execution_id: int) -> dict | None:
-        snapshot = self._cache.get(_cache_key(execution_id))
-        return snapshot if isinstance(snapshot, dict) else None
+        base_key, head_key = _cache_key(execution_id), _head_key(execution_id)
+        stored = self._cache.get_many([base_key, head_key])
+        snapshot = stored.get(base_key)
+        if not isinstance(snapshot, dict):
+            return None
+        head = stored.get(head_key)
+        if (
+            not isinstance(head, dict)
+            or head.get("id") != snapshot["id"]
+            or head.get("sequence", 0) <= snapshot["sequence"]
+        ):
+            return snapshot
+
+        sequences = range(snapshot["sequence"] + 1, head["sequence"] + 1)
+        keys = [_delta_key(execution_id, snapshot["id"], seq) for seq in sequences]
+        tail = self._cache.get_many(keys)
+        items = OrderedDict(
+            (item["id"], dict(item, text=[item["text"]])) for item in snapshot["items"]
+        )
+        sequence = snapshot["sequence"]
+        for key in keys:
+            # Stop at a gap: the preview is only ever a prefix of the stream.
+            entry = tail.get(key)
+            if not isinstance(entry, list):
+                break
+            for delta in entry:
+                item = items.get(delta["id"])
+                if item is None:
+                    item = {
+                        "id": delta["id"],
+                        "type": delta["type"],
+                        "text": [],
+                        "at": delta["at"],
+                    }
+                    items[delta["id"]] = item
+                item["text"].append(delta["delta"])
+            sequence += 1
+        return {
+            **snapshot,
+            "sequence": sequence,
+            "items": [
+                dict(item, text="".join(item["text"])) for item in items.values()
+            ],
+        }
 
     def set(self, execution_id: int, snapshot: dict) -> None:
-        self._cache.set(
-            _cache_key(execution_id),
-            snapshot,
+        self._cache.set_many(
+            {
+                _cache_key(execution_id): snapshot,
+                _head_key(execution_id): {
+                    "id": snapshot["id"],
+                    "sequence": snapshot["sequence"],
+                },
+            },
+            timeout=STREAM_CACHE_TTL_SECONDS,
+        )
+
+    def append(
+        self, execution_id: int, *, stream_id: str, sequence: int, deltas: list[dict]
+    ) -> None:
+        self._cache.set_many(
+            {
+                _delta_key(execution_id, stream_id, sequence): deltas,
+                _head_key(execution_id): {"id": stream_id, "sequence": sequence},
+            },
             timeout=STREAM_CACHE_TTL_SECONDS,
         )
 
     def clear(self, execution_id: int) -> None:
-        self._cache.delete(_cache_key(execution_id))
+        self._cache.delete_many([_cache_key(execution_id), _head_key(execution_id)])
 
 
 class NotebookStreamBuffer:
-    """Accumulate provider deltas, snapshot them, and publish small batches."""
+    """Accumulate provider deltas, log them, and publish small batches."""
 
     def __init__(
         self,
@@ -85,6 +164,8 @@ class NotebookStreamBuffer:
         self.last_flush_at: float | None = None
         self.last_active_check_at: float | None = None
         self.stream_revision = 0
+        # Flushes logged since the last base snapshot; None before the first.
+        self.tail_length: int | None = None
         self.stopped = False
 
     def append(self, iteration: int, event) -> None:
@@ -106,16 +187,20 @@ class NotebookStreamBuffer:
             item = {
                 "id": item_id,
                 "type": item_type,
-                "text": "",
+                "parts": [],
+                "length": 0,
                 "at": timezone.now().isoformat(),
             }
             self.items[item_id] = item
 
-        room = maximum - len(item["text"])
+        room = maximum - item["length"]
         fragment = event.text[: max(0, room)]
         if not fragment:
             return
-        item["text"] += fragment
+        # Kept as parts so a long answer is joined once per compaction rather
+        # than copied on every fragment.
+        item["parts"].append(fragment)
+        item["length"] += len(fragment)
 
         pending = self.pending.get(item_id)
         if pending is None:
@@ -149,15 +234,25 @@ class NotebookStreamBuffer:
         sequence = self.sequence + 1
         stream_id = self._stream_id()
         deltas = [dict(delta) for delta in self.pending.values()]
-        self.store.set(
-            self.execution_id,
-            {
-                "id": stream_id,
-                "sequence": sequence,
-                "iteration": self.iteration,
-                "items": [dict(item) for item in self.items.values()],
-            },
-        )
+        if self.tail_length is None or self.tail_length >= STREAM_COMPACT_DELTAS:
+            self.store.set(
+                self.execution_id,
+                {
+                    "id": stream_id,
+                    "sequence": sequence,
+                    "iteration": self.iteration,
+                    "items": [self._compact_item(item) for item in self.items.values()],
+                },
+            )
+            self.tail_length = 0
+        else:
+            self.store.append(
+                self.execution_id,
+                stream_id=stream_id,
+                sequence=sequence,
+                deltas=deltas,
+            )
+            self.tail_length += 1
         published = self.publisher.publish_stream(
             self.conversation_id,
             self.execution_id,
@@ -192,6 +287,7 @@ class NotebookStreamBuffer:
                 "items": [],
             },
         )
+        self.tail_length = 0
         published = self.publisher.publish_stream(
             self.conversation_id,
             self.execution_id,
@@ -223,6 +319,7 @@ class NotebookStreamBuffer:
         self.last_flush_at = None
         self.last_active_check_at = None
         self.stream_revision = 0
+        self.tail_length = None
 
     def _active_check_due(self, now: float) -> bool:
         """Whether the throttled durable execution-state probe should run."""
@@ -236,6 +333,13 @@ class NotebookStreamBuffer:
         self.last_active_check_at = now
         return True
 
+    @staticmethod
+    def _compact_item(item: dict) -> dict:
+        """Snapshot form of an item; folds its parts into one string."""
+        text = "".join(item["parts"])
+        item["parts"] = [text]
+        return {"id": item["id"], "type": item["type"], "text": text, "at": item["at"]}
+
     def _stream_id(self) -> str:
         stream_id = f"{self.execution_id}:{self.iteration}"
         if self.stream_revision:
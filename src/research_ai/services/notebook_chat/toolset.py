@@ -8,6 +8,7 @@ a terminal submit tool from another flow must not ride along.
 """
 
 import logging
+import threading
 
 from research_ai.services.agent import Tool, Toolset
 from research_ai.services.researcher_profile.openalex_tools import SUBMIT_PROFILE
@@ -49,6 +50,8 @@ class NotebookWebSearchToolset:
         self._client = client or BraveSearch()
         self.max_searches = max_searches
         self._searches_used = 0
+        # Searches from one turn run concurrently; the budget is shared.
+        self._budget_lock = threading.Lock()
 
     def build_tools(self) -> list[Tool]:
         return [
@@ -63,6 +66,7 @@ class NotebookWebSearchToolset:
                 ),
                 input_schema=_WEB_SEARCH_INPUT_SCHEMA,
                 handler=self._web_search,
+                parallel_safe=True,
             )
         ]
 
@@ -77,14 +81,15 @@ class NotebookWebSearchToolset:
                     "from the literature tools and what you already know."
                 )
             }
-        if self._searches_used >= self.max_searches:
-            return {
-                "error": (
-                    f"Web search budget exhausted ({self.max_searches} "
-                    "searches). Work from what you have already found."
-                )
-            }
-        self._searches_used += 1
+        with self._budget_lock:
+            if self._searches_used >= self.max_searches:
+                return {
+                    "error": (
+                        f"Web search budget exhausted ({self.max_searches} "
+                        "searches). Work from what you have already found."
+                    )
+                }
+            self._searches_used += 1
         results = self._client.search(query, count=_MAX_RESULTS)
         return {"query": query, "results": results}
 
@@ -164,6 +164,7 @@ class ProposalVerificationToolset:
                 ),
                 input_schema=_SEARCH_WORKS_INPUT_SCHEMA,
                 handler=self.search_works,
+                parallel_safe=True,
             ),
             Tool(
                 name="verify_citations",
@@ -176,6 +177,7 @@ class ProposalVerificationToolset:
                 ),
                 input_schema=_CITATIONS_INPUT_SCHEMA,
                 handler=self.verify_citations,
+                parallel_safe=True,
             ),
         ]
 
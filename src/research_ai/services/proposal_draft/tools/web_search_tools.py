@@ -22,6 +22,7 @@ rather than breaks.
 """
 
 import logging
+import threading
 
 from research_ai.services.agent import Tool, Toolset
 from utils.brave_search import BraveSearch
@@ -70,6 +71,8 @@ class ProposalWebSearchToolset:
         self.provenance = provenance if provenance is not None else set()
         self.max_searches = max_searches
         self._searches_used = 0
+        # Searches from one turn run concurrently; the budget is shared.
+        self._budget_lock = threading.Lock()
 
     # -- tool construction ------------------------------------------------
 
@@ -89,6 +92,7 @@ class ProposalWebSearchToolset:
                 ),
                 input_schema=_INPUT_SCHEMA,
                 handler=self._web_search,
+                parallel_safe=True,
             )
         ]
 
@@ -109,14 +113,15 @@ class ProposalWebSearchToolset:
                     "proposal in the profile and OpenAlex tools instead."
                 )
             }
-        if self._searches_used >= self.max_searches:
-            return {
-                "error": (
-                    f"Web search budget exhausted ({self.max_searches} searches). "
-                    "Work from what you have already found."
-                )
-            }
-        self._searches_used += 1
+        with self._budget_lock:
+            if self._searches_used >= self.max_searches:
+                return {
+                    "error": (
+                        f"Web search budget exhausted ({self.max_searches} "
+                        "searches). Work from what you have already found."
+                    )
+                }
+            self._searches_used += 1
 
         results = self._client.search(query, count=_MAX_RESULTS)
         for result in results:
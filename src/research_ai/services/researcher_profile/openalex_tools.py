@@ -16,6 +16,7 @@ final profile from these records so a hallucinated citation cannot survive.
 """
 
 import logging
+import threading
 from collections.abc import Callable
 
 from research_ai.services.agent import Tool, Toolset
@@ -97,6 +98,8 @@ class OpenAlexToolset:
         self._pdf_text_fetcher = pdf_text_fetcher or self._fetch_pdf_text
         self._max_fulltext_fetches = max_fulltext_fetches
         self._fulltext_fetches_used = 0
+        # The read tools run concurrently within a turn; the budget is shared.
+        self._fulltext_budget_lock = threading.Lock()
         # Full ground-truth work record for every work handed to the model,
         # keyed by source_url. The profile is materialized from these rather
         # than from the model's (often mangled) copy of each work.
@@ -127,6 +130,7 @@ class OpenAlexToolset:
                     "required": ["query"],
                 },
                 handler=self._search_institutions,
+                parallel_safe=True,
             ),
             Tool(
                 name="search_authors",
@@ -154,6 +158,7 @@ class OpenAlexToolset:
                     "required": ["name"],
                 },
                 handler=self._search_authors,
+                parallel_safe=True,
             ),
             Tool(
                 name="get_author",
@@ -175,6 +180,7 @@ class OpenAlexToolset:
                     },
                 },
                 handler=self._get_author,
+                parallel_safe=True,
             ),
             Tool(
                 name="get_author_works",
@@ -204,6 +210,7 @@ class OpenAlexToolset:
                     "required": ["openalex_author_id"],
                 },
                 handler=self._get_author_works,
+                parallel_safe=True,
             ),
             Tool(
                 name=GET_WORK_FULLTEXT,
@@ -230,6 +237,7 @@ class OpenAlexToolset:
                     "required": ["source_url"],
                 },
                 handler=self._get_work_fulltext,
+                parallel_safe=True,
             ),
             Tool(
                 name=SUBMIT_PROFILE,
@@ -332,15 +340,16 @@ class OpenAlexToolset:
                     "get_author_works."
                 )
             }
-        if self._fulltext_fetches_used >= self._max_fulltext_fetches:
-            return {
-                "error": (
-                    "Full-text read budget exhausted "
-                    f"({self._max_fulltext_fetches} reads). Work from the "
-                    "abstracts already returned."
-                )
-            }
-        self._fulltext_fetches_used += 1
+        with self._fulltext_budget_lock:
+            if self._fulltext_fetches_used >= self._max_fulltext_fetches:
+                return {
+                    "error": (
+                        "Full-text read budget exhausted "
+                        f"({self._max_fulltext_fetches} reads). Work from the "
+                        "abstracts already returned."
+                    )
+                }
+            self._fulltext_fetches_used += 1
 
         text = self._pdf_text_fetcher(str(work.get("pdf_url") or "").strip())
         content_type = "pdf"
@@ -229,6 +229,89 @@ class AgentLoopTests(SimpleTestCase):
         self.assertEqual(result.stop_reason, "stop_tool")
         self.assertEqual(result.iterations, 2)
 
+    def test_parallel_safe_calls_are_checked_for_cancellation_per_call(self):
+        # Arrange: the run is active for its provider request and first tool
+        # call, then is cancelled before the second of the turn's lookups.
+        class CancellingRecorder(RecordingRecorder):
+            def __init__(self):
+                super().__init__()
+                self.activity_checks = 0
+
+            def is_active(self):
+                self.activity_checks += 1
+                return self.activity_checks <= 2
+
+        seen = []
+
+        def lookup(input):
+            seen.append(input["q"])
+            return {"ok": True}
+
+        toolset = Toolset(
+            [Tool("lookup", "lookup", {"type": "object"}, lookup, parallel_safe=True)]
+        )
+        provider = FakeProvider(
+            [
+                AssistantTurn(
+                    text_blocks=[],
+                    tool_calls=[
+                        ToolUseBlock(id=f"t{q}", name="lookup", input={"q": q})
+                        for q in ("a", "b", "c")
+                    ],
+                    stop_reason=StopReason.TOOL_USE,
+                )
+            ]
+        )
+        recorder = CancellingRecorder()
+        agent = _build_agent(provider, toolset, recorder=recorder)
+
+        # Act
+        with self.assertRaises(InterruptedError):
+            agent.run("research")
+
+        # Assert
+        self.assertEqual(seen, ["a"])
+        self.assertEqual(recorder.activity_checks, 3)
+
+    def test_parallel_tool_results_keep_call_order(self):
+        # Arrange
+        toolset = Toolset(
+            [
+                Tool(
+                    "lookup",
+                    "lookup",
+                    {"type": "object"},
+                    lambda input: {"q": input["q"]},
+                    parallel_safe=True,
+                )
+            ]
+        )
+        provider = FakeProvider(
+            [
+                AssistantTurn(
+                    text_blocks=[],
+                    tool_calls=[
+                        ToolUseBlock(id=f"t{q}", name="lookup", input={"q": q})
+                        for q in ("a", "b", "c")
+                    ],
+                    stop_reason=StopReason.TOOL_USE,
+                ),
+                _build_text_turn("done"),
+            ]
+        )
+        agent = _build_agent(provider, toolset)
+
+        # Act
+        result = agent.run("research")
+
+        # Assert
+        results = result.messages[2].content
+        self.assertEqual([block.tool_use_id for block in results], ["ta", "tb", "tc"])
+        self.assertEqual(
+            [block.content for block in results],
+            [{"q": "a"}, {"q": "b"}, {"q": "c"}],
+        )
+
     def test_thinking_blocks_lead_the_replayed_assistant_turn(self):
         # Arrange: a turn that thinks, narrates, then calls a tool.
         thinking = ThinkingBlock(data={"type": "thinking", "signature": "sig"})
@@ -1,11 +1,13 @@
 """Unit tests for the Tool / Toolset dispatch contract."""
 
+import threading
+
 from django.test import SimpleTestCase
 
 from research_ai.services.agent.tools import MAX_TOOL_RESULT_BYTES, Tool, Toolset
 
 
-def _build_ok_tool(name, *, is_terminal=False):
+def _build_ok_tool(name, *, is_terminal=False, parallel_safe=False):
     """Build a well-behaved Tool whose handler echoes its input."""
     return Tool(
         name=name,
@@ -13,6 +15,7 @@ def _build_ok_tool(name, *, is_terminal=False):
         input_schema={"type": "object"},
         handler=lambda input: {"echo": input},
         is_terminal=is_terminal,
+        parallel_safe=parallel_safe,
     )
 
 
@@ -190,3 +193,86 @@ class ToolsetDispatchTests(SimpleTestCase):
         self.assertEqual(toolset.names, ["search"])
         self.assertIs(toolset.get("search"), search)
         self.assertIsNone(toolset.get("missing"))
+
+
+class ToolsetDispatchManyTests(SimpleTestCase):
+    def test_parallel_safe_calls_run_together_and_keep_call_order(self):
+        # Arrange: each call waits for the other, so they only both succeed if
+        # they run at the same time; the first call finishes last.
+        barrier = threading.Barrier(2, timeout=5)
+        finished = []
+
+        def lookup(input):
+            barrier.wait()
+            if input["q"] == "first":
+                barrier.wait()
+            finished.append(input["q"])
+            if input["q"] == "second":
+                barrier.wait()
+            return {"q": input["q"]}
+
+        toolset = Toolset(
+            [Tool("lookup", "lookup", {"type": "object"}, lookup, parallel_safe=True)]
+        )
+
+        # Act
+        results = toolset.dispatch_many(
+            [("lookup", {"q": "first"}), ("lookup", {"q": "second"})]
+        )
+
+        # Assert
+        self.assertEqual(finished, ["second", "first"])
+        self.assertEqual(results, [({"q": "first"}, False), ({"q": "second"}, False)])
+
+    def test_other_and_terminal_calls_run_alone_in_call_order(self):
+        # Arrange
+        order = []
+
+        def record(name, **kwargs):
+            def handler(input):
+                order.append(name)
+                return {"name": name}
+
+            return Tool(name, name, {"type": "object"}, handler, **kwargs)
+
+        toolset = Toolset(
+            [
+                record("lookup", parallel_safe=True),
+                record("edit"),
+                record("submit", is_terminal=True, parallel_safe=True),
+            ]
+        )
+
+        # Act
+        results = toolset.dispatch_many(
+            [("edit", {}), ("lookup", {}), ("submit", {}), ("edit", {})]
+        )
+
+        # Assert
+        self.assertEqual(order, ["edit", "lookup", "submit", "edit"])
+        self.assertEqual([stop for _, stop in results], [False, False, True, False])
+
+    def test_before_call_raising_stops_the_remaining_calls(self):
+        # Arrange
+        seen = []
+
+        def lookup(input):
+            seen.append(input["q"])
+            return {"q": input["q"]}
+
+        def before_call(index):
+            if index == 1:
+                raise InterruptedError("cancelled")
+
+        toolset = Toolset(
+            [Tool("lookup", "lookup", {"type": "object"}, lookup, parallel_safe=True)],
+            max_parallel=2,
+        )
+
+        # Act & Assert
+        with self.assertRaises(InterruptedError):
+            toolset.dispatch_many(
+                [("lookup", {"q": q}) for q in ("a", "b", "c")],
+                before_call=before_call,
+            )
+        self.assertEqual(seen, ["a"])
@@ -9,6 +9,7 @@ from research_ai.services.agent.types import (
 )
 from research_ai.services.notebook_chat.streaming import (
     MAX_STREAM_THINKING_CHARS,
+    STREAM_COMPACT_DELTAS,
     ExecutionStreamStore,
     NotebookStreamBuffer,
 )
@@ -19,15 +20,16 @@ class FakeCache:
         self.values = {}
         self.set_calls = []
 
-    def get(self, key):
-        return self.values.get(key)
+    def get_many(self, keys):
+        return {key: self.values[key] for key in keys if key in self.values}
 
-    def set(self, key, value, timeout=None):
-        self.set_calls.append((key, value, timeout))
-        self.values[key] = value
+    def set_many(self, data, timeout=None):
+        self.set_calls.append((data, timeout))
+        self.values.update(data)
 
-    def delete(self, key):
-        self.values.pop(key, None)
+    def delete_many(self, keys):
+        for key in keys:
+            self.values.pop(key, None)
 
 
 class FakePublisher:
@@ -103,6 +105,64 @@ class NotebookStreamBufferTests(SimpleTestCase):
         self.assertEqual(self.store.get(9)["sequence"], 2)
         self.assertEqual(len(self.cache.set_calls), 2)
 
+    def test_flushes_append_deltas_instead_of_rewriting_the_snapshot(self):
+        # Arrange
+        self.buffer.append(1, TextStreamDelta(block_index=0, text="a" * 600))
+        self.now += 1
+
+        # Act
+        self.buffer.append(1, TextStreamDelta(block_index=0, text="b"))
+
+        # Assert: the second write holds only its own delta and the head.
+        (written, _) = self.cache.set_calls[-1]
+        self.assertEqual(
+            sorted(written),
+            [
+                "research_ai:notebook_chat:stream:9:delta:9:1:2",
+                "research_ai:notebook_chat:stream:9:head",
+            ],
+        )
+        self.assertEqual(
+            written["research_ai:notebook_chat:stream:9:delta:9:1:2"][0]["delta"], "b"
+        )
+        snapshot = self.store.get(9)
+        self.assertEqual(snapshot["sequence"], 2)
+        self.assertEqual(snapshot["items"][0]["text"], "a" * 600 + "b")
+
+    def test_tail_is_compacted_into_a_new_base_snapshot(self):
+        # Arrange
+        self.buffer.append(1, TextStreamDelta(block_index=0, text="x"))
+        base_key = "research_ai:notebook_chat:stream:9"
+
+        # Act
+        for _ in range(STREAM_COMPACT_DELTAS + 1):
+            self.now += 1
+            self.buffer.append(1, TextStreamDelta(block_index=1, text="y"))
+
+        # Assert
+        base = self.cache.values[base_key]
+        self.assertEqual(base["sequence"], STREAM_COMPACT_DELTAS + 2)
+        self.assertEqual(
+            [item["text"] for item in base["items"]],
+            ["x", "y" * (STREAM_COMPACT_DELTAS + 1)],
+        )
+        self.assertEqual(self.store.get(9), base)
+
+    def test_reader_stops_at_a_missing_delta(self):
+        # Arrange
+        self.buffer.append(1, TextStreamDelta(block_index=0, text="a"))
+        for text in ("b", "c"):
+            self.now += 1
+            self.buffer.append(1, TextStreamDelta(block_index=0, text=text))
+        del self.cache.values["research_ai:notebook_chat:stream:9:delta:9:1:2"]
+
+        # Act
+        snapshot = self.store.get(9)
+
+        # Assert
+        self.assertEqual(snapshot["sequence"], 1)
+        self.assertEqual(snapshot["items"][0]["text"], "a")
+
     def test_thinking_preview_is_bounded_and_opaque_state_is_ignored(self):
         # Arrange
         oversized = "x" * (MAX_STREAM_THINKING_CHARS + 10)
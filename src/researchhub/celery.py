@@ -43,7 +43,23 @@ app.conf.beat_schedule = {
     # Feed
     "feed-refresh-hot-scores": {
         "task": "feed.tasks.refresh_feed_hot_scores",
-        "schedule": crontab(hour="*/8", minute=20),
+        "schedule": crontab(hour=4, minute=20),
+        "options": {
+            "priority": 1,
+            "queue": QUEUE_CACHES,
+        },
+    },
+    "feed-refresh-hot-scores-decay": {
+        "task": "feed.tasks.refresh_feed_hot_scores_decay",
+        "schedule": crontab(minute="*/10"),
+        "options": {
+            "priority": 1,
+            "queue": QUEUE_CACHES,
+        },
+    },
+    "feed-refresh-stale-hot-scores": {
+        "task": "feed.tasks.refresh_stale_feed_hot_scores",
+        "schedule": crontab(minute="*/5"),
         "options": {
             "priority": 1,
             "queue": QUEUE_CACHES,
@@ -83,6 +99,14 @@ app.conf.beat_schedule = {
             "queue": QUEUE_PURCHASES,
         },
     },
+    "purchase_reconcile-balance-summaries": {
+        "task": "purchase.tasks.reconcile_balance_summaries_task",
+        "schedule": crontab(minute=15),  # every hour
+        "options": {
+            "priority": 3,
+            "queue": QUEUE_PURCHASES,
+        },
+    },
     "purchase_send-monthly-preregistration-update-reminders": {
         "task": "purchase.tasks.send_monthly_preregistration_update_reminders",
         "schedule": crontab(day_of_month=1, hour=16, minute=0),
@@ -247,4 +271,22 @@ app.conf.beat_schedule = {
             "queue": QUEUE_X_METRICS,
         },
     },
+    # Personalize
+    "personalize-drain-sync-queue": {
+        "task": "personalize.tasks.drain_personalize_sync_queue_task",
+        "schedule": crontab(minute="*"),
+        "options": {
+            "priority": 3,
+            "queue": QUEUE_PAPER_MISC,
+        },
+    },
+    # Notifications
+    "notification_reconcile-unread-counts": {
+        "task": "notification.tasks.reconcile_unread_notification_counts",
+        "schedule": crontab(hour=4, minute=0),  # Run daily at 4:00 AM UTC
+        "options": {
+            "priority": 3,
+            "queue": QUEUE_NOTIFICATION,
+        },
+    },
 }
@@ -963,6 +963,12 @@ RESEARCHHUB_JOURNAL_ID = os.environ.get(
     "RESEARCHHUB_JOURNAL_ID", keys.RESEARCHHUB_JOURNAL_ID
 )
 
+# Balance reads from UserBalanceSummary instead of the Balance ledger. Enable
+# once the summaries are backfilled and reconcile reports no drift.
+BALANCE_SUMMARY_READS_ENABLED = (
+    os.environ.get("BALANCE_SUMMARY_READS_ENABLED", "false").lower() == "true"
+)
+
 # Paper ingestion from prerint servers
 PAPER_INGESTION_ENABLED = (
     os.environ.get("PAPER_INGESTION_ENABLED", "false").lower() == "true"
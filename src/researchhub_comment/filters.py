@@ -99,7 +99,10 @@ class RHCommentFilter(filters.FilterSet):
         model = RhCommentModel
         fields = ("ordering",)
 
-    def __init__(self, *args, request=None, **kwargs):
+    def __init__(self, *args, request=None, tree=False, **kwargs):
+        # `tree` marks a queryset holding the replies of several comments, see
+        # `researchhub_comment.services.comment_tree_service`
+        self._is_tree = tree
         # Privacy type should always be set, even if not passed in
         # This will ensure private/organization comments will be hidden
         if request.method == "GET":
@@ -147,6 +150,8 @@ class RHCommentFilter(filters.FilterSet):
         # This checks whether we are filtering on the comment's children
         # because we don't want the related filters to be called
         # on the base comments, only children
+        if self._is_tree:
+            return True
         instance_class_name = self.queryset.__class__.__name__
         if instance_class_name == "RelatedManager":
             return True
@@ -264,7 +269,8 @@ class RHCommentFilter(filters.FilterSet):
         return qs
 
     def filter_child_count(self, qs, name, value):
-        if not self._is_on_child_queryset():
+        # Replies of several comments are limited per parent by the tree loader
+        if not self._is_on_child_queryset() or self._is_tree:
             return qs
         offset = int(self.data.get("child_offset", 0))
         count = offset + value
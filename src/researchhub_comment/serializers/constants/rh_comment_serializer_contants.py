@@ -23,3 +23,7 @@ RH_COMMENT_READ_ONLY_FIELDS = [
     "is_edited",
     "updated_date",
 ]
+
+# Levels of comments rendered by `DynamicRhCommentSerializer`, including the
+# comment itself, when `rhc_dcs_get_children_max_depth` is not set
+RH_COMMENT_CHILDREN_MAX_DEPTH = 3
@@ -11,6 +11,7 @@ from purchase.serializers import DynamicPurchaseSerializer
 from researchhub.serializers import DynamicModelFieldSerializer
 from researchhub_comment.models import RhCommentModel
 from researchhub_comment.serializers.constants.rh_comment_serializer_contants import (
+    RH_COMMENT_CHILDREN_MAX_DEPTH,
     RH_COMMENT_FIELDS,
     RH_COMMENT_READ_ONLY_FIELDS,
 )
@@ -119,7 +120,9 @@ class DynamicRhCommentSerializer(
         _filter_fields = _context_fields.get("_filter_fields", {})
         _select_related_fields = _context_fields.get("_select_related_fields", [])
         _prefetch_related_fields = _context_fields.get("_prefetch_related_fields", [])
-        max_depth = context.get("rhc_dcs_get_children_max_depth", 3)
+        max_depth = context.get(
+            "rhc_dcs_get_children_max_depth", RH_COMMENT_CHILDREN_MAX_DEPTH
+        )
         depth_key = f"rhc_dcs_get_children_{comment.thread.id}_depth"
         relative_depth_key = f"relative_depth_{comment.id}"
         depth_context = context.get(depth_key, None)
@@ -138,15 +141,22 @@ class DynamicRhCommentSerializer(
         if depth_context[relative_depth_key] >= max_depth:
             return []
 
-        if view:
-            qs = view.filter_queryset(comment.children)
+        # Set by views that load the whole reply tree up front,
+        # see `researchhub_comment.services.comment_tree_service`
+        children_by_parent = context.get("rhc_dcs_children_by_parent", {})
+        if comment.id in children_by_parent:
+            children = children_by_parent[comment.id]
         else:
-            qs = comment.children.filter(**_filter_fields)
+            if view:
+                qs = view.filter_queryset(comment.children)
+            else:
+                qs = comment.children.filter(**_filter_fields)
+            children = qs.select_related(*_select_related_fields).prefetch_related(
+                *_prefetch_related_fields
+            )
 
         serializer = DynamicRhCommentSerializer(
-            qs.select_related(*_select_related_fields).prefetch_related(
-                *_prefetch_related_fields
-            ),
+            children,
             many=True,
             context=context,
             **_context_fields,
@@ -202,6 +212,11 @@ class DynamicRhCommentSerializer(
         return None
 
     def get_user_vote(self, comment):
+        # Votes of the request user, loaded in bulk by the view
+        user_votes = self.context.get("rhc_dcs_user_votes", {})
+        if comment.id in user_votes:
+            return user_votes[comment.id]
+
         vote = None
         user = get_user_from_request(self.context)
         try:
@@ -0,0 +1,77 @@
+"""
+Bulk loading of comment reply trees.
+
+`DynamicRhCommentSerializer.get_children` queries the children of every comment
+it renders. For a page of comments, `get_comment_replies` instead fetches all
+replies down to the rendered depth with a single recursive query, so related
+rows can be prefetched once for the whole tree, and `build_comment_tree`
+groups them per parent. The result is handed to the serializer through the
+`rhc_dcs_children_by_parent` context key.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable
+
+from django.db import connection
+from django.db.models import QuerySet
+from django.db.models.expressions import RawSQL
+
+from researchhub_comment.models import RhCommentModel
+
+_REPLY_IDS_SQL = """
+WITH RECURSIVE replies (id, depth) AS (
+    SELECT id, 1 FROM {table}
+    WHERE parent_id = ANY(%s) AND NOT is_removed
+    UNION ALL
+    SELECT child.id, replies.depth + 1 FROM {table} child
+    JOIN replies ON child.parent_id = replies.id
+    WHERE replies.depth < %s AND NOT child.is_removed
+)
+SELECT id FROM replies
+"""
+
+
+def get_comment_replies(comment_ids: Iterable[int], depth: int) -> QuerySet:
+    """
+    Replies of `comment_ids` down to `depth` levels below them.
+
+    Replies of removed comments are left out, as they are when reading
+    `comment.children`.
+    """
+    table = connection.ops.quote_name(RhCommentModel._meta.db_table)
+    reply_ids = RawSQL(_REPLY_IDS_SQL.format(table=table), (list(comment_ids), depth))
+    return RhCommentModel.objects.filter(id__in=reply_ids)
+
+
+def build_comment_tree(
+    comments: Iterable[RhCommentModel],
+    replies: Iterable[RhCommentModel],
+    depth: int,
+    child_count: int | None = None,
+    child_offset: int = 0,
+) -> dict[int, list[RhCommentModel]]:
+    """
+    Group `replies` under their parents, keeping their order.
+
+    Returns the children of `comments` and of every reply above the last of
+    `depth` levels, keyed by comment ID. When `child_count` is given, each
+    comment keeps `child_count` children starting at `child_offset`, as the
+    `child_count` filter does for the children of a single comment.
+    """
+    replies_by_parent = defaultdict(list)
+    for reply in replies:
+        replies_by_parent[reply.parent_id].append(reply)
+
+    children_by_parent = {}
+    level = list(comments)
+    for _ in range(depth):
+        next_level = []
+        for comment in level:
+            children = replies_by_parent.get(comment.id, [])
+            if child_count is not None:
+                children = children[child_offset : child_offset + int(child_count)]
+            children_by_parent[comment.id] = children
+            next_level.extend(children)
+        level = next_level
+
+    return children_by_parent
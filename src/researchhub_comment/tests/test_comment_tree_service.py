@@ -0,0 +1,39 @@
+from django.test import SimpleTestCase
+
+from researchhub_comment.models import RhCommentModel
+from researchhub_comment.services.comment_tree_service import build_comment_tree
+
+
+class BuildCommentTreeTests(SimpleTestCase):
+    def setUp(self):
+        self.root = RhCommentModel(id=1)
+        self.replies = [
+            RhCommentModel(id=2, parent_id=1),
+            RhCommentModel(id=3, parent_id=1),
+            RhCommentModel(id=4, parent_id=2),
+            RhCommentModel(id=5, parent_id=4),
+            # Parent filtered out of the replies
+            RhCommentModel(id=6, parent_id=99),
+        ]
+
+    def _ids(self, tree):
+        return {
+            comment_id: [child.id for child in children]
+            for comment_id, children in tree.items()
+        }
+
+    def test_groups_replies_down_to_depth(self):
+        # Act
+        tree = build_comment_tree([self.root], self.replies, depth=2)
+
+        # Assert
+        self.assertEqual(self._ids(tree), {1: [2, 3], 2: [4], 3: []})
+
+    def test_limits_children_per_parent(self):
+        # Act
+        tree = build_comment_tree(
+            [self.root], self.replies, depth=2, child_count=1, child_offset=1
+        )
+
+        # Assert
+        self.assertEqual(self._ids(tree), {1: [3], 3: []})
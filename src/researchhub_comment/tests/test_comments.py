@@ -4,8 +4,10 @@ from unittest.mock import patch
 
 from django.contrib.contenttypes.models import ContentType
 from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APIClient, APITestCase, APITransactionTestCase
 
+from discussion.models import Vote
 from hub.models import Hub
 from notification.models import Notification
 from paper.tests.helpers import create_paper
@@ -491,6 +493,53 @@ class CommentViewTests(APITestCase):
         )
         self.assertEqual(comment_detail_res.status_code, 404)
 
+    def test_list_loads_reply_tree_up_front(self):
+        """
+        Test that replies are rendered down to the depth limit without
+        querying the children of each comment separately.
+        """
+        parent = self._create_paper_comment(self.paper.id, self.user_1)
+        child = self._create_paper_comment(
+            self.paper.id, self.user_2, parent_id=parent.data["id"]
+        )
+        grandchild = self._create_paper_comment(
+            self.paper.id, self.user_3, parent_id=child.data["id"]
+        )
+        self._create_paper_comment(
+            self.paper.id, self.user_4, parent_id=grandchild.data["id"]
+        )
+        Vote.objects.create(
+            created_by=self.user_1,
+            item=RhCommentModel.objects.get(id=grandchild.data["id"]),
+            vote_type=Vote.UPVOTE,
+        )
+
+        self.client.force_authenticate(self.user_1)
+        with CaptureQueriesContext(connection) as queries:
+            comments_res = self.client.get(f"/api/paper/{self.paper.id}/comments/")
+
+        self.assertEqual(comments_res.status_code, 200)
+        top_comment = comments_res.data["results"][0]
+        self.assertEqual(top_comment["id"], parent.data["id"])
+        self.assertEqual([c["id"] for c in top_comment["children"]], [child.data["id"]])
+        child_comment = top_comment["children"][0]
+        self.assertIsNone(child_comment["user_vote"])
+        self.assertEqual(
+            [c["id"] for c in child_comment["children"]], [grandchild.data["id"]]
+        )
+        grandchild_comment = child_comment["children"][0]
+        self.assertEqual(grandchild_comment["user_vote"]["vote_type"], Vote.UPVOTE)
+        # The depth limit stops at the grandchild
+        self.assertEqual(grandchild_comment["children_count"], 1)
+        self.assertEqual(grandchild_comment["children"], [])
+
+        per_comment_children_queries = [
+            query["sql"]
+            for query in queries.captured_queries
+            if '"researchhub_comment_rhcommentmodel"."parent_id" = ' in query["sql"]
+        ]
+        self.assertEqual(per_comment_children_queries, [])
+
     def test_nested_censored_comments_excluded_from_hierarchy(self):
         """
         Test that censored comments are excluded from the comment hierarchy.
@@ -18,6 +18,7 @@ from rest_framework.viewsets import ModelViewSet
 from analytics.amplitude import track_event
 from discussion.permissions import EditorCensorDiscussion
 from discussion.views import ReactionViewActionMixin
+from feed.user_votes import get_user_votes
 from reputation.models import Contribution
 from reputation.permissions import IsFoundationUser
 from reputation.tasks import create_contribution, find_qualified_users_and_notify
@@ -50,6 +51,13 @@ from researchhub_comment.serializers import (
     RhCommentSerializer,
     RhCommentThreadSerializer,
 )
+from researchhub_comment.serializers.constants.rh_comment_serializer_contants import (
+    RH_COMMENT_CHILDREN_MAX_DEPTH,
+)
+from researchhub_comment.services.comment_tree_service import (
+    build_comment_tree,
+    get_comment_replies,
+)
 from researchhub_comment.tasks import celery_create_mention_notification
 from researchhub_document.related_models.constants.document_type import (
     FILTER_BOUNTY_OPEN,
@@ -244,6 +252,7 @@ class RhCommentViewSet(ReactionViewActionMixin, ModelViewSet):
                     "bounties__solutions",
                     "bounties__solutions__created_by",
                     "bounties__solutions__created_by__author_profile",
+                    "bounty_solution",
                     "reviews",
                     "thread__permissions",
                     "thread__content_type",
@@ -321,6 +330,55 @@ class RhCommentViewSet(ReactionViewActionMixin, ModelViewSet):
         }
         return context
 
+    def _get_comment_tree_context(self, comments, context):
+        """
+        Load the replies that `DynamicRhCommentSerializer` renders below
+        `comments`, and the request user's votes on all of them, in bulk
+        instead of per comment.
+        """
+        request = self.request
+        comments = list(comments)
+        depth = (
+            context.get("rhc_dcs_get_children_max_depth", RH_COMMENT_CHILDREN_MAX_DEPTH)
+            - 1
+        )
+        if not comments or depth < 1:
+            return context
+
+        # Replies are filtered like `view.filter_queryset(comment.children)`
+        filterset = self.filterset_class(
+            data=request.query_params,
+            queryset=get_comment_replies([comment.id for comment in comments], depth),
+            request=request,
+            tree=True,
+        )
+        children_fields = context.get("rhc_dcs_get_children", {})
+        replies = filterset.qs.select_related(
+            *children_fields.get("_select_related_fields", [])
+        ).prefetch_related(*children_fields.get("_prefetch_related_fields", []))
+        children_by_parent = build_comment_tree(
+            comments,
+            replies,
+            depth,
+            child_count=filterset.form.cleaned_data.get("child_count"),
+            child_offset=int(request.query_params.get("child_offset", 0)),
+        )
+        context = {**context, "rhc_dcs_children_by_parent": children_by_parent}
+
+        user = request.user
+        if user.is_authenticated:
+            comment_ids = {comment.id for comment in comments}
+            for children in children_by_parent.values():
+                comment_ids.update(child.id for child in children)
+            content_type = ContentType.objects.get_for_model(RhCommentModel)
+            votes = get_user_votes(user.id, {content_type.id: list(comment_ids)})
+            context["rhc_dcs_user_votes"] = {
+                comment_id: votes.get((content_type.id, comment_id))
+                for comment_id in comment_ids
+            }
+
+        return context
+
     def _create_rh_comment(self, request, *args, **kwargs):
         data = request.data
         user = request.user
@@ -509,6 +567,7 @@ class RhCommentViewSet(ReactionViewActionMixin, ModelViewSet):
             "bounties__solutions",
             "bounties__solutions__created_by",
             "bounties__solutions__created_by__author_profile",
+            "bounty_solution",
             "reviews",
             "thread__permissions",
             "thread__content_type",
@@ -525,6 +584,7 @@ class RhCommentViewSet(ReactionViewActionMixin, ModelViewSet):
         page = self.paginate_queryset(queryset)
         context = self._get_retrieve_context()
         if page is not None:
+            context = self._get_comment_tree_context(page, context)
             serializer = self.get_serializer(
                 page,
                 many=True,
@@ -565,7 +625,9 @@ class RhCommentViewSet(ReactionViewActionMixin, ModelViewSet):
 
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
-        context = self._get_retrieve_context()
+        context = self._get_comment_tree_context(
+            [instance], self._get_retrieve_context()
+        )
         serializer = self.get_serializer(
             instance,
             context=context,
@@ -2,10 +2,12 @@ import logging
 from collections.abc import Iterable, Iterator
 from itertools import islice
 
+from institution.models import Institution
 from paper.models import Paper
 from researchhub.celery import QUEUE_ELASTIC_SEARCH, app
 from researchhub_document.models import ResearchhubPost
 from search.documents.base import BaseDocument
+from search.documents.institution import InstitutionDocument
 from search.documents.paper import PaperDocument
 from search.documents.post import PostDocument
 from search.documents.user import UserDocument
@@ -49,6 +51,45 @@ def update_user_related_documents(user_id: int, batch_size: int = 500) -> None:
     )
 
 
+@app.task(queue=QUEUE_ELASTIC_SEARCH, ignore_result=True)
+def update_institution_documents(
+    institution_ids: list[int], batch_size: int = 500
+) -> None:
+    """
+    Update the search documents of the given institutions.
+
+    Used after bulk writes, which don't send the post_save signals that
+    normally keep the index up to date.
+    """
+    _update_document(
+        InstitutionDocument(),
+        Institution.objects.filter(id__in=institution_ids).iterator(
+            chunk_size=batch_size
+        ),
+        batch_size=batch_size,
+    )
+
+
+@app.task(queue=QUEUE_ELASTIC_SEARCH, ignore_result=True)
+def update_author_related_documents(
+    author_ids: list[int], batch_size: int = 500
+) -> None:
+    """
+    Update the search documents of users whose author profile is one of the
+    given authors.
+
+    Used after bulk writes, which don't send the post_save signals that
+    normally keep the index up to date.
+    """
+    _update_document(
+        UserDocument(),
+        User.objects.filter(author_profile__id__in=author_ids)
+        .select_related("author_profile")
+        .iterator(chunk_size=batch_size),
+        batch_size=batch_size,
+    )
+
+
 def _iter_batches(
     iterable: Iterable[object], batch_size: int
 ) -> Iterator[list[object]]:
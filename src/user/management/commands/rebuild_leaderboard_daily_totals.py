@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from user.related_models.leaderboard_model import LeaderboardDailyTotal
+from user.services.leaderboard_service import rebuild_daily_totals
+from user.tasks.leaderboard_tasks import refresh_leaderboard_task
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild LeaderboardDailyTotal from FundingActivity rows and refresh the "
+        "Leaderboard table. Run after backfills that bypass model signals."
+    )
+
+    def handle(self, *args, **options):
+        rebuild_daily_totals()
+        self.stdout.write(
+            f"Rebuilt {LeaderboardDailyTotal.objects.count()} daily totals."
+        )
+
+        refresh_leaderboard_task()
+        self.stdout.write(self.style.SUCCESS("Refreshed leaderboards."))
@@ -0,0 +1,75 @@
+# Generated by Django 5.2
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("user", "0150_author_user_soft_delete_fields"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LeaderboardDailyTotal",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "leaderboard_type",
+                    models.CharField(
+                        choices=[("FUNDER", "Funder"), ("EARNER", "Earner")],
+                        help_text="Type of leaderboard (funder or earner)",
+                        max_length=16,
+                    ),
+                ),
+                (
+                    "day",
+                    models.DateField(
+                        help_text="Day of the funding activities in this total"
+                    ),
+                ),
+                (
+                    "total_amount",
+                    models.DecimalField(
+                        decimal_places=8,
+                        help_text="Total RSC amount for the day",
+                        max_digits=19,
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        help_text="The user this daily total belongs to",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="leaderboard_daily_totals",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Leaderboard Daily Total",
+                "verbose_name_plural": "Leaderboard Daily Totals",
+                "indexes": [
+                    models.Index(
+                        fields=["leaderboard_type", "day"],
+                        name="lb_daily_type_day_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "leaderboard_type", "day"),
+                        name="unique_user_leaderboard_day",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -6,7 +6,7 @@ from .related_models.funding_activity_model import (
     FundingActivityRecipient,
 )
 from .related_models.gatekeeper_model import Gatekeeper
-from .related_models.leaderboard_model import Leaderboard
+from .related_models.leaderboard_model import Leaderboard, LeaderboardDailyTotal
 from .related_models.organization_model import Organization
 from .related_models.profile_image_storage import ProfileImageStorage
 from .related_models.risk_score_model import RiskScore, RiskScoreEvent
@@ -23,6 +23,7 @@ migratables = (
     FundingActivityRecipient,
     Gatekeeper,
     Leaderboard,
+    LeaderboardDailyTotal,
     Major,
     ProfileImageStorage,
     RiskScore,
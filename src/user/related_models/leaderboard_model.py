@@ -82,3 +82,53 @@ class Leaderboard(models.Model):
             f"Leaderboard: {self.user_id} - {self.leaderboard_type} - "
             f"{self.period} - Rank {self.rank}"
         )
+
+
+class LeaderboardDailyTotal(models.Model):
+    """
+    Per-user daily funding totals for both funders and earners.
+    Kept up to date by the funding activity signals, so leaderboards for any
+    date range sum at most one row per user and day.
+    """
+
+    user = models.ForeignKey(
+        "user.User",
+        on_delete=models.CASCADE,
+        related_name="leaderboard_daily_totals",
+        help_text="The user this daily total belongs to",
+    )
+    leaderboard_type = models.CharField(
+        max_length=16,
+        choices=Leaderboard.LEADERBOARD_TYPE_CHOICES,
+        help_text="Type of leaderboard (funder or earner)",
+    )
+    day = models.DateField(
+        help_text="Day of the funding activities in this total",
+    )
+    total_amount = models.DecimalField(
+        max_digits=19,
+        decimal_places=8,
+        help_text="Total RSC amount for the day",
+    )
+
+    class Meta:
+        verbose_name = "Leaderboard Daily Total"
+        verbose_name_plural = "Leaderboard Daily Totals"
+        indexes = [
+            models.Index(
+                fields=["leaderboard_type", "day"],
+                name="lb_daily_type_day_idx",
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "leaderboard_type", "day"],
+                name="unique_user_leaderboard_day",
+            ),
+        ]
+
+    def __str__(self):
+        return (
+            f"LeaderboardDailyTotal: {self.user_id} - {self.leaderboard_type} - "
+            f"{self.day} - {self.total_amount}"
+        )
@@ -1,8 +1,10 @@
 import uuid
+from collections.abc import Iterable
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, datetime
 from decimal import Decimal
 
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.contrib.auth.models import UserManager as DjangoUserManager
 from django.contrib.contenttypes.models import ContentType
@@ -12,7 +14,7 @@ from django.db.models.functions import Cast, Coalesce, Lower
 from django.utils import timezone
 
 from hub.models import Hub
-from purchase.related_models.balance_model import Balance
+from purchase.related_models.balance_model import Balance, UserBalanceSummary
 from reputation.models import PaidStatusModelMixin, Withdrawal
 from researchhub.settings import BASE_FRONTEND_URL
 from researchhub_access_group.constants import (
@@ -26,7 +28,12 @@ from utils.throttles import UserSustainedRateThrottle
 
 FOUNDATION_EMAIL = "main@researchhub.foundation"
 FOUNDATION_REVENUE_EMAIL = "revenue1@researchhub.foundation"
+REVENUE_EMAIL = "revenue@researchhub.com"
 AI_EXPERT_EMAIL = "ai-review@researchhub.foundation"
+# Fee accounts receive a balance row on every purchase and bounty. A running
+# summary row would serialize all of those writes, so their balances are only
+# read from the ledger.
+LEDGER_ONLY_BALANCE_EMAILS = (REVENUE_EMAIL, FOUNDATION_REVENUE_EMAIL)
 
 
 @dataclass(frozen=True)
@@ -55,7 +62,7 @@ class UserManager(SoftDeletableManagerMixin, DjangoUserManager):
         return User.objects.get(id=1)
 
     def get_revenue_account(self):
-        user = User.objects.filter(email="revenue@researchhub.com")
+        user = User.objects.filter(email=REVENUE_EMAIL)
         if user.exists():
             return user.first()
 
@@ -222,8 +229,34 @@ class User(SoftDeletableModel, AbstractUser):
         )
         return balance
 
+    def reads_balance_summary(self) -> bool:
+        """Whether balance reads come from `UserBalanceSummary` rows."""
+        return (
+            settings.BALANCE_SUMMARY_READS_ENABLED
+            and self.email not in LEDGER_ONLY_BALANCE_EMAILS
+        )
+
+    def get_balance_summary_total(self, unlocked=True, locked=True) -> Decimal:
+        """
+        Balance total read from the user's `UserBalanceSummary` rows instead
+        of the ledger.
+        """
+        summaries = self.balance_summaries.all()
+        if not locked:
+            summaries = summaries.filter(balance_type=UserBalanceSummary.UNLOCKED)
+        elif not unlocked:
+            summaries = summaries.exclude(balance_type=UserBalanceSummary.UNLOCKED)
+
+        # Summed in the database, the totals carry more digits than Python's
+        # default decimal precision.
+        return summaries.aggregate(
+            total=Coalesce(Sum("total"), Value(0), output_field=DecimalField())
+        )["total"]
+
     def get_balance(self, queryset=None, include_locked=False):
         if queryset is None:
+            if self.reads_balance_summary():
+                return self.get_balance_summary_total(locked=include_locked)
             queryset = self.get_balance_qs()
 
         # By default, exclude locked funds unless explicitly requested
@@ -244,6 +277,8 @@ class User(SoftDeletableModel, AbstractUser):
     def get_available_balance(self, queryset=None):
         """Returns balance excluding locked amounts"""
         if queryset is None:
+            if self.reads_balance_summary():
+                return self.get_balance_summary_total(locked=False)
             queryset = self.get_balance_qs()
 
         # Exclude locked balances from available balance
@@ -252,6 +287,8 @@ class User(SoftDeletableModel, AbstractUser):
 
     def get_locked_balance(self):
         """Returns total locked balance amount (promotional included)."""
+        if self.reads_balance_summary():
+            return self.get_balance_summary_total(unlocked=False)
         locked_queryset = self.get_balance_qs().filter(is_locked=True)
         return self.get_balance(queryset=locked_queryset, include_locked=True)
 
@@ -279,6 +316,14 @@ class User(SoftDeletableModel, AbstractUser):
         order, to the overall locked total so category debt cannot create
         spendable or yield-eligible funds in another category.
         """
+        if self.reads_balance_summary():
+            raw_balances = dict(
+                self.balance_summaries.exclude(
+                    balance_type=UserBalanceSummary.UNLOCKED
+                ).values_list("balance_type", "total")
+            )
+            return self.effective_locked_balances(raw_balances)
+
         rows = (
             self.get_balance_qs()
             .filter(is_locked=True)
@@ -290,7 +335,13 @@ class User(SoftDeletableModel, AbstractUser):
             )
         )
         raw_balances = {row["lock_type"]: row["total"] or Decimal(0) for row in rows}
+        return self.effective_locked_balances(raw_balances)
 
+    @staticmethod
+    def effective_locked_balances(
+        raw_balances: dict[str, Decimal],
+    ) -> dict[str, Decimal]:
+        """Cap raw locked totals by lock type, see `get_locked_balance_by_lock_type`."""
         valid_lock_types = set(Balance.LOCKED_SPEND_ORDER)
         unexpected_lock_types = set(raw_balances) - valid_lock_types
         if unexpected_lock_types:
@@ -363,13 +414,13 @@ class User(SoftDeletableModel, AbstractUser):
                 is_locked=True, lock_type=Balance.LockType.PROMOTIONAL
             )
         )
-        promotional_lots = self._cap_balance_lots_lifo(
+        promotional_lots = self.cap_balance_lots_lifo(
             promotional_lots, self.get_promotional_balance()
         )
         return self.get_unlocked_balance_lots_lifo() + promotional_lots
 
     @staticmethod
-    def _cap_balance_lots_lifo(
+    def cap_balance_lots_lifo(
         lots: list[UnlockedBalanceLot], maximum: Decimal
     ) -> list[UnlockedBalanceLot]:
         """Cap lots by applying any excess as a LIFO debit."""
@@ -393,14 +444,24 @@ class User(SoftDeletableModel, AbstractUser):
         return capped_lots
 
     def _balance_lots_lifo(self, queryset: models.QuerySet) -> list[UnlockedBalanceLot]:
+        balance_rows = queryset.order_by("-created_date", "-id").values_list(
+            "amount", "created_date"
+        )
+        return self.balance_lots_lifo(balance_rows.iterator())
+
+    @staticmethod
+    def balance_lots_lifo(
+        balance_rows: Iterable[tuple[str, datetime]],
+    ) -> list[UnlockedBalanceLot]:
+        """
+        Build LIFO lots from `(amount, created_date)` balance rows ordered
+        newest first.
+        """
         remaining_debits = Decimal(0)
         lots = []
-        balance_rows = queryset.order_by("-created_date", "-id").only(
-            "id", "amount", "created_date"
-        )
 
-        for balance in balance_rows.iterator():
-            amount = Decimal(str(balance.amount))
+        for balance_amount, created_date in balance_rows:
+            amount = Decimal(str(balance_amount))
             if amount < 0:
                 remaining_debits += -amount
                 continue
@@ -421,7 +482,7 @@ class User(SoftDeletableModel, AbstractUser):
             lots.append(
                 UnlockedBalanceLot(
                     amount=remaining_amount,
-                    created_date=balance.created_date.date(),
+                    created_date=created_date.date(),
                 )
             )
 
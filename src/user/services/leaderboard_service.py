@@ -0,0 +1,154 @@
+"""
+Daily leaderboard rollup.
+
+`LeaderboardDailyTotal` holds one row per `(user, leaderboard type, day)`:
+
+- FUNDER: sum of `FundingActivity.total_amount` funded by the user,
+- EARNER: sum of `FundingActivityRecipient.amount` received by the user for
+  review tips and bounty payouts.
+
+The funding activity signals call `refresh_daily_total` whenever a row
+changes, which recomputes the affected day from the source rows. Leaderboards
+for any date range are then aggregated from the rollup instead of the activity
+tables.
+"""
+
+from datetime import date
+
+from django.db import transaction
+from django.db.models import Sum
+from django.db.models.functions import TruncDate
+
+from user.related_models.funding_activity_model import (
+    FundingActivity,
+    FundingActivityRecipient,
+)
+from user.related_models.leaderboard_model import Leaderboard, LeaderboardDailyTotal
+
+EARNER_SOURCE_TYPES = (
+    FundingActivity.TIP_REVIEW,
+    FundingActivity.BOUNTY_PAYOUT,
+)
+
+BATCH_SIZE = 1000
+
+
+def refresh_daily_total(leaderboard_type: str, user_id: int, day: date):
+    """Recompute a user's daily total from the funding activity tables."""
+    with transaction.atomic():
+        # Lock the row first: concurrent refreshes of the same day wait for
+        # each other, so the sum below always includes committed activity.
+        daily_total, _ = (
+            LeaderboardDailyTotal.objects.select_for_update().get_or_create(
+                user_id=user_id,
+                leaderboard_type=leaderboard_type,
+                day=day,
+                defaults={"total_amount": 0},
+            )
+        )
+
+        if leaderboard_type == Leaderboard.FUNDER:
+            total = FundingActivity.objects.filter(
+                funder_id=user_id, activity_date__date=day
+            ).aggregate(total=Sum("total_amount"))["total"]
+        else:
+            total = FundingActivityRecipient.objects.filter(
+                recipient_user_id=user_id,
+                activity__source_type__in=EARNER_SOURCE_TYPES,
+                activity__activity_date__date=day,
+            ).aggregate(total=Sum("amount"))["total"]
+
+        if total is None:
+            daily_total.delete()
+        elif total != daily_total.total_amount:
+            daily_total.total_amount = total
+            daily_total.save(update_fields=["total_amount"])
+
+
+def rebuild_daily_totals():
+    """
+    Rebuild the whole rollup from the funding activity tables, e.g. after a
+    backfill that wrote activity rows without sending signals.
+    """
+    funder_rows = (
+        FundingActivity.objects.annotate(day=TruncDate("activity_date"))
+        .values("funder_id", "day")
+        .annotate(total=Sum("total_amount"))
+        .order_by()
+    )
+    earner_rows = (
+        FundingActivityRecipient.objects.filter(
+            activity__source_type__in=EARNER_SOURCE_TYPES
+        )
+        .annotate(day=TruncDate("activity__activity_date"))
+        .values("recipient_user_id", "day")
+        .annotate(total=Sum("amount"))
+        .order_by()
+    )
+
+    with transaction.atomic():
+        LeaderboardDailyTotal.objects.all().delete()
+        LeaderboardDailyTotal.objects.bulk_create(
+            (
+                LeaderboardDailyTotal(
+                    user_id=row["funder_id"],
+                    leaderboard_type=Leaderboard.FUNDER,
+                    day=row["day"],
+                    total_amount=row["total"],
+                )
+                for row in funder_rows.iterator()
+            ),
+            batch_size=BATCH_SIZE,
+        )
+        LeaderboardDailyTotal.objects.bulk_create(
+            (
+                LeaderboardDailyTotal(
+                    user_id=row["recipient_user_id"],
+                    leaderboard_type=Leaderboard.EARNER,
+                    day=row["day"],
+                    total_amount=row["total"],
+                )
+                for row in earner_rows.iterator()
+            ),
+            batch_size=BATCH_SIZE,
+        )
+
+
+def get_leaderboard_totals(
+    leaderboard_type: str,
+    start_day: date | None = None,
+    end_day: date | None = None,
+    excluded_user_ids=(),
+):
+    """
+    Per-user totals for a date range (inclusive), as `{"user_id", "total"}`
+    rows ordered by total, highest first.
+    """
+    qs = LeaderboardDailyTotal.objects.filter(leaderboard_type=leaderboard_type)
+    if start_day is not None:
+        qs = qs.filter(day__gte=start_day)
+    if end_day is not None:
+        qs = qs.filter(day__lte=end_day)
+    return (
+        qs.exclude(user_id__in=excluded_user_ids)
+        .values("user_id")
+        .annotate(total=Sum("total_amount"))
+        .order_by("-total")
+    )
+
+
+def get_user_leaderboard_total(
+    leaderboard_type: str,
+    user_id: int,
+    start_day: date | None = None,
+    end_day: date | None = None,
+):
+    """A single user's total for a date range (inclusive)."""
+    qs = LeaderboardDailyTotal.objects.filter(
+        leaderboard_type=leaderboard_type, user_id=user_id
+    )
+    if start_day is not None:
+        qs = qs.filter(day__gte=start_day)
+    if end_day is not None:
+        qs = qs.filter(day__lte=end_day)
+    return qs.aggregate(total=Sum("total_amount"))["total"] or 0
@@ -2,8 +2,9 @@ import logging
 
 from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
+from django.utils import timezone
 
 from paper.models import Paper
 from purchase.models import Fundraise, Purchase
@@ -15,7 +16,12 @@ from researchhub_comment.constants.rh_comment_thread_types import (
 )
 from researchhub_comment.models import RhCommentModel
 from researchhub_document.related_models.researchhub_post_model import ResearchhubPost
-from user.related_models.funding_activity_model import FundingActivity
+from user.related_models.funding_activity_model import (
+    FundingActivity,
+    FundingActivityRecipient,
+)
+from user.related_models.leaderboard_model import Leaderboard
+from user.services.leaderboard_service import refresh_daily_total
 from user.tasks.funding_activity_tasks import create_funding_activity_task
 
 logger = logging.getLogger(__name__)
@@ -166,3 +172,86 @@ def on_distribution_created(sender, instance, created, **kwargs):
             )
 
     transaction.on_commit(schedule)
+
+
+@receiver(
+    pre_save,
+    sender=FundingActivity,
+    dispatch_uid="leaderboard_daily_total_remember_funding_activity",
+)
+def remember_funding_activity_day(sender, instance, update_fields, **kwargs):
+    # An update can move the activity to another day or funder, whose daily
+    # totals then need a refresh as well.
+    if instance._state.adding or not instance.pk:
+        return
+    if update_fields is not None and not {"activity_date", "funder"} & set(
+        update_fields
+    ):
+        return
+    instance._previous_daily_total_key = (
+        sender.objects.filter(pk=instance.pk)
+        .values_list("funder_id", "activity_date")
+        .first()
+    )
+
+
+@receiver(
+    post_save,
+    sender=FundingActivity,
+    dispatch_uid="leaderboard_daily_total_on_funding_activity_saved",
+)
+def on_funding_activity_saved(sender, instance, created, **kwargs):
+    """Keep the funder's (and on updates, recipients') daily totals current."""
+    day = timezone.localdate(instance.activity_date)
+    refresh_daily_total(Leaderboard.FUNDER, instance.funder_id, day)
+    if created:
+        return
+
+    recipient_user_ids = list(
+        instance.recipients.values_list("recipient_user_id", flat=True)
+    )
+    for recipient_user_id in recipient_user_ids:
+        refresh_daily_total(Leaderboard.EARNER, recipient_user_id, day)
+
+    previous = instance.__dict__.pop("_previous_daily_total_key", None)
+    if previous is None:
+        return
+    previous_funder_id, previous_activity_date = previous
+    previous_day = timezone.localdate(previous_activity_date)
+    if (previous_funder_id, previous_day) != (instance.funder_id, day):
+        refresh_daily_total(Leaderboard.FUNDER, previous_funder_id, previous_day)
+    if previous_day != day:
+        for recipient_user_id in recipient_user_ids:
+            refresh_daily_total(Leaderboard.EARNER, recipient_user_id, previous_day)
+
+
+@receiver(
+    post_delete,
+    sender=FundingActivity,
+    dispatch_uid="leaderboard_daily_total_on_funding_activity_deleted",
+)
+def on_funding_activity_deleted(sender, instance, **kwargs):
+    day = timezone.localdate(instance.activity_date)
+    refresh_daily_total(Leaderboard.FUNDER, instance.funder_id, day)
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=FundingActivityRecipient,
+    dispatch_uid="leaderboard_daily_total_on_funding_recipient_changed",
+)
+def on_funding_recipient_changed(sender, instance, **kwargs):
+    """Keep the recipient's earner daily total current."""
+    activity_date = (
+        FundingActivity.objects.filter(pk=instance.activity_id)
+        .values_list("activity_date", flat=True)
+        .first()
+    )
+    if activity_date is None:
+        return
+
+    refresh_daily_total(
+        Leaderboard.EARNER,
+        instance.recipient_user_id,
+        timezone.localdate(activity_date),
+    )
@@ -2,16 +2,12 @@ import logging
 from datetime import timedelta
 
 from django.db import transaction
-from django.db.models import Sum
 from django.utils import timezone
 
 from researchhub.celery import QUEUE_CACHES, app
-from user.related_models.funding_activity_model import (
-    FundingActivity,
-    FundingActivityRecipient,
-)
 from user.related_models.leaderboard_model import Leaderboard
 from user.services.funding_activity_service import get_leaderboard_excluded_user_ids
+from user.services.leaderboard_service import get_leaderboard_totals
 
 logger = logging.getLogger(__name__)
 
@@ -51,8 +47,9 @@ def _get_period_date_range(period):
 def refresh_leaderboard_task():
     """
     Refresh leaderboard data for all periods and types.
-    Aggregates FundingActivity and FundingActivityRecipient data,
-    calculates ranks, and writes to Leaderboard table.
+    Sums the LeaderboardDailyTotal rollup per user, calculates ranks, and
+    writes to Leaderboard table. Each period is replaced in its own
+    transaction.
     """
     excluded_user_ids = get_leaderboard_excluded_user_ids()
     periods = [
@@ -65,114 +62,43 @@ def refresh_leaderboard_task():
 
     logger.info("refresh_leaderboard_task: Starting leaderboard refresh")
 
-    with transaction.atomic():
-        # Refresh funder leaderboards
-        for period in periods:
-            _refresh_funder_leaderboard(period, excluded_user_ids)
-
-        # Refresh earner leaderboards
+    for leaderboard_type in (Leaderboard.FUNDER, Leaderboard.EARNER):
         for period in periods:
-            _refresh_earner_leaderboard(period, excluded_user_ids)
+            _refresh_leaderboard(leaderboard_type, period, excluded_user_ids)
 
     logger.info("refresh_leaderboard_task: Completed leaderboard refresh")
 
 
-def _refresh_funder_leaderboard(period, excluded_user_ids):
-    """Refresh funder leaderboard for a given period."""
+def _refresh_leaderboard(leaderboard_type, period, excluded_user_ids):
+    """Refresh the leaderboard of a type for a given period."""
     start_date, end_date = _get_period_date_range(period)
 
-    # Aggregate FundingActivity by funder
-    qs = FundingActivity.objects.exclude(funder_id__in=excluded_user_ids)
-
-    if start_date:
-        qs = qs.filter(activity_date__gte=start_date, activity_date__lte=end_date)
-
-    funder_totals = (
-        qs.values("funder_id")
-        .annotate(total_amount=Sum("total_amount"))
-        .order_by("-total_amount")
+    totals = get_leaderboard_totals(
+        leaderboard_type,
+        start_date.date() if start_date else None,
+        end_date.date(),
+        excluded_user_ids,
     )
 
-    # Delete existing entries for this period and type
-    Leaderboard.objects.filter(
-        leaderboard_type=Leaderboard.FUNDER, period=period
-    ).delete()
-
-    # Create new entries with ranks
-    rank = 1
-    entries_to_create = []
-    for entry in funder_totals:
-        entries_to_create.append(
-            Leaderboard(
-                user_id=entry["funder_id"],
-                leaderboard_type=Leaderboard.FUNDER,
-                period=period,
-                rank=rank,
-                total_amount=entry["total_amount"],
-            )
+    entries_to_create = [
+        Leaderboard(
+            user_id=entry["user_id"],
+            leaderboard_type=leaderboard_type,
+            period=period,
+            rank=rank,
+            total_amount=entry["total"],
         )
-        rank += 1
+        for rank, entry in enumerate(totals, start=1)
+    ]
 
-    if entries_to_create:
+    with transaction.atomic():
+        # Delete existing entries for this period and type
+        Leaderboard.objects.filter(
+            leaderboard_type=leaderboard_type, period=period
+        ).delete()
         Leaderboard.objects.bulk_create(entries_to_create)
-        logger.info(
-            f"refresh_leaderboard_task: Created {len(entries_to_create)} "
-            f"funder entries for period {period}"
-        )
-
-
-def _refresh_earner_leaderboard(period, excluded_user_ids):
-    """Refresh earner leaderboard for a given period."""
-    start_date, end_date = _get_period_date_range(period)
 
-    # Aggregate FundingActivityRecipient by recipient_user
-    # (reviewers only: tip + bounty)
-    qs = (
-        FundingActivityRecipient.objects.select_related("activity")
-        .filter(
-            activity__source_type__in=[
-                FundingActivity.TIP_REVIEW,
-                FundingActivity.BOUNTY_PAYOUT,
-            ]
-        )
-        .exclude(recipient_user_id__in=excluded_user_ids)
-    )
-
-    if start_date:
-        qs = qs.filter(
-            activity__activity_date__gte=start_date,
-            activity__activity_date__lte=end_date,
-        )
-
-    earner_totals = (
-        qs.values("recipient_user_id")
-        .annotate(total_amount=Sum("amount"))
-        .order_by("-total_amount")
+    logger.info(
+        f"refresh_leaderboard_task: Created {len(entries_to_create)} "
+        f"{leaderboard_type.lower()} entries for period {period}"
     )
-
-    # Delete existing entries for this period and type
-    Leaderboard.objects.filter(
-        leaderboard_type=Leaderboard.EARNER, period=period
-    ).delete()
-
-    # Create new entries with ranks
-    rank = 1
-    entries_to_create = []
-    for entry in earner_totals:
-        entries_to_create.append(
-            Leaderboard(
-                user_id=entry["recipient_user_id"],
-                leaderboard_type=Leaderboard.EARNER,
-                period=period,
-                rank=rank,
-                total_amount=entry["total_amount"],
-            )
-        )
-        rank += 1
-
-    if entries_to_create:
-        Leaderboard.objects.bulk_create(entries_to_create)
-        logger.info(
-            f"refresh_leaderboard_task: Created {len(entries_to_create)} "
-            f"earner entries for period {period}"
-        )
@@ -12,6 +12,7 @@ from discussion.models import Flag, Vote
 from discussion.views import censor
 from feed.models import FeedEntry
 from notification.models import Notification
+from notification.services.unread_count_service import delete_notifications
 from paper.models import Paper
 from purchase.models import Fundraise, Grant
 from purchase.services.fundraise_service import FundraiseService
@@ -91,7 +92,7 @@ def handle_spam_user_task(user_id, requestor=None):
 
     # Purge feed entries and notifications
     FeedEntry.objects.filter(user=user).delete()
-    Notification.objects.filter(action_user=user).delete()
+    delete_notifications(Notification.objects.filter(action_user=user))
 
     # Resolve any open moderation flags on the user's content
     _resolve_open_flags_for_user(user, requestor)
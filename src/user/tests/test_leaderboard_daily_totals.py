@@ -0,0 +1,140 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.contenttypes.models import ContentType
+from django.test import TestCase
+from django.utils import timezone
+
+from user.related_models.funding_activity_model import (
+    FundingActivity,
+    FundingActivityRecipient,
+)
+from user.related_models.leaderboard_model import Leaderboard, LeaderboardDailyTotal
+from user.services.leaderboard_service import rebuild_daily_totals
+from user.tasks.leaderboard_tasks import refresh_leaderboard_task
+from user.tests.helpers import create_random_default_user
+
+
+class LeaderboardDailyTotalTests(TestCase):
+    def setUp(self):
+        self.funder = create_random_default_user("daily_total_funder")
+        self.reviewer = create_random_default_user("daily_total_reviewer")
+        self.content_type = ContentType.objects.get_for_model(type(self.funder))
+        self.now = timezone.now()
+        self.source_object_id = 0
+
+    def _create_activity(self, source_type, amount, days_ago=0, recipient=None):
+        self.source_object_id += 1
+        activity = FundingActivity.objects.create(
+            funder=self.funder,
+            source_type=source_type,
+            total_amount=Decimal(amount),
+            activity_date=self.now - timedelta(days=days_ago),
+            source_content_type=self.content_type,
+            source_object_id=self.source_object_id,
+        )
+        if recipient is not None:
+            FundingActivityRecipient.objects.create(
+                activity=activity, recipient_user=recipient, amount=Decimal(amount)
+            )
+        return activity
+
+    def _daily_totals(self):
+        return {
+            (row.user_id, row.leaderboard_type, row.day): row.total_amount
+            for row in LeaderboardDailyTotal.objects.all()
+        }
+
+    def test_signals_maintain_daily_totals(self):
+        # Arrange
+        today = timezone.localdate(self.now)
+        yesterday = today - timedelta(days=1)
+
+        # Act
+        self._create_activity(FundingActivity.TIP_REVIEW, "10", recipient=self.reviewer)
+        self._create_activity(FundingActivity.BOUNTY_PAYOUT, "5", days_ago=1)
+        self._create_activity(FundingActivity.FEE, "2", recipient=self.reviewer)
+        removed = self._create_activity(
+            FundingActivity.TIP_REVIEW, "7", days_ago=1, recipient=self.reviewer
+        )
+        removed.delete()
+
+        # Assert
+        self.assertEqual(
+            self._daily_totals(),
+            {
+                (self.funder.id, Leaderboard.FUNDER, today): Decimal(12),
+                (self.funder.id, Leaderboard.FUNDER, yesterday): Decimal(5),
+                (self.reviewer.id, Leaderboard.EARNER, today): Decimal(10),
+            },
+        )
+
+    def test_moving_activity_to_another_day_refreshes_both_days(self):
+        # Arrange
+        today = timezone.localdate(self.now)
+        yesterday = today - timedelta(days=1)
+        activity = self._create_activity(
+            FundingActivity.TIP_REVIEW, "10", recipient=self.reviewer
+        )
+
+        # Act
+        activity.activity_date = self.now - timedelta(days=1)
+        activity.save()
+
+        # Assert
+        self.assertEqual(
+            self._daily_totals(),
+            {
+                (self.funder.id, Leaderboard.FUNDER, yesterday): Decimal(10),
+                (self.reviewer.id, Leaderboard.EARNER, yesterday): Decimal(10),
+            },
+        )
+
+    def test_rebuild_matches_incremental_totals(self):
+        # Arrange
+        self._create_activity(FundingActivity.TIP_REVIEW, "10", recipient=self.reviewer)
+        self._create_activity(FundingActivity.FEE, "3", days_ago=40)
+        incremental = self._daily_totals()
+
+        # Act
+        rebuild_daily_totals()
+
+        # Assert
+        self.assertEqual(self._daily_totals(), incremental)
+
+    def test_refresh_leaderboard_ranks_from_daily_totals(self):
+        # Arrange
+        other_funder = create_random_default_user("daily_total_other_funder")
+        self._create_activity(FundingActivity.FEE, "10")
+        self._create_activity(FundingActivity.FEE, "30", days_ago=40)
+        self.source_object_id += 1
+        FundingActivity.objects.create(
+            funder=other_funder,
+            source_type=FundingActivity.FEE,
+            total_amount=Decimal(20),
+            activity_date=self.now,
+            source_content_type=self.content_type,
+            source_object_id=self.source_object_id,
+        )
+
+        # Act
+        refresh_leaderboard_task()
+
+        # Assert
+        def ranking(period):
+            return list(
+                Leaderboard.objects.filter(
+                    leaderboard_type=Leaderboard.FUNDER, period=period
+                )
+                .order_by("rank")
+                .values_list("user_id", "total_amount")
+            )
+
+        self.assertEqual(
+            ranking(Leaderboard.THIRTY_DAYS),
+            [(other_funder.id, Decimal(20)), (self.funder.id, Decimal(10))],
+        )
+        self.assertEqual(
+            ranking(Leaderboard.ALL_TIME),
+            [(self.funder.id, Decimal(40)), (other_funder.id, Decimal(20))],
+        )
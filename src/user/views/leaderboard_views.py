@@ -1,7 +1,6 @@
 from datetime import datetime
 
 from django.core.cache import cache
-from django.db.models import Sum
 from django.utils import timezone
 from django.utils.decorators import method_decorator
 from django.views.decorators.cache import cache_page
@@ -12,13 +11,13 @@ from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 
 from user.models import User
-from user.related_models.funding_activity_model import (
-    FundingActivity,
-    FundingActivityRecipient,
-)
 from user.related_models.leaderboard_model import Leaderboard
 from user.serializers import DynamicUserSerializer
 from user.services.funding_activity_service import get_leaderboard_excluded_user_ids
+from user.services.leaderboard_service import (
+    get_leaderboard_totals,
+    get_user_leaderboard_total,
+)
 
 # Maximum allowed date range (in days) when querying leaderboard by start_date/end_date.
 MAX_DATE_RANGE_DAYS = 60
@@ -208,70 +207,26 @@ class LeaderboardViewSet(viewsets.ModelViewSet):
             except Leaderboard.DoesNotExist:
                 return None
 
-        if leaderboard_type == Leaderboard.EARNER:
-            earner_source_types = [
-                FundingActivity.TIP_REVIEW,
-                FundingActivity.BOUNTY_PAYOUT,
-            ]
-            user_total_qs = FundingActivityRecipient.objects.filter(
-                recipient_user=user,
-                activity__activity_date__gte=start_dt,
-                activity__activity_date__lte=end_dt,
-                activity__source_type__in=earner_source_types,
-            ).aggregate(total=Sum("amount"))
-            user_total = user_total_qs["total"] or 0
-
-            if user_total == 0:
-                return None
-
-            higher_count = (
-                FundingActivityRecipient.objects.filter(
-                    activity__activity_date__gte=start_dt,
-                    activity__activity_date__lte=end_dt,
-                    activity__source_type__in=earner_source_types,
-                )
-                .exclude(recipient_user_id__in=excluded_ids)
-                .values("recipient_user_id")
-                .annotate(total=Sum("amount"))
-                .filter(total__gt=user_total)
-                .count()
-            )
-            rank = higher_count + 1
-
-            return {
-                **self.serialize_user(user),
-                "earned_rsc": user_total,
-                "rank": rank,
-            }
-        else:  # FUNDER
-            user_total_qs = FundingActivity.objects.filter(
-                funder=user,
-                activity_date__gte=start_dt,
-                activity_date__lte=end_dt,
-            ).aggregate(total=Sum("total_amount"))
-            user_total = user_total_qs["total"] or 0
-
-            if user_total == 0:
-                return None
-
-            higher_count = (
-                FundingActivity.objects.filter(
-                    activity_date__gte=start_dt,
-                    activity_date__lte=end_dt,
-                )
-                .exclude(funder_id__in=excluded_ids)
-                .values("funder_id")
-                .annotate(total=Sum("total_amount"))
-                .filter(total__gt=user_total)
-                .count()
-            )
-            rank = higher_count + 1
+        start_day, end_day = start_dt.date(), end_dt.date()
+        user_total = get_user_leaderboard_total(
+            leaderboard_type, user.id, start_day, end_day
+        )
+        if user_total == 0:
+            return None
 
-            return {
-                **self.serialize_user(user),
-                "total_funding": user_total,
-                "rank": rank,
-            }
+        higher_count = (
+            get_leaderboard_totals(leaderboard_type, start_day, end_day, excluded_ids)
+            .filter(total__gt=user_total)
+            .count()
+        )
+        amount_label = (
+            "earned_rsc" if leaderboard_type == Leaderboard.EARNER else "total_funding"
+        )
+        return {
+            **self.serialize_user(user),
+            amount_label: user_total,
+            "rank": higher_count + 1,
+        }
 
     @action(
         detail=False,
@@ -453,51 +408,13 @@ class LeaderboardViewSet(viewsets.ModelViewSet):
         if error_response is not None:
             return error_response
 
-        excluded_ids = get_leaderboard_excluded_user_ids()
-        aggregated = (
-            FundingActivityRecipient.objects.filter(
-                activity__activity_date__gte=start_dt,
-                activity__activity_date__lte=end_dt,
-                activity__source_type__in=[
-                    FundingActivity.TIP_REVIEW,
-                    FundingActivity.BOUNTY_PAYOUT,
-                ],
-            )
-            .exclude(recipient_user_id__in=excluded_ids)
-            .values("recipient_user_id")
-            .annotate(total=Sum("amount"))
-            .order_by("-total")
+        aggregated = get_leaderboard_totals(
+            Leaderboard.EARNER,
+            start_dt.date(),
+            end_dt.date(),
+            get_leaderboard_excluded_user_ids(),
         )
-
-        page = self.paginate_queryset(aggregated)
-        if page is None:
-            return Response([])
-
-        page_number = self.paginator.page.number
-        page_size = self.paginator.page_size
-        starting_rank = (page_number - 1) * page_size + 1
-
-        user_ids = [row["recipient_user_id"] for row in page]
-        users_by_id = {
-            u.id: u
-            for u in User.objects.filter(id__in=user_ids).select_related(
-                "author_profile"
-            )
-        }
-        totals_by_user = {row["recipient_user_id"]: row["total"] for row in page}
-        data = []
-        for index, uid in enumerate(user_ids):
-            user = users_by_id.get(uid)
-            if not user:
-                continue
-            data.append(
-                {
-                    **self.serialize_user(user),
-                    "earned_rsc": totals_by_user[uid],
-                    "rank": starting_rank + index,
-                }
-            )
-        return self.get_paginated_response(data)
+        return self._paginated_aggregated_response(aggregated, "user_id", "earned_rsc")
 
     @method_decorator(cache_page(60 * 60 * 6))
     @action(detail=False, methods=["GET"])
@@ -539,44 +456,12 @@ class LeaderboardViewSet(viewsets.ModelViewSet):
         if error_response is not None:
             return error_response
 
-        excluded_ids = get_leaderboard_excluded_user_ids()
-        aggregated = (
-            FundingActivity.objects.filter(
-                activity_date__gte=start_dt,
-                activity_date__lte=end_dt,
-            )
-            .exclude(funder_id__in=excluded_ids)
-            .values("funder_id")
-            .annotate(total=Sum("total_amount"))
-            .order_by("-total")
+        aggregated = get_leaderboard_totals(
+            Leaderboard.FUNDER,
+            start_dt.date(),
+            end_dt.date(),
+            get_leaderboard_excluded_user_ids(),
+        )
+        return self._paginated_aggregated_response(
+            aggregated, "user_id", "total_funding"
         )
-
-        page = self.paginate_queryset(aggregated)
-        if page is None:
-            return Response([])
-
-        page_number = self.paginator.page.number
-        page_size = self.paginator.page_size
-        starting_rank = (page_number - 1) * page_size + 1
-
-        user_ids = [row["funder_id"] for row in page]
-        users_by_id = {
-            u.id: u
-            for u in User.objects.filter(id__in=user_ids).select_related(
-                "author_profile"
-            )
-        }
-        totals_by_user = {row["funder_id"]: row["total"] for row in page}
-        data = []
-        for index, uid in enumerate(user_ids):
-            user = users_by_id.get(uid)
-            if not user:
-                continue
-            data.append(
-                {
-                    **self.serialize_user(user),
-                    "total_funding": totals_by_user[uid],
-                    "rank": starting_rank + index,
-                }
-            )
-        return self.get_paginated_response(data)
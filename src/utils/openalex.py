@@ -1,9 +1,15 @@
+import hashlib
+import logging
 import math
+import os
 import re
+import threading
 from dataclasses import dataclass
 from unicodedata import normalize
+from urllib.parse import urlencode
 
 from dateutil import parser
+from django.core.cache import cache
 from django.utils.timezone import get_current_timezone, is_aware, make_aware
 
 from paper.exceptions import DOINotFoundError
@@ -12,6 +18,48 @@ from researchhub.settings import OPENALEX_KEY
 from utils.parsers import rebuild_sentence_from_inverted_index
 from utils.retryable_requests import retryable_requests_session
 
+logger = logging.getLogger(__name__)
+
+# Responses of non-paginated requests (lookups, searches, autocomplete) are
+# cached on their normalized URL. Eviction is left to the cache backend.
+OPENALEX_CACHE_TIMEOUT = 60 * 60
+# Most ids OpenAlex accepts in one `filter=doi:a|b|c` (or id) filter.
+OPENALEX_MAX_FILTER_IDS = 50
+
+_session_local = threading.local()
+
+
+def openalex_session():
+    """
+    The calling thread's pooled OpenAlex session, so consecutive requests reuse
+    connections instead of opening a new one each time. A forked worker builds
+    its own rather than sharing sockets with its parent.
+    """
+    pid = os.getpid()
+    if getattr(_session_local, "pid", None) != pid:
+        _session_local.session = retryable_requests_session()
+        _session_local.pid = pid
+    return _session_local.session
+
+
+def _response_cache_key(url: str, params: dict) -> str:
+    # The API key is a credential, not part of the resource
+    normalized = urlencode(
+        sorted((key, str(value)) for key, value in params.items() if key != "api_key")
+    )
+    digest = hashlib.sha256(f"{url}?{normalized}".encode()).hexdigest()
+    return f"openalex:response:{digest}"
+
+
+def normalize_doi(doi: str | None) -> str:
+    """Bare, lowercase DOI from a DOI or a doi.org URL (``""`` when empty)."""
+    doi = str(doi or "").strip().lower()
+    for prefix in ("https://doi.org/", "http://doi.org/", "doi:"):
+        if doi.startswith(prefix):
+            return doi[len(prefix) :]
+    return doi
+
+
 SOURCE_TO_OPENALEX_ID = {
     "BIORXIV": "s4306402567",
     "MEDRXIV": "s4306400573",
@@ -247,12 +295,33 @@ class OpenAlex:
         params = {**filters, **self.base_params}
         headers = {**headers, **self.base_headers}
         url = f"{self.base_url}/{url}"
-        with retryable_requests_session() as session:
-            response = session.get(
-                url, params=params, headers=headers, timeout=self.timeout
-            )
+
+        # Paginated crawls (any request with a cursor, including the first page)
+        # must see fresh pages and are rarely repeated, so only lookups, search
+        # and autocomplete responses are cached.
+        cacheable = "cursor" not in filters
+        cache_key = _response_cache_key(url, params) if cacheable else None
+        if cache_key:
+            try:
+                cached = cache.get(cache_key)
+            except Exception:
+                logger.warning("OpenAlex response cache read failed", exc_info=True)
+                cached = None
+            if cached is not None:
+                return cached
+
+        response = openalex_session().get(
+            url, params=params, headers=headers, timeout=self.timeout
+        )
         response.raise_for_status()
-        return response.json()
+        data = response.json()
+
+        if cache_key:
+            try:
+                cache.set(cache_key, data, timeout=OPENALEX_CACHE_TIMEOUT)
+            except Exception:
+                logger.warning("OpenAlex response cache write failed", exc_info=True)
+        return data
 
     def _get_works_from_api_url(self, data):
         if isinstance(data, list):
@@ -262,10 +331,9 @@ class OpenAlex:
         elif isinstance(data, dict):
             works_api_url = data.get("works_api_url", None)
             if works_api_url:
-                with retryable_requests_session() as session:
-                    response = session.get(
-                        works_api_url, headers=self.base_headers, timeout=self.timeout
-                    )
+                response = openalex_session().get(
+                    works_api_url, headers=self.base_headers, timeout=self.timeout
+                )
                 response.raise_for_status()
                 data["works"] = response.json().get("results", [])
         return data
@@ -598,6 +666,28 @@ class OpenAlex:
         results = response.get("results", [])
         return results[0] if results else None
 
+    def get_works_by_dois(self, dois) -> dict[str, dict]:
+        """
+        Fetch works for many DOIs, `OPENALEX_MAX_FILTER_IDS` per request.
+
+        Returns works keyed by their normalized DOI (see `normalize_doi`);
+        DOIs without a work are left out.
+        """
+        unique_dois = list(dict.fromkeys(filter(None, map(normalize_doi, dois))))
+        works = {}
+        for start in range(0, len(unique_dois), OPENALEX_MAX_FILTER_IDS):
+            chunk = unique_dois[start : start + OPENALEX_MAX_FILTER_IDS]
+            filters = {
+                "filter": f"doi:{'|'.join(chunk)}",
+                "per-page": len(chunk),
+            }
+            response = self._get("works", filters=filters)
+            for work in response.get("results", []):
+                doi = normalize_doi(work.get("doi"))
+                if doi:
+                    works[doi] = work
+        return works
+
     def search_works(self, query, per_page=5):
         """Relevance-ranked, DOI-bearing works matching a free-text query.
 
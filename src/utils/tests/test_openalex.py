@@ -5,6 +5,7 @@ from pathlib import Path
 from unittest.mock import patch
 
 import responses
+from django.core.cache import cache
 from django.test import TestCase
 
 from utils.openalex import (
@@ -21,6 +22,7 @@ fixtures_dir = Path(__file__).parent
 
 class OpenAlexTests(TestCase):
     def setUp(self):
+        cache.clear()
         with open(fixtures_dir / "work_by_doi.json") as response_body_file:
             self.works_json = json.load(response_body_file)
         with open(fixtures_dir / "openalex_with_researchhub_works.json") as content:
@@ -81,6 +83,58 @@ class OpenAlexTests(TestCase):
 
         self.assertEqual("https://openalex.org/W3018513801", result["id"])
 
+    @responses.activate
+    def test_lookups_are_served_from_the_response_cache(self):
+        # Arrange
+        responses.add(
+            responses.Response(
+                method=self.method, url=self.works_url, json=self.works_json
+            )
+        )
+        OpenAlex().get_data_from_doi(self.doi)
+
+        # Act
+        result = OpenAlex().get_data_from_doi(self.doi)
+
+        # Assert
+        self.assertEqual(len(responses.calls), 1)
+        self.assertEqual("https://openalex.org/W3018513801", result["id"])
+
+    @responses.activate
+    def test_cursor_pages_are_not_cached(self):
+        # Arrange
+        responses.add(
+            responses.Response(
+                method=self.method, url=self.works_url, json=self.works_json
+            )
+        )
+
+        # Act
+        for next_cursor in ("*", "*", "page-2", "page-2"):
+            OpenAlex().get_works(next_cursor=next_cursor)
+
+        # Assert
+        self.assertEqual(len(responses.calls), 4)
+
+    @patch.object(OpenAlex, "_get")
+    def test_get_works_by_dois_batches_and_keys_by_normalized_doi(self, mock_get):
+        # Arrange
+        mock_get.side_effect = lambda url, filters: {
+            "results": [
+                {"doi": f"https://doi.org/{doi.upper()}"}
+                for doi in filters["filter"].removeprefix("doi:").split("|")
+            ]
+        }
+        dois = [f"https://doi.org/10.1/{i}" for i in range(51)]
+
+        # Act
+        works = OpenAlex().get_works_by_dois(dois + ["10.1/0", None])
+
+        # Assert
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(len(works), 51)
+        self.assertEqual(works["10.1/50"], {"doi": "https://doi.org/10.1/50"})
+
     @patch.object(OpenAlex, "_get")
     def test_get_works_adds_is_core_parameter(self, mock_get):
         """Test that get_works adds the is_core parameter."""